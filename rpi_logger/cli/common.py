@@ -380,6 +380,17 @@ def setup_module_logging(
         log_file=log_file,
     )
 
+    if is_command_mode:
+        # Show module logs in the master's log panel (batched, rate limited)
+        from rpi_logger.core.module_log_manager import install_forwarding_handler
+        install_forwarding_handler(
+            getattr(args, "instance_id", None) or module_name,
+            getattr(logging, str(args.log_level).upper(), logging.INFO),
+        )
+        # Live metrics for the master's telemetry bus (coalesced, ~10 Hz)
+        from rpi_logger.core.telemetry import install_telemetry_publisher
+        install_telemetry_publisher(getattr(args, "instance_id", None) or module_name)
+
     runtime_logger = get_module_logger(module_name or __name__)
     if used_fallback:
         runtime_logger.warning(
@@ -19,6 +19,7 @@ from rpi_logger.core.shutdown_coordinator import get_shutdown_coordinator
 from rpi_logger.core.config_manager import get_config_manager
 from rpi_logger.core.paths import CONFIG_PATH, MASTER_LOG_FILE
 from rpi_logger.core.devices import InterfaceType, DeviceFamily
+from rpi_logger.core.telemetry import DEFAULT_SUBSCRIBER_RATE, TelemetrySubscription
 
 
 logger = get_module_logger("APIController")
@@ -1161,6 +1162,36 @@ class APIController:
 
         return await self.read_log_file(str(log_path), offset, limit)
 
+    # =========================================================================
+    # Telemetry
+    # =========================================================================
+
+    async def get_telemetry(
+        self,
+        topics: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get the latest telemetry sample of every matching topic."""
+        bus = self.logger_system.telemetry
+        samples = bus.latest(topics or ("*",), sources)
+        return {
+            "samples": samples,
+            "count": len(samples),
+            "subscribers": bus.subscriber_count,
+        }
+
+    def subscribe_telemetry(
+        self,
+        topics: Optional[List[str]] = None,
+        sources: Optional[List[str]] = None,
+        max_rate: float = DEFAULT_SUBSCRIBER_RATE,
+    ) -> TelemetrySubscription:
+        """Open a rate-bounded telemetry subscription for a streaming client."""
+        return self.logger_system.telemetry.subscribe(topics or ("*",), sources, max_rate)
+
+    def unsubscribe_telemetry(self, subscription: TelemetrySubscription) -> None:
+        self.logger_system.telemetry.unsubscribe(subscription)
+
     # =========================================================================
     # Module-Specific Operations
     # =========================================================================
@@ -12,6 +12,7 @@ Core route modules (always present):
 - windows: Window and UI control endpoints
 - testing: Testing and verification endpoints
 - debug: Debug and introspection endpoints
+- stream: Live telemetry (WebSocket/SSE)
 
 Module-specific routes are loaded dynamically from each module's api/ package.
 """
@@ -34,6 +35,7 @@ from .settings import setup_settings_routes
 from .windows import setup_windows_routes
 from .testing import setup_testing_routes
 from .debug import setup_debug_routes
+from .stream import setup_stream_routes
 
 
 def setup_all_routes(app, controller):
@@ -53,6 +55,7 @@ def setup_all_routes(app, controller):
     setup_windows_routes(app, controller)
     setup_testing_routes(app, controller)
     setup_debug_routes(app, controller)
+    setup_stream_routes(app, controller)
 
     # Module-provided routes (loaded from module api/ packages)
     from ..module_api_loader import get_api_registry
@@ -0,0 +1,137 @@
+"""Stream Routes - Live telemetry over WebSocket or Server-Sent Events."""
+
+import asyncio
+import contextlib
+import json
+from typing import List, Optional, Tuple
+
+from aiohttp import WSMsgType, web
+
+from rpi_logger.core.telemetry import DEFAULT_SUBSCRIBER_RATE, TelemetrySubscription
+
+from ..controller import APIController
+from ..middleware import create_error_response
+
+# Seconds without telemetry before an SSE keepalive comment is sent
+KEEPALIVE_INTERVAL = 15.0
+
+
+def setup_stream_routes(app: web.Application, controller: APIController) -> None:
+    """Register telemetry stream routes."""
+    app.router.add_get("/api/v1/stream", stream_handler)
+    app.router.add_get("/api/v1/stream/latest", latest_telemetry_handler)
+
+
+def _split(value: Optional[str]) -> Optional[List[str]]:
+    if not value:
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()] or None
+
+
+def _parse_subscription(request: web.Request) -> Tuple[Optional[List[str]], Optional[List[str]], float, Optional[web.Response]]:
+    """Parse topics/sources/rate query params. Returns (topics, sources, rate, error_response)."""
+    try:
+        rate = float(request.query.get("rate", DEFAULT_SUBSCRIBER_RATE))
+    except ValueError:
+        return None, None, 0.0, create_error_response("INVALID_PARAMETER", "rate must be a number", status=400)
+    if rate <= 0:
+        return None, None, 0.0, create_error_response("INVALID_PARAMETER", "rate must be positive", status=400)
+    return _split(request.query.get("topics")), _split(request.query.get("sources")), rate, None
+
+
+def _subscription_info(subscription: TelemetrySubscription) -> dict:
+    return {
+        "topics": list(subscription.topics),
+        "sources": list(subscription.sources) if subscription.sources else None,
+        "rate": subscription.max_rate,
+    }
+
+
+async def latest_telemetry_handler(request: web.Request) -> web.Response:
+    """GET /api/v1/stream/latest - Latest sample of each matching topic."""
+    controller: APIController = request.app["controller"]
+    topics, sources, _rate, err = _parse_subscription(request)
+    if err:
+        return err
+    return web.json_response(await controller.get_telemetry(topics, sources))
+
+
+async def stream_handler(request: web.Request) -> web.StreamResponse:
+    """GET /api/v1/stream - Live telemetry (WebSocket upgrade, otherwise SSE).
+
+    Query params: topics (comma-separated patterns, e.g. ``audio.*``),
+    sources (comma-separated instance ids), rate (max updates/s per topic).
+    """
+    controller: APIController = request.app["controller"]
+    topics, sources, rate, err = _parse_subscription(request)
+    if err:
+        return err
+
+    subscription = controller.subscribe_telemetry(topics, sources, rate)
+    try:
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await _serve_websocket(request, subscription)
+        return await _serve_sse(request, subscription)
+    finally:
+        controller.unsubscribe_telemetry(subscription)
+
+
+async def _serve_sse(request: web.Request, subscription: TelemetrySubscription) -> web.StreamResponse:
+    response = web.StreamResponse(headers={
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+    })
+    await response.prepare(request)
+    await response.write(f"event: subscribed\ndata: {json.dumps(_subscription_info(subscription))}\n\n".encode())
+    try:
+        while True:
+            samples = await subscription.next_batch(timeout=KEEPALIVE_INTERVAL)
+            if samples:
+                data = json.dumps({"samples": samples}, separators=(",", ":"))
+                await response.write(f"event: telemetry\ndata: {data}\n\n".encode())
+            else:
+                await response.write(b": keepalive\n\n")
+    except ConnectionResetError:
+        pass
+    return response
+
+
+async def _serve_websocket(request: web.Request, subscription: TelemetrySubscription) -> web.WebSocketResponse:
+    """Send telemetry batches; clients may change the subscription with
+    ``{"type": "subscribe", "topics": [...], "sources": [...], "rate": n}``.
+    """
+    ws = web.WebSocketResponse(heartbeat=KEEPALIVE_INTERVAL)
+    await ws.prepare(request)
+    await ws.send_json({"type": "subscribed", **_subscription_info(subscription)})
+
+    async def send_loop() -> None:
+        while not ws.closed:
+            samples = await subscription.next_batch()
+            if samples and not ws.closed:
+                await ws.send_json({"type": "telemetry", "samples": samples})
+
+    sender = asyncio.create_task(send_loop())
+    try:
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            try:
+                message = json.loads(msg.data)
+            except ValueError:
+                await ws.send_json({"type": "error", "code": "INVALID_MESSAGE", "message": "Messages must be JSON"})
+                continue
+            if not isinstance(message, dict) or message.get("type") != "subscribe":
+                await ws.send_json({"type": "error", "code": "UNKNOWN_MESSAGE", "message": "Expected a subscribe message"})
+                continue
+            try:
+                rate = float(message["rate"]) if message.get("rate") is not None else None
+            except (TypeError, ValueError):
+                await ws.send_json({"type": "error", "code": "INVALID_PARAMETER", "message": "rate must be a number"})
+                continue
+            subscription.update(message.get("topics"), message.get("sources"), rate)
+            await ws.send_json({"type": "subscribed", **_subscription_info(subscription)})
+    finally:
+        sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await sender
+    return ws
@@ -1,5 +1,6 @@
 
 from .command_protocol import CommandMessage, StatusMessage, StatusType
+from .ipc_channel import FrameType, FrameWriter
 from .base_handler import BaseCommandHandler
 from .base_slave_mode import BaseSlaveMode
 
@@ -7,6 +8,8 @@ __all__ = [
     'CommandMessage',
     'StatusMessage',
     'StatusType',
+    'FrameType',
+    'FrameWriter',
     'BaseCommandHandler',
     'BaseSlaveMode',
 ]
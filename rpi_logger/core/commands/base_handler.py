@@ -375,6 +375,8 @@ class BaseCommandHandler(ABC):
             pass
 
         # Fallback: directly adjust handler levels on root logger
+        from rpi_logger.core.module_log_manager import ForwardingHandler
+
         level = getattr(logging, level_str, logging.INFO)
         root_logger = logging.getLogger()
 
@@ -389,6 +391,11 @@ class BaseCommandHandler(ABC):
                 handler.setLevel(level)
                 handlers_updated += 1
 
+            # Adjust logs forwarded to the master UI
+            if target in ("ui", "all") and isinstance(handler, ForwardingHandler):
+                handler.setLevel(level)
+                handlers_updated += 1
+
         self.logger.info(
             "Log level updated: level=%s, target=%s, handlers=%d",
             level_str, target, handlers_updated
@@ -1,10 +1,14 @@
 
+import atexit
 import datetime
 import json
+import threading
 from typing import Any, Dict, Optional
 
 from rpi_logger.core.logging_utils import get_module_logger
 
+from .ipc_channel import FrameWriter, writer_from_env
+
 logger = get_module_logger("CommandProtocol")
 
 
@@ -316,6 +320,11 @@ class StatusMessage:
 
     output_stream = None
 
+    # Binary channel to the master (see ipc_channel); opened on first send
+    channel: Optional[FrameWriter] = None
+    _channel_checked = False
+    _channel_lock = threading.Lock()
+
     def __init__(self, raw_json: str):
         self.raw = raw_json.strip()
         self.data = None
@@ -326,10 +335,36 @@ class StatusMessage:
 
         self._parse()
 
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "StatusMessage":
+        """Build a StatusMessage from an already decoded message dict."""
+        message = cls.__new__(cls)
+        message.raw = ""
+        message.data = None
+        message.status_type = None
+        message.timestamp = None
+        message.payload = {}
+        message.valid = False
+        message._load(data)
+        return message
+
     @classmethod
     def configure(cls, output_stream) -> None:
         cls.output_stream = output_stream
 
+    @classmethod
+    def _get_channel(cls) -> Optional[FrameWriter]:
+        if not cls._channel_checked:
+            with cls._channel_lock:
+                if not cls._channel_checked:
+                    # Mark first so anything logged while opening goes to stdout
+                    cls._channel_checked = True
+                    channel = writer_from_env()
+                    if channel is not None:
+                        atexit.register(channel.close)
+                    cls.channel = channel
+        return cls.channel
+
     @staticmethod
     def send(status: str, data: Optional[Dict[str, Any]] = None, command_id: Optional[str] = None) -> None:
         """
@@ -349,6 +384,11 @@ class StatusMessage:
         }
         if command_id:
             message["command_id"] = command_id
+        channel = StatusMessage._get_channel()
+        if channel is not None and not channel.failed:
+            # A dropped batched message is backpressure, not a broken channel
+            if channel.send_status(message) or not channel.failed:
+                return
         output = StatusMessage.output_stream if StatusMessage.output_stream else sys.stdout
         print(json.dumps(message), file=output, flush=True)
 
@@ -393,26 +433,28 @@ class StatusMessage:
 
     def _parse(self) -> None:
         try:
-            self.data = json.loads(self.raw)
-
-            if not isinstance(self.data, dict):
-                logger.warning("Status message is not a dict: %s", self.raw)
-                return
-
-            if self.data.get("type") != "status":
-                logger.debug("Non-status message: %s", self.data.get("type"))
-                return
-
-            self.status_type = self.data.get("status")
-            self.timestamp = self.data.get("timestamp")
-            self.payload = self.data.get("data", {})
-            self.valid = True
-
+            self._load(json.loads(self.raw))
         except json.JSONDecodeError as e:
             logger.warning("Failed to parse JSON status: %s - %s", e, self.raw)
         except Exception as e:
             logger.error("Unexpected error parsing status: %s - %s", e, self.raw)
 
+    def _load(self, data: Any) -> None:
+        self.data = data
+
+        if not isinstance(self.data, dict):
+            logger.warning("Status message is not a dict: %s", self.raw or self.data)
+            return
+
+        if self.data.get("type") != "status":
+            logger.debug("Non-status message: %s", self.data.get("type"))
+            return
+
+        self.status_type = self.data.get("status")
+        self.timestamp = self.data.get("timestamp")
+        self.payload = self.data.get("data", {})
+        self.valid = True
+
     def is_valid(self) -> bool:
         return self.valid
 
@@ -498,6 +540,10 @@ class StatusType:
     # Logging control status
     LOG_LEVEL_CHANGED = "log_level_changed"  # Module log level was changed
     LOG_MESSAGE = "log_message"              # Forwarded log message for master UI
+    LOG_BATCH = "log_batch"                  # Batch of forwarded log records (ForwardingHandler)
+
+    # Live metrics for the master's telemetry bus
+    TELEMETRY = "telemetry"                  # Batch of telemetry samples (TelemetryPublisher)
 
 
 if __name__ == "__main__":
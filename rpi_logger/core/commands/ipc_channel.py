@@ -0,0 +1,288 @@
+"""
+Binary IPC channel between the master and module subprocesses.
+
+Status messages normally travel as JSON lines on the module's stdout, one
+``print(..., flush=True)`` (one write syscall) each, and the master parses
+every line it reads. On POSIX the master also hands each module one end of
+a socketpair (fd number in ``RPI_LOGGER_IPC_FD``); StatusMessage.send then
+writes length-prefixed frames to it instead:
+
+    +----------------+----------+-------------------------+
+    | length (u32 BE)| type (u8)| payload (compact JSON)  |
+    +----------------+----------+-------------------------+
+
+The type byte multiplexes status, log and event traffic so the master can
+route frames without looking inside them. High-rate types (forwarded log
+records, VOG events, preview frames, telemetry) are batched: they are buffered and
+written together every ``batch_interval`` or once ``max_batch_bytes`` is
+reached. Any other status flushes the pending batch and itself at once, so
+ordering is preserved and acks are never delayed.
+
+Backpressure: sends block for at most ``send_timeout`` when the master is
+not reading. While a batch is over ``max_pending_bytes`` further batched
+frames are dropped (and counted) instead of growing without bound; other
+statuses are never dropped.
+
+Modules without the environment variable (Windows, master started with
+``binary_ipc=False``) keep using JSON lines; the master reads both.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger("IpcChannel")
+
+# Environment variable carrying the module's socket fd
+IPC_FD_ENV = "RPI_LOGGER_IPC_FD"
+
+HEADER = struct.Struct("!IB")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+DEFAULT_BATCH_INTERVAL = 0.02
+DEFAULT_MAX_BATCH_BYTES = 64 * 1024
+DEFAULT_MAX_PENDING_BYTES = 1024 * 1024
+DEFAULT_SEND_TIMEOUT = 5.0
+READ_CHUNK_SIZE = 256 * 1024
+
+
+class FrameType:
+    STATUS = 1
+    LOG = 2
+    EVENT = 3
+
+
+# Status types sent as batched frames, and the frame type they travel as
+BATCHED_STATUS_TYPES: Dict[str, int] = {
+    "log_message": FrameType.LOG,
+    "log_batch": FrameType.LOG,
+    "vog_event": FrameType.EVENT,
+    "preview_frame": FrameType.EVENT,
+    "telemetry": FrameType.EVENT,
+}
+
+
+def binary_ipc_supported() -> bool:
+    """True if this platform can pass a socketpair end to a subprocess."""
+    return os.name == "posix" and hasattr(socket, "socketpair")
+
+
+# Reused: json.dumps builds a new encoder per call for non-default separators
+_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+def encode_frame(frame_type: int, message: Dict[str, Any]) -> bytes:
+    """Encode one message as a length-prefixed frame."""
+    payload = _encoder.encode(message).encode("utf-8")
+    return HEADER.pack(len(payload), frame_type) + payload
+
+
+def decode_payload(payload: bytes) -> Dict[str, Any]:
+    # Decoding first skips json's per-call encoding detection for bytes
+    return json.loads(payload.decode("utf-8"))
+
+
+class FrameWriter:
+    """Thread-safe, batching frame writer for the module side of the channel."""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_pending_bytes: int = DEFAULT_MAX_PENDING_BYTES,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT,
+    ):
+        self._sock = sock
+        self._sock.settimeout(send_timeout)
+        self.batch_interval = batch_interval
+        self.max_batch_bytes = max_batch_bytes
+        self.max_pending_bytes = max_pending_bytes
+
+        self._batch = bytearray()
+        self._batch_frames = 0
+        self._batch_lock = threading.Lock()  # Guards _batch
+        self._write_lock = threading.Lock()  # Serializes socket writes
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._failed = False
+        # A forked child must not interleave frames with its parent
+        self._pid = os.getpid()
+
+        self.frames_sent = 0
+        self.writes = 0
+        self.dropped_frames = 0
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="ipc-frame-flusher", daemon=True)
+        self._flusher.start()
+
+    @property
+    def failed(self) -> bool:
+        """True once a write failed or the channel was closed; callers should fall back to stdout."""
+        return self._failed or self._closed or self._pid != os.getpid()
+
+    def send_status(self, message: Dict[str, Any]) -> bool:
+        """Send a StatusMessage dict, batching high-rate status types.
+
+        Returns:
+            False if the message was dropped or the channel is broken
+        """
+        frame_type = BATCHED_STATUS_TYPES.get(message.get("status", ""))
+        if frame_type is None:
+            return self.send(FrameType.STATUS, message)
+        return self.send(frame_type, message, batch=True)
+
+    def send(self, frame_type: int, message: Dict[str, Any], batch: bool = False) -> bool:
+        if self.failed:
+            return False
+        frame = encode_frame(frame_type, message)
+
+        if batch:
+            with self._batch_lock:
+                if len(self._batch) >= self.max_pending_bytes:
+                    self.dropped_frames += 1
+                    return False
+                self._batch += frame
+                self._batch_frames += 1
+                full = len(self._batch) >= self.max_batch_bytes
+            if full:
+                self._wakeup.set()
+            return True
+
+        # Urgent: write the pending batch and this frame now, in order
+        with self._write_lock:
+            with self._batch_lock:
+                data = bytes(self._batch) + frame
+                frames = self._batch_frames + 1
+                self._batch.clear()
+                self._batch_frames = 0
+            return self._write(data, frames)
+
+    def flush(self) -> bool:
+        """Write any batched frames now."""
+        with self._write_lock:
+            with self._batch_lock:
+                if not self._batch:
+                    return True
+                frames = self._batch_frames
+                data = bytes(self._batch)
+                self._batch.clear()
+                self._batch_frames = 0
+            return self._write(data, frames)
+
+    def _write(self, data: bytes, frames: int) -> bool:
+        # Caller holds _write_lock
+        if self.failed:
+            return False
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            # Includes socket.timeout: the master stopped reading
+            self._failed = True
+            return False
+        self.frames_sent += frames
+        self.writes += 1
+        return True
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.batch_interval)
+            self._wakeup.clear()
+            if self._batch:
+                self.flush()
+
+    def close(self) -> None:
+        """Flush pending frames and close the socket."""
+        if self._closed or self._pid != os.getpid():
+            return
+        self.flush()
+        self._closed = True
+        self._wakeup.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=1.0)
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+
+def writer_from_env() -> Optional[FrameWriter]:
+    """Open the module side of the channel if the master provided one.
+
+    The variable is removed so processes this module starts do not mistake
+    an unrelated fd for the channel.
+    """
+    fd_text = os.environ.pop(IPC_FD_ENV, None)
+    if not fd_text:
+        return None
+    try:
+        sock = socket.socket(fileno=int(fd_text))
+    except (ValueError, OSError) as exc:
+        logger.warning("Binary IPC fd %r unusable, using JSON lines: %s", fd_text, exc)
+        return None
+    return FrameWriter(sock)
+
+
+async def read_frames(
+    reader: asyncio.StreamReader,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (frame_type, message) from the master side of the channel until EOF.
+
+    Reads whatever has arrived (up to ``chunk_size``) and decodes every
+    complete frame in it, so a batch costs one read rather than two per frame.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            return
+        buffer += chunk
+        offset = 0
+        while len(buffer) - offset >= HEADER.size:
+            length, frame_type = HEADER.unpack_from(buffer, offset)
+            if length > MAX_FRAME_SIZE:
+                raise ValueError(f"IPC frame of {length} bytes exceeds {MAX_FRAME_SIZE}")
+            end = offset + HEADER.size + length
+            if end > len(buffer):
+                break
+            payload = bytes(buffer[offset + HEADER.size:end])
+            offset = end
+            try:
+                message = decode_payload(payload)
+            except ValueError as exc:
+                logger.warning("Dropping undecodable IPC frame (type %d): %s", frame_type, exc)
+                continue
+            yield frame_type, message
+        del buffer[:offset]
+
+
+def create_channel_pair() -> Tuple[socket.socket, socket.socket]:
+    """Create (master end, module end); the module end is inheritable."""
+    master_sock, module_sock = socket.socketpair()
+    module_sock.set_inheritable(True)
+    return master_sock, module_sock
+
+
+__all__ = [
+    "BATCHED_STATUS_TYPES",
+    "FrameType",
+    "FrameWriter",
+    "HEADER",
+    "IPC_FD_ENV",
+    "MAX_FRAME_SIZE",
+    "binary_ipc_supported",
+    "create_channel_pair",
+    "decode_payload",
+    "encode_frame",
+    "read_frames",
+    "writer_from_env",
+]
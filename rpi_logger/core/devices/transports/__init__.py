@@ -10,15 +10,25 @@ Base Classes:
 Implementations:
     XBeeTransport: Direct XBee serial communication
     XBeeProxyTransport: XBee communication via command protocol proxy
+
+Serial input:
+    SerialReactor: Per-process reader threads timestamping serial lines on arrival
+    LineInbox: Event-loop side buffer a transport drains
+    RawLine: A received line with its host arrival time
 """
 
 from .base_transport import BaseTransport, BaseReadOnlyTransport
+from .serial_reactor import LineInbox, RawLine, SerialReactor, get_serial_reactor
 from .xbee_transport import XBeeTransport
 from .xbee_proxy_transport import XBeeProxyTransport
 
 __all__ = [
     "BaseTransport",
     "BaseReadOnlyTransport",
+    "LineInbox",
+    "RawLine",
+    "SerialReactor",
+    "get_serial_reactor",
     "XBeeTransport",
     "XBeeProxyTransport",
 ]
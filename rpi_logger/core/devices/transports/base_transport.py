@@ -7,8 +7,11 @@ communication. Used by modules that need to send commands to devices (DRT, VOG).
 For read-only transports (like GPS receivers), see BaseReadOnlyTransport.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
+
+from .serial_reactor import RawLine
 
 
 class BaseTransport(ABC):
@@ -22,6 +25,9 @@ class BaseTransport(ABC):
     GPS uses BaseReadOnlyTransport instead since GPS receivers are read-only.
     """
 
+    # Sleep used by the default wait_for_data (transports without a wakeup)
+    POLL_INTERVAL = 0.01
+
     def __init__(self):
         """Initialize the transport."""
         self._connected = False
@@ -71,6 +77,39 @@ class BaseTransport(ABC):
         """
         ...
 
+    async def read_raw_line(self) -> Optional[RawLine]:
+        """
+        Read a line together with its host arrival time.
+
+        The default stamps the line returned by read_line when it is read;
+        transports that see bytes arrive override this with the real
+        arrival time.
+
+        Returns:
+            The line record, or None if no data
+        """
+        line = await self.read_line()
+        if not line:
+            return None
+        return RawLine.now(line.encode('utf-8'), str(getattr(self, 'port', '')))
+
+    async def wait_for_data(self, timeout: float) -> bool:
+        """
+        Wait until read_line may have a line available.
+
+        The default polls: it sleeps for POLL_INTERVAL (at most ``timeout``).
+        Event-driven transports override this to return as soon as a line
+        arrives.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if data may be available
+        """
+        await asyncio.sleep(min(timeout, self.POLL_INTERVAL))
+        return True
+
     async def write_line(self, line: str, ending: str = '\n') -> bool:
         """
         Write a line of text to the device.
@@ -143,6 +182,39 @@ class BaseReadOnlyTransport(ABC):
         """
         ...
 
+    async def read_raw_line(self, timeout: float = 1.0) -> Optional[RawLine]:
+        """
+        Read a line together with its host arrival time.
+
+        The default stamps the line returned by read_line when it is read.
+
+        Args:
+            timeout: Maximum time to wait for data in seconds
+
+        Returns:
+            The line record, or None if timeout/no data
+        """
+        line = await self.read_line(timeout=timeout)
+        if not line:
+            return None
+        return RawLine.now(line.encode('utf-8'), str(getattr(self, 'port', '')))
+
+    async def read_raw_lines(self, timeout: float = 1.0) -> List[RawLine]:
+        """
+        Read every line available, waiting up to ``timeout`` for the first.
+
+        The default returns at most one line from read_raw_line; transports
+        that buffer lines override this to hand over the whole batch.
+
+        Args:
+            timeout: Maximum time to wait for data in seconds
+
+        Returns:
+            Lines in arrival order (empty on timeout)
+        """
+        raw = await self.read_raw_line(timeout=timeout)
+        return [raw] if raw is not None else []
+
     async def __aenter__(self):
         """Async context manager entry."""
         await self.connect()
@@ -0,0 +1,376 @@
+"""
+Serial Reactor
+
+Event-driven line input shared by the serial transports (DRT, VOG, GPS).
+
+Each attached port gets one reader thread that blocks in ``read()`` until
+bytes arrive, stamps them with ``perf_counter_ns``/``time_ns`` right away,
+splits complete lines out of a reusable bytearray and hands every chunk's
+lines to the asyncio loop in one ``call_soon_threadsafe`` batch. An idle
+port costs one blocked thread and no event loop wakeups, and a line's host
+timestamp is taken when its first byte is read rather than whenever the
+handler next polls.
+
+Lines are delivered as RawLine records into a LineInbox, which the
+transport's ``read_raw_line``/``read_line`` drains and whose ``wait``
+replaces the handlers' poll-and-sleep loops. Handlers carry the RawLine
+through to the data loggers, so CSV record times are arrival times.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Maximum partial-line size to prevent memory exhaustion from malformed devices
+MAX_LINE_BUFFER_SIZE = 65536  # 64KB
+
+# Lines kept for a consumer that has stopped reading (oldest dropped first)
+MAX_INBOX_LINES = 4096
+
+# Backoff when read() returns nothing long before its timeout (ports opened
+# with timeout=0, mocks), so the reader thread never spins
+IDLE_READ_INTERVAL = 0.01
+
+
+@dataclass(frozen=True, slots=True)
+class RawLine:
+    """One received line, stamped when its first byte reached the host.
+
+    ``arrival_mono_ns`` is on the ``perf_counter`` clock used for every
+    module's ``record_time_mono``; ``arrival_unix_ns`` is ``time_ns``.
+    """
+
+    data: bytes  # Raw line including its terminator
+    arrival_mono_ns: int
+    arrival_unix_ns: int
+    port: str = ""
+
+    @classmethod
+    def now(cls, data: bytes, port: str = "") -> "RawLine":
+        """Stamp ``data`` with the current time (sources without arrival stamps)."""
+        return cls(data, time.perf_counter_ns(), time.time_ns(), port)
+
+    @property
+    def text(self) -> str:
+        """Decoded line without surrounding whitespace."""
+        return self.data.decode("utf-8", errors="replace").strip()
+
+    @property
+    def arrival_mono(self) -> float:
+        """Arrival time in ``perf_counter`` seconds."""
+        return self.arrival_mono_ns / 1e9
+
+    @property
+    def arrival_unix(self) -> float:
+        """Arrival time in Unix seconds."""
+        return self.arrival_unix_ns / 1e9
+
+    def host_latency_us(self, now_mono_ns: Optional[int] = None) -> float:
+        """Microseconds from arrival until ``now_mono_ns`` (default: now)."""
+        if now_mono_ns is None:
+            now_mono_ns = time.perf_counter_ns()
+        return (now_mono_ns - self.arrival_mono_ns) / 1000.0
+
+
+class LineSplitter:
+    """Incremental newline splitter with per-line arrival timestamps.
+
+    Bytes are appended to one bytearray; the search for newlines resumes
+    where the previous chunk's search stopped, and consumed lines are
+    removed with a single ``del`` per chunk.
+    """
+
+    __slots__ = ("_buffer", "_scan", "_start_mono_ns", "_start_unix_ns", "max_size", "port", "dropped_bytes")
+
+    def __init__(self, max_size: int = MAX_LINE_BUFFER_SIZE, port: str = "") -> None:
+        self._buffer = bytearray()
+        self._scan = 0
+        self._start_mono_ns = 0
+        self._start_unix_ns = 0
+        self.max_size = max_size
+        self.port = port
+        self.dropped_bytes = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes of the current, unterminated line."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes, mono_ns: int, unix_ns: int) -> list[RawLine]:
+        """Add a chunk read at (``mono_ns``, ``unix_ns``); return completed lines.
+
+        Each line carries the arrival time of the chunk its first byte came in.
+        """
+        buffer = self._buffer
+        if not buffer:
+            self._start_mono_ns, self._start_unix_ns = mono_ns, unix_ns
+        buffer += data
+
+        lines: list[RawLine] = []
+        start = 0
+        end = buffer.find(b"\n", self._scan)
+        while end >= 0:
+            lines.append(RawLine(bytes(buffer[start:end + 1]), self._start_mono_ns, self._start_unix_ns, self.port))
+            # Any further line starts inside this chunk
+            self._start_mono_ns, self._start_unix_ns = mono_ns, unix_ns
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+
+        overflow = len(buffer) - self.max_size
+        if overflow > 0:
+            # Keep most recent data, drop oldest
+            del buffer[:overflow]
+            self.dropped_bytes += overflow
+        self._scan = len(buffer)
+        return lines
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self._scan = 0
+
+
+class LineInbox:
+    """Event-loop side of a reactor port: buffered lines plus a wakeup.
+
+    ``deliver`` and ``fail`` run on the event loop (scheduled by the reader
+    thread); everything else is called by the transport.
+    """
+
+    def __init__(self, max_lines: int = MAX_INBOX_LINES) -> None:
+        self._lines: deque[RawLine] = deque()
+        self._max_lines = max_lines
+        self._event = asyncio.Event()
+        self.error: Optional[BaseException] = None
+        self.dropped_lines = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def deliver(self, batch: list[RawLine]) -> None:
+        self._lines.extend(batch)
+        overflow = len(self._lines) - self._max_lines
+        if overflow > 0:
+            for _ in range(overflow):
+                self._lines.popleft()
+            self.dropped_lines += overflow
+            logger.warning("Serial inbox full, dropped %d oldest lines", overflow)
+        self._event.set()
+
+    def fail(self, error: BaseException) -> None:
+        """The reader thread stopped on ``error``; wake any waiter."""
+        self.error = error
+        self._event.set()
+
+    def get_nowait(self) -> Optional[RawLine]:
+        """Oldest buffered line, or None."""
+        return self._lines.popleft() if self._lines else None
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a line (or a reader error).
+
+        Returns:
+            True if a line is buffered or the reader failed
+        """
+        if self._lines or self.error is not None:
+            return True
+        self._event.clear()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return bool(self._lines) or self.error is not None
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self.error = None
+
+
+class _PortReader(threading.Thread):
+    """Blocks in ``serial.read`` and posts each chunk's lines to the loop."""
+
+    def __init__(
+        self,
+        serial_port: Any,
+        loop: asyncio.AbstractEventLoop,
+        inbox: LineInbox,
+        name: str,
+        max_line_size: int,
+    ) -> None:
+        super().__init__(name=f"serial-reader-{name}", daemon=True)
+        self.port_name = name
+        self._serial = serial_port
+        self._loop = loop
+        self._inbox = inbox
+        self._splitter = LineSplitter(max_line_size, name)
+        self._stop_event = threading.Event()
+        self.bytes_read = 0
+        self.lines_read = 0
+        self.batches = 0
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        cancel_read = getattr(self._serial, "cancel_read", None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except Exception:
+                pass
+
+    def run(self) -> None:
+        ser = self._serial
+        timeout = getattr(ser, "timeout", None)
+        min_wait = timeout / 2 if isinstance(timeout, (int, float)) and timeout else 0.0
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                # Block for the first byte, stamp it, then take the rest without waiting
+                data = ser.read(1)
+                if data:
+                    mono_ns = time.perf_counter_ns()
+                    unix_ns = time.time_ns()
+                    waiting = ser.in_waiting
+                    if waiting:
+                        data += ser.read(waiting)
+            except Exception as exc:
+                if not self._stop_event.is_set():
+                    logger.warning("Serial read error on %s: %s", self.port_name, exc)
+                    self._post(self._inbox.fail, exc)
+                return
+
+            if not data:
+                if not min_wait or time.monotonic() - started < min_wait:
+                    self._stop_event.wait(IDLE_READ_INTERVAL)
+                continue
+
+            self.bytes_read += len(data)
+            dropped = self._splitter.dropped_bytes
+            lines = self._splitter.feed(data, mono_ns, unix_ns)
+            if self._splitter.dropped_bytes != dropped:
+                logger.warning(
+                    "Read buffer overflow on %s, dropping %d oldest bytes",
+                    self.port_name, self._splitter.dropped_bytes - dropped,
+                )
+            if lines:
+                self.lines_read += len(lines)
+                self.batches += 1
+                if not self._post(self._inbox.deliver, lines):
+                    return
+
+    def _post(self, callback: Callable[..., None], arg: Any) -> bool:
+        try:
+            self._loop.call_soon_threadsafe(callback, arg)
+            return True
+        except RuntimeError:
+            # Event loop closed underneath us; nobody is listening any more
+            self._stop_event.set()
+            return False
+
+
+class SerialReactor:
+    """Per-process registry of serial reader threads.
+
+    Transports ``attach`` an open port after connecting and ``detach`` it
+    before closing. ``detach`` blocks until the reader thread has exited
+    (at most one read timeout), so call it from a worker thread.
+    """
+
+    def __init__(self) -> None:
+        self._readers: dict[int, _PortReader] = {}
+        self._lock = threading.Lock()
+
+    def attach(
+        self,
+        serial_port: Any,
+        inbox: LineInbox,
+        *,
+        name: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_line_size: int = MAX_LINE_BUFFER_SIZE,
+    ) -> _PortReader:
+        """Start reading ``serial_port`` into ``inbox`` on ``loop``.
+
+        Args:
+            serial_port: Open pyserial-compatible port (blocking ``read``)
+            inbox: Receives line batches on ``loop``
+            name: Port name for logs and the thread name
+            loop: Event loop to deliver to (default: the running loop)
+            max_line_size: Longest partial line kept before dropping bytes
+
+        Returns:
+            Handle to pass to ``detach``
+        """
+        reader = _PortReader(serial_port, loop or asyncio.get_running_loop(), inbox, name, max_line_size)
+        with self._lock:
+            self._readers[id(reader)] = reader
+        reader.start()
+        logger.debug("Serial reader started for %s", name)
+        return reader
+
+    def detach(self, reader: _PortReader, timeout: float = 2.0) -> None:
+        """Stop a reader thread and wait for it to exit."""
+        with self._lock:
+            self._readers.pop(id(reader), None)
+        reader.stop()
+        if reader is not threading.current_thread():
+            reader.join(timeout)
+        if reader.is_alive():
+            logger.warning("Serial reader for %s did not stop within %.1fs", reader.port_name, timeout)
+        else:
+            logger.debug(
+                "Serial reader stopped for %s (%d bytes, %d lines in %d batches)",
+                reader.port_name, reader.bytes_read, reader.lines_read, reader.batches,
+            )
+
+    @property
+    def port_count(self) -> int:
+        with self._lock:
+            return len(self._readers)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Per-port byte, line and batch counters."""
+        with self._lock:
+            readers = list(self._readers.values())
+        return {
+            reader.port_name: {
+                "bytes": reader.bytes_read,
+                "lines": reader.lines_read,
+                "batches": reader.batches,
+            }
+            for reader in readers
+        }
+
+
+_reactor: Optional[SerialReactor] = None
+_reactor_lock = threading.Lock()
+
+
+def get_serial_reactor() -> SerialReactor:
+    """Return the process-wide serial reactor."""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = SerialReactor()
+        return _reactor
+
+
+__all__ = [
+    "IDLE_READ_INTERVAL",
+    "LineInbox",
+    "LineSplitter",
+    "MAX_INBOX_LINES",
+    "MAX_LINE_BUFFER_SIZE",
+    "RawLine",
+    "SerialReactor",
+    "get_serial_reactor",
+]
@@ -14,6 +14,8 @@ import asyncio
 import logging
 from typing import Optional, Callable, Awaitable
 
+from .serial_reactor import RawLine
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +50,8 @@ class XBeeProxyTransport:
         self._connected = False
 
         # Receive buffer - asyncio Queue for async/await compatibility
-        self._receive_buffer: asyncio.Queue[str] = asyncio.Queue(maxsize=self.MAX_BUFFER_SIZE)
+        self._receive_buffer: asyncio.Queue[RawLine] = asyncio.Queue(maxsize=self.MAX_BUFFER_SIZE)
+        self._data_event = asyncio.Event()
         self._dropped_messages = 0
 
     @property
@@ -90,11 +93,27 @@ class XBeeProxyTransport:
 
     async def read_line(self) -> Optional[str]:
         """Read from the receive buffer (non-blocking)."""
+        raw = await self.read_raw_line()
+        return raw.text if raw is not None else None
+
+    async def read_raw_line(self) -> Optional[RawLine]:
+        """Read from the receive buffer with the time the data was pushed."""
         try:
             return self._receive_buffer.get_nowait()
         except asyncio.QueueEmpty:
             return None
 
+    async def wait_for_data(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for pushed data; True if any is buffered."""
+        if not self._receive_buffer.empty():
+            return True
+        self._data_event.clear()
+        try:
+            await asyncio.wait_for(self._data_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return not self._receive_buffer.empty()
+
     async def write_line(self, line: str, ending: str = '\n') -> bool:
         """
         Write a line of text to the device.
@@ -120,8 +139,13 @@ class XBeeProxyTransport:
             data: Raw data string from the device
         """
         stripped = data.strip()
+        if not stripped:
+            return
+        # Stamped on arrival in this process, before any queueing delay
+        raw = RawLine.now(stripped.encode('utf-8'), self.node_id)
+        self._data_event.set()
         try:
-            self._receive_buffer.put_nowait(stripped)
+            self._receive_buffer.put_nowait(raw)
         except asyncio.QueueFull:
             # Buffer full - drop oldest to make room (ring buffer behavior)
             try:
@@ -129,9 +153,9 @@ class XBeeProxyTransport:
                 self._dropped_messages += 1
                 logger.warning(
                     f"Receive buffer full for {self.node_id}, dropped: "
-                    f"'{dropped[:50]}...' (total dropped: {self._dropped_messages})"
+                    f"'{dropped.text[:50]}...' (total dropped: {self._dropped_messages})"
                 )
-                self._receive_buffer.put_nowait(stripped)
+                self._receive_buffer.put_nowait(raw)
             except asyncio.QueueEmpty:
                 pass
 
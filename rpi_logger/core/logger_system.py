@@ -12,7 +12,7 @@ import asyncio
 import time
 from rpi_logger.core.logging_utils import get_module_logger
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Callable, Set, TYPE_CHECKING
 
 from .module_discovery import ModuleInfo
 from .module_process import ModuleState
@@ -27,7 +27,7 @@ from .module_state_manager import (
 from .observers import UIStateObserver
 from .platform_info import get_platform_info
 from .state_facade import StateFacade
-from .commands import StatusMessage, CommandMessage
+from .commands import StatusMessage, CommandMessage, StatusType
 from .window_manager import WindowManager, WindowGeometry
 from rpi_logger.modules.base import gui_utils
 from .config_manager import get_config_manager
@@ -41,6 +41,7 @@ from .devices import (
 )
 from .instance_identity import InstanceIdentity, MULTI_INSTANCE_MODULES
 from .device_connection_coordinator import DeviceConnectionCoordinator
+from .telemetry import TelemetryBus
 
 if TYPE_CHECKING:
     from .event_logger import EventLogger
@@ -80,6 +81,10 @@ class LoggerSystem:
         self.session_prefix = session_prefix
         self.log_level = log_level
         self.ui_callback = ui_callback
+        # Receives (instance_id, log_batch payload) forwarded by modules; set by the UI
+        self.module_log_sink: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        # Live module metrics for API streaming clients
+        self.telemetry = TelemetryBus()
 
         # Create the centralized state manager
         self.state_manager = ModuleStateManager()
@@ -253,6 +258,23 @@ class LoggerSystem:
         module_name = process.module_info.name
         effective_id = instance_id or module_name
 
+        if status and status.get_status_type() == StatusType.LOG_BATCH:
+            # High-rate and UI-only: hand straight to the log panel buffer
+            if self.module_log_sink:
+                try:
+                    self.module_log_sink(effective_id, status.get_payload())
+                except Exception as e:
+                    self.logger.error("Module log sink error: %s", e)
+            return
+
+        if status and status.get_status_type() == StatusType.TELEMETRY:
+            # High-rate and API-only: no state changes, no UI callback
+            try:
+                self.telemetry.ingest(effective_id, status.get_payload())
+            except Exception as e:
+                self.logger.error("Telemetry ingest error: %s", e)
+            return
+
         if status:
             if status.get_status_type() == "recording_started":
                 self.logger.info("Module %s started recording", module_name)
@@ -267,6 +289,7 @@ class LoggerSystem:
             elif status.get_status_type() == "quitting":
                 self.logger.info("Module/instance quitting: %s", effective_id)
                 self._gracefully_quitting_modules.add(effective_id)
+                self.telemetry.forget_source(effective_id)
 
                 # Route to instance manager for state tracking
                 self.instance_manager.on_status_message(
@@ -5,7 +5,8 @@ This provides centralized logging management for modules, enabling:
 1. Dynamic log level changes via commands from master
 2. File logging always at DEBUG (full capture for diagnostics)
 3. Console/UI logging at user-controllable levels
-4. Optional log forwarding to master for unified UI display
+4. Optional log forwarding to master for unified UI display, batched and
+   rate limited off the logging thread (see ForwardingHandler)
 
 Architecture:
     Master Process                    Module Subprocess
@@ -18,40 +19,227 @@ Architecture:
 """
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 from rpi_logger.core.logging_config import LOG_FORMAT, LOG_DATEFMT
 from rpi_logger.core.logging_utils import get_module_logger
 
 logger = get_module_logger("ModuleLogManager")
 
+# Forwarding defaults (per module)
+FORWARD_BATCH_INTERVAL = 0.25      # Seconds between batches sent to master
+FORWARD_QUEUE_SIZE = 10000         # Records buffered before emit() starts dropping
+FORWARD_RATE_LIMIT = 50.0          # Sustained records/s forwarded
+FORWARD_BURST = 200                # Records forwarded back-to-back before limiting
+FORWARD_REPEAT_WINDOW = 1.0        # Seconds identical records are collapsed over
 
-class ForwardingHandler(logging.Handler):
+# (created, levelno, levelname, logger name, formatted message)
+_QueuedRecord = Tuple[float, int, str, str, str]
+
+
+class TokenBucket:
+    """Token bucket rate limiter: ``rate`` tokens/s, at most ``burst`` saved."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last = clock()
+
+    def take(self) -> bool:
+        """Consume one token; False if none are available."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+def _send_log_batch(payload: Dict[str, Any]) -> None:
+    from rpi_logger.core.commands import StatusMessage, StatusType
+    StatusMessage.send(StatusType.LOG_BATCH, payload)
+
+
+class ForwardingHandler(QueueHandler):
     """Handler that forwards log records to master via StatusMessage.
 
     This enables centralized log viewing in the master's UI panel.
     The handler respects its level setting for filtering.
+
+    ``emit`` only formats the record and puts it on a bounded queue, so the
+    thread that logs (capture and encode workers included) never waits on
+    the pipe to the master; a full queue drops the record. A sender thread
+    sends what has queued every ``batch_interval`` as one ``log_batch``
+    status, after:
+
+    - collapsing identical records: the first is sent, repeats within
+      ``repeat_window`` are counted and sent as one "(×N in last 1 s)" record
+    - a token-bucket rate limit (ERROR and above are never limited)
+
+    A repeat window opens only when a record is actually sent, so a record
+    the rate limit rejected does not turn later copies into "repeats" of
+    something the master never saw. Each batch carries the number of
+    records dropped on a full queue and, separately, the number throttled
+    by the rate limit since the last batch.
     """
 
-    def __init__(self, module_id: str, level: int = logging.INFO):
-        super().__init__(level)
+    def __init__(
+        self,
+        module_id: str,
+        level: int = logging.INFO,
+        batch_interval: float = FORWARD_BATCH_INTERVAL,
+        max_queue: int = FORWARD_QUEUE_SIZE,
+        rate_limit: float = FORWARD_RATE_LIMIT,
+        burst: int = FORWARD_BURST,
+        repeat_window: float = FORWARD_REPEAT_WINDOW,
+        send: Optional[Callable[[Dict[str, Any]], None]] = None,
+        start: bool = True,
+    ):
+        super().__init__(queue.Queue(max_queue))
+        self.setLevel(level)
         self.module_id = module_id
+        self.batch_interval = batch_interval
+        self.repeat_window = repeat_window
         self.setFormatter(logging.Formatter("%(name)s | %(message)s"))
 
-    def emit(self, record: logging.LogRecord) -> None:
+        self._send = send or _send_log_batch
+        self._bucket = TokenBucket(rate_limit, burst)
+        # (levelno, name, message) -> [first seen, repeats since, levelname]
+        self._repeats: Dict[Tuple[int, str, str], List[Any]] = {}
+        self._drop_lock = threading.Lock()
+        self._dropped = 0
+        self.dropped_total = 0
+        self.throttled_total = 0
+        self.batches_sent = 0
+
+        self._stop_event = threading.Event()
+        self._sender: Optional[threading.Thread] = None
+        if start:
+            self._sender = threading.Thread(target=self._send_loop, name="log-forwarder", daemon=True)
+            self._sender.start()
+
+    def prepare(self, record: logging.LogRecord) -> _QueuedRecord:
+        return (record.created, record.levelno, record.levelname, record.name, self.format(record))
+
+    def enqueue(self, record: _QueuedRecord) -> None:
         try:
-            from rpi_logger.core.commands import StatusMessage
-            StatusMessage.send("log_message", {
-                "level": record.levelname,
-                "logger_name": record.name,
-                "message": self.format(record),
-                "module_id": self.module_id,
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._count_dropped(1)
+
+    def handleError(self, record: logging.LogRecord) -> None:
+        pass  # Never let logging crash the module
+
+    def _count_dropped(self, count: int) -> None:
+        with self._drop_lock:
+            self._dropped += count
+            self.dropped_total += count
+
+    def _send_loop(self) -> None:
+        while not self._stop_event.wait(self.batch_interval):
+            self.flush_batch()
+
+    def flush_batch(self, now: Optional[float] = None, final: bool = False) -> Optional[Dict[str, Any]]:
+        """Send everything queued so far as one batch.
+
+        Args:
+            now: Current Unix time (default: ``time.time()``)
+            final: Also send the repeat counts of windows still open
+
+        Returns:
+            The batch payload sent, or None if there was nothing to send
+        """
+        now = time.time() if now is None else now
+        records: List[Dict[str, Any]] = []
+        throttled = 0
+
+        while True:
+            try:
+                created, levelno, levelname, name, message = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            key = (levelno, name, message)
+            repeat = self._repeats.get(key)
+            if repeat is not None and created - repeat[0] < self.repeat_window:
+                repeat[1] += 1
+                continue
+            if levelno < logging.ERROR and not self._bucket.take():
+                # Not sent, so it must not open (or restart) a repeat window
+                throttled += 1
+                continue
+            if repeat is not None and repeat[1]:
+                records.append(self._summary(key, repeat))
+            self._repeats[key] = [created, 0, levelname]
+            records.append({
+                "level": levelname,
+                "logger_name": name,
+                "message": message,
+                "created": created,
             })
+
+        for key, repeat in list(self._repeats.items()):
+            if final or now - repeat[0] >= self.repeat_window:
+                del self._repeats[key]
+                if repeat[1]:
+                    records.append(self._summary(key, repeat))
+
+        self.throttled_total += throttled
+        with self._drop_lock:
+            dropped, self._dropped = self._dropped, 0
+
+        if not records and not dropped and not throttled:
+            return None
+        payload = {
+            "module_id": self.module_id,
+            "records": records,
+            "dropped": dropped,
+            "throttled": throttled,
+        }
+        try:
+            self._send(payload)
+            self.batches_sent += 1
         except Exception:
             pass  # Never let logging crash the module
+        return payload
+
+    def _summary(self, key: Tuple[int, str, str], repeat: List[Any]) -> Dict[str, Any]:
+        _, name, message = key
+        return {
+            "level": repeat[2],
+            "logger_name": name,
+            "message": f"{message} (×{repeat[1]} in last {self.repeat_window:g} s)",
+            "created": repeat[0],
+            "repeat": repeat[1],
+        }
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._sender is not None and self._sender is not threading.current_thread():
+            self._sender.join(timeout=2.0)
+        self._sender = None
+        self.flush_batch(final=True)
+        super().close()
+
+
+def install_forwarding_handler(module_id: str, level: int = logging.INFO) -> ForwardingHandler:
+    """Attach a ForwardingHandler to the root logger (replacing any existing one)."""
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, ForwardingHandler):
+            root_logger.removeHandler(handler)
+            handler.close()
+    handler = ForwardingHandler(module_id, level)
+    root_logger.addHandler(handler)
+    return handler
 
 
 class ModuleLogManager:
@@ -155,6 +343,7 @@ class ModuleLogManager:
         """Disable log forwarding to master UI."""
         if self._forwarding_handler is not None:
             logging.getLogger().removeHandler(self._forwarding_handler)
+            self._forwarding_handler.close()
             self._forwarding_handler = None
             self._forwarding_enabled = False
             logger.debug("Log forwarding disabled")
@@ -220,6 +409,7 @@ class ModuleLogManager:
 
         if self._forwarding_handler:
             root_logger.removeHandler(self._forwarding_handler)
+            self._forwarding_handler.close()
             self._forwarding_handler = None
 
     @property
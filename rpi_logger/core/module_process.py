@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Awaitable, Callable, Optional
 
 from .commands import CommandMessage, StatusMessage, StatusType
+from .commands.ipc_channel import IPC_FD_ENV, binary_ipc_supported, create_channel_pair, read_frames
 from .module_discovery import ModuleInfo
 from .config_manager import get_config_manager
 from .platform_info import get_platform_info
@@ -39,6 +40,7 @@ class ModuleProcess:
         instance_id: Optional[str] = None,
         config_path: Optional[Path] = None,
         camera_index: Optional[int] = None,
+        binary_ipc: bool = True,
     ):
         self.module_info = module_info
         self.output_dir = Path(output_dir)
@@ -49,6 +51,8 @@ class ModuleProcess:
         self.instance_id = instance_id
         self.config_path = config_path
         self.camera_index = camera_index
+        # Offer the module a framed socket channel for status (JSON lines on stdout still work)
+        self.binary_ipc = binary_ipc and binary_ipc_supported()
 
         self.logger = get_module_logger(f"ModuleProcess.{module_info.name}")
 
@@ -62,6 +66,9 @@ class ModuleProcess:
         self.stderr_task: Optional[asyncio.Task] = None
         self.monitor_task: Optional[asyncio.Task] = None
         self.stdin_task: Optional[asyncio.Task] = None
+        self.ipc_task: Optional[asyncio.Task] = None
+        self._ipc_socket = None
+        self._ipc_writer: Optional[asyncio.StreamWriter] = None
 
         # Bounded queue to prevent memory exhaustion (100 commands should be plenty)
         self.command_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
@@ -155,13 +162,26 @@ class ModuleProcess:
                 
             env['PYTHONPATH'] = os.pathsep.join(paths_to_add)
 
-            self.process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=env,
-            )
+            pass_fds = ()
+            module_socket = None
+            if self.binary_ipc:
+                self._ipc_socket, module_socket = create_channel_pair()
+                env[IPC_FD_ENV] = str(module_socket.fileno())
+                pass_fds = (module_socket.fileno(),)
+
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    pass_fds=pass_fds,
+                )
+            finally:
+                # The child has its own copy; EOF on our end then means it exited
+                if module_socket is not None:
+                    module_socket.close()
 
             self.logger.info("Process started with PID: %d", self.process.pid)
 
@@ -169,11 +189,14 @@ class ModuleProcess:
             self.stderr_task = asyncio.create_task(self._stderr_reader())
             self.monitor_task = asyncio.create_task(self._process_monitor())
             self.stdin_task = asyncio.create_task(self._stdin_writer())
+            if self._ipc_socket is not None:
+                self.ipc_task = asyncio.create_task(self._ipc_reader())
 
             self._was_forcefully_stopped = False
             return True
 
         except Exception as e:
+            self._close_ipc_channel()
             self.logger.error("Failed to start process: %s", e, exc_info=True)
             self.state = ModuleState.ERROR
             self.error_message = str(e)
@@ -224,6 +247,33 @@ class ModuleProcess:
         except Exception as e:
             self.logger.error("stdout reader error: %s", e, exc_info=True)
 
+    async def _ipc_reader(self) -> None:
+        """Read framed status messages from the binary channel."""
+        if self._ipc_socket is None:
+            return
+
+        try:
+            reader, self._ipc_writer = await asyncio.open_connection(sock=self._ipc_socket)
+            async for _frame_type, data in read_frames(reader):
+                if self.shutdown_event.is_set():
+                    break
+                status = StatusMessage.from_data(data)
+                if status.is_valid():
+                    await self._handle_status(status)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error("IPC reader error: %s", e, exc_info=True)
+
+    def _close_ipc_channel(self) -> None:
+        if self._ipc_writer is not None:
+            self._ipc_writer.close()
+        elif self._ipc_socket is not None:
+            self._ipc_socket.close()
+        self._ipc_writer = None
+        self._ipc_socket = None
+
     async def _stderr_reader(self) -> None:
         if not self.process or not self.process.stderr:
             return
@@ -505,7 +555,7 @@ class ModuleProcess:
 
     async def _cleanup_reader_tasks(self) -> None:
         """Clean up reader tasks with proper error handling."""
-        for task in [self.stdout_task, self.stderr_task, self.monitor_task, self.stdin_task]:
+        for task in [self.stdout_task, self.stderr_task, self.monitor_task, self.stdin_task, self.ipc_task]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -521,6 +571,8 @@ class ModuleProcess:
         On Windows, asyncio subprocess transports need explicit cleanup to avoid
         'ValueError: I/O operation on closed pipe' during garbage collection.
         """
+        self._close_ipc_channel()
+
         if not self.process:
             return
 
@@ -0,0 +1,372 @@
+"""
+Telemetry - live metric samples from modules to the master and its API.
+
+Module side (subprocess):
+    TelemetryPublisher keeps the latest sample per topic. Hot paths either
+    ``publish`` a sample (a dict update, coalesced until the next send) or
+    ``register`` a provider the sender thread polls, so nothing runs in the
+    capture/audio callbacks at all. Every ``interval`` the pending samples
+    go to the master as one ``telemetry`` status, a batched EVENT frame on
+    the binary IPC channel.
+
+Master side:
+    TelemetryBus stores the latest sample per (source, topic) and offers
+    each new sample to the matching TelemetrySubscription. Subscriptions
+    coalesce (a newer sample replaces an undelivered one) and decimate (each
+    (source, topic) is delivered at most ``max_rate`` times per second), so
+    a slow dashboard costs a bounded amount of memory and bandwidth.
+
+Sample format (module -> master -> client)::
+
+    {"topic": "audio.levels", "source": "Audio:hw_1_0", "t": 1700000000.1,
+     "values": {"rms_db": -32.1, "peak_db": -12.0}}
+
+Topics are dotted names (``audio.levels``, ``camera.metrics``,
+``eyetracker.gaze``, ``gps.fix``, ``drt.trial``); subscriptions match them
+with shell-style patterns (``audio.*``). Telemetry is "latest value"
+data: a subscriber that asks for fewer updates than a module produces
+sees the most recent sample, not every sample.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger("Telemetry")
+
+# Seconds between telemetry batches sent by a module
+PUBLISH_INTERVAL = 0.1
+# Default and upper bound of per-topic deliveries/s to a subscriber
+DEFAULT_SUBSCRIBER_RATE = 5.0
+MAX_SUBSCRIBER_RATE = 30.0
+
+Sample = Dict[str, Any]
+Provider = Callable[[], Optional[Dict[str, Any]]]
+
+
+def _send_telemetry(payload: Dict[str, Any]) -> None:
+    from rpi_logger.core.commands import StatusMessage, StatusType
+    StatusMessage.send(StatusType.TELEMETRY, payload)
+
+
+# =============================================================================
+# Module side
+# =============================================================================
+
+
+class TelemetryPublisher:
+    """Coalescing, rate-bounded sender of a module's telemetry samples.
+
+    Thread-safe: ``publish`` may be called from any thread.
+    """
+
+    def __init__(
+        self,
+        source_id: str,
+        interval: float = PUBLISH_INTERVAL,
+        send: Optional[Callable[[Dict[str, Any]], None]] = None,
+        start: bool = True,
+    ):
+        self.source_id = source_id
+        self.interval = interval
+        self._send = send or _send_telemetry
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._providers: Dict[str, Provider] = {}
+        self.samples_coalesced = 0
+        self.batches_sent = 0
+
+        self._stop_event = threading.Event()
+        self._sender: Optional[threading.Thread] = None
+        if start:
+            self._sender = threading.Thread(target=self._send_loop, name="telemetry-publisher", daemon=True)
+            self._sender.start()
+
+    def publish(self, topic: str, values: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        """Queue the newest sample of ``topic``; replaces an unsent older one."""
+        sample = (time.time() if timestamp is None else timestamp, values)
+        with self._lock:
+            if topic in self._pending:
+                self.samples_coalesced += 1
+            self._pending[topic] = sample
+
+    def register(self, topic: str, provider: Provider) -> None:
+        """Poll ``provider`` once per interval; a None result sends nothing."""
+        with self._lock:
+            self._providers[topic] = provider
+
+    def unregister(self, topic: str) -> None:
+        with self._lock:
+            self._providers.pop(topic, None)
+
+    def _send_loop(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.flush()
+
+    def flush(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Send the pending samples (and polled providers) as one batch.
+
+        Returns:
+            The payload sent, or None if there was nothing to send
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            providers = list(self._providers.items())
+
+        for topic, provider in providers:
+            try:
+                values = provider()
+            except Exception as exc:
+                logger.debug("Telemetry provider %s failed: %s", topic, exc)
+                continue
+            if values is not None:
+                pending[topic] = (now, values)
+
+        if not pending:
+            return None
+        payload = {
+            "source": self.source_id,
+            "samples": [
+                {"topic": topic, "t": timestamp, "values": values}
+                for topic, (timestamp, values) in pending.items()
+            ],
+        }
+        try:
+            self._send(payload)
+            self.batches_sent += 1
+        except Exception:
+            pass  # Telemetry must never break the module
+        return payload
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._sender is not None and self._sender is not threading.current_thread():
+            self._sender.join(timeout=2.0)
+        self._sender = None
+        self.flush()
+
+
+_publisher: Optional[TelemetryPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def install_telemetry_publisher(source_id: str, **kwargs: Any) -> TelemetryPublisher:
+    """Start this process's publisher (replacing any existing one)."""
+    global _publisher
+    with _publisher_lock:
+        if _publisher is not None:
+            _publisher.close()
+        _publisher = TelemetryPublisher(source_id, **kwargs)
+        return _publisher
+
+
+def get_telemetry_publisher() -> Optional[TelemetryPublisher]:
+    """This process's publisher; None unless running under the master."""
+    return _publisher
+
+
+def publish_telemetry(topic: str, values: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+    """Publish a sample if a publisher is installed; a no-op otherwise."""
+    publisher = _publisher
+    if publisher is not None:
+        publisher.publish(topic, values, timestamp)
+
+
+def register_telemetry(topic: str, provider: Provider) -> None:
+    """Register a polled provider if a publisher is installed."""
+    publisher = _publisher
+    if publisher is not None:
+        publisher.register(topic, provider)
+
+
+def unregister_telemetry(topic: str) -> None:
+    publisher = _publisher
+    if publisher is not None:
+        publisher.unregister(topic)
+
+
+# =============================================================================
+# Master side
+# =============================================================================
+
+
+def _sample_matches(sample: Sample, topics: Tuple[str, ...], sources: Optional[Tuple[str, ...]]) -> bool:
+    if sources is not None and sample["source"] not in sources:
+        return False
+    return any(fnmatch.fnmatchcase(sample["topic"], pattern) for pattern in topics)
+
+
+class TelemetrySubscription:
+    """One client's view of the bus: topic/source filter plus a rate bound.
+
+    Must be used from the event loop that feeds the bus.
+    """
+
+    def __init__(
+        self,
+        topics: Iterable[str] = ("*",),
+        sources: Optional[Iterable[str]] = None,
+        max_rate: float = DEFAULT_SUBSCRIBER_RATE,
+    ):
+        self._pending: Dict[Tuple[str, str], Sample] = {}
+        self._last_sent: Dict[Tuple[str, str], float] = {}
+        self._wakeup = asyncio.Event()
+        self.topics: Tuple[str, ...] = ("*",)
+        self.sources: Optional[Tuple[str, ...]] = None
+        self.max_rate = DEFAULT_SUBSCRIBER_RATE
+        self.samples_delivered = 0
+        self.samples_coalesced = 0
+        self.update(topics, sources, max_rate)
+
+    def update(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """Change the filter or rate; unspecified arguments keep their value."""
+        if topics is not None:
+            self.topics = tuple(topics) or ("*",)
+        if sources is not None:
+            self.sources = tuple(sources) or None
+        if max_rate is not None:
+            self.max_rate = min(max(float(max_rate), 0.1), MAX_SUBSCRIBER_RATE)
+        self._pending = {key: sample for key, sample in self._pending.items() if self.matches(sample)}
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.max_rate
+
+    def matches(self, sample: Sample) -> bool:
+        return _sample_matches(sample, self.topics, self.sources)
+
+    def offer(self, sample: Sample) -> None:
+        key = (sample["source"], sample["topic"])
+        if key in self._pending:
+            self.samples_coalesced += 1
+        self._pending[key] = sample
+        self._wakeup.set()
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Sample]:
+        """Wait for samples that are due under the rate bound.
+
+        Returns:
+            The due samples, or an empty list once ``timeout`` expires
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            now = loop.time()
+            ready: List[Sample] = []
+            next_due: Optional[float] = None
+            for key in list(self._pending):
+                due = self._last_sent.get(key, 0.0) + self.interval
+                if due <= now:
+                    ready.append(self._pending.pop(key))
+                    self._last_sent[key] = now
+                elif next_due is None or due < next_due:
+                    next_due = due
+            if ready:
+                self.samples_delivered += len(ready)
+                return ready
+
+            wake_at = next_due
+            if deadline is not None:
+                if now >= deadline:
+                    return []
+                wake_at = deadline if wake_at is None else min(wake_at, deadline)
+            self._wakeup.clear()
+            try:
+                if wake_at is None:
+                    await self._wakeup.wait()
+                else:
+                    await asyncio.wait_for(self._wakeup.wait(), max(wake_at - now, 0.0))
+            except asyncio.TimeoutError:
+                pass
+
+
+class TelemetryBus:
+    """Latest telemetry per (source, topic) and fan-out to subscriptions."""
+
+    def __init__(self) -> None:
+        self._latest: Dict[Tuple[str, str], Sample] = {}
+        self._subscriptions: List[TelemetrySubscription] = []
+        self.samples_received = 0
+
+    def ingest(self, source: str, payload: Dict[str, Any]) -> None:
+        """Take a module's ``telemetry`` status payload."""
+        for raw in payload.get("samples") or ():
+            topic = raw.get("topic")
+            if not topic:
+                continue
+            self.publish(source, topic, raw.get("values") or {}, raw.get("t"))
+
+    def publish(self, source: str, topic: str, values: Dict[str, Any], timestamp: Optional[float] = None) -> None:
+        sample = {
+            "topic": topic,
+            "source": source,
+            "t": time.time() if timestamp is None else timestamp,
+            "values": values,
+        }
+        self._latest[(source, topic)] = sample
+        self.samples_received += 1
+        for subscription in self._subscriptions:
+            if subscription.matches(sample):
+                subscription.offer(sample)
+
+    def latest(self, topics: Iterable[str] = ("*",), sources: Optional[Iterable[str]] = None) -> List[Sample]:
+        """Most recent sample of every matching (source, topic)."""
+        topics = tuple(topics) or ("*",)
+        sources = tuple(sources) if sources else None
+        return [sample for sample in self._latest.values() if _sample_matches(sample, topics, sources)]
+
+    def subscribe(
+        self,
+        topics: Iterable[str] = ("*",),
+        sources: Optional[Iterable[str]] = None,
+        max_rate: float = DEFAULT_SUBSCRIBER_RATE,
+        replay: bool = True,
+    ) -> TelemetrySubscription:
+        """Add a subscription; ``replay`` queues the current latest samples."""
+        subscription = TelemetrySubscription(topics, sources, max_rate)
+        self._subscriptions.append(subscription)
+        if replay:
+            for sample in self._latest.values():
+                if subscription.matches(sample):
+                    subscription.offer(sample)
+        return subscription
+
+    def unsubscribe(self, subscription: TelemetrySubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def forget_source(self, source: str) -> None:
+        """Drop the latest samples of a module instance that stopped."""
+        for key in [key for key in self._latest if key[0] == source]:
+            del self._latest[key]
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+
+__all__ = [
+    "DEFAULT_SUBSCRIBER_RATE",
+    "MAX_SUBSCRIBER_RATE",
+    "PUBLISH_INTERVAL",
+    "TelemetryBus",
+    "TelemetryPublisher",
+    "TelemetrySubscription",
+    "get_telemetry_publisher",
+    "install_telemetry_publisher",
+    "publish_telemetry",
+    "register_telemetry",
+    "unregister_telemetry",
+]
@@ -1,6 +1,7 @@
 
 import asyncio
 import logging
+import time
 from collections import deque
 from concurrent.futures import Future
 from rpi_logger.core.logging_config import LOG_FORMAT, LOG_DATEFMT
@@ -135,6 +136,39 @@ class TextHandler(logging.Handler):
         except Exception:
             pass  # Silent: logging should never crash the app
 
+    def ingest_module_batch(self, module_id: str, payload: dict) -> None:
+        """Buffer a module's forwarded ``log_batch`` for the next flush.
+
+        Called from the asyncio thread; like ``emit`` it only appends to the
+        buffer, so a batch costs no Tk work until the periodic flush.
+        """
+        if self._closed:
+            return
+        try:
+            ui_level = self._ui_filter.ui_level
+            lines = []
+            for record in payload.get("records", ()):
+                levelname = record.get("level", "INFO")
+                levelno = logging.getLevelName(levelname)
+                if isinstance(levelno, int) and levelno < ui_level:
+                    continue
+                asctime = time.strftime(LOG_DATEFMT, time.localtime(record.get("created", time.time())))
+                lines.append(f"{asctime} | {levelname:<8} | {module_id} | {record.get('message', '')}\n")
+
+            dropped = payload.get("dropped", 0)
+            if dropped:
+                lines.append(f"[... {module_id}: {dropped} log records dropped (queue full) ...]\n")
+            throttled = payload.get("throttled", 0)
+            if throttled:
+                lines.append(f"[... {module_id}: {throttled} log records throttled (rate limiting) ...]\n")
+
+            overflow = len(self._buffer) + len(lines) - self._buffer.maxlen
+            if overflow > 0:
+                self._dropped_count += min(overflow, len(self._buffer) + len(lines))
+            self._buffer.extend(lines)
+        except Exception:
+            pass  # Silent: logging should never crash the app
+
     def start_flush_timer(self) -> None:
         """Start the periodic flush timer. Must be called from main thread."""
         if not self._flush_scheduled and not self._closed:
@@ -831,6 +865,9 @@ class MainWindow:
         app_logger = logging.getLogger('rpi_logger')
         app_logger.addHandler(self.log_handler)
 
+        # Module logs arrive as batches and share the same buffer and flush
+        self.logger_system.module_log_sink = self.log_handler.ingest_module_batch
+
         # Start the periodic flush timer (must be on main thread)
         self.log_handler.start_flush_timer()
 
@@ -838,6 +875,7 @@ class MainWindow:
 
     def cleanup_log_handler(self) -> None:
         if self.log_handler:
+            self.logger_system.module_log_sink = None
             self.log_handler.close()
             app_logger = logging.getLogger('rpi_logger')
             app_logger.removeHandler(self.log_handler)
@@ -156,10 +156,12 @@ class AudioApiMixin:
         """Get current audio input levels.
 
         Returns the current RMS and peak audio levels in dB for the active
-        audio device. Uses module command to query the running module.
+        audio device, from the ``audio.levels`` telemetry the module
+        publishes (about 10 times per second while its stream is open).
 
         Returns:
-            Dict with 'rms_db', 'peak_db', and 'has_device' fields.
+            Dict with 'rms_db', 'peak_db', and 'has_device' fields, plus
+            'devices' with one entry per audio instance.
         """
         # Check if Audio module is running
         if not self.logger_system.is_module_running("Audio"):
@@ -170,27 +172,26 @@ class AudioApiMixin:
                 "message": "Audio module not running",
             }
 
-        # Send get_status command to the audio module to get current levels
-        # The module tracks levels internally via LevelMeter
-        result = await self.send_module_command("Audio", "get_status")
-
-        if not result.get("success"):
+        samples = self.logger_system.telemetry.latest(("audio.levels",))
+        if not samples:
             return {
                 "has_device": False,
                 "rms_db": None,
                 "peak_db": None,
-                "message": "Failed to get audio status",
+                "message": "No audio levels received (no input stream open)",
             }
 
-        # The status command triggers a status report from the module
-        # For now, return a response indicating the command was sent
-        # In a full implementation, we would capture the status response
+        devices = [
+            {"instance_id": sample["source"], "timestamp": sample["t"], **sample["values"]}
+            for sample in samples
+        ]
+        first = devices[0]
         return {
             "has_device": True,
-            "rms_db": None,  # Would be populated from module response
-            "peak_db": None,  # Would be populated from module response
-            "message": "Level query sent to module",
-            "note": "Real-time levels available via status callback",
+            "rms_db": first.get("rms_db"),
+            "peak_db": first.get("peak_db"),
+            "timestamp": first.get("timestamp"),
+            "devices": devices,
         }
 
     async def get_audio_status(self) -> Dict[str, Any]:
@@ -50,6 +50,10 @@ class AudioApp:
             settings.sample_rate,
             settings.recorder_start_timeout,
             settings.recorder_stop_timeout,
+            preroll_seconds=settings.preroll_seconds,
+            preroll_max_bytes=settings.preroll_max_mb * 1024 * 1024,
+            channels=settings.channels,
+            data_format=settings.data_format,
         )
         self.session_service = SessionService(
             settings.output_dir,
@@ -20,6 +20,9 @@ class DeviceManager:
             self.logger.warning("Device %s (%d) failed to start streaming", device.name, device.device_id)
             self.state.clear_device()
             return False
+        recorder = self.recorder_service.recorder
+        if recorder and recorder.channels > 1:
+            self.state.set_channel_meters(recorder.channel_meters, tuple(ch + 1 for ch in recorder.channel_map))
         self.logger.info("Device %s (%d) enabled", device.name, device.device_id)
         return True
 
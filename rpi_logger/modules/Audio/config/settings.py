@@ -7,8 +7,11 @@ from pathlib import Path
 from typing import Any, Mapping
 
 from rpi_logger.cli.common import add_common_cli_arguments
+from rpi_logger.modules.base.columnar import DATA_FORMATS, normalize_data_format
 from rpi_logger.modules.base.preferences import ScopedPreferences
 
+from ..domain import parse_channel_spec
+
 
 @dataclass(slots=True)
 class AudioSettings:
@@ -19,11 +22,15 @@ class AudioSettings:
     log_file: Path | None = None
     enable_commands: bool = False
     sample_rate: int = 48_000
+    channels: str = "1"  # Device channels to record, 1-based in file order ("1,2,4", "1-4", "all")
     console_output: bool = False
     meter_refresh_interval: float = 0.08
     recorder_start_timeout: float = 3.0
     recorder_stop_timeout: float = 2.0
     shutdown_timeout: float = 15.0
+    preroll_seconds: float = 0.0  # Audio kept from before each record command (0 = off)
+    preroll_max_mb: int = 16
+    data_format: str = "csv"  # Timing data: csv | npy (columnar sidecar)
 
     @classmethod
     def from_args(cls, args: Any) -> "AudioSettings":
@@ -43,11 +50,15 @@ class AudioSettings:
             log_file=getattr(args, "log_file", None),
             enable_commands=bool(_get("enable_commands", d.enable_commands)),
             sample_rate=int(_get("sample_rate", d.sample_rate)),
+            channels=str(_get("channels", d.channels)),
             console_output=bool(_get("console_output", d.console_output)),
             meter_refresh_interval=float(_get("meter_refresh_interval", d.meter_refresh_interval)),
             recorder_start_timeout=float(_get("recorder_start_timeout", d.recorder_start_timeout)),
             recorder_stop_timeout=float(_get("recorder_stop_timeout", d.recorder_stop_timeout)),
             shutdown_timeout=float(_get("shutdown_timeout", d.shutdown_timeout)),
+            preroll_seconds=float(_get("preroll_seconds", d.preroll_seconds)),
+            preroll_max_mb=int(_get("preroll_max_mb", d.preroll_max_mb)),
+            data_format=normalize_data_format(_get("data_format", d.data_format)),
         )
 
     @classmethod
@@ -55,7 +66,9 @@ class AudioSettings:
         base = cls.from_args(args)
         merged = asdict(base)
         for key, cast in [("session_prefix", str), ("log_level", str), ("sample_rate", int),
-                          ("console_output", bool), ("output_dir", Path)]:
+                          ("channels", str), ("console_output", bool), ("output_dir", Path),
+                          ("preroll_seconds", float), ("preroll_max_mb", int),
+                          ("data_format", normalize_data_format)]:
             stored = prefs.get(key)
             if stored is not None:
                 try:
@@ -108,6 +121,14 @@ def _config_value(config: Mapping[str, object], key: str, fallback: Any) -> Any:
     return value
 
 
+def _channel_spec(value: str) -> str:
+    try:
+        parse_channel_spec(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    return value
+
+
 def build_arg_parser(config: Mapping[str, object]) -> argparse.ArgumentParser:
     defaults = AudioSettings()
     parser = argparse.ArgumentParser(description="Audio module")
@@ -129,6 +150,31 @@ def build_arg_parser(config: Mapping[str, object]) -> argparse.ArgumentParser:
         default=_config_value(config, "sample_rate", defaults.sample_rate),
         help="Sample rate (Hz) for input streams",
     )
+    parser.add_argument(
+        "--channels",
+        type=_channel_spec,
+        default=str(_config_value(config, "channels", defaults.channels)),
+        help="Input channels to record into one interleaved file, 1-based and in file order "
+             "(e.g. '1,2,4', '1-4' or 'all')",
+    )
+    parser.add_argument(
+        "--preroll-seconds",
+        type=float,
+        default=_config_value(config, "preroll_seconds", defaults.preroll_seconds),
+        help="Seconds of audio kept from before each recording starts (0 disables)",
+    )
+    parser.add_argument(
+        "--preroll-max-mb",
+        type=int,
+        default=_config_value(config, "preroll_max_mb", defaults.preroll_max_mb),
+        help="Memory cap (MiB) for the pre-roll buffer",
+    )
+    parser.add_argument(
+        "--data-format",
+        choices=DATA_FORMATS,
+        default=normalize_data_format(_config_value(config, "data_format", defaults.data_format)),
+        help="Timing data format (npy writes a columnar sidecar instead of CSV)",
+    )
 
     return parser
 
@@ -8,6 +8,7 @@ from .constants import (
     DB_RED,
     DB_YELLOW,
 )
+from .channels import parse_channel_spec, resolve_channel_map
 from .entities import AudioDeviceInfo, AudioSnapshot
 from .level_meter import LevelMeter
 from .state import AudioState
@@ -23,4 +24,6 @@ __all__ = [
     "DB_MAX",
     "DB_YELLOW",
     "DB_RED",
+    "parse_channel_spec",
+    "resolve_channel_map",
 ]
@@ -0,0 +1,50 @@
+"""Input channel selection for multi-channel devices."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def parse_channel_spec(spec: str | Sequence[int] | None) -> tuple[int, ...] | None:
+    """Parse a channel selection into 1-based device channels, in file order.
+
+    Accepts "all" (returns None), "1,2,4", "1-4" or a sequence of ints.
+    Raises ValueError for anything else.
+    """
+    if spec is None:
+        return (1,)
+    if not isinstance(spec, str):
+        channels = tuple(int(ch) for ch in spec)
+    else:
+        text = spec.strip().lower()
+        if text == "all":
+            return None
+        channels = ()
+        for part in filter(None, (p.strip() for p in text.split(","))):
+            if "-" in part:
+                first, last = (int(x) for x in part.split("-", 1))
+                channels += tuple(range(first, last + 1))
+            else:
+                channels += (int(part),)
+    if not channels or any(ch < 1 for ch in channels):
+        raise ValueError(f"Invalid channel selection: {spec!r}")
+    if len(set(channels)) != len(channels):
+        raise ValueError(f"Duplicate channel in selection: {spec!r}")
+    return channels
+
+
+def resolve_channel_map(spec: str | Sequence[int] | None, available: int) -> tuple[int, ...]:
+    """0-based device channel for each recorded channel.
+
+    Channels the device does not have are skipped; if none remain, the
+    first channel is recorded.
+    """
+    available = max(1, int(available or 1))
+    channels = parse_channel_spec(spec)
+    if channels is None:
+        return tuple(range(available))
+    mapped = tuple(ch - 1 for ch in channels if ch <= available)
+    return mapped or (0,)
+
+
+__all__ = ["parse_channel_spec", "resolve_channel_map"]
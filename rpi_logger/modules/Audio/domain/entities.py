@@ -24,6 +24,9 @@ class AudioSnapshot:
     trial_number: int
     session_dir: Path | None
     status_text: str
+    # Per-channel meters and their 1-based device channels (multi-channel only)
+    channel_meters: tuple[LevelMeter, ...] = ()
+    channels: tuple[int, ...] = ()
 
 
 __all__ = ["AudioDeviceInfo", "AudioSnapshot"]
@@ -29,11 +29,14 @@ class LevelMeter:
 
     def add_samples(self, samples: Iterable[float], timestamp: float | None = None) -> None:
         array = np.asarray(samples, dtype=np.float32)
+        if array.ndim != 1:
+            array = array.reshape(-1)
         if array.size == 0:
             return
 
-        rms = float(np.sqrt(np.mean(np.square(array), dtype=np.float32)))
-        peak = float(np.max(np.abs(array)))
+        # Reductions only: this runs in the audio callback, so no temporaries
+        rms = math.sqrt(max(float(np.dot(array, array)), 0.0) / array.size)
+        peak = max(float(array.max()), -float(array.min()))
         now = timestamp or time.time()
 
         if rms > 0:
@@ -17,6 +17,8 @@ class AudioState:
     def __init__(self) -> None:
         self.device: AudioDeviceInfo | None = None
         self.level_meter: LevelMeter | None = None
+        self.channel_meters: tuple[LevelMeter, ...] = ()
+        self.channels: tuple[int, ...] = ()
         self.session_dir: Path | None = None
         self.recording: bool = False
         self.trial_number: int = 1
@@ -38,15 +40,22 @@ class AudioState:
 
     def snapshot(self) -> AudioSnapshot:
         return AudioSnapshot(self.device, self.level_meter, self.recording,
-                             self.trial_number, self.session_dir, self._status_text)
+                             self.trial_number, self.session_dir, self._status_text,
+                             self.channel_meters, self.channels)
 
     def set_device(self, device: AudioDeviceInfo) -> None:
         self.device, self.level_meter = device, LevelMeter()
+        self.channel_meters, self.channels = (), ()
         self._update_status()
         self._notify()
 
+    def set_channel_meters(self, meters: tuple[LevelMeter, ...], channels: tuple[int, ...]) -> None:
+        self.channel_meters, self.channels = tuple(meters), tuple(channels)
+        self._notify()
+
     def clear_device(self) -> None:
         self.device = self.level_meter = None
+        self.channel_meters, self.channels = (), ()
         self._update_status()
         self._notify()
 
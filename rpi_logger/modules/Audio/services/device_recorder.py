@@ -5,20 +5,69 @@ from __future__ import annotations
 import contextlib
 import csv
 import logging
-import queue
+import math
 import threading
 import time
 import wave
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 import sounddevice as sd
 
-from ..domain import AUDIO_BIT_DEPTH, AUDIO_CHANNELS_MONO, AudioDeviceInfo, LevelMeter
+from ..domain import AUDIO_BIT_DEPTH, AudioDeviceInfo, LevelMeter
+from rpi_logger.modules.base.columnar import (
+    Column,
+    ColumnarFile,
+    as_float,
+    columnar_path,
+    columns_dtype,
+    normalize_data_format,
+)
+from rpi_logger.modules.base.preroll import (
+    DEFAULT_PREROLL_MAX_BYTES,
+    PreRollStats,
+    log_preroll_flush,
+)
 from rpi_logger.modules.base.storage_utils import module_filename_prefix, sanitize_device_id
+from rpi_logger.core.telemetry import register_telemetry, unregister_telemetry
+from .pcm_ring import PcmPreRoll, PcmRing
 
 _CSV_FLUSH_INTERVAL = 200
+_WRITER_POLL_INTERVAL = 0.05  # Seconds between batched writes
+_RING_SECONDS = 4.0  # Audio the writer may fall behind before blocks drop
+
+
+_TIMING_HEADER = [
+    'trial',
+    'module',
+    'device_id',
+    'label',
+    'record_time_unix',
+    'record_time_mono',
+    'device_time_unix',
+    'device_time_offset',
+    'write_time_unix',
+    'write_time_mono',
+    'chunk_index',
+    'frames',
+    'total_frames',
+]
+
+# Variable timing columns in npy mode (trial, module, device_id, label are the prefix)
+_TIMING_COLUMNS = (
+    Column('record_time_unix', 'f8', '%.6f'),
+    Column('record_time_mono', 'f8', '%.9f'),
+    Column('device_time_unix', 'f8', '%.9f'),
+    Column('device_time_offset', 'f8', '%.9f'),
+    Column('write_time_unix', 'f8', '%.6f'),
+    Column('write_time_mono', 'f8', '%.9f'),
+    Column('chunk_index', 'i8'),
+    Column('frames', 'i8'),
+    Column('total_frames', 'i8'),
+)
+_TIMING_DTYPE = columns_dtype(_TIMING_COLUMNS)
 
 
 @dataclass(slots=True)
@@ -32,11 +81,14 @@ class RecordingHandle:
     trial_label: str = ""
     start_time_unix: float | None = None
     start_time_monotonic: float | None = None
+    channels: int = 1
+    preroll_chunks: int = 0
+    preroll_seconds: float = 0.0
 
 
 @dataclass(slots=True)
 class AudioChunk:
-    data: bytes
+    data: bytes | memoryview
     frames: int
     chunk_index: int
     unix_time: float
@@ -46,29 +98,55 @@ class AudioChunk:
 
 
 class AudioDeviceRecorder:
-    """Manages sounddevice stream and sample buffering."""
+    """Manages sounddevice stream and sample buffering.
+
+    ``channel_map`` lists the 0-based device channel for each recorded
+    channel; all of them share one stream, one interleaved WAV and one
+    timing CSV. ``level_meter`` follows the first recorded channel and
+    ``channel_meters`` has one meter per recorded channel.
+
+    With ``preroll_seconds`` > 0, PCM blocks from the last window are kept
+    in a preallocated ring while idle and written (with their timing rows)
+    at the start of the next recording.
+
+    With ``data_format="npy"`` the timing rows go to a columnar ``.npy``
+    sidecar (built straight from the ring's arrays) instead of a CSV.
+    """
     def __init__(
         self,
         device: AudioDeviceInfo,
         sample_rate: int,
         level_meter: LevelMeter,
         logger: logging.Logger,
+        preroll_seconds: float = 0.0,
+        preroll_max_bytes: int = DEFAULT_PREROLL_MAX_BYTES,
+        channel_map: Sequence[int] | None = None,
+        data_format: str = "csv",
     ) -> None:
         self.device = device
         self.sample_rate = max(1, int(sample_rate))
+        self.channel_map: tuple[int, ...] = tuple(channel_map) if channel_map else (0,)
         self.level_meter = level_meter
+        self.data_format = normalize_data_format(data_format)
+        self.channel_meters: tuple[LevelMeter, ...] = (level_meter,) + tuple(
+            LevelMeter() for _ in self.channel_map[1:]
+        )
         self.logger = logger.getChild(f"Dev{device.device_id}")
         self.stream: sd.InputStream | None = None
         self.recording = False
         self._last_status: str | None = None
         self._writer_thread: threading.Thread | None = None
         self._writer_stop = threading.Event()
-        self._write_queue: queue.Queue[AudioChunk] = queue.Queue(maxsize=64)
+        self._ring: PcmRing | None = None
         self._active_handle: RecordingHandle | None = None
         self._dropped_blocks = 0
-        self._chunk_counter = 0
-        self._total_frames = 0
         self._meter_errors = 0
+        self._preroll: PcmPreRoll | None = (
+            PcmPreRoll(self.sample_rate, preroll_seconds, preroll_max_bytes, self.channels)
+            if preroll_seconds > 0 else None
+        )
+        # Makes "flush pre-roll, then go live" atomic with respect to the callback
+        self._preroll_lock = threading.Lock()
 
     def start_stream(self) -> None:
         if self.stream is not None:
@@ -77,8 +155,14 @@ class AudioDeviceRecorder:
         def _callback(indata, frames, time_info, status):
             self._handle_callback(indata, frames, time_info, status)
 
-        channels = max(1, min(self.device.channels or 1, AUDIO_CHANNELS_MONO))
-        self.logger.debug("Opening input stream for device %d (%s)", self.device.device_id, self.device.name)
+        # Open enough device channels to reach every mapped one; unmapped ones are ignored
+        channels = max(self.channel_map) + 1
+        self.logger.debug(
+            "Opening input stream for device %d (%s), channels %s",
+            self.device.device_id,
+            self.device.name,
+            [ch + 1 for ch in self.channel_map],
+        )
         try:
             stream = sd.InputStream(
                 device=self.device.device_id,
@@ -97,6 +181,8 @@ class AudioDeviceRecorder:
                 self.logger.warning("Device %d rate adjusted %d -> %d", self.device.device_id, self.sample_rate, actual_rate)
                 self.sample_rate = actual_rate
             self.stream = stream
+            # Levels are polled by the telemetry sender, not pushed from the callback
+            register_telemetry("audio.levels", self._telemetry_levels)
             self.logger.info("Input stream started (%d Hz)", self.sample_rate)
         except Exception as exc:
             self.stream = None
@@ -108,6 +194,7 @@ class AudioDeviceRecorder:
         if stream is None:
             return
         self.stream = None
+        unregister_telemetry("audio.levels")
         self.logger.debug("Stopping input stream for device %d", self.device.device_id)
         try:
             stream.stop()
@@ -116,6 +203,21 @@ class AudioDeviceRecorder:
             self.logger.debug("Stream close error: %s", exc)
         self.logger.info("Input stream stopped")
 
+    def _telemetry_levels(self) -> dict:
+        rms_db, peak_db = self.level_meter.get_db_levels()
+        values = {
+            "device_id": self.device.device_id,
+            "rms_db": rms_db,
+            "peak_db": peak_db,
+            "recording": self.recording,
+        }
+        if len(self.channel_meters) > 1:
+            levels = [meter.get_db_levels() for meter in self.channel_meters]
+            values["channels"] = [source + 1 for source in self.channel_map]
+            values["channel_rms_db"] = [rms for rms, _ in levels]
+            values["channel_peak_db"] = [peak for _, peak in levels]
+        return values
+
     def begin_recording(self, session_dir: Path, trial_number: int, trial_label: str = "") -> None:
         if self.recording:
             return
@@ -123,14 +225,16 @@ class AudioDeviceRecorder:
         file_path = self._make_filename(session_dir, trial_number)
         timing_csv = self._make_timing_filename(file_path)
         wave_handle = wave.open(str(file_path), "wb")
-        wave_handle.setnchannels(1)
+        wave_handle.setnchannels(self.channels)
         wave_handle.setsampwidth(AUDIO_BIT_DEPTH // 8)
         wave_handle.setframerate(self.sample_rate)
 
         self._writer_stop.clear()
-        self._write_queue = queue.Queue(maxsize=128)
-        self._chunk_counter = 0
-        self._total_frames = 0
+        ring = self._ring
+        capacity = math.ceil(self.sample_rate * _RING_SECONDS)
+        if ring is None or ring.capacity != capacity or ring.channels != self.channels:
+            ring = self._ring = PcmRing.for_duration(self.sample_rate, _RING_SECONDS, self.channels)
+        ring.reset()
         handle = RecordingHandle(
             file_path=file_path,
             timing_csv_path=timing_csv,
@@ -139,18 +243,60 @@ class AudioDeviceRecorder:
             device_id=self.device.device_id,
             device_name=self.device.name,
             trial_label=trial_label,
+            channels=self.channels,
         )
-        self._active_handle = handle
+        with self._preroll_lock:
+            preroll = self._take_preroll(handle)
+            self._active_handle = handle
+            self.recording = True
         self._writer_thread = threading.Thread(
             target=self._writer_loop,
-            args=(wave_handle, handle),
+            args=(wave_handle, handle, ring, preroll),
             name=f"AudioWriter-{self.device.device_id}",
             daemon=True,
         )
         self._writer_thread.start()
-        self.recording = True
         self.logger.info("Recording to %s (timing -> %s)", file_path.name, timing_csv.name)
 
+    def _take_preroll(self, handle: RecordingHandle) -> list[AudioChunk]:
+        """Drain the pre-roll, numbering its chunks as the start of the recording."""
+        if self._preroll is None:
+            return []
+        stats = self._preroll.stats()
+        samples, blocks = self._preroll.take()
+        data = memoryview(samples).cast("B")
+        block_bytes = samples.shape[1] * samples.itemsize
+        chunks = []
+        total_frames = 0
+        for index, (frames, unix_time, monotonic_time, adc_time) in enumerate(blocks, start=1):
+            chunks.append(AudioChunk(
+                data=data[total_frames * block_bytes:(total_frames + frames) * block_bytes],
+                frames=frames,
+                chunk_index=index,
+                unix_time=unix_time,
+                monotonic_time=monotonic_time,
+                adc_timestamp=adc_time,
+                total_frames=total_frames + frames,
+            ))
+            total_frames += frames
+        if chunks:
+            first = chunks[0]
+            handle.start_time_unix = first.adc_timestamp or first.unix_time
+            handle.start_time_monotonic = first.monotonic_time
+            handle.preroll_chunks = len(chunks)
+            handle.preroll_seconds = total_frames / self.sample_rate
+            log_preroll_flush(self.logger, handle.file_path.name, stats)
+        return chunks
+
+    @property
+    def channels(self) -> int:
+        """Number of recorded channels."""
+        return len(self.channel_map)
+
+    def preroll_stats(self) -> PreRollStats:
+        """Pre-roll buffer contents (``bytes`` is its memory use)."""
+        return self._preroll.stats() if self._preroll else PreRollStats()
+
     def finish_recording(self) -> RecordingHandle | None:
         if not self.recording:
             return None
@@ -168,40 +314,36 @@ class AudioDeviceRecorder:
         return handle
 
     def _handle_callback(self, indata, frames: int, time_info, status: sd.CallbackFlags) -> None:
-        mono = indata[:, 0] if indata.ndim > 1 else indata
         now_unix = time.time()
         now_monotonic = time.perf_counter()
         try:
-            self.level_meter.add_samples(mono, now_unix)
+            if indata.ndim == 1:
+                self.level_meter.add_samples(indata, now_unix)
+            else:
+                # Column views over the interleaved block
+                for meter, source in zip(self.channel_meters, self.channel_map):
+                    meter.add_samples(indata[:, source], now_unix)
         except Exception:
             self._meter_errors += 1
             if self._meter_errors == 1:
                 self.logger.warning("Level meter error (suppressing further)", exc_info=True)
 
-        if self.recording and self._active_handle:
-            chunk_bytes = self._to_pcm_bytes(mono)
-            chunk_index = self._chunk_counter + 1
-            total_frames = self._total_frames + frames
-            adc_time = self._extract_time_info(time_info)
-            chunk = AudioChunk(
-                data=chunk_bytes,
-                frames=frames,
-                chunk_index=chunk_index,
-                unix_time=now_unix,
-                monotonic_time=now_monotonic,
-                adc_timestamp=adc_time,
-                total_frames=total_frames,
-            )
-            self._chunk_counter = chunk_index
-            self._total_frames = total_frames
-
-            if self._active_handle.start_time_unix is None:
-                self._active_handle.start_time_unix = adc_time or now_unix
-                self._active_handle.start_time_monotonic = now_monotonic
+        if self._preroll is not None and not self.recording:
+            with self._preroll_lock:
+                if not self.recording:
+                    # Converted into the preallocated pre-roll ring, like live blocks
+                    self._preroll.push(
+                        indata, now_unix, now_monotonic, self._extract_time_info(time_info), self.channel_map,
+                    )
 
-            try:
-                self._write_queue.put_nowait(chunk)
-            except queue.Full:
+        handle = self._active_handle
+        if self.recording and handle:
+            # Converted straight into the preallocated ring; no per-block buffers
+            adc_time = self._extract_time_info(time_info)
+            if handle.start_time_unix is None:
+                handle.start_time_unix = adc_time or now_unix
+                handle.start_time_monotonic = now_monotonic
+            if not self._ring.push(indata, now_unix, now_monotonic, adc_time, self.channel_map):
                 self._dropped_blocks += 1
                 if self._dropped_blocks % 25 == 0:
                     self.logger.warning("Dropped %d audio blocks (slow writer)", self._dropped_blocks)
@@ -212,75 +354,161 @@ class AudioDeviceRecorder:
                 self.logger.warning("Audio callback status: %s", status_str)
                 self._last_status = status_str
 
-    def _writer_loop(self, wave_handle: wave.Wave_write, handle: RecordingHandle) -> None:
+    def _writer_loop(
+        self,
+        wave_handle: wave.Wave_write,
+        handle: RecordingHandle,
+        ring: PcmRing,
+        preroll: list[AudioChunk] | None = None,
+    ) -> None:
         csv_file = None
+        columnar: ColumnarFile | None = None
         writer = None
         written_rows = 0
+        chunk_index = 0
+        total_frames = 0
         try:
-            csv_file = open(handle.timing_csv_path, 'w', newline='', encoding='utf-8')
-            writer = csv.writer(csv_file)
-            writer.writerow([
-                'trial',
-                'module',
-                'device_id',
-                'label',
-                'record_time_unix',
-                'record_time_mono',
-                'device_time_unix',
-                'device_time_offset',
-                'write_time_unix',
-                'write_time_mono',
-                'chunk_index',
-                'frames',
-                'total_frames',
-            ])
-
-            while not self._writer_stop.is_set() or not self._write_queue.empty():
-                try:
-                    chunk = self._write_queue.get(timeout=0.2)
-                except queue.Empty:
-                    continue
-                try:
-                    wave_handle.writeframes(chunk.data)
+            if self.data_format == "npy":
+                columnar = ColumnarFile(
+                    handle.timing_csv_path,
+                    _TIMING_COLUMNS,
+                    csv_header=_TIMING_HEADER,
+                    prefix_fields=(handle.trial_number, 'Audio', handle.device_id, handle.trial_label),
+                )
+            else:
+                csv_file = open(handle.timing_csv_path, 'w', newline='', encoding='utf-8')
+                writer = csv.writer(csv_file)
+                writer.writerow(_TIMING_HEADER)
+            timing_file = columnar if columnar is not None else csv_file
+
+            if preroll:
+                wave_handle.writeframes(b"".join(chunk.data for chunk in preroll))
+                write_time_unix = time.time()
+                write_time_mono = time.perf_counter()
+                if columnar is not None:
+                    columnar.write([
+                        (chunk.unix_time, chunk.monotonic_time, math.nan, as_float(chunk.adc_timestamp),
+                         write_time_unix, write_time_mono, chunk.chunk_index, chunk.frames, chunk.total_frames)
+                        for chunk in preroll
+                    ])
+                else:
+                    writer.writerows(
+                        self._timing_row(
+                            handle, chunk.unix_time, chunk.monotonic_time, chunk.adc_timestamp,
+                            write_time_unix, write_time_mono, chunk.chunk_index, chunk.frames, chunk.total_frames,
+                        )
+                        for chunk in preroll
+                    )
+                written_rows += len(preroll)
+                chunk_index = preroll[-1].chunk_index
+                total_frames = preroll[-1].total_frames
+
+            while True:
+                # Read the stop flag first so the final pass sees every block
+                stopping = self._writer_stop.is_set()
+                first_seq, count, spans = ring.peek()
+                if count:
+                    # One write for everything the callback produced since the last pass
+                    for span in spans:
+                        wave_handle.writeframes(span)
                     write_time_unix = time.time()
                     write_time_mono = time.perf_counter()
-                    writer.writerow([
-                        handle.trial_number,
-                        'Audio',
-                        handle.device_id,
-                        handle.trial_label,
-                        f"{chunk.unix_time:.6f}",
-                        f"{chunk.monotonic_time:.9f}",
-                        '',
-                        f"{chunk.adc_timestamp:.9f}" if chunk.adc_timestamp is not None else '',
-                        f"{write_time_unix:.6f}",
-                        f"{write_time_mono:.9f}",
-                        chunk.chunk_index,
-                        chunk.frames,
-                        chunk.total_frames,
-                    ])
-                    written_rows += 1
-                    if written_rows % _CSV_FLUSH_INTERVAL == 0:
-                        csv_file.flush()
-                except Exception as exc:
-                    self.logger.error("Failed to persist audio chunk: %s", exc)
+                    if columnar is not None:
+                        chunk = self._timing_chunk(
+                            ring, first_seq, count, chunk_index, total_frames, write_time_unix, write_time_mono,
+                        )
+                        chunk_index += count
+                        total_frames = int(chunk['total_frames'][-1])
+                        ring.release(count)
+                        columnar.write(chunk)
+                    else:
+                        rows = []
+                        for seq in range(first_seq, first_seq + count):
+                            slot = seq % ring.max_blocks
+                            frames = int(ring.frames[slot])
+                            adc_time = float(ring.adc_time[slot])
+                            chunk_index += 1
+                            total_frames += frames
+                            rows.append(self._timing_row(
+                                handle, float(ring.unix_time[slot]), float(ring.monotonic_time[slot]),
+                                None if math.isnan(adc_time) else adc_time,
+                                write_time_unix, write_time_mono, chunk_index, frames, total_frames,
+                            ))
+                        ring.release(count)
+                        writer.writerows(rows)
+                    previous_rows = written_rows
+                    written_rows += count
+                    if written_rows // _CSV_FLUSH_INTERVAL != previous_rows // _CSV_FLUSH_INTERVAL:
+                        timing_file.flush()
+                if stopping:
                     break
+                if not count:
+                    self._writer_stop.wait(_WRITER_POLL_INTERVAL)
+        except Exception as exc:
+            self.logger.error("Failed to persist audio chunk: %s", exc)
         finally:
             with contextlib.suppress(Exception):
                 wave_handle.close()
+            if columnar is not None:
+                with contextlib.suppress(Exception):
+                    columnar.close()
             if csv_file is not None:
                 with contextlib.suppress(Exception):
                     csv_file.flush()
                     csv_file.close()
 
-    def _to_pcm_bytes(self, samples) -> bytes:
-        array = np.asarray(samples, dtype=np.float32)
-        if array.ndim > 1:
-            array = array[:, 0]
-        scaled = np.clip(array, -1.0, 1.0)
-        max_int = (2 ** (AUDIO_BIT_DEPTH - 1)) - 1
-        int_samples = (scaled * max_int).astype(np.int16)
-        return int_samples.tobytes()
+    @staticmethod
+    def _timing_chunk(
+        ring: PcmRing,
+        first_seq: int,
+        count: int,
+        chunk_index: int,
+        total_frames: int,
+        write_time_unix: float,
+        write_time_mono: float,
+    ) -> np.ndarray:
+        """Timing rows for ``count`` ring blocks, built column-wise from the ring's arrays."""
+        slots = np.arange(first_seq, first_seq + count) % ring.max_blocks
+        frames = ring.frames[slots]
+        chunk = np.empty(count, dtype=_TIMING_DTYPE)
+        chunk['record_time_unix'] = ring.unix_time[slots]
+        chunk['record_time_mono'] = ring.monotonic_time[slots]
+        chunk['device_time_unix'] = math.nan
+        chunk['device_time_offset'] = ring.adc_time[slots]
+        chunk['write_time_unix'] = write_time_unix
+        chunk['write_time_mono'] = write_time_mono
+        chunk['chunk_index'] = np.arange(chunk_index + 1, chunk_index + count + 1)
+        chunk['frames'] = frames
+        chunk['total_frames'] = total_frames + np.cumsum(frames)
+        return chunk
+
+    @staticmethod
+    def _timing_row(
+        handle: RecordingHandle,
+        unix_time: float,
+        monotonic_time: float,
+        adc_time: float | None,
+        write_time_unix: float,
+        write_time_mono: float,
+        chunk_index: int,
+        frames: int,
+        total_frames: int,
+    ) -> list:
+        return [
+            handle.trial_number,
+            'Audio',
+            handle.device_id,
+            handle.trial_label,
+            f"{unix_time:.6f}",
+            f"{monotonic_time:.9f}",
+            '',
+            f"{adc_time:.9f}" if adc_time is not None else '',
+            f"{write_time_unix:.6f}",
+            f"{write_time_mono:.9f}",
+            chunk_index,
+            frames,
+            total_frames,
+        ]
 
     def _make_filename(self, session_dir: Path, trial_number: int) -> Path:
         safe_name = sanitize_device_id(self.device.name)
@@ -289,7 +517,8 @@ class AudioDeviceRecorder:
         return session_dir / filename
 
     def _make_timing_filename(self, audio_path: Path) -> Path:
-        return audio_path.with_name(f"{audio_path.stem}_timing.csv")
+        timing_path = audio_path.with_name(f"{audio_path.stem}_timing.csv")
+        return columnar_path(timing_path) if self.data_format == "npy" else timing_path
 
     def _extract_time_info(self, time_info) -> float | None:
         if not time_info:
@@ -0,0 +1,259 @@
+"""Preallocated rings for interleaved PCM blocks (recording and pre-roll)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from ..domain import AUDIO_BIT_DEPTH
+from rpi_logger.modules.base.preroll import PreRollStats
+
+_MAX_INT = (2 ** (AUDIO_BIT_DEPTH - 1)) - 1
+
+
+class PcmRing:
+    """Lock-free SPSC ring of interleaved int16 frames plus per-block timing.
+
+    The audio callback (producer) converts each float32 block straight into
+    the preallocated (capacity, channels) sample buffer, picking and
+    reordering device channels on the way, and records the block's timing in
+    preallocated arrays; nothing is allocated per block. The writer thread
+    (consumer) takes everything published so far as one contiguous span (two
+    at the wrap point), so a single ``write`` covers many blocks.
+
+    Only the producer advances ``_head`` and only the consumer advances
+    ``_tail``; both are plain ints whose stores are atomic under the GIL,
+    and each side publishes its index after touching the data.
+    """
+
+    def __init__(
+        self,
+        capacity_frames: int,
+        max_blocks: int = 1024,
+        max_block_frames: int = 8192,
+        channels: int = 1,
+    ) -> None:
+        self.capacity = max(1, int(capacity_frames))
+        self.max_blocks = max(1, int(max_blocks))
+        self.channels = max(1, int(channels))
+        self._samples = np.zeros((self.capacity, self.channels), dtype=np.int16)
+        self._scratch = np.zeros((max_block_frames, self.channels), dtype=np.float32)
+        self.frames = np.zeros(self.max_blocks, dtype=np.int64)
+        self.unix_time = np.zeros(self.max_blocks, dtype=np.float64)
+        self.monotonic_time = np.zeros(self.max_blocks, dtype=np.float64)
+        self.adc_time = np.full(self.max_blocks, np.nan, dtype=np.float64)
+        self._head = 0  # Blocks published (producer)
+        self._tail = 0  # Blocks consumed (consumer)
+        self._sample_head = 0
+        self._sample_tail = 0
+
+    @classmethod
+    def for_duration(cls, sample_rate: int, seconds: float = 4.0, channels: int = 1) -> "PcmRing":
+        """Ring holding ``seconds`` of ``channels``-channel audio at ``sample_rate``."""
+        return cls(math.ceil(sample_rate * seconds), channels=channels)
+
+    def reset(self) -> None:
+        """Discard all blocks; only call while no producer is running."""
+        self._head = self._tail = 0
+        self._sample_head = self._sample_tail = 0
+
+    @property
+    def pending_blocks(self) -> int:
+        return self._head - self._tail
+
+    @property
+    def pending_frames(self) -> int:
+        return self._sample_head - self._sample_tail
+
+    @property
+    def tail(self) -> int:
+        """Sequence number of the oldest unconsumed block."""
+        return self._tail
+
+    def push(
+        self,
+        samples: np.ndarray,
+        unix_time: float,
+        monotonic_time: float,
+        adc_time: float | None,
+        channel_map: Sequence[int] | None = None,
+    ) -> bool:
+        """Convert and publish one float32 block (producer side).
+
+        Args:
+            samples: (frames,) or (frames, device_channels) block
+            unix_time: Host capture time
+            monotonic_time: Host capture time (monotonic)
+            adc_time: Device ADC time, if reported
+            channel_map: Device channel for each ring channel (default:
+                the first ``channels`` columns)
+
+        Returns:
+            False if the ring is full and the block was dropped.
+        """
+        frames = samples.shape[0]
+        if (
+            self._head - self._tail >= self.max_blocks
+            or self._sample_head - self._sample_tail + frames > self.capacity
+        ):
+            return False
+        if frames > self._scratch.shape[0]:
+            # Only happens if the host switches to a larger block size
+            self._scratch = np.zeros((frames, self.channels), dtype=np.float32)
+
+        scratch = self._scratch[:frames]
+        if samples.ndim == 1:
+            np.clip(samples, -1.0, 1.0, out=scratch[:, 0])
+        else:
+            # Column views of the device block; no gathered copy
+            for out, source in enumerate(channel_map if channel_map is not None else range(self.channels)):
+                np.clip(samples[:, source], -1.0, 1.0, out=scratch[:, out])
+        np.multiply(scratch, _MAX_INT, out=scratch)
+        start = self._sample_head % self.capacity
+        first = min(frames, self.capacity - start)
+        # Unsafe cast truncates toward zero, matching astype(np.int16)
+        np.copyto(self._samples[start:start + first], scratch[:first], casting="unsafe")
+        if first < frames:
+            np.copyto(self._samples[:frames - first], scratch[first:], casting="unsafe")
+
+        slot = self._head % self.max_blocks
+        self.frames[slot] = frames
+        self.unix_time[slot] = unix_time
+        self.monotonic_time[slot] = monotonic_time
+        self.adc_time[slot] = np.nan if adc_time is None else adc_time
+        self._sample_head += frames
+        self._head += 1
+        return True
+
+    def peek(self) -> tuple[int, int, list[memoryview]]:
+        """Published blocks not yet consumed (consumer side).
+
+        Returns:
+            (first block sequence number, block count, sample spans). Block
+            ``seq`` has its timing at index ``seq % max_blocks``. Call
+            ``release`` with the same count once the spans are written.
+        """
+        count = self._head - self._tail
+        if not count:
+            return self._tail, 0, []
+        # Size the span from the published blocks, not _sample_head, which
+        # may already include a block whose _head is not yet published
+        total = self._frames_in(count)
+        start = self._sample_tail % self.capacity
+        first = min(total, self.capacity - start)
+        spans = [memoryview(self._samples[start:start + first])]
+        if first < total:
+            spans.append(memoryview(self._samples[:total - first]))
+        return self._tail, count, spans
+
+    def release(self, count: int) -> None:
+        """Return ``count`` consumed blocks' space to the producer."""
+        self._sample_tail += self._frames_in(count)
+        self._tail += count
+
+    def _frames_in(self, count: int) -> int:
+        frames = 0
+        for seq in range(self._tail, self._tail + count):
+            frames += int(self.frames[seq % self.max_blocks])
+        return frames
+
+
+class PcmPreRoll:
+    """Pre-roll window of PCM blocks kept in a preallocated PcmRing.
+
+    The audio callback is both producer and consumer while idle: ``push``
+    drops the oldest blocks once they fall out of ``window`` seconds or
+    leave no room, then converts the new block in place, so nothing is
+    allocated per block. The ring is sized for the window, or for
+    ``max_bytes`` if that is smaller. ``take`` copies the window out once
+    and empties the ring; call it only while the callback is not pushing.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        window: float,
+        max_bytes: int,
+        channels: int = 1,
+        max_block_frames: int = 8192,
+    ) -> None:
+        self.window = max(0.0, float(window))
+        self.max_bytes = max(0, int(max_bytes))
+        window_frames = math.ceil(sample_rate * self.window) + max_block_frames
+        cap_frames = self.max_bytes // (max(1, channels) * AUDIO_BIT_DEPTH // 8)
+        # Space runs out before the window only when max_bytes is the limit
+        self._byte_capped = cap_frames < window_frames
+        capacity = max(1, min(window_frames, cap_frames))
+        self._ring = PcmRing(
+            capacity, max_blocks=max(64, capacity // 32), max_block_frames=max_block_frames, channels=channels,
+        )
+        self._evicted = 0
+        self._capped = 0
+
+    def push(
+        self,
+        samples: np.ndarray,
+        unix_time: float,
+        monotonic_time: float,
+        adc_time: float | None,
+        channel_map: Sequence[int] | None = None,
+    ) -> None:
+        """Add one float32 block, evicting old blocks first (callback side)."""
+        ring = self._ring
+        while ring.pending_blocks and monotonic_time - ring.monotonic_time[ring.tail % ring.max_blocks] > self.window:
+            self._drop_oldest(False)
+        while not ring.push(samples, unix_time, monotonic_time, adc_time, channel_map):
+            if not ring.pending_blocks:
+                self._evicted += 1  # Block larger than the whole ring
+                return
+            self._drop_oldest(self._byte_capped)
+
+    def _drop_oldest(self, over_cap: bool) -> None:
+        self._ring.release(1)
+        self._evicted += 1
+        if over_cap:
+            self._capped += 1
+
+    def take(self) -> tuple[np.ndarray, list[tuple[int, float, float, float | None]]]:
+        """Copy out and clear the window.
+
+        Returns:
+            ((frames, channels) int16 samples, one (frames, unix_time,
+            monotonic_time, adc_time) tuple per block, oldest first)
+        """
+        ring = self._ring
+        first_seq, count, spans = ring.peek()
+        samples = np.concatenate([np.asarray(span) for span in spans]) if spans else (
+            np.zeros((0, ring.channels), dtype=np.int16)
+        )
+        blocks = []
+        for seq in range(first_seq, first_seq + count):
+            slot = seq % ring.max_blocks
+            adc_time = float(ring.adc_time[slot])
+            blocks.append((
+                int(ring.frames[slot]), float(ring.unix_time[slot]), float(ring.monotonic_time[slot]),
+                None if math.isnan(adc_time) else adc_time,
+            ))
+        ring.reset()
+        return samples, blocks
+
+    def stats(self) -> PreRollStats:
+        ring = self._ring
+        count = ring.pending_blocks
+        seconds = 0.0
+        if count:
+            newest = ring.monotonic_time[(ring.tail + count - 1) % ring.max_blocks]
+            seconds = float(newest - ring.monotonic_time[ring.tail % ring.max_blocks])
+        return PreRollStats(
+            items=count,
+            bytes=ring.pending_frames * ring.channels * AUDIO_BIT_DEPTH // 8,
+            seconds=seconds,
+            max_bytes=self.max_bytes,
+            evicted=self._evicted,
+            capped=self._capped,
+        )
+
+
+__all__ = ["PcmPreRoll", "PcmRing"]
@@ -5,26 +5,46 @@ import asyncio
 import logging
 from pathlib import Path
 
-from ..domain import AudioDeviceInfo, LevelMeter
+from rpi_logger.modules.base.preroll import DEFAULT_PREROLL_MAX_BYTES
+
+from ..domain import AudioDeviceInfo, LevelMeter, resolve_channel_map
 from .device_recorder import AudioDeviceRecorder, RecordingHandle
 
 
 class RecorderService:
     """Manage audio device recorder."""
     def __init__(self, logger: logging.Logger, sample_rate: int,
-                 start_timeout: float, stop_timeout: float) -> None:
+                 start_timeout: float, stop_timeout: float,
+                 preroll_seconds: float = 0.0, preroll_max_bytes: int = DEFAULT_PREROLL_MAX_BYTES,
+                 channels: str = "1", data_format: str = "csv") -> None:
         self.logger = logger.getChild("RecorderService")
         self._default_sample_rate = max(1, int(sample_rate))
         self.start_timeout = start_timeout
         self.stop_timeout = stop_timeout
+        self.preroll_seconds = max(0.0, float(preroll_seconds))
+        self.preroll_max_bytes = preroll_max_bytes
+        self.channels = channels
+        self.data_format = data_format
         self.recorder: AudioDeviceRecorder | None = None
 
     async def enable_device(self, device: AudioDeviceInfo, meter: LevelMeter) -> bool:
         effective_rate = self._resolve_sample_rate(device)
-        if self.recorder and self.recorder.sample_rate != effective_rate:
+        channel_map = resolve_channel_map(self.channels, device.channels)
+        if self.recorder and (
+            self.recorder.sample_rate != effective_rate or self.recorder.channel_map != channel_map
+        ):
             await self.disable_device()
         if self.recorder is None:
-            self.recorder = AudioDeviceRecorder(device, effective_rate, meter, self.logger)
+            if len(channel_map) > 1:
+                self.logger.info("Recording device channels %s as one %d-channel stream",
+                                 [ch + 1 for ch in channel_map], len(channel_map))
+            self.recorder = AudioDeviceRecorder(
+                device, effective_rate, meter, self.logger,
+                preroll_seconds=self.preroll_seconds,
+                preroll_max_bytes=self.preroll_max_bytes,
+                channel_map=channel_map,
+                data_format=self.data_format,
+            )
         try:
             await asyncio.wait_for(asyncio.to_thread(self.recorder.start_stream), timeout=self.start_timeout)
             return True
@@ -70,6 +90,11 @@ class RecorderService:
             self.logger.info("Stopping recorder")
             await self.disable_device()
 
+    @property
+    def channel_meters(self) -> tuple[LevelMeter, ...]:
+        """One meter per recorded channel of the active device."""
+        return self.recorder.channel_meters if self.recorder else ()
+
     @property
     def any_recording_active(self) -> bool:
         return self.recorder is not None and self.recorder.recording
@@ -54,9 +54,10 @@ class MeterPanel:
     def __init__(self, logger: logging.Logger) -> None:
         self.logger = logger.getChild("MeterPanel")
         self._container: "ttk.Frame | None" = None  # type: ignore[assignment]
+        # Keyed by meter row: one per recorded channel (a single row for mono)
         self._meter_canvases: dict[int, "tk.Canvas"] = {}
         self._canvas_items: dict[int, dict[str, int]] = {}
-        self._rendered_devices: tuple[int, ...] = ()
+        self._rendered_layout: tuple[int, ...] = ()
 
     def attach(self, parent) -> None:
         if tk is None or ttk is None:
@@ -71,11 +72,11 @@ class MeterPanel:
     def rebuild(self, snapshot: AudioSnapshot) -> None:
         if tk is None or ttk is None or self._container is None:
             return
-        desired_order = (snapshot.device.device_id,) if snapshot.device else ()
-        if desired_order == self._rendered_devices:
+        desired_layout = self._layout(snapshot)
+        if desired_layout == self._rendered_layout:
             return
 
-        self._rendered_devices = desired_order
+        self._rendered_layout = desired_layout
 
         for child in list(self._container.winfo_children()):
             child.destroy()
@@ -83,40 +84,53 @@ class MeterPanel:
         self._meter_canvases.clear()
         self._canvas_items.clear()
 
-        if not desired_order:
+        if not desired_layout:
             return
 
-        for row_index, device_id in enumerate(desired_order):
+        channels = desired_layout[1:]
+        for row_index in range(max(1, len(channels))):
             self._container.rowconfigure(row_index, weight=1)
             device_frame = ttk.Frame(self._container)
             device_frame.grid(row=row_index, column=0, sticky="ew", pady=(0, 6))
             device_frame.columnconfigure(0, weight=1)
+            if channels:
+                ttk.Label(device_frame, text=f"Ch {channels[row_index]}").grid(row=1, column=1, padx=(4, 0))
             canvas = tk.Canvas(
                 device_frame,
                 width=260,
-                height=32,
+                height=32 if not channels else 18,
                 bg=Colors.BG_CANVAS if Colors else "#1e1e1e",
                 highlightthickness=1,
                 highlightbackground=Colors.BORDER if Colors else "#404055",
             )
             canvas.grid(row=1, column=0, sticky="ew")
-            self._meter_canvases[device_id] = canvas
+            self._meter_canvases[row_index] = canvas
+
+    @staticmethod
+    def _layout(snapshot: AudioSnapshot) -> tuple[int, ...]:
+        """(device_id, *channels) for the rows to show; () without a device."""
+        if not snapshot.device:
+            return ()
+        return (snapshot.device.device_id, *snapshot.channels) if snapshot.channel_meters else (snapshot.device.device_id,)
 
     def draw(self, snapshot: AudioSnapshot, *, force: bool = False) -> None:
         if tk is None or self._container is None:
             return
-        for device_id, canvas in list(self._meter_canvases.items()):
+        if not snapshot.device or self._layout(snapshot) != self._rendered_layout:
+            return
+        meters = snapshot.channel_meters or (snapshot.level_meter,)
+        for row_index, canvas in list(self._meter_canvases.items()):
             if not canvas.winfo_exists():
                 continue
-            meter = snapshot.level_meter if snapshot.device and snapshot.device.device_id == device_id else None
+            meter = meters[row_index] if row_index < len(meters) else None
             if not meter:
                 continue
-            items = self._canvas_items.get(device_id)
+            items = self._canvas_items.get(row_index)
             if not force and not meter.dirty and items:
                 continue
-            self._draw_meter(canvas, device_id, meter)
+            self._draw_meter(canvas, row_index, meter)
 
-    def _draw_meter(self, canvas: "tk.Canvas", device_id: int, meter) -> None:
+    def _draw_meter(self, canvas: "tk.Canvas", row_index: int, meter) -> None:
         width = canvas.winfo_width()
         height = canvas.winfo_height()
         if width < 10 or height < 10:
@@ -134,7 +148,7 @@ class MeterPanel:
         yellow_width = ((DB_RED - DB_YELLOW) / total_range) * usable_width
         red_width = ((DB_MAX - DB_RED) / total_range) * usable_width
 
-        items = self._canvas_items.get(device_id)
+        items = self._canvas_items.get(row_index)
         if not items or items.get("width") != width or items.get("height") != height:
             canvas.delete("all")
             items = {"width": width, "height": height}
@@ -177,7 +191,7 @@ class MeterPanel:
             items["peak_line"] = canvas.create_line(
                 0, 0, 0, 0, fill=MeterColors.PEAK_LINE, width=2
             )
-            self._canvas_items[device_id] = items
+            self._canvas_items[row_index] = items
 
         rms_position = max(DB_MIN, min(rms_db, DB_MAX))
         rms_fraction = (rms_position - DB_MIN) / total_range
@@ -5,7 +5,32 @@ Provides Cameras (USB webcam) specific methods that are
 dynamically added to APIController.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from .preview_stream import PreviewStream, PreviewStreamHub
+
+# Modules that publish preview frames to a shared-memory slot
+PREVIEW_MODULES = ("Cameras", "Cameras_CSI", "EyeTracker")
+
+
+def _match_instance(
+    instances: List[Dict[str, Any]], camera_id: str, module_ids: tuple = ("Cameras",)
+) -> Optional[Dict[str, Any]]:
+    for instance in instances:
+        if instance.get("module_id") in module_ids:
+            if camera_id in (instance.get("device_id") or ""):
+                return instance
+            if camera_id in (instance.get("instance_id") or ""):
+                return instance
+    return None
+
+
+def _preview_hub(controller: Any) -> PreviewStreamHub:
+    """The controller's preview streams, created on first use."""
+    hub = getattr(controller, "_preview_streams", None)
+    if hub is None:
+        hub = controller._preview_streams = PreviewStreamHub()
+    return hub
 
 
 class CamerasApiMixin:
@@ -75,11 +100,30 @@ class CamerasApiMixin:
         """
         return await self.update_module_config("Cameras", updates)
 
+    async def get_camera_stream(self, camera_id: str) -> Optional[PreviewStream]:
+        """Get the shared preview stream of a camera.
+
+        Frames come from the module's shared-memory preview slot and are
+        JPEG-encoded once for all clients.
+
+        Args:
+            camera_id: The camera identifier (device or instance id).
+
+        Returns:
+            The camera's PreviewStream, or None if no matching instance runs.
+        """
+        instance = _match_instance(await self.list_instances(), camera_id, PREVIEW_MODULES)
+        if not instance:
+            return None
+        return _preview_hub(self).get(instance["instance_id"])
+
     async def get_camera_preview(self, camera_id: str) -> Optional[Dict[str, Any]]:
         """Get a preview frame from a camera as base64.
 
-        Sends a command to the Cameras module to capture a preview frame
-        and return it encoded as base64.
+        Reads the frame from the module's shared-memory preview slot when
+        it has one; otherwise sends a command to the matched module
+        (Cameras, Cameras_CSI or EyeTracker) to capture a preview frame and
+        return it encoded as base64.
 
         Args:
             camera_id: The camera identifier.
@@ -90,25 +134,31 @@ class CamerasApiMixin:
         """
         import base64
 
-        # Find the camera instance
-        instances = await self.list_instances()
-        camera_instance = None
-        for instance in instances:
-            if instance.get("module_id") == "Cameras":
-                # Check if this instance matches the camera_id
-                if camera_id in instance.get("device_id", ""):
-                    camera_instance = instance
-                    break
-                if camera_id in instance.get("instance_id", ""):
-                    camera_instance = instance
-                    break
-
-        if not camera_instance:
+        instance = _match_instance(await self.list_instances(), camera_id, PREVIEW_MODULES)
+        if not instance:
             return None
+        stream = _preview_hub(self).get(instance["instance_id"])
+
+        if stream.available:
+            result = await stream.next_frame()
+            if result is None:
+                return {
+                    "error": "No frame data available",
+                    "error_code": "NO_FRAME_DATA",
+                }
+            _sequence, jpeg, meta = result
+            return {
+                "camera_id": camera_id,
+                "frame": base64.b64encode(jpeg).decode("utf-8"),
+                "format": "jpeg",
+                "width": meta.get("width"),
+                "height": meta.get("height"),
+                "timestamp": meta.get("timestamp"),
+            }
 
         # Send get_preview command to the module
         result = await self.send_module_command(
-            "Cameras", "get_preview", camera_id=camera_id
+            instance["module_id"], "get_preview", camera_id=camera_id
         )
 
         if not result.get("success"):
@@ -0,0 +1,185 @@
+"""
+Master-side preview streams read from module shared-memory slots.
+
+One ``PreviewStream`` per camera instance reads frames from the module's
+preview slot (see ``rpi_logger.modules.base.preview_shm``), JPEG-encodes each
+new frame once, and hands the same bytes to every connected client. The
+stream stops polling (and the module stops publishing) shortly after the
+last client leaves.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import AsyncIterator, Dict, Optional
+
+import cv2
+
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.preview_shm import PreviewSlotReader, preview_slot_name
+
+logger = get_module_logger(__name__)
+
+MJPEG_BOUNDARY = "rpiloggerframe"
+
+
+class PreviewStream:
+    """Latest JPEG frame of one module's preview slot, shared by all clients."""
+
+    POLL_INTERVAL = 0.01
+    IDLE_TIMEOUT = 5.0
+
+    def __init__(self, instance_id: str, jpeg_quality: int = 80) -> None:
+        self.instance_id = instance_id
+        self.slot_name = preview_slot_name(instance_id)
+        self.jpeg_quality = jpeg_quality
+        self._reader: Optional[PreviewSlotReader] = None
+        self._jpeg: Optional[bytes] = None
+        self._jpeg_meta: Dict[str, object] = {}
+        self._sequence = 0
+        # Slot sequence of the last encode; kept across restarts so a frame
+        # already served (and possibly stale) is not encoded again
+        self._encoded_sequence = 0
+        self._changed = asyncio.Condition()
+        self._task: Optional[asyncio.Task] = None
+        self._clients = 0
+        self._last_client = time.monotonic()
+        self.frames_encoded = 0
+
+    @property
+    def clients(self) -> int:
+        return self._clients
+
+    @property
+    def available(self) -> bool:
+        """True if the module has created its preview slot."""
+        return self._attach() is not None
+
+    def _attach(self) -> Optional[PreviewSlotReader]:
+        if self._reader is not None and self._reader.closed:
+            self._reader.close()
+            self._reader = None
+        if self._reader is None:
+            self._reader = PreviewSlotReader.open(self.slot_name)
+        return self._reader
+
+    def _encode(self, reader: PreviewSlotReader, sequence: int) -> Optional[tuple[bytes, Dict[str, object], int]]:
+        """Encode the slot's current frame straight from shared memory (worker thread)."""
+        with reader.view() as frame:
+            if frame is None:
+                return None
+            ok, encoded = cv2.imencode(".jpg", frame.image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+            meta = {
+                "width": frame.width,
+                "height": frame.height,
+                "frame_number": frame.frame_number,
+                "timestamp": frame.timestamp,
+            }
+        if not ok or not reader.frame_valid:
+            return None  # Overwritten while encoding; the next poll gets the newer frame
+        return encoded.tobytes(), meta, sequence
+
+    def ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"preview_stream:{self.instance_id}")
+
+    async def _run(self) -> None:
+        # The reader is attached, polled and closed on the loop only; the
+        # worker thread just encodes from the reader it is handed
+        encoding: Optional[asyncio.Future] = None
+        try:
+            while self._clients or time.monotonic() - self._last_client < self.IDLE_TIMEOUT:
+                reader = self._attach()
+                result = None
+                if reader is not None:
+                    reader.touch()
+                    sequence = reader.sequence
+                    if sequence != self._encoded_sequence:
+                        encoding = asyncio.ensure_future(asyncio.to_thread(self._encode, reader, sequence))
+                        result = await asyncio.shield(encoding)
+                        encoding = None
+                if result is None:
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                    continue
+                jpeg, meta, sequence = result
+                async with self._changed:
+                    self._jpeg, self._jpeg_meta, self._sequence = jpeg, meta, sequence
+                    self._encoded_sequence = sequence
+                    self.frames_encoded += 1
+                    self._changed.notify_all()
+        except Exception as exc:
+            logger.warning("Preview stream %s stopped: %s", self.instance_id, exc)
+        finally:
+            if encoding is not None:
+                # Cancelled mid-encode: the thread still reads the slot
+                with contextlib.suppress(Exception, asyncio.CancelledError):
+                    await encoding
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+            # Nothing kept once polling stops: the next client waits for a new frame
+            self._jpeg, self._jpeg_meta, self._sequence = None, {}, 0
+
+    async def next_frame(self, after: int = 0, timeout: float = 2.0) -> Optional[tuple[int, bytes, Dict[str, object]]]:
+        """Wait for a frame newer than ``after``; None on timeout.
+
+        Returns:
+            (sequence, jpeg bytes, metadata)
+        """
+        self._last_client = time.monotonic()
+        self.ensure_running()
+        try:
+            async with self._changed:
+                await asyncio.wait_for(
+                    self._changed.wait_for(lambda: self._jpeg is not None and self._sequence != after),
+                    timeout,
+                )
+                return self._sequence, self._jpeg, self._jpeg_meta
+        except asyncio.TimeoutError:
+            return None
+
+    async def frames(self) -> AsyncIterator[tuple[bytes, Dict[str, object]]]:
+        """Yield every new frame until the caller stops iterating."""
+        self._clients += 1
+        sequence = 0
+        try:
+            while True:
+                result = await self.next_frame(sequence)
+                if result is None:
+                    continue
+                sequence, jpeg, meta = result
+                yield jpeg, meta
+        finally:
+            self._clients -= 1
+            self._last_client = time.monotonic()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class PreviewStreamHub:
+    """``PreviewStream`` per module instance, created on first use."""
+
+    def __init__(self) -> None:
+        self._streams: Dict[str, PreviewStream] = {}
+
+    def get(self, instance_id: str) -> PreviewStream:
+        stream = self._streams.get(instance_id)
+        if stream is None:
+            stream = self._streams[instance_id] = PreviewStream(instance_id)
+        return stream
+
+    async def close(self) -> None:
+        for stream in self._streams.values():
+            await stream.close()
+        self._streams.clear()
+
+
+__all__ = ["MJPEG_BOUNDARY", "PreviewStream", "PreviewStreamHub"]
@@ -2,6 +2,8 @@
 
 from aiohttp import web
 
+from .preview_stream import MJPEG_BOUNDARY
+
 
 def result_to_response(result, error_code: str, error_msg: str) -> web.Response:
     """Convert result to JSON response, handling None as error."""
@@ -41,6 +43,7 @@ def setup_cameras_routes(app: web.Application, controller) -> None:
     app.router.add_put("/api/v1/modules/cameras/config", update_camera_config_handler)
     app.router.add_get("/api/v1/modules/cameras/status", get_cameras_status_handler)
     app.router.add_get("/api/v1/modules/cameras/{camera_id}/preview", get_camera_preview_handler)
+    app.router.add_get("/api/v1/modules/cameras/{camera_id}/stream", stream_camera_preview_handler)
     app.router.add_post("/api/v1/modules/cameras/{camera_id}/snapshot", capture_snapshot_handler)
     app.router.add_put("/api/v1/modules/cameras/{camera_id}/resolution", set_camera_resolution_handler)
     app.router.add_put("/api/v1/modules/cameras/{camera_id}/fps", set_camera_fps_handler)
@@ -75,6 +78,35 @@ async def get_camera_preview_handler(request: web.Request) -> web.Response:
     return result_to_response(result, "CAMERA_NOT_FOUND", "Camera not found or not active")
 
 
+async def stream_camera_preview_handler(request: web.Request) -> web.StreamResponse:
+    """GET /api/v1/modules/cameras/{camera_id}/stream - Live MJPEG preview stream."""
+    controller = request.app["controller"]
+    stream = await controller.get_camera_stream(request.match_info["camera_id"])
+    if stream is None:
+        return create_error_response("CAMERA_NOT_FOUND", "Camera not found or not active", status=404)
+    if not stream.available:
+        return create_error_response("PREVIEW_UNAVAILABLE", "Camera is not publishing preview frames", status=503)
+
+    response = web.StreamResponse(headers={
+        "Content-Type": f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}",
+        "Cache-Control": "no-cache, no-store",
+    })
+    await response.prepare(request)
+    frames = stream.frames()
+    try:
+        async for jpeg, _meta in frames:
+            await response.write(
+                f"--{MJPEG_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                f"Content-Length: {len(jpeg)}\r\n\r\n".encode("ascii")
+                + jpeg + b"\r\n"
+            )
+    except ConnectionResetError:
+        pass
+    finally:
+        await frames.aclose()
+    return response
+
+
 async def capture_snapshot_handler(request: web.Request) -> web.Response:
     """POST /api/v1/modules/cameras/{camera_id}/snapshot - Capture single frame."""
     controller = request.app["controller"]
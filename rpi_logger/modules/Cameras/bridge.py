@@ -90,6 +90,9 @@ class CamerasRuntime(ModuleRuntime):
         # Create controller with default settings, then restore from config
         self.controller = CameraController()
         self._restore_settings_from_config()
+        instance_id = getattr(getattr(ctx, "args", None), "instance_id", None)
+        if instance_id:
+            self.controller.enable_shared_preview(instance_id)
 
         # State tracking
         self._pending_device_ready: Optional[tuple[str, Optional[str]]] = None
@@ -312,7 +315,7 @@ class CamerasRuntime(ModuleRuntime):
         # Attach view to stub and connect callbacks
         self.view.attach()
         self.controller.subscribe(self.view.render)
-        self.controller.set_preview_callback(self.view.push_frame)
+        self.controller.set_preview_callback(self.view.push_frame, self.view.preview_pacer)
         self.view.set_settings_callback(self._on_settings_changed)
 
         self.logger.info("Cameras runtime ready")
@@ -576,8 +579,8 @@ class CamerasRuntime(ModuleRuntime):
         try:
             import cv2
 
-            # Try to get a frame from the buffer
-            frame = self.controller._frame_buffer.get_latest()
+            # Borrow the latest frame so capture cannot recycle its buffer
+            frame = self.controller._frame_buffer.borrow_latest()
             if frame is None:
                 return {
                     "success": False,
@@ -585,14 +588,17 @@ class CamerasRuntime(ModuleRuntime):
                 }
 
             # Encode as JPEG
-            _, jpeg_data = cv2.imencode('.jpg', frame.data, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            try:
+                _, jpeg_data = cv2.imencode('.jpg', frame.data, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            finally:
+                frame.release()
 
             return {
                 "success": True,
                 "frame_data": bytes(jpeg_data),
                 "format": "jpeg",
-                "width": frame.data.shape[1],
-                "height": frame.data.shape[0],
+                "width": frame.size[0],
+                "height": frame.size[1],
                 "timestamp": time.time(),
             }
         except Exception as e:
@@ -633,7 +639,7 @@ class CamerasRuntime(ModuleRuntime):
         try:
             import cv2
 
-            frame = self.controller._frame_buffer.get_latest()
+            frame = self.controller._frame_buffer.borrow_latest()
             if frame is None:
                 return {
                     "success": False,
@@ -648,14 +654,17 @@ class CamerasRuntime(ModuleRuntime):
                 ext = ".jpg"
                 encode_params = [cv2.IMWRITE_JPEG_QUALITY, 90]
 
-            _, encoded = cv2.imencode(ext, frame.data, encode_params)
+            try:
+                _, encoded = cv2.imencode(ext, frame.data, encode_params)
+            finally:
+                frame.release()
             frame_data = bytes(encoded)
 
             result = {
                 "success": True,
                 "format": format_type,
-                "width": frame.data.shape[1],
-                "height": frame.data.shape[0],
+                "width": frame.size[0],
+                "height": frame.size[1],
                 "timestamp": time.time(),
             }
 
@@ -1,6 +1,7 @@
 """Capture module - video and audio acquisition."""
 
 from .frame import CapturedFrame, AudioChunk
+from .frame_pool import FramePool, FramePoolStats, FrameSlot
 from .ring_buffer import FrameRingBuffer, AudioRingBuffer
 from .camera import USBCamera
 from .audio import AudioCapture
@@ -8,6 +9,9 @@ from .audio import AudioCapture
 __all__ = [
     "CapturedFrame",
     "AudioChunk",
+    "FramePool",
+    "FramePoolStats",
+    "FrameSlot",
     "FrameRingBuffer",
     "AudioRingBuffer",
     "USBCamera",
@@ -15,6 +15,7 @@ import time
 from typing import Optional
 
 from .frame import CapturedFrame
+from .frame_pool import FramePool, FramePoolStats
 from .ring_buffer import FrameRingBuffer
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ class Camera:
         resolution: tuple[int, int],
         fps_hint: float,
         buffer: FrameRingBuffer,
+        pool_size: int = 0,
     ):
         """Initialize camera.
 
@@ -41,11 +43,14 @@ class Camera:
             resolution: Requested resolution (width, height)
             fps_hint: Hint to hardware (not enforced)
             buffer: Ring buffer for captured frames
+            pool_size: Preallocated frame slots (0 disables the frame pool)
         """
         self._device = device
         self._resolution = resolution
         self._fps_hint = fps_hint
         self._buffer = buffer
+        self._pool_size = pool_size
+        self._pool: Optional[FramePool] = None
 
         self._cap: Optional[cv2.VideoCapture] = None
         self._thread: Optional[threading.Thread] = None
@@ -96,6 +101,11 @@ class Camera:
             int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
         )
 
+        # Size the frame pool from the negotiated resolution
+        if self._pool_size > 0:
+            width, height = self._actual_resolution
+            self._pool = FramePool((height, width, 3), capacity=self._pool_size)
+
         fourcc_code = int(self._cap.get(cv2.CAP_PROP_FOURCC))
         fourcc_str = "".join([chr((fourcc_code >> 8 * i) & 0xFF) for i in range(4)])
 
@@ -140,12 +150,29 @@ class Camera:
 
         logger.debug("Capture loop started")
 
+        pool = self._pool
+
         while self._running and self._cap and self._cap.isOpened():
-            ret, frame_data = self._cap.read()
+            slot = pool.acquire() if pool else None
+            if slot is not None:
+                ret, frame_data = self._cap.read(image=slot.array)
+            else:
+                ret, frame_data = self._cap.read()
             if not ret or frame_data is None:
+                if slot is not None:
+                    slot.release()
                 time.sleep(0.001)
                 continue
 
+            if slot is not None:
+                if frame_data is slot.array:
+                    pool.record_hit()
+                else:
+                    # Backend allocated its own buffer (shape/dtype mismatch)
+                    slot.release()
+                    slot = None
+                    pool.record_miss(frame_data.shape)
+
             now = time.monotonic()
             self._frame_number += 1
 
@@ -164,7 +191,9 @@ class Camera:
                 monotonic_time=time.perf_counter(),
                 wall_time=time.time(),
                 size=(frame_data.shape[1], frame_data.shape[0]),
+                slot=slot,
             )
+            # Buffer takes over the slot reference acquired above
             self._buffer.put(frame)
 
         logger.debug(
@@ -188,6 +217,13 @@ class Camera:
         """Total frames captured."""
         return self._frame_number
 
+    @property
+    def pool_stats(self) -> FramePoolStats:
+        """Frame pool counters (all zero when the pool is disabled)."""
+        if self._pool is None:
+            return FramePoolStats()
+        return self._pool.stats
+
     @property
     def is_running(self) -> bool:
         """True if capture thread is running."""
@@ -1,8 +1,13 @@
 """Frame and audio data structures."""
 
 from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
 import numpy as np
 
+if TYPE_CHECKING:
+    from .frame_pool import FrameSlot
+
 
 @dataclass(frozen=True, slots=True)
 class CapturedFrame:
@@ -13,6 +18,20 @@ class CapturedFrame:
     monotonic_time: float  # time.perf_counter() for cross-module sync
     wall_time: float  # Wall clock time (time.time())
     size: tuple[int, int]  # (width, height)
+    slot: Optional["FrameSlot"] = None  # Pooled buffer backing data, if any
+
+    def retain(self) -> None:
+        """Borrow the frame's pooled buffer (no-op for unpooled frames)."""
+        if self.slot is not None:
+            self.slot.retain()
+
+    def release(self) -> None:
+        """Return a borrowed buffer to the pool (no-op for unpooled frames).
+
+        ``data`` must not be used after the last reference is released.
+        """
+        if self.slot is not None:
+            self.slot.release()
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,161 @@
+"""Preallocated, reference-counted frame buffers for the capture path.
+
+The capture thread reads each frame directly into a pooled slot
+(``cap.read(image=slot.array)``) instead of letting OpenCV allocate a new
+ndarray per frame. Every consumer that holds on to a frame borrows the slot
+and releases it when done; a slot only returns to the free list once its
+reference count drops to zero.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class FramePoolStats:
+    """Immutable snapshot of pool counters."""
+
+    capacity: int = 0  # Number of preallocated slots
+    in_use: int = 0  # Slots currently borrowed
+    hits: int = 0  # Frames captured directly into a pooled slot
+    misses: int = 0  # Frames the backend delivered in its own buffer
+    starved: int = 0  # Acquires that found every slot borrowed
+
+
+class FrameSlot:
+    """One preallocated frame buffer with a reference count."""
+
+    __slots__ = ("array", "_pool", "_refs", "_generation")
+
+    def __init__(self, pool: "FramePool", array: np.ndarray, generation: int):
+        self.array = array
+        self._pool = pool
+        self._refs = 0
+        self._generation = generation
+
+    def retain(self) -> None:
+        """Add a reference (consumer borrows the slot)."""
+        self._pool._retain(self)
+
+    def release(self) -> None:
+        """Drop a reference; the slot is recycled when none remain."""
+        self._pool._release(self)
+
+    @property
+    def refs(self) -> int:
+        """Current reference count."""
+        return self._refs
+
+
+class FramePool:
+    """Fixed-size pool of frame buffers shared by capture and consumers.
+
+    Never blocks the capture thread: when every slot is borrowed,
+    ``acquire()`` returns None and the caller falls back to a fresh
+    allocation (counted as starvation).
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        capacity: int = 10,
+        dtype: np.dtype = np.uint8,
+    ):
+        """Initialize pool.
+
+        Args:
+            shape: Frame array shape, e.g. (height, width, 3)
+            capacity: Number of slots to preallocate
+            dtype: Frame element type
+        """
+        self._lock = threading.Lock()
+        self._capacity = max(1, int(capacity))
+        self._dtype = np.dtype(dtype)
+        self._shape = tuple(shape)
+        self._generation = 0
+        self._free: list[FrameSlot] = []
+        self._in_use = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._starved = 0
+
+        self._allocate()
+
+    def _allocate(self) -> None:
+        """Fill the free list with slots of the current shape (lock held)."""
+        self._free = [
+            FrameSlot(self, np.empty(self._shape, dtype=self._dtype), self._generation)
+            for _ in range(self._capacity - self._in_use)
+        ]
+
+    def acquire(self) -> Optional[FrameSlot]:
+        """Take a free slot with one reference, or None if starved."""
+        with self._lock:
+            if not self._free:
+                self._starved += 1
+                return None
+            slot = self._free.pop()
+            slot._refs = 1
+            self._in_use += 1
+            return slot
+
+    def record_hit(self) -> None:
+        """Count a frame that was captured into a pooled slot."""
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self, shape: tuple[int, ...]) -> None:
+        """Count a frame delivered outside the pool.
+
+        If the backend's frame shape differs from the pool's (e.g. the driver
+        negotiated another resolution than reported), the pool is resized so
+        subsequent reads hit again. Borrowed slots of the old shape are
+        discarded as they are released.
+        """
+        with self._lock:
+            self._misses += 1
+            shape = tuple(shape)
+            if shape != self._shape:
+                self._shape = shape
+                self._generation += 1
+                self._allocate()
+
+    def _retain(self, slot: FrameSlot) -> None:
+        with self._lock:
+            slot._refs += 1
+
+    def _release(self, slot: FrameSlot) -> None:
+        with self._lock:
+            if slot._refs <= 0:
+                return
+            slot._refs -= 1
+            if slot._refs:
+                return
+            self._in_use -= 1
+            if slot._generation == self._generation:
+                self._free.append(slot)
+            elif len(self._free) + self._in_use < self._capacity:
+                self._free.append(
+                    FrameSlot(self, np.empty(self._shape, dtype=self._dtype), self._generation)
+                )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of frames currently allocated by the pool."""
+        return self._shape
+
+    @property
+    def stats(self) -> FramePoolStats:
+        """Snapshot of pool counters."""
+        with self._lock:
+            return FramePoolStats(
+                capacity=self._capacity,
+                in_use=self._in_use,
+                hits=self._hits,
+                misses=self._misses,
+                starved=self._starved,
+            )
@@ -28,12 +28,17 @@ class RingBuffer(Generic[T]):
 
     def put(self, item: T) -> bool:
         """Add item (thread-safe). Returns False if dropped old item."""
+        evicted: Optional[T] = None
         with self._lock:
             was_full = len(self._buffer) == self._buffer.maxlen
             if was_full:
                 self._drops += 1
+                evicted = self._buffer[0]
             self._buffer.append(item)
 
+        if evicted is not None:
+            self._on_evict(evicted)
+
         # Signal async consumers
         if self._loop and self._event:
             self._loop.call_soon_threadsafe(self._event.set)
@@ -52,9 +57,14 @@ class RingBuffer(Generic[T]):
                 await self._event.wait()
                 self._event.clear()
 
-            with self._lock:
-                while self._buffer:
-                    yield self._buffer.popleft()
+            while True:
+                # Pop under the lock but yield outside it, so producers are
+                # never blocked while a consumer awaits downstream work.
+                with self._lock:
+                    if not self._buffer:
+                        break
+                    item = self._buffer.popleft()
+                yield item
 
     def stop(self) -> None:
         """Stop the buffer and wake any waiting consumers."""
@@ -65,7 +75,13 @@ class RingBuffer(Generic[T]):
     def clear(self) -> None:
         """Clear all items from buffer."""
         with self._lock:
+            items = list(self._buffer)
             self._buffer.clear()
+        for item in items:
+            self._on_evict(item)
+
+    def _on_evict(self, item: T) -> None:
+        """Hook for items discarded without being consumed."""
 
     @property
     def drops(self) -> int:
@@ -80,7 +96,28 @@ class RingBuffer(Generic[T]):
 
 
 class FrameRingBuffer(RingBuffer[CapturedFrame]):
-    """Ring buffer specialized for video frames."""
+    """Ring buffer specialized for video frames.
+
+    The buffer owns one reference to each queued frame's pooled slot.
+    Frames handed out by ``frames()`` transfer that reference to the
+    consumer, which must call ``frame.release()`` when done with it.
+    """
+
+    def _on_evict(self, item: CapturedFrame) -> None:
+        item.release()
+
+    def borrow_latest(self) -> Optional[CapturedFrame]:
+        """Get most recent frame with a reference held for the caller.
+
+        Unlike ``get_latest()``, the frame's buffer cannot be recycled by
+        the capture thread until the caller calls ``frame.release()``.
+        """
+        with self._lock:
+            if not self._buffer:
+                return None
+            frame = self._buffer[-1]
+            frame.retain()
+            return frame
 
     async def frames(self) -> AsyncIterator[CapturedFrame]:
         """Async iterator yielding frames as they arrive."""
@@ -14,7 +14,12 @@ from ..capture import (
     FrameRingBuffer,
     AudioRingBuffer,
     CapturedFrame,
+    FramePoolStats,
 )
+from rpi_logger.modules.base.preroll import PreRollStats
+from rpi_logger.modules.base.preview import PreviewPacer, frame_to_ppm
+from rpi_logger.modules.base.preview_shm import PreviewPublisher
+from rpi_logger.core.telemetry import publish_telemetry
 
 try:
     from rpi_logger.modules.base.storage_utils import module_filename_prefix, sanitize_device_id
@@ -24,6 +29,11 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frames queued between capture and the consumer loop
+_FRAME_BUFFER_CAPACITY = 8
+# Pool slots: buffered frames + one being captured + one being consumed
+_FRAME_POOL_SIZE = _FRAME_BUFFER_CAPACITY + 2
+
 
 class CameraController:
     """Controls USB camera lifecycle and frame routing.
@@ -49,9 +59,17 @@ class CameraController:
         self._recorder = None
         self._muxer = None
         self._timing = None
+        # Continuous encoder holding the pre-trigger window (settings.preroll_seconds)
+        self._preroll = None
+
+        # H.264 backend selection (benchmarked in the background once streaming)
+        self._codec_task: Optional[asyncio.Task] = None
 
-        # Preview callback
+        # Preview callback, paced by the view (visibility, Tk render time)
         self._preview_callback: Optional[Callable[[bytes], None]] = None
+        self._preview_pacer = PreviewPacer()
+        # Shared-memory preview slot read by the master and its HTTP API
+        self._preview_slot: Optional[PreviewPublisher] = None
 
         # Recording state
         self._frames_recorded = 0
@@ -74,9 +92,29 @@ class CameraController:
             except Exception as e:
                 logger.error("Subscriber error: %s", e)
 
-    def set_preview_callback(self, callback: Optional[Callable[[bytes], None]]) -> None:
-        """Set callback for preview frames (PPM data)."""
+    def set_preview_callback(
+        self,
+        callback: Optional[Callable[[bytes], None]],
+        pacer: Optional[PreviewPacer] = None,
+    ) -> None:
+        """Set callback for preview frames (PPM data).
+
+        Args:
+            callback: Receives PPM bytes for the UI
+            pacer: Pacer shared with the view; frames are only converted
+                when it allows (default: fixed rate from settings)
+        """
         self._preview_callback = callback
+        if pacer is not None:
+            self._preview_pacer = pacer
+
+    def enable_shared_preview(self, instance_id: str) -> None:
+        """Publish preview frames to the instance's shared-memory slot.
+
+        The slot exists while streaming; frames are only converted into it
+        while a reader (master, HTTP API) is watching.
+        """
+        self._preview_slot = PreviewPublisher(instance_id)
 
     @property
     def state(self) -> CameraState:
@@ -110,7 +148,7 @@ class CameraController:
             loop = asyncio.get_running_loop()
 
             # Create frame buffer and bind to event loop
-            self._frame_buffer = FrameRingBuffer(capacity=8)
+            self._frame_buffer = FrameRingBuffer(capacity=_FRAME_BUFFER_CAPACITY)
             self._frame_buffer.bind_loop(loop)
 
             # Create and open camera (run in thread to avoid blocking async loop)
@@ -119,6 +157,7 @@ class CameraController:
                 resolution=self._state.settings.resolution,
                 fps_hint=float(self._state.settings.frame_rate),
                 buffer=self._frame_buffer,
+                pool_size=_FRAME_POOL_SIZE,
             )
 
             # Camera open can be slow (especially MSMF on Windows), run in thread
@@ -131,6 +170,14 @@ class CameraController:
             if self._state.settings.audio_enabled and self._state.has_audio:
                 await self._setup_audio(device_info, loop)
 
+            # Pick the muxer's H.264 encoder for the negotiated mode (cached per camera)
+            self._codec_task = asyncio.create_task(self._select_codec_backend())
+
+            await self._setup_preroll()
+
+            if self._preview_slot:
+                self._preview_slot.start(self._camera.resolution, self._state.settings.preview_scale)
+
             # Start capture
             self._camera.start()
             if self._audio:
@@ -155,9 +202,86 @@ class CameraController:
             self._state.phase = Phase.ERROR
             self._state.error = str(e)
             self._notify()
+            if self._codec_task:
+                self._codec_task.cancel()
+                self._codec_task = None
+            await self._close_preroll()
             await self._cleanup()
             return False
 
+    async def _select_codec_backend(self):
+        """Benchmark H.264 encoders for the current camera mode (runs in executor).
+
+        Returns:
+            Chosen CodecBackend, or None to use the muxer default.
+        """
+        from rpi_logger.modules.base.camera_capabilities import build_capabilities
+        from rpi_logger.modules.base.camera_validator import CapabilityValidator
+        from rpi_logger.modules.base.codec_backends import select_backend
+
+        if not self._camera:
+            return None
+        resolution = self._camera.resolution
+        fps = self._camera.hardware_fps or float(self._state.settings.frame_rate)
+        caps = build_capabilities([{"size": resolution, "fps": fps}])
+        fingerprint = f"{self._state.device_name or 'camera'}:{CapabilityValidator(caps).fingerprint()}"
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                None,
+                lambda: select_backend(
+                    resolution, fps, fingerprint=fingerprint,
+                    families=("h264",), container="mp4",
+                ),
+            )
+        except Exception as e:
+            logger.warning("Codec selection failed, using default: %s", e)
+            return None
+
+    def _selected_codec_backend(self):
+        """Selected H.264 backend if selection has finished, else None."""
+        task = self._codec_task
+        if task is None or not task.done() or task.cancelled():
+            return None
+        return task.result()
+
+    async def _setup_preroll(self) -> None:
+        """Start the pre-roll encoder if a pre-roll window is configured."""
+        settings = self._state.settings
+        if settings.preroll_seconds <= 0 or not self._camera:
+            return
+
+        from ..recording import PreRollRecorder
+
+        # The pre-roll encoder runs for the whole stream, so wait for the
+        # benchmarked backend rather than falling back to software x264
+        if self._codec_task:
+            await asyncio.wait([self._codec_task])
+
+        preroll = PreRollRecorder(
+            resolution=self._camera.resolution,
+            fps=settings.frame_rate,
+            window=settings.preroll_seconds,
+            max_bytes=settings.preroll_max_mb * 1024 * 1024,
+            sample_rate=self._audio.sample_rate if self._audio else None,
+            audio_channels=self._audio.channels if self._audio else 1,
+            codec_backend=self._selected_codec_backend(),
+        )
+        try:
+            await preroll.start()
+        except Exception as e:
+            logger.warning("Pre-roll disabled, encoder failed to start: %s", e)
+            return
+        self._preroll = preroll
+
+    async def _close_preroll(self) -> None:
+        if self._preroll:
+            preroll = self._preroll
+            self._preroll = None
+            with contextlib.suppress(Exception):
+                await preroll.close()
+
     async def _setup_audio(
         self, device_info: dict, loop: asyncio.AbstractEventLoop
     ) -> None:
@@ -200,6 +324,11 @@ class CameraController:
                 await asyncio.wait_for(self._consumer_task, timeout=2.0)
             self._consumer_task = None
 
+        if self._codec_task:
+            self._codec_task.cancel()
+            self._codec_task = None
+
+        await self._close_preroll()
         await self._cleanup()
 
         self._state.phase = Phase.IDLE
@@ -225,6 +354,7 @@ class CameraController:
         """Synchronous cleanup (runs in thread to avoid blocking event loop)."""
         if self._frame_buffer:
             self._frame_buffer.stop()
+            self._frame_buffer.clear()
             self._frame_buffer = None
 
         if self._audio_buffer:
@@ -239,6 +369,9 @@ class CameraController:
             self._camera.close()
             self._camera = None
 
+        if self._preview_slot:
+            self._preview_slot.close()
+
     def _force_cleanup(self) -> None:
         """Force cleanup by nullifying references (used after timeout)."""
         self._frame_buffer = None
@@ -308,7 +441,19 @@ class CameraController:
             # Fallback when running standalone without Logger
             video_base = f"trial{trial:03d}_{safe_name}"
 
-        if use_muxer:
+        if self._preroll:
+            # Pre-roll encoder writes the buffered window first, then live frames
+            video_path = output_dir / f"{video_base}.mp4"
+            timing_path = output_dir / f"{video_base}_timing.csv"
+            self._timing = TimingWriter(
+                timing_path, trial, safe_name, trial_label, data_format=self._state.settings.data_format
+            )
+            await self._timing.start()
+            await self._preroll.start_recording(video_path, self._timing)
+            self._frames_recorded = self._preroll.preroll_frame_count
+            self._recorder = None
+            self._muxer = None
+        elif use_muxer:
             from ..recording import AVMuxer
 
             video_path = output_dir / f"{video_base}.mp4"
@@ -318,6 +463,7 @@ class CameraController:
                 video_fps=actual_fps,
                 sample_rate=self._audio.sample_rate,
                 audio_channels=self._audio.channels,
+                codec_backend=self._selected_codec_backend(),
             )
             await self._muxer.start()
             self._recorder = None
@@ -331,9 +477,12 @@ class CameraController:
             await self._recorder.start()
             self._muxer = None
 
-        timing_path = output_dir / f"{video_base}_timing.csv"
-        self._timing = TimingWriter(timing_path, trial, safe_name, trial_label)
-        await self._timing.start()
+        if not self._preroll:
+            timing_path = output_dir / f"{video_base}_timing.csv"
+            self._timing = TimingWriter(
+                timing_path, trial, safe_name, trial_label, data_format=self._state.settings.data_format
+            )
+            await self._timing.start()
 
         self._state.recording_phase = RecordingPhase.RECORDING
         self._state.session_dir = output_dir
@@ -341,17 +490,21 @@ class CameraController:
         self._notify()
 
         logger.info(
-            "Recording started: %s at %d fps (requested=%d, hardware=%.1f, muxer=%s)",
+            "Recording started: %s at %d fps (requested=%d, hardware=%.1f, muxer=%s, pre-roll frames=%d)",
             video_path,
             actual_fps,
             requested_fps,
             hardware_fps,
             use_muxer,
+            self._frames_recorded,
         )
         return True
 
     async def stop_recording(self) -> None:
         """Stop recording."""
+        if self._preroll:
+            await self._preroll.stop_recording()
+
         if self._recorder:
             await self._recorder.stop()
             self._recorder = None
@@ -373,8 +526,9 @@ class CameraController:
         """Consume frames from capture buffer and route to recording/preview.
 
         Records ALL frames from camera - no rate limiting. The camera is already
-        configured for the desired FPS via fps_hint. Preview is throttled via
-        preview_divisor to reduce UI overhead.
+        configured for the desired FPS via fps_hint. Preview is capped at
+        frame_rate / preview_divisor and paced by the view's PreviewPacer
+        (skipped while hidden, slowed when Tk rendering falls behind).
         """
         if not self._frame_buffer:
             return
@@ -384,8 +538,7 @@ class CameraController:
         if self._audio_buffer and self._audio:
             audio_task = asyncio.create_task(self._audio_consumer_loop())
 
-        # Timing state for preview and metrics (wall-clock based)
-        preview_next = 0.0
+        # Timing state for metrics (wall-clock based)
         metrics_next = 0.0
 
         # FPS tracking via timestamp lists
@@ -404,54 +557,86 @@ class CameraController:
 
         try:
             async for frame in self._frame_buffer.frames():
-                now = time.monotonic()
-                frame_count += 1
-
-                # Initialize timing on first frame
-                if frame_count == 1:
-                    logger.debug("First frame: %dx%d", frame.size[0], frame.size[1])
-                    preview_next = now
-                    metrics_next = now + 1.0
-
-                # Preview interval from settings
-                settings = self._state.settings
-                base_interval = 1.0 / settings.frame_rate if settings.frame_rate > 0 else 1.0 / 30
-                preview_interval = base_interval * settings.preview_divisor
-
-                # Record ALL frames - no rate limiting
-                if self._state.recording_phase == RecordingPhase.RECORDING:
-                    await self._record_frame(frame)
-                    self._frames_recorded += 1
-                    frame_time = frame.monotonic_time
-                    record_frame_times.append(frame_time)
-                    if len(record_frame_times) > 30:
-                        record_frame_times.pop(0)
-
-                # Preview frame if due
-                if self._preview_callback and now >= preview_next:
-                    preview_data = self._frame_to_preview(frame)
-                    if preview_data:
-                        self._preview_callback(preview_data)
-                    preview_times.append(now)
-                    if len(preview_times) > 30:
-                        preview_times.pop(0)
-                    preview_next += preview_interval
-                    if preview_next < now:
-                        preview_next = now + preview_interval
-
-                # Update metrics every second
-                if now >= metrics_next:
-                    metrics_next = now + 1.0
-                    self._state.metrics = Metrics(
-                        hardware_fps=self._camera.hardware_fps if self._camera else 0.0,
-                        record_fps=calc_fps(record_frame_times),
-                        preview_fps=calc_fps(preview_times),
-                        frames_captured=self._camera.frame_count if self._camera else 0,
-                        frames_recorded=self._frames_recorded,
-                        frames_dropped=self._frame_buffer.drops if self._frame_buffer else 0,
-                        audio_chunks=self._audio.chunk_count if self._audio else 0,
-                    )
-                    self._notify()
+                try:
+                    now = time.monotonic()
+                    frame_count += 1
+
+                    # Initialize timing on first frame
+                    if frame_count == 1:
+                        logger.debug("First frame: %dx%d", frame.size[0], frame.size[1])
+                        metrics_next = now + 1.0
+
+                    # Preview rate cap from settings (the pacer may go slower)
+                    settings = self._state.settings
+                    frame_rate = settings.frame_rate if settings.frame_rate > 0 else 30
+                    self._preview_pacer.max_fps = frame_rate / max(1, settings.preview_divisor)
+
+                    # Pre-roll encodes every frame: buffered while idle, written while recording
+                    if self._preroll:
+                        await self._preroll.write_video(frame)
+
+                    # Record ALL frames - no rate limiting
+                    if self._state.recording_phase == RecordingPhase.RECORDING:
+                        await self._record_frame(frame)
+                        self._frames_recorded += 1
+                        frame_time = frame.monotonic_time
+                        record_frame_times.append(frame_time)
+                        if len(record_frame_times) > 30:
+                            record_frame_times.pop(0)
+
+                    # Preview frame if due (and the preview is actually shown)
+                    if self._preview_callback and self._preview_pacer.acquire(now):
+                        preview_data = self._frame_to_preview(frame)
+                        if preview_data:
+                            self._preview_callback(preview_data)
+                        else:
+                            self._preview_pacer.abandon()
+                        preview_times.append(now)
+                        if len(preview_times) > 30:
+                            preview_times.pop(0)
+
+                    # Shared-memory preview, only while the master or API reads it
+                    if self._preview_slot:
+                        self._preview_slot.max_fps = self._preview_pacer.max_fps
+                    if self._preview_slot and self._preview_slot.due(now):
+                        self._preview_slot.publish_frame(
+                            frame.data, frame.size, scale=settings.preview_scale,
+                            frame_number=frame.frame_number, timestamp=frame.wall_time,
+                        )
+
+                    # Update metrics every second
+                    if now >= metrics_next:
+                        metrics_next = now + 1.0
+                        pool_stats = self._camera.pool_stats if self._camera else FramePoolStats()
+                        preroll_stats = self._preroll.stats() if self._preroll else PreRollStats()
+                        self._state.metrics = Metrics(
+                            hardware_fps=self._camera.hardware_fps if self._camera else 0.0,
+                            record_fps=calc_fps(record_frame_times),
+                            preview_fps=calc_fps(preview_times),
+                            frames_captured=self._camera.frame_count if self._camera else 0,
+                            frames_recorded=self._frames_recorded,
+                            frames_dropped=self._frame_buffer.drops if self._frame_buffer else 0,
+                            audio_chunks=self._audio.chunk_count if self._audio else 0,
+                            pool_hits=pool_stats.hits,
+                            pool_misses=pool_stats.misses,
+                            pool_starved=pool_stats.starved,
+                            preroll_seconds=preroll_stats.seconds,
+                            preroll_bytes=preroll_stats.bytes,
+                        )
+                        metrics = self._state.metrics
+                        publish_telemetry("camera.metrics", {
+                            "capture_fps": metrics.hardware_fps,
+                            "record_fps": metrics.record_fps,
+                            "preview_fps": metrics.preview_fps,
+                            "frames_captured": metrics.frames_captured,
+                            "frames_recorded": metrics.frames_recorded,
+                            "frames_dropped": metrics.frames_dropped,
+                            "recording": self._state.recording_phase == RecordingPhase.RECORDING,
+                        })
+                        self._notify()
+                finally:
+                    # All consumers are done with the pooled buffer
+                    frame.release()
 
         except asyncio.CancelledError:
             if audio_task:
@@ -469,7 +654,9 @@ class CameraController:
 
         try:
             async for chunk in self._audio_buffer.chunks():
-                if (
+                if self._preroll:
+                    await self._preroll.write_audio(chunk)
+                elif (
                     self._state.recording_phase == RecordingPhase.RECORDING
                     and self._muxer
                 ):
@@ -481,6 +668,8 @@ class CameraController:
 
     async def _record_frame(self, frame: CapturedFrame) -> None:
         """Record a single frame."""
+        if self._preroll:
+            return  # Already written, with its timing row, by the pre-roll encoder
         if self._muxer:
             await self._muxer.write_video(frame)
         elif self._recorder:
@@ -490,27 +679,14 @@ class CameraController:
             await self._timing.write_frame(frame)
 
     def _frame_to_preview(self, frame: CapturedFrame) -> Optional[bytes]:
-        """Convert frame to PPM for Tkinter."""
+        """Convert frame to PPM for Tkinter (downscaled before colour conversion)."""
         try:
-            import cv2
-
-            rgb = cv2.cvtColor(frame.data, cv2.COLOR_BGR2RGB)
-
             scale = self._state.settings.preview_scale
-            if scale < 1.0:
-                h, w = rgb.shape[:2]
-                new_w = max(1, int(w * scale))
-                new_h = max(1, int(h * scale))
-                rgb = cv2.resize(
-                    rgb, (new_w, new_h), interpolation=cv2.INTER_NEAREST
-                )
-
-            h, w = rgb.shape[:2]
-            ppm_data = f"P6\n{w} {h}\n255\n".encode() + rgb.tobytes()
+            ppm_data = frame_to_ppm(frame.data, frame.size, scale=scale)
 
             if frame.frame_number <= 3:
                 logger.debug("Preview frame %d: %dx%d, scale=%.2f, ppm_len=%d",
-                             frame.frame_number, w, h, scale, len(ppm_data))
+                             frame.frame_number, frame.size[0], frame.size[1], scale, len(ppm_data))
 
             return ppm_data
         except Exception as e:
@@ -526,6 +702,8 @@ class CameraController:
         self._state.settings = settings
 
         if self._state.phase == Phase.STREAMING:
+            if (old.preroll_seconds, old.preroll_max_mb) != (settings.preroll_seconds, settings.preroll_max_mb):
+                logger.info("Pre-roll change takes effect when streaming restarts")
             if old.resolution != settings.resolution:
                 logger.info(
                     "Resolution change from %s to %s requires restart",
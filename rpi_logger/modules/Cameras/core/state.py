@@ -5,6 +5,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Optional
 
+from rpi_logger.modules.base.columnar import normalize_data_format
+
 
 class Phase(Enum):
     """Camera lifecycle phase."""
@@ -34,6 +36,9 @@ class Settings:
     audio_device_index: Optional[int] = None
     sample_rate: int = 48000
     audio_channels: int = 1
+    preroll_seconds: float = 0.0  # Pre-trigger window kept while idle (0 = off)
+    preroll_max_mb: int = 64  # Memory cap for pre-roll packets
+    data_format: str = "csv"  # Timing data: csv | npy (columnar sidecar)
 
 
 @dataclass(frozen=True)
@@ -47,6 +52,11 @@ class Metrics:
     frames_recorded: int = 0  # Written to video
     frames_dropped: int = 0  # Buffer overflows
     audio_chunks: int = 0  # Audio chunks captured
+    pool_hits: int = 0  # Frames captured into a preallocated slot
+    pool_misses: int = 0  # Frames the backend allocated itself
+    pool_starved: int = 0  # Captures that found every slot borrowed
+    preroll_seconds: float = 0.0  # Video currently held in the pre-roll buffer
+    preroll_bytes: int = 0  # Memory used by the pre-roll buffer
 
 
 @dataclass
@@ -86,6 +96,9 @@ def settings_to_persistable(settings: Settings) -> dict[str, str]:
         "preview_divisor": str(settings.preview_divisor),
         "audio_enabled": "true" if settings.audio_enabled else "false",
         "sample_rate": str(settings.sample_rate),
+        "preroll_seconds": str(settings.preroll_seconds),
+        "preroll_max_mb": str(settings.preroll_max_mb),
+        "data_format": settings.data_format,
     }
 
 
@@ -141,6 +154,9 @@ def settings_from_persistable(
         preview_divisor=get_int("preview_divisor", defaults.preview_divisor),
         audio_enabled=get_bool("audio_enabled", defaults.audio_enabled),
         sample_rate=get_int("sample_rate", defaults.sample_rate),
+        preroll_seconds=get_float("preroll_seconds", defaults.preroll_seconds),
+        preroll_max_mb=get_int("preroll_max_mb", defaults.preroll_max_mb),
+        data_format=normalize_data_format(data.get("data_format", defaults.data_format)),
         # Preserve runtime-only values from defaults
         audio_device_index=defaults.audio_device_index,
         audio_channels=defaults.audio_channels,
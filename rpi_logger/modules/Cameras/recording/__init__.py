@@ -3,9 +3,11 @@
 from .recorder import VideoRecorder
 from .timing import TimingWriter
 from .muxer import AVMuxer
+from .preroll import PreRollRecorder
 
 __all__ = [
     "VideoRecorder",
     "TimingWriter",
     "AVMuxer",
+    "PreRollRecorder",
 ]
@@ -5,6 +5,13 @@ import logging
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
+from rpi_logger.modules.base.codec_backends import (
+    CodecBackend,
+    fallback_chain,
+    get_backend,
+    open_video_output,
+)
+
 if TYPE_CHECKING:
     from ..capture import CapturedFrame, AudioChunk
 
@@ -16,6 +23,10 @@ class AVMuxer:
 
     Creates MP4 files with H.264 video and AAC audio.
     Cross-platform compatible (Windows/Mac/Linux/Pi).
+
+    The H.264 encoder is a CodecBackend (hardware where available, see
+    codec_backends.select_backend); libx264 is used when none is given or
+    the chosen backend fails to open.
     """
 
     def __init__(
@@ -25,6 +36,7 @@ class AVMuxer:
         video_fps: int,
         sample_rate: int,
         audio_channels: int,
+        codec_backend: Optional[CodecBackend] = None,
     ):
         """Initialize muxer.
 
@@ -34,12 +46,14 @@ class AVMuxer:
             video_fps: Video frame rate
             sample_rate: Audio sample rate (Hz)
             audio_channels: Number of audio channels
+            codec_backend: H.264 encoder backend (default: libx264)
         """
         self._path = path
         self._resolution = resolution
         self._video_fps = video_fps
         self._sample_rate = sample_rate
         self._audio_channels = audio_channels
+        self._codec_backend = codec_backend or get_backend("libx264")
 
         self._container = None
         self._video_stream = None
@@ -56,19 +70,16 @@ class AVMuxer:
         except ImportError:
             raise RuntimeError("PyAV not installed. Install with: pip install av")
 
-        self._container = av.open(str(self._path), mode="w")
-
         from fractions import Fraction
 
-        # Video stream - H.264
-        self._video_stream = self._container.add_stream("libx264", rate=self._video_fps)
-        self._video_stream.width = self._resolution[0]
-        self._video_stream.height = self._resolution[1]
-        self._video_stream.pix_fmt = "yuv420p"
-        # Use high-resolution time_base for precise timestamps (codec may change it)
-        self._video_stream.codec_context.time_base = Fraction(1, self._video_fps)
-        # Fast encoding preset for real-time
-        self._video_stream.options = {"preset": "ultrafast", "tune": "zerolatency"}
+        # Video stream - H.264 (falls back to software if the backend won't open)
+        self._container, self._video_stream, self._codec_backend = open_video_output(
+            str(self._path),
+            fallback_chain(self._codec_backend, container="mp4"),
+            self._resolution,
+            self._video_fps,
+            time_base=Fraction(1, self._video_fps),
+        )
 
         # Audio stream - AAC (rate must be int, not float)
         # Set layout to configure channels (channels property is read-only in newer PyAV)
@@ -81,8 +92,9 @@ class AVMuxer:
         self._audio_sample_count = 0
 
         logger.info(
-            "AVMuxer started: %s (video=%dx%d@%dfps, audio=%dHz/%dch)",
+            "AVMuxer started: %s (video=%s %dx%d@%dfps, audio=%dHz/%dch)",
             self._path,
+            self._codec_backend.name,
             *self._resolution,
             self._video_fps,
             self._sample_rate,
@@ -108,13 +120,10 @@ class AVMuxer:
             return
 
         import av
-        import cv2
-
-        # Convert BGR to RGB
-        rgb = cv2.cvtColor(frame.data, cv2.COLOR_BGR2RGB)
 
-        # Create PyAV frame with pts in codec time_base units
-        av_frame = av.VideoFrame.from_ndarray(rgb, format="rgb24")
+        # Wrap BGR directly; the encoder's swscale pass converts to yuv420p,
+        # so no intermediate RGB copy of the (pooled) frame is made here.
+        av_frame = av.VideoFrame.from_ndarray(frame.data, format="bgr24")
         av_frame.pts = self._video_frame_count
         av_frame.time_base = self._video_stream.codec_context.time_base
 
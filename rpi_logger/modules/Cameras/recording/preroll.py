@@ -0,0 +1,321 @@
+"""Pre-roll recorder: continuous H.264 encoding into a bounded packet ring."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Optional, TYPE_CHECKING
+
+from rpi_logger.modules.base.codec_backends import CodecBackend, get_backend
+from rpi_logger.modules.base.preroll import (
+    DEFAULT_PREROLL_MAX_BYTES,
+    PreRollBuffer,
+    PreRollStats,
+    log_preroll_flush,
+)
+
+if TYPE_CHECKING:
+    from ..capture import CapturedFrame, AudioChunk
+    from .timing import TimingWriter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedPacket:
+    """One encoded video packet with the capture times of its frame."""
+
+    data: bytes
+    pts: int
+    dts: int
+    keyframe: bool
+    wall_time: float
+    monotonic_time: float
+
+
+class PreRollRecorder:
+    """Encodes every frame and keeps the last ``window`` seconds as packets.
+
+    While idle, H.264 packets go into a PreRollBuffer (keyframe every
+    second, so eviction granularity is one GOP). ``start_recording`` opens
+    an MP4, writes the buffered packets and their timing rows, then muxes
+    new packets directly until ``stop_recording``. The encoder keeps running
+    between trials, so the next pre-roll fills immediately.
+
+    Camera audio (if configured) is buffered as raw chunks for the same
+    window and encoded to AAC when recording starts.
+    """
+
+    def __init__(
+        self,
+        resolution: tuple[int, int],
+        fps: int,
+        window: float,
+        max_bytes: int = DEFAULT_PREROLL_MAX_BYTES,
+        codec_backend: Optional[CodecBackend] = None,
+        sample_rate: Optional[int] = None,
+        audio_channels: int = 1,
+    ):
+        """Initialize pre-roll recorder.
+
+        Args:
+            resolution: Video resolution (width, height)
+            fps: Nominal frame rate (time base and GOP length)
+            window: Seconds of pre-roll to keep
+            max_bytes: Memory cap for buffered video packets
+            codec_backend: H.264 backend (default: libx264)
+            sample_rate: Audio sample rate, or None for video only
+            audio_channels: Number of audio channels
+        """
+        self._resolution = resolution
+        self._fps = max(1, int(fps))
+        self._backend = codec_backend or get_backend("libx264")
+        self._sample_rate = sample_rate
+        self._audio_channels = audio_channels
+
+        self._video_ring: PreRollBuffer[EncodedPacket] = PreRollBuffer(window, max_bytes)
+        self._audio_ring: PreRollBuffer["AudioChunk"] = PreRollBuffer(window, max_bytes)
+
+        self._encoder: Any = None
+        self._frame_times: dict[int, tuple[float, float]] = {}
+        self._next_pts = 0
+        self._force_keyframe = False
+
+        self._container: Any = None
+        self._video_stream: Any = None
+        self._audio_stream: Any = None
+        self._timing: Optional["TimingWriter"] = None
+        self._path: Optional[Path] = None
+        self._base_pts: Optional[int] = None
+        self._base_mono: Optional[float] = None
+        self._video_frame_count = 0
+        self._audio_sample_count = 0
+        self._preroll_frames = 0
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Open the encoder; frames are buffered from now on."""
+        await asyncio.to_thread(self._open_encoder)
+
+    def _open_encoder(self) -> None:
+        import av
+
+        codec = self._backend.codec if self._backend else "libx264"
+        try:
+            self._encoder = self._create_encoder(av, codec, self._backend.options if self._backend else {})
+        except Exception as e:
+            if codec == "libx264":
+                raise
+            logger.warning("Pre-roll encoder %s failed (%s), using libx264", codec, e)
+            self._backend = get_backend("libx264")
+            self._encoder = self._create_encoder(av, "libx264", self._backend.options)
+        logger.info(
+            "Pre-roll encoder started: %s %dx%d@%dfps, window=%.1fs, cap=%.0f MiB",
+            self._encoder.name,
+            *self._resolution,
+            self._fps,
+            self._video_ring.window,
+            self._video_ring.max_bytes / (1024 * 1024),
+        )
+
+    def _create_encoder(self, av: Any, codec: str, options: dict[str, str]) -> Any:
+        # No global header: SPS/PPS travel in-band with every keyframe, so any
+        # keyframe can start a file (the MP4 muxer builds avcC from it)
+        ctx = av.CodecContext.create(codec, "w")
+        ctx.width, ctx.height = self._resolution
+        ctx.pix_fmt = "yuv420p"
+        ctx.time_base = Fraction(1, self._fps)
+        ctx.framerate = Fraction(self._fps)
+        ctx.gop_size = self._fps
+        ctx.options = dict(options)
+        ctx.open()
+        return ctx
+
+    async def write_video(self, frame: "CapturedFrame") -> None:
+        """Encode a frame into the pre-roll buffer or the open recording."""
+        if self._encoder is None:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._write_video_sync, frame)
+
+    def _write_video_sync(self, frame: "CapturedFrame") -> None:
+        import av
+
+        av_frame = av.VideoFrame.from_ndarray(frame.data, format="bgr24")
+        av_frame.pts = self._next_pts
+        if self._force_keyframe:
+            av_frame.pict_type = av.video.frame.PictureType.I
+            self._force_keyframe = False
+        self._frame_times[self._next_pts] = (frame.wall_time, frame.monotonic_time)
+        self._next_pts += 1
+        for packet in self._encoder.encode(av_frame):
+            self._handle_packet(packet)
+
+    def _handle_packet(self, packet: Any) -> None:
+        wall_time, mono_time = self._frame_times.pop(packet.pts, (0.0, 0.0))
+        encoded = EncodedPacket(
+            data=bytes(packet),
+            pts=packet.pts,
+            dts=packet.dts if packet.dts is not None else packet.pts,
+            keyframe=packet.is_keyframe,
+            wall_time=wall_time,
+            monotonic_time=mono_time,
+        )
+        if self._container is not None:
+            self._mux_packet(encoded)
+        else:
+            self._video_ring.append(encoded, mono_time, len(encoded.data), encoded.keyframe)
+
+    async def write_audio(self, chunk: "AudioChunk") -> None:
+        """Buffer or record a camera audio chunk."""
+        if self._sample_rate is None:
+            return
+        async with self._lock:
+            if self._container is not None:
+                await asyncio.to_thread(self._encode_audio, chunk)
+            else:
+                self._audio_ring.append(chunk, chunk.monotonic_time, chunk.data.nbytes)
+
+    async def start_recording(self, path: Path, timing: Optional["TimingWriter"] = None) -> PreRollStats:
+        """Open ``path`` and flush the pre-roll into it.
+
+        Returns:
+            Stats of the flushed pre-roll (what the file starts with).
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._start_recording_sync, path, timing)
+
+    def _start_recording_sync(self, path: Path, timing: Optional["TimingWriter"]) -> PreRollStats:
+        import av
+
+        stats = self._video_ring.stats()
+        packets = self._video_ring.drain()
+        chunks = self._audio_ring.drain()
+
+        self._container = av.open(str(path), "w")
+        self._video_stream = self._container.add_mux_stream(
+            "h264", rate=self._fps, width=self._resolution[0], height=self._resolution[1]
+        )
+        self._video_stream.time_base = Fraction(1, self._fps)
+        if self._sample_rate is not None:
+            rate = int(self._sample_rate)
+            self._audio_stream = self._container.add_stream("aac", rate=rate)
+            self._audio_stream.layout = "mono" if self._audio_channels == 1 else "stereo"
+            self._audio_stream.codec_context.time_base = Fraction(1, rate)
+
+        self._path = path
+        self._timing = timing
+        self._base_pts = None
+        self._base_mono = None
+        self._video_frame_count = 0
+        self._audio_sample_count = 0
+        if not packets:
+            # Nothing buffered (e.g. straight after the previous trial): start on a keyframe
+            self._force_keyframe = True
+
+        for packet in packets:
+            self._mux_packet(packet)
+        self._preroll_frames = self._video_frame_count
+
+        # Camera audio from before the first pre-roll frame has no video to go with
+        first_mono = self._base_mono
+        for chunk in chunks:
+            if first_mono is None or chunk.monotonic_time >= first_mono:
+                self._encode_audio(chunk)
+
+        log_preroll_flush(logger, path.name, stats)
+        return stats
+
+    def _mux_packet(self, encoded: EncodedPacket) -> None:
+        import av
+
+        if self._base_pts is None:
+            if not encoded.keyframe:
+                return  # Wait for the forced keyframe
+            self._base_pts = encoded.dts
+            self._base_mono = encoded.monotonic_time
+
+        packet = av.Packet(encoded.data)
+        packet.pts = encoded.pts - self._base_pts
+        packet.dts = encoded.dts - self._base_pts
+        # Encoder time base; the muxer rescales to the stream's own once the header is written
+        packet.time_base = Fraction(1, self._fps)
+        packet.duration = 1
+        packet.is_keyframe = encoded.keyframe
+        packet.stream = self._video_stream
+        self._container.mux(packet)
+        self._video_frame_count += 1
+        if self._timing is not None:
+            self._timing.write_times(encoded.wall_time, encoded.monotonic_time)
+
+    def _encode_audio(self, chunk: "AudioChunk") -> None:
+        import av
+        import numpy as np
+
+        if self._audio_stream is None or self._base_pts is None:
+            return
+        audio_data = chunk.data.reshape(-1, 1) if chunk.data.ndim == 1 else chunk.data
+        audio_data = np.ascontiguousarray(audio_data.T)
+        av_frame = av.AudioFrame.from_ndarray(audio_data, format="fltp", layout=self._audio_stream.layout.name)
+        av_frame.sample_rate = chunk.sample_rate
+        av_frame.pts = self._audio_sample_count
+        av_frame.time_base = self._audio_stream.codec_context.time_base
+        for packet in self._audio_stream.encode(av_frame):
+            self._container.mux(packet)
+        self._audio_sample_count += chunk.samples
+
+    async def stop_recording(self) -> None:
+        """Close the current file; the encoder keeps filling the pre-roll."""
+        async with self._lock:
+            await asyncio.to_thread(self._stop_recording_sync)
+
+    def _stop_recording_sync(self) -> None:
+        if self._container is None:
+            return
+        if self._audio_stream is not None:
+            for packet in self._audio_stream.encode():
+                self._container.mux(packet)
+        self._container.close()
+        logger.info(
+            "Pre-roll recording stopped: %s (%d video frames, %d from pre-roll, %d audio samples)",
+            self._path,
+            self._video_frame_count,
+            self._preroll_frames,
+            self._audio_sample_count,
+        )
+        self._container = None
+        self._video_stream = None
+        self._audio_stream = None
+        self._timing = None
+
+    async def close(self) -> None:
+        """Stop any recording and release the encoder."""
+        await self.stop_recording()
+        async with self._lock:
+            self._encoder = None
+            self._video_ring.clear()
+            self._audio_ring.clear()
+            self._frame_times.clear()
+
+    def stats(self) -> PreRollStats:
+        """Current video pre-roll contents (memory use is ``bytes``)."""
+        return self._video_ring.stats()
+
+    @property
+    def is_recording(self) -> bool:
+        return self._container is not None
+
+    @property
+    def video_frame_count(self) -> int:
+        """Video frames written to the current (or last) file."""
+        return self._video_frame_count
+
+    @property
+    def preroll_frame_count(self) -> int:
+        """Frames of the current (or last) file that came from the pre-roll."""
+        return self._preroll_frames
+
+    @property
+    def audio_sample_count(self) -> int:
+        return self._audio_sample_count
@@ -3,7 +3,16 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional, TextIO, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
+
+from rpi_logger.modules.base.columnar import Column, normalize_data_format
+from rpi_logger.modules.base.timing_sink import (
+    DEFAULT_FLUSH_POLICY,
+    FlushPolicy,
+    TimingStream,
+    open_columnar_timing_stream,
+    open_timing_stream,
+)
 
 if TYPE_CHECKING:
     from ..capture import CapturedFrame
@@ -15,15 +24,33 @@ class TimingWriter:
     """CSV timing metadata writer.
 
     Records timestamp information for each recorded frame to enable
-    accurate synchronization with other data streams.
+    accurate synchronization with other data streams. Rows are batched
+    through the process-wide timing sink; ``policy`` bounds how much
+    data can be lost on a crash, and ``stop()`` fsyncs the file.
 
-    Format matches Cameras_CSI timing CSV for consistency.
+    Format matches Cameras_CSI timing CSV for consistency. With
+    ``data_format="npy"`` the rows go to a columnar ``.npy`` sidecar.
     """
 
     HEADER = "trial,module,device_id,label,record_time_unix,record_time_mono,frame_index,sensor_timestamp_ns,video_pts\n"
     MODULE = "USBCameras"
-
-    def __init__(self, path: Path, trial: int, device_id: str, label: str = ""):
+    COLUMNS = (
+        Column("record_time_unix", "f8", "%.6f"),
+        Column("record_time_mono", "f8", "%.9f"),
+        Column("frame_index", "i8"),
+        Column("sensor_timestamp_ns", "i8"),
+        Column("video_pts", "i8"),
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        trial: int,
+        device_id: str,
+        label: str = "",
+        policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+        data_format: str = "csv",
+    ):
         """Initialize timing writer.
 
         Args:
@@ -31,21 +58,32 @@ class TimingWriter:
             trial: Trial number for this recording
             device_id: Camera device identifier
             label: Optional label for this recording
+            policy: Flush-by-count/flush-by-time policy for buffered rows
+            data_format: "csv", or "npy" for a columnar sidecar next to ``path``
         """
         self._path = path
         self._trial = trial
         self._device_id = device_id
         self._label = label
-        self._file: Optional[TextIO] = None
+        self._policy = policy
+        self._columnar = normalize_data_format(data_format) == "npy"
+        self._stream: Optional[TimingStream] = None
         self._frame_index = 0
 
     async def start(self) -> None:
         """Open timing file for writing."""
-        self._file = open(self._path, "w")
-        self._file.write(self.HEADER)
-        self._file.flush()
+        if self._columnar:
+            self._stream = open_columnar_timing_stream(
+                self._path,
+                self.COLUMNS,
+                self.HEADER,
+                (self._trial, self.MODULE, self._device_id, self._label),
+                self._policy,
+            )
+        else:
+            self._stream = open_timing_stream(self._path, self.HEADER, self._policy)
         self._frame_index = 0
-        logger.info("TimingWriter started: %s", self._path)
+        logger.info("TimingWriter started: %s", self._stream.path)
 
     async def write_frame(self, frame: "CapturedFrame") -> None:
         """Write timing entry for a frame.
@@ -53,29 +91,48 @@ class TimingWriter:
         Args:
             frame: The captured frame
         """
-        if self._file:
-            self._frame_index += 1
-            row = self._format_row(frame, self._frame_index)
-            await asyncio.to_thread(self._write_and_flush, row)
+        self.write_times(frame.wall_time, frame.monotonic_time)
 
-    def _write_and_flush(self, row: str) -> None:
-        """Write row and flush to disk."""
-        self._file.write(row)
-        self._file.flush()
+    def write_times(self, wall_time: float, monotonic_time: float) -> None:
+        """Write timing entry from capture times (e.g. a buffered pre-roll frame).
+
+        Safe to call from any thread.
+
+        Args:
+            wall_time: Frame wall clock time
+            monotonic_time: Frame time.perf_counter() time
+        """
+        if self._stream:
+            self._frame_index += 1
+            if self._columnar:
+                # USB cameras have no hardware sensor timestamp
+                self._stream.write_row((wall_time, monotonic_time, self._frame_index, 0, self._frame_index))
+            else:
+                self._stream.write_row(self._format_times_row(wall_time, monotonic_time, self._frame_index))
 
     def _format_row(self, frame: "CapturedFrame", frame_index: int) -> str:
         """Format a CSV row matching CSI timing format."""
+        return self._format_times_row(frame.wall_time, frame.monotonic_time, frame_index)
+
+    def _format_times_row(self, wall_time: float, monotonic_time: float, frame_index: int) -> str:
         return (
             f"{self._trial},{self.MODULE},{self._device_id},{self._label},"
-            f"{frame.wall_time:.6f},{frame.monotonic_time:.9f},"
+            f"{wall_time:.6f},{monotonic_time:.9f},"
             f"{frame_index},0,{frame_index}\n"  # USB cameras have no hardware sensor timestamp
         )
 
     async def stop(self) -> None:
-        """Close timing file."""
-        if self._file:
-            self._file.close()
-            self._file = None
+        """Flush, fsync and close timing file."""
+        if self._stream:
+            stream = self._stream
+            self._stream = None
+            await asyncio.to_thread(stream.close)
+            if stream.rows_dropped:
+                logger.warning(
+                    "TimingWriter dropped %d rows (writer overloaded): %s",
+                    stream.rows_dropped,
+                    self._path,
+                )
 
         logger.info(
             "TimingWriter stopped: %s (%d entries)",
@@ -83,6 +140,11 @@ class TimingWriter:
             self._frame_index,
         )
 
+    @property
+    def path(self) -> Path:
+        """Timing file path (the ``.npy`` sidecar in npy mode)."""
+        return self._stream.path if self._stream else self._path
+
     @property
     def frame_count(self) -> int:
         """Number of timing entries written."""
@@ -9,6 +9,8 @@ import logging
 import threading
 from typing import Any, Callable, Dict, Optional
 
+from rpi_logger.modules.base.preview import PreviewPacer, PreviewSurface
+
 from ..core import CameraState, Phase, RecordingPhase
 
 logger = logging.getLogger(__name__)
@@ -65,8 +67,8 @@ class CameraView:
         self._ui_thread = threading.current_thread()
 
         self._canvas = None
-        self._photo = None
-        self._canvas_image_id = None
+        self._preview_surface: Optional[PreviewSurface] = None
+        self.preview_pacer = PreviewPacer()
         self._canvas_width = 0
         self._canvas_height = 0
         self._has_ui = False
@@ -84,6 +86,8 @@ class CameraView:
     def mark_shutdown(self) -> None:
         """Mark view as shutting down - prevents further UI updates."""
         self._shutting_down = True
+        if self._preview_surface is not None:
+            self._preview_surface.close()
         # Close settings window if open
         if self._settings_window is not None:
             try:
@@ -134,6 +138,7 @@ class CameraView:
         self._canvas = tk.Canvas(parent, bg="black", highlightthickness=0)
         self._canvas.grid(row=0, column=0, sticky="nsew")
         self._canvas.bind("<Configure>", self._on_canvas_configure)
+        self._preview_surface = PreviewSurface(self._canvas, tk, self.preview_pacer)
 
     def _install_metrics_display(self, tk, ttk) -> None:
         """Install metrics display in the IO panel."""
@@ -212,7 +217,6 @@ class CameraView:
         """Handle canvas resize."""
         self._canvas_width = event.width
         self._canvas_height = event.height
-        self._canvas_image_id = None
 
     def _on_settings_click(self) -> None:
         """Handle settings menu click."""
@@ -547,6 +551,7 @@ class CameraView:
             ppm_data: PPM format image data
         """
         if not self._has_ui or not self._canvas or self._shutting_down:
+            self.preview_pacer.abandon()
             if self._frame_count == 0 and not self._shutting_down:
                 self._logger.debug("push_frame: no UI (has_ui=%s, canvas=%s)",
                                    self._has_ui, self._canvas is not None)
@@ -564,29 +569,17 @@ class CameraView:
         self._schedule_ui(update)
 
     def _render_frame(self, ppm_data: Optional[bytes]) -> None:
-        """Render a frame to the canvas."""
+        """Render a frame to the canvas (reuses one PhotoImage)."""
         try:
-            if ppm_data is None:
+            if ppm_data is None or self._preview_surface is None or self._shutting_down:
+                self.preview_pacer.abandon()
                 return
 
             if self._frame_count <= 3:
-                self._logger.debug("_render_frame: creating PhotoImage, canvas=%dx%d",
+                self._logger.debug("_render_frame: canvas=%dx%d",
                                    self._canvas_width, self._canvas_height)
 
-            self._photo = self._tk.PhotoImage(data=ppm_data)
-
-            x = self._canvas_width // 2 if self._canvas_width > 1 else 0
-            y = self._canvas_height // 2 if self._canvas_height > 1 else 0
-
-            if self._canvas_image_id is not None:
-                self._canvas.itemconfig(self._canvas_image_id, image=self._photo)
-                self._canvas.coords(self._canvas_image_id, x, y)
-            else:
-                self._canvas_image_id = self._canvas.create_image(
-                    x, y, image=self._photo, anchor="center"
-                )
-                if self._frame_count <= 3:
-                    self._logger.debug("_render_frame: created image at (%d, %d)", x, y)
+            self._preview_surface.render(ppm_data)
 
         except Exception as e:
             # Always log render errors - they indicate a real problem
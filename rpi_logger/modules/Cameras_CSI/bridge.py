@@ -84,6 +84,8 @@ class CSICamerasRuntime(ModuleRuntime):
         self.logger.debug("=" * 60)
 
         self._auto_record = getattr(args, "record", False)
+        if instance_id := getattr(args, "instance_id", None):
+            self.executor.enable_shared_preview(instance_id)
         if output_dir := getattr(args, "output_dir", None):
             self._session_dir = Path(output_dir)
 
@@ -97,7 +99,7 @@ class CSICamerasRuntime(ModuleRuntime):
         self.view.bind_dispatch(self.store.dispatch)
         self.store.subscribe(self.view.render)
 
-        self.executor.set_preview_callback(self.view.push_frame)
+        self.executor.set_preview_callback(self.view.push_frame, self.view.preview_pacer)
 
         self.logger.info("CSI Cameras runtime ready")
         StatusMessage.send("ready")
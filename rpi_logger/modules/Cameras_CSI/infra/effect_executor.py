@@ -1,8 +1,12 @@
 import asyncio
+import time
 from pathlib import Path
 from typing import Callable, Awaitable, Optional
 
 from rpi_logger.core.logging_utils import LoggerLike, ensure_structured_logger
+from rpi_logger.core.telemetry import publish_telemetry
+from rpi_logger.modules.base.preview import PreviewPacer, frame_to_ppm
+from rpi_logger.modules.base.preview_shm import PreviewPublisher
 
 from ..core import (
     Action, Effect,
@@ -16,7 +20,7 @@ from ..core import (
     CameraCapabilities, FrameMetrics,
 )
 from ..capture import PicamSource, CapturedFrame, HAS_PICAMERA2
-from ..recording import RecordingSession
+from ..recording import RecordingSession, select_encoder_backend
 
 
 class EffectExecutor:
@@ -30,9 +34,15 @@ class EffectExecutor:
         self._camera: PicamSource | None = None
         self._recording: RecordingSession | None = None
         self._capture_task: asyncio.Task | None = None
+        # Encoder backend selection for the open camera mode (may benchmark)
+        self._codec_task: asyncio.Task | None = None
+        self._codec_mode: tuple[tuple[int, int], int] | None = None
         self._status_callback = status_callback
         self._settings_save_callback = settings_save_callback
         self._preview_callback: Callable[[bytes], None] | None = None
+        self._preview_pacer = PreviewPacer()
+        # Shared-memory preview slot read by the master and its HTTP API
+        self._preview_slot: PreviewPublisher | None = None
         self._frame_rate = 30
         self._preview_divisor = 4
         self._preview_scale = 0.25  # 1/4 scale default
@@ -40,8 +50,19 @@ class EffectExecutor:
         self._camera_index: int = 0
         self._camera_id: str = ""
 
-    def set_preview_callback(self, callback: Callable[[bytes], None] | None) -> None:
+    def set_preview_callback(
+        self,
+        callback: Callable[[bytes], None] | None,
+        pacer: PreviewPacer | None = None,
+    ) -> None:
+        # The view's pacer skips previews while hidden and slows them when Tk lags
         self._preview_callback = callback
+        if pacer is not None:
+            self._preview_pacer = pacer
+
+    def enable_shared_preview(self, instance_id: str) -> None:
+        # Slot exists while the camera is open; filled only while someone reads it
+        self._preview_slot = PreviewPublisher(instance_id)
 
     async def __call__(
         self,
@@ -89,6 +110,8 @@ class EffectExecutor:
                 self._preview_scale = settings.preview_scale
                 if self._settings_save_callback:
                     self._settings_save_callback(settings)
+                if self._camera:
+                    self._start_codec_selection(self._resolution, self._frame_rate)
                 # Reconfigure camera hardware if frame rate changed
                 if self._camera and old_frame_rate != self._frame_rate:
                     self._logger.debug("Frame rate changed %d -> %d, reconfiguring camera",
@@ -156,12 +179,48 @@ class EffectExecutor:
             fps=fps,
         )
         await self._camera.start()
+        if self._preview_slot:
+            self._preview_slot.start(resolution, self._preview_scale)
+        self._start_codec_selection(resolution, fps)
+
+    def _start_codec_selection(self, resolution: tuple[int, int], fps: int) -> None:
+        if self._codec_mode == (resolution, fps) and self._codec_task:
+            return
+        if self._codec_task:
+            self._codec_task.cancel()
+        self._codec_mode = (resolution, fps)
+        self._codec_task = asyncio.create_task(self._select_codec_backend(resolution, fps))
+
+    async def _select_codec_backend(self, resolution: tuple[int, int], fps: int):
+        try:
+            return await asyncio.to_thread(
+                select_encoder_backend, resolution, fps, self._camera_id or None,
+            )
+        except Exception as e:
+            self._logger.warning("Codec selection failed, using default: %s", e)
+            return None
+
+    def _selected_codec_backend(self, resolution: tuple[int, int], fps: int):
+        # Recording never waits on the benchmark: until it finishes, record
+        # with the software fallbacks
+        task = self._codec_task
+        if self._codec_mode != (resolution, fps) or task is None:
+            return None
+        if not task.done() or task.cancelled():
+            return None
+        return task.result()
 
     async def _close_camera(self) -> None:
         if self._camera:
             self._logger.debug("Closing camera")
             await self._camera.stop()
             self._camera = None
+        if self._codec_task:
+            self._codec_task.cancel()
+            self._codec_task = None
+            self._codec_mode = None
+        if self._preview_slot:
+            self._preview_slot.close()
 
     def _start_capture_loop(self, dispatch: Callable[[Action], Awaitable[None]]) -> None:
         if self._capture_task and not self._capture_task.done():
@@ -192,7 +251,6 @@ class EffectExecutor:
         record_count = 0
         preview_count = 0
         next_record_time = 0.0
-        next_preview_time = 0.0
         last_record_actual = 0.0  # For interval measurement only
         last_preview_actual = 0.0  # For interval measurement only
         record_intervals: list[float] = []
@@ -206,8 +264,7 @@ class EffectExecutor:
 
             # Read intervals dynamically so settings changes take effect immediately
             record_interval = 1.0 / self._frame_rate if self._frame_rate > 0 else 1.0
-            preview_fps = max(1, self._frame_rate // self._preview_divisor)
-            preview_interval = 1.0 / preview_fps
+            self._preview_pacer.max_fps = max(1, self._frame_rate // self._preview_divisor)
 
             if self._recording:
                 # Initialize schedule on first frame
@@ -231,33 +288,34 @@ class EffectExecutor:
                     if next_record_time < now:
                         next_record_time = now + record_interval
 
-            if self._preview_callback:
-                # Initialize schedule on first frame
-                if next_preview_time == 0.0:
-                    next_preview_time = now
-                if now >= next_preview_time:
-                    preview_data = self._frame_to_ppm(frame)
-                    if preview_data:
-                        self._preview_callback(preview_data)
-                        if preview_count < 3:
-                            self._logger.info("Preview frame %d sent, size=%d bytes", preview_count, len(preview_data))
-                    elif preview_count < 3:
+            if self._preview_callback and self._preview_pacer.acquire(time.monotonic()):
+                preview_data = self._frame_to_ppm(frame)
+                if preview_data:
+                    self._preview_callback(preview_data)
+                    if preview_count < 3:
+                        self._logger.info("Preview frame %d sent, size=%d bytes", preview_count, len(preview_data))
+                else:
+                    self._preview_pacer.abandon()
+                    if preview_count < 3:
                         self._logger.warning("Preview frame %d: _frame_to_ppm returned None", preview_count)
-                    preview_count += 1
-                    # Record actual interval for FPS measurement
-                    if last_preview_actual > 0:
-                        preview_intervals.append(now - last_preview_actual)
-                        if len(preview_intervals) > 30:
-                            preview_intervals.pop(0)
-                        if len(preview_intervals) >= 5:
-                            avg_interval = sum(preview_intervals) / len(preview_intervals)
-                            preview_fps_actual = 1.0 / avg_interval if avg_interval > 0 else 0.0
-                    last_preview_actual = now
-                    # Advance target by interval (not actual time) to prevent drift
-                    next_preview_time += preview_interval
-                    # Catch up if we've fallen behind (e.g., app was paused)
-                    if next_preview_time < now:
-                        next_preview_time = now + preview_interval
+                preview_count += 1
+                # Record actual interval for FPS measurement
+                if last_preview_actual > 0:
+                    preview_intervals.append(now - last_preview_actual)
+                    if len(preview_intervals) > 30:
+                        preview_intervals.pop(0)
+                    if len(preview_intervals) >= 5:
+                        avg_interval = sum(preview_intervals) / len(preview_intervals)
+                        preview_fps_actual = 1.0 / avg_interval if avg_interval > 0 else 0.0
+                last_preview_actual = now
+
+            if self._preview_slot:
+                self._preview_slot.max_fps = self._preview_pacer.max_fps
+                if self._preview_slot.due():
+                    self._preview_slot.publish_frame(
+                        frame.data, frame.size, frame.color_format, self._preview_scale,
+                        frame_number=frame.frame_number, timestamp=frame.wall_time,
+                    )
 
             if frame_count % 30 == 0:
                 metrics = FrameMetrics(
@@ -270,52 +328,26 @@ class EffectExecutor:
                     record_fps_actual=record_fps_actual,
                     preview_fps_actual=preview_fps_actual,
                 )
+                publish_telemetry("camera.metrics", {
+                    "capture_fps": metrics.capture_fps_actual,
+                    "record_fps": metrics.record_fps_actual,
+                    "preview_fps": metrics.preview_fps_actual,
+                    "frames_captured": metrics.frames_captured,
+                    "frames_recorded": metrics.frames_recorded,
+                    "frames_dropped": metrics.frames_dropped,
+                    "recording": self._recording is not None,
+                })
                 await dispatch(UpdateMetrics(metrics))
 
     def _frame_to_ppm(self, frame: CapturedFrame) -> bytes | None:
         """Convert frame to PPM format for Tkinter PhotoImage.
 
         Uses preview_scale (default 0.25 = 1/4 scale). Never upscales.
-        Handles buffer stride padding (e.g., 1456 -> 1536 for DMA alignment).
+        YUV420 planes are downscaled before colour conversion, and buffer
+        stride padding (e.g., 1456 -> 1536 for DMA alignment) is skipped.
         """
         try:
-            import cv2
-            target_width, target_height = frame.size
-
-            if frame.color_format == "yuv420":
-                # YUV420 buffer has stride padding for DMA alignment
-                # Shape is (height * 1.5, stride) where stride >= width
-                if len(frame.data.shape) == 2:
-                    yuv_height, stride = frame.data.shape
-                    rgb = cv2.cvtColor(frame.data, cv2.COLOR_YUV2RGB_I420)
-                    # Crop to actual image size (remove stride padding)
-                    rgb = rgb[:target_height, :target_width]
-                else:
-                    # Fallback: try to reshape using actual dimensions
-                    yuv_height = target_height + target_height // 2
-                    yuv = frame.data.reshape((yuv_height, -1))
-                    rgb = cv2.cvtColor(yuv, cv2.COLOR_YUV2RGB_I420)
-                    rgb = rgb[:target_height, :target_width]
-            else:
-                rgb = frame.data
-                if len(rgb.shape) == 3 and rgb.shape[2] == 3:
-                    rgb = cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB)
-                # Crop if needed
-                rgb = rgb[:target_height, :target_width]
-
-            h, w = rgb.shape[:2]
-
-            # Use preview_scale (default 1/4), never upscale
-            scale = min(self._preview_scale, 1.0)
-            if scale < 1.0:
-                new_w = int(w * scale)
-                new_h = int(h * scale)
-                if new_w > 0 and new_h > 0:
-                    rgb = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_NEAREST)
-
-            h, w = rgb.shape[:2]
-            header = f"P6\n{w} {h}\n255\n".encode('ascii')
-            return header + rgb.tobytes()
+            return frame_to_ppm(frame.data, frame.size, frame.color_format, self._preview_scale)
         except Exception as e:
             self._logger.warning("Preview frame error: %s (format=%s, size=%s, shape=%s)",
                                e, frame.color_format, frame.size, frame.data.shape)
@@ -339,6 +371,7 @@ class EffectExecutor:
             resolution=resolution,
             fps=fps,
             label=label,
+            codec_backend=self._selected_codec_backend(resolution, fps),
         )
         await self._recording.start()
         await dispatch(RecordingStarted())
@@ -1,10 +1,11 @@
 from .timing_writer import TimingCSVWriter
-from .encoder import VideoEncoder
+from .encoder import VideoEncoder, select_encoder_backend
 from .session import RecordingSession, RecordingMetrics
 
 __all__ = [
     "TimingCSVWriter",
     "VideoEncoder",
+    "select_encoder_backend",
     "RecordingSession",
     "RecordingMetrics",
 ]
@@ -1,12 +1,60 @@
 from pathlib import Path
 import asyncio
-import subprocess
-from typing import BinaryIO
+import logging
+from fractions import Fraction
+from typing import Any
 import cv2
 import numpy as np
 
+from rpi_logger.modules.base.codec_backends import (
+    CodecBackend,
+    fallback_chain,
+    get_backend,
+    open_video_output,
+    select_backend,
+)
+
 from capture.frame import CapturedFrame
 
+logger = logging.getLogger(__name__)
+
+try:
+    import av
+    HAS_PYAV = True
+except ImportError:
+    av = None
+    HAS_PYAV = False
+
+# Codec families that take yuv420p (or its full-range twin) natively
+_YUV_FAMILIES = ("h264", "mjpeg")
+
+
+def yuv420_to_av_frame(data: np.ndarray, size: tuple[int, int]) -> Any:
+    # Wrap a (possibly stride-padded) I420 buffer as a yuv420p VideoFrame without
+    # copying: plane line sizes are taken from the row stride, padding is ignored.
+    width, height = size
+    if data.ndim != 2:
+        data = data.reshape((height + height // 2, -1))
+    return av.VideoFrame.from_numpy_buffer(data, format="yuv420p", width=width)
+
+
+def select_encoder_backend(
+    resolution: tuple[int, int],
+    fps: int,
+    fingerprint: str | None = None,
+    container: str = "avi",
+) -> CodecBackend | None:
+    # Blocking: benchmarks every backend on the first call for a camera mode.
+    # Run it off the event loop when the camera is configured, not at record time.
+    return select_backend(
+        resolution,
+        fps,
+        fingerprint=fingerprint,
+        families=_YUV_FAMILIES,
+        container=container,
+        source_format="yuv420p",
+    )
+
 
 class VideoEncoder:
     def __init__(
@@ -14,19 +62,34 @@ class VideoEncoder:
         output_path: Path,
         resolution: tuple[int, int],
         fps: int,
-        quality: int = 85
+        quality: int = 85,
+        codec: str = "auto",
+        use_pyav: bool | None = None,
+        codec_backend: CodecBackend | None = None,
     ):
         self._output_path = output_path
         self._resolution = resolution
         self._fps = fps
         self._quality = quality
+        self._codec = codec
+        # Backend picked by select_encoder_backend(); None means software fallbacks
+        self._codec_backend = codec_backend
+        self._use_pyav = HAS_PYAV if use_pyav is None else (use_pyav and HAS_PYAV)
         self._writer: cv2.VideoWriter | None = None
+        self._container: Any = None
+        self._stream: Any = None
+        self._backend: CodecBackend | None = None
         self._frame_count = 0
+        self._conversions = 0
         self._running = False
 
     async def start(self) -> None:
-        self._writer = await asyncio.to_thread(self._create_writer)
+        if self._use_pyav:
+            await asyncio.to_thread(self._open_pyav)
+        else:
+            self._writer = await asyncio.to_thread(self._create_writer)
         self._frame_count = 0
+        self._conversions = 0
         self._running = True
 
     def _create_writer(self) -> cv2.VideoWriter:
@@ -38,18 +101,57 @@ class VideoEncoder:
             self._resolution,
         )
 
+    def _open_pyav(self) -> None:
+        container_ext = self._output_path.suffix.lstrip(".").lower() or None
+        if self._codec == "auto":
+            backend = self._codec_backend
+        else:
+            backend = get_backend(self._codec)
+            if backend is None:
+                raise ValueError(f"Unknown codec backend: {self._codec}")
+
+        self._container, self._stream, self._backend = open_video_output(
+            str(self._output_path),
+            fallback_chain(backend, container=container_ext),
+            self._resolution,
+            Fraction(self._fps).limit_denominator(1000),
+        )
+        logger.info("CSI encoder: %s %dx%d @ %s fps", self._backend.name,
+                    self._resolution[0], self._resolution[1], self._fps)
+
     async def write_frame(self, frame: CapturedFrame) -> None:
-        if not self._writer or not self._running:
+        if not self._running:
+            return
+        if self._stream is not None:
+            await asyncio.to_thread(self._encode_pyav, frame)
+            return
+        if not self._writer:
             return
 
         if frame.color_format == "yuv420":
             bgr = await asyncio.to_thread(self._convert_yuv_to_bgr, frame.data, frame.size)
+            self._conversions += 1
         else:
             bgr = frame.data
 
         await asyncio.to_thread(self._writer.write, bgr)
         self._frame_count += 1
 
+    def _encode_pyav(self, frame: CapturedFrame) -> None:
+        if self._stream is None:
+            return
+        if frame.color_format == "yuv420":
+            av_frame = yuv420_to_av_frame(frame.data, frame.size)
+        else:
+            av_frame = av.VideoFrame.from_ndarray(np.ascontiguousarray(frame.data), format="bgr24")
+        # PyAV reformats to the encoder's pixel format when they differ
+        if av_frame.format.name != self._stream.codec_context.pix_fmt:
+            self._conversions += 1
+        av_frame.pts = self._frame_count
+        for packet in self._stream.encode(av_frame):
+            self._container.mux(packet)
+        self._frame_count += 1
+
     def _convert_yuv_to_bgr(self, yuv_data: np.ndarray, size: tuple[int, int]) -> np.ndarray:
         width, height = size
         if len(yuv_data.shape) == 2:
@@ -62,14 +164,36 @@ class VideoEncoder:
 
     async def stop(self) -> None:
         self._running = False
+        if self._container:
+            await asyncio.to_thread(self._close_pyav)
         if self._writer:
             await asyncio.to_thread(self._writer.release)
             self._writer = None
 
+    def _close_pyav(self) -> None:
+        try:
+            for packet in self._stream.encode(None):
+                self._container.mux(packet)
+        except Exception as e:
+            logger.warning("CSI encoder flush failed: %s", e)
+        finally:
+            self._container.close()
+            self._container = None
+            self._stream = None
+
     @property
     def frame_count(self) -> int:
         return self._frame_count
 
+    @property
+    def conversion_count(self) -> int:
+        # Full-frame pixel format conversions performed (or requested from PyAV)
+        return self._conversions
+
+    @property
+    def codec_name(self) -> str:
+        return self._backend.name if self._backend else "opencv-mjpg"
+
     @property
     def output_path(self) -> Path:
         return self._output_path
@@ -2,6 +2,7 @@ from pathlib import Path
 from dataclasses import dataclass
 import time
 
+from rpi_logger.modules.base.codec_backends import CodecBackend
 from rpi_logger.modules.base.storage_utils import module_filename_prefix
 
 from capture.frame import CapturedFrame
@@ -25,7 +26,8 @@ class RecordingSession:
         device_id: str,
         resolution: tuple[int, int],
         fps: int,
-        label: str = ""
+        label: str = "",
+        codec_backend: CodecBackend | None = None,
     ):
         self._session_dir = session_dir
         self._trial_number = trial_number
@@ -39,7 +41,9 @@ class RecordingSession:
         self._video_path = session_dir / f"{prefix}_{safe_name}.avi"
         self._timing_path = session_dir / f"{prefix}_{safe_name}_timing.csv"
 
-        self._encoder = VideoEncoder(self._video_path, resolution, fps)
+        self._encoder = VideoEncoder(
+            self._video_path, resolution, fps, codec_backend=codec_backend,
+        )
         self._timing_writer = TimingCSVWriter(self._timing_path, trial_number, device_id, label)
 
         self._is_recording = False
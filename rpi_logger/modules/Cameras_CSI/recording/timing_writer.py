@@ -1,6 +1,12 @@
 from pathlib import Path
 import asyncio
-from typing import TextIO
+
+from rpi_logger.modules.base.timing_sink import (
+    DEFAULT_FLUSH_POLICY,
+    FlushPolicy,
+    TimingStream,
+    open_timing_stream,
+)
 
 from capture.frame import CapturedFrame
 
@@ -9,34 +15,34 @@ class TimingCSVWriter:
     HEADER = "trial,module,device_id,label,record_time_unix,record_time_mono,frame_index,sensor_timestamp_ns,video_pts\n"
     MODULE = "CSICameras"
 
-    def __init__(self, path: Path, trial_number: int, device_id: str, label: str = ""):
+    def __init__(
+        self,
+        path: Path,
+        trial_number: int,
+        device_id: str,
+        label: str = "",
+        policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+    ):
         self._path = path
         self._trial = trial_number
         self._device_id = device_id
         self._label = label
-        self._file: TextIO | None = None
+        self._policy = policy
+        self._stream: TimingStream | None = None
         self._frame_index = 0
 
     async def start(self) -> None:
-        self._file = await asyncio.to_thread(self._open_file)
+        self._stream = await asyncio.to_thread(
+            open_timing_stream, self._path, self.HEADER, self._policy
+        )
         self._frame_index = 0
 
-    def _open_file(self) -> TextIO:
-        f = open(self._path, 'w', newline='')
-        f.write(self.HEADER)
-        f.flush()
-        return f
-
     async def write_frame(self, frame: CapturedFrame) -> None:
-        if not self._file:
+        if not self._stream:
             return
         self._frame_index += 1
-        row = self._format_row(frame, self._frame_index)
-        await asyncio.to_thread(self._write_and_flush, row)
-
-    def _write_and_flush(self, row: str) -> None:
-        self._file.write(row)
-        self._file.flush()
+        # Batched by the shared timing sink; no per-frame thread hop or flush
+        self._stream.write_row(self._format_row(frame, self._frame_index))
 
     def _format_row(self, frame: CapturedFrame, frame_index: int) -> str:
         return (
@@ -46,9 +52,10 @@ class TimingCSVWriter:
         )
 
     async def stop(self) -> None:
-        if self._file:
-            await asyncio.to_thread(self._file.close)
-            self._file = None
+        if self._stream:
+            stream = self._stream
+            self._stream = None
+            await asyncio.to_thread(stream.close)
 
     @property
     def frame_count(self) -> int:
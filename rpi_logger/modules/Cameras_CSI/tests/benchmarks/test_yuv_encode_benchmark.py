@@ -0,0 +1,75 @@
+"""Recording throughput and colorspace conversions per frame for YUV420 input.
+
+Synthetic stride-padded I420 buffers (as PicamSource delivers them) are fed to:
+- legacy: cvtColor(I420 -> BGR) + OpenCV MJPG writer (BGR -> YUV inside)
+- pyav-mjpeg: yuv420p frame -> MJPEG (yuv420p -> yuvj420p range pass only)
+- pyav-auto: yuv420p frame -> selected yuv420p-native encoder (no conversion)
+
+Run: pytest rpi_logger/modules/Cameras_CSI/tests/benchmarks -m slow -s
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+
+from rpi_logger.modules.base.codec_backends import CodecBenchmarkCache
+from recording.encoder import VideoEncoder, select_encoder_backend
+
+WIDTH, HEIGHT, STRIDE = 1456, 1088, 1536  # IMX296 full frame, DMA-padded stride
+FRAMES = 60
+
+
+@dataclass
+class MockFrame:
+    data: np.ndarray
+    size: tuple[int, int] = (WIDTH, HEIGHT)
+    color_format: str = "yuv420"
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+async def _run(encoder: VideoEncoder, frames: list[MockFrame]) -> float:
+    await encoder.start()
+    start = time.perf_counter()
+    for frame in frames:
+        await encoder.write_frame(frame)
+    await encoder.stop()
+    return len(frames) / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_yuv_encode_benchmark(tmp_path: Path, monkeypatch):
+    import rpi_logger.modules.base.codec_backends as codec_backends
+
+    monkeypatch.setattr(codec_backends, "default_cache",
+                        lambda: CodecBenchmarkCache(tmp_path / "codec_benchmarks.json"))
+
+    rng = np.random.default_rng(0)
+    buffers = [rng.integers(0, 256, (HEIGHT * 3 // 2, STRIDE), dtype=np.uint8) for _ in range(4)]
+    frames = [MockFrame(buffers[i % len(buffers)]) for i in range(FRAMES)]
+
+    variants = {
+        # OpenCV's MJPG writer converts BGR back to YUV internally: +1 per frame
+        "legacy": (VideoEncoder(tmp_path / "legacy.avi", (WIDTH, HEIGHT), 30, use_pyav=False), 1),
+        "pyav-mjpeg": (VideoEncoder(tmp_path / "mjpeg.avi", (WIDTH, HEIGHT), 30, codec="mjpeg"), 0),
+        "pyav-auto": (VideoEncoder(tmp_path / "auto.avi", (WIDTH, HEIGHT), 30,
+                                   codec_backend=select_encoder_backend((WIDTH, HEIGHT), 30)), 0),
+    }
+
+    print(f"\n{WIDTH}x{HEIGHT} I420 (stride {STRIDE}), {FRAMES} frames")
+    conversions = {}
+    for name, (encoder, hidden) in variants.items():
+        fps = await _run(encoder, frames)
+        conversions[name] = (encoder.conversion_count + hidden * encoder.frame_count) / encoder.frame_count
+        print(f"  {name:<11} {encoder.codec_name:<12} {fps:7.1f} fps  "
+              f"{conversions[name]:.0f} conversions/frame")
+
+    assert conversions["legacy"] == 2
+    assert conversions["pyav-mjpeg"] <= 1
+    assert conversions["pyav-auto"] == 0
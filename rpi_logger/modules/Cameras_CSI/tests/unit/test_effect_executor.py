@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from rpi_logger.modules.Cameras_CSI.infra import effect_executor as executor_module
+from rpi_logger.modules.Cameras_CSI.infra.effect_executor import EffectExecutor
+
+
+class FakeSession:
+    created: list[dict] = []
+
+    def __init__(self, **kwargs):
+        FakeSession.created.append(kwargs)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    FakeSession.created = []
+    monkeypatch.setattr(executor_module, "RecordingSession", FakeSession)
+    return FakeSession
+
+
+async def noop_dispatch(action) -> None:
+    pass
+
+
+class TestCodecSelection:
+    @pytest.mark.asyncio
+    async def test_recording_does_not_wait_for_benchmark(self, monkeypatch, fake_session, tmp_path: Path):
+        release = threading.Event()
+        calls = []
+
+        def slow_select(resolution, fps, fingerprint=None, container="avi"):
+            calls.append((resolution, fps, fingerprint))
+            release.wait(5)
+            return "selected"
+
+        monkeypatch.setattr(executor_module, "select_encoder_backend", slow_select)
+        executor = EffectExecutor()
+        executor._camera_id = "imx296"
+        executor._start_codec_selection((640, 480), 30)
+
+        await asyncio.wait_for(
+            executor._start_recording(tmp_path / "trial_001.avi", 30, (640, 480), "", noop_dispatch),
+            timeout=1.0,
+        )
+        assert fake_session.created[-1]["codec_backend"] is None
+
+        release.set()
+        await executor._codec_task
+        await executor._start_recording(tmp_path / "trial_002.avi", 30, (640, 480), "", noop_dispatch)
+        assert fake_session.created[-1]["codec_backend"] == "selected"
+        assert calls == [((640, 480), 30, "imx296")]
+
+    @pytest.mark.asyncio
+    async def test_mode_change_ignores_stale_selection(self, monkeypatch, fake_session, tmp_path: Path):
+        monkeypatch.setattr(
+            executor_module, "select_encoder_backend",
+            lambda resolution, fps, fingerprint=None, container="avi": resolution,
+        )
+        executor = EffectExecutor()
+        executor._start_codec_selection((640, 480), 30)
+        await executor._codec_task
+
+        await executor._start_recording(tmp_path / "trial_001.avi", 30, (1280, 720), "", noop_dispatch)
+        assert fake_session.created[-1]["codec_backend"] is None
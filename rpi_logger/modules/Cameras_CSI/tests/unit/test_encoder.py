@@ -0,0 +1,127 @@
+import pytest
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+av = pytest.importorskip("av")
+
+from recording.encoder import VideoEncoder, yuv420_to_av_frame
+
+
+WIDTH, HEIGHT, STRIDE = 96, 64, 128  # Stride padded like the IMX296 (1456 -> 1536)
+
+
+@dataclass
+class MockFrame:
+    """Mock YUV420 frame as delivered by PicamSource."""
+    data: np.ndarray
+    size: tuple[int, int] = (WIDTH, HEIGHT)
+    color_format: str = "yuv420"
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def make_i420(width: int = WIDTH, height: int = HEIGHT, stride: int = STRIDE) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    return rng.integers(0, 256, (height * 3 // 2, stride), dtype=np.uint8)
+
+
+class TestYuv420Frame:
+    def test_planes_use_buffer_stride(self):
+        data = make_i420()
+        frame = yuv420_to_av_frame(data, (WIDTH, HEIGHT))
+
+        assert frame.format.name == "yuv420p"
+        assert (frame.width, frame.height) == (WIDTH, HEIGHT)
+        assert [p.line_size for p in frame.planes] == [STRIDE, STRIDE // 2, STRIDE // 2]
+
+    def test_wraps_buffer_without_copy(self):
+        data = make_i420()
+        frame = yuv420_to_av_frame(data, (WIDTH, HEIGHT))
+
+        y_plane = np.frombuffer(frame.planes[0], dtype=np.uint8)
+        data[0, 0] ^= 0xFF
+        assert y_plane[0] == data[0, 0]
+
+    def test_flat_buffer_reshaped(self):
+        data = make_i420(stride=WIDTH).reshape(-1)
+        frame = yuv420_to_av_frame(data, (WIDTH, HEIGHT))
+        assert (frame.width, frame.height) == (WIDTH, HEIGHT)
+
+
+class TestVideoEncoderYuvPath:
+    @pytest.mark.asyncio
+    async def test_lossless_roundtrip_no_conversion(self, tmp_path: Path):
+        """yuv420p frames go straight into a yuv420p encoder, padding dropped."""
+        data = make_i420()
+        encoder = VideoEncoder(tmp_path / "out.avi", (WIDTH, HEIGHT), 10, codec="ffv1")
+        await encoder.start()
+        for _ in range(3):
+            await encoder.write_frame(MockFrame(data))
+        await encoder.stop()
+
+        assert encoder.frame_count == 3
+        assert encoder.conversion_count == 0
+
+        with av.open(str(tmp_path / "out.avi")) as container:
+            decoded = [f.to_ndarray() for f in container.decode(video=0)]
+        assert len(decoded) == 3
+        assert np.array_equal(decoded[0][:HEIGHT], data[:HEIGHT, :WIDTH])
+
+    @pytest.mark.asyncio
+    async def test_mjpeg_counts_range_conversion(self, tmp_path: Path):
+        encoder = VideoEncoder(tmp_path / "out.avi", (WIDTH, HEIGHT), 10, codec="mjpeg")
+        await encoder.start()
+        await encoder.write_frame(MockFrame(make_i420()))
+        await encoder.stop()
+
+        assert encoder.codec_name == "mjpeg"
+        assert encoder.conversion_count == 1
+
+    @pytest.mark.asyncio
+    async def test_opencv_fallback_converts_to_bgr(self, tmp_path: Path):
+        encoder = VideoEncoder(tmp_path / "out.avi", (WIDTH, HEIGHT), 10, use_pyav=False)
+        await encoder.start()
+        await encoder.write_frame(MockFrame(make_i420()))
+        await encoder.stop()
+
+        assert encoder.codec_name == "opencv-mjpg"
+        assert encoder.frame_count == 1
+        assert encoder.conversion_count == 1
+
+
+class TestVideoEncoderBackend:
+    @pytest.mark.asyncio
+    async def test_auto_uses_preselected_backend(self, tmp_path: Path, monkeypatch):
+        """start() must not benchmark; the backend is chosen when the camera opens."""
+        from recording import encoder as encoder_module
+        from rpi_logger.modules.base.codec_backends import get_backend
+
+        def fail(*args, **kwargs):
+            raise AssertionError("select_backend called from start()")
+
+        monkeypatch.setattr(encoder_module, "select_backend", fail)
+        encoder = VideoEncoder(
+            tmp_path / "out.avi", (WIDTH, HEIGHT), 10, codec_backend=get_backend("ffv1"),
+        )
+        await encoder.start()
+        await encoder.write_frame(MockFrame(make_i420()))
+        await encoder.stop()
+
+        assert encoder.codec_name == "ffv1"
+
+    @pytest.mark.asyncio
+    async def test_auto_without_backend_uses_software_fallback(self, tmp_path: Path, monkeypatch):
+        from recording import encoder as encoder_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("select_backend called from start()")
+
+        monkeypatch.setattr(encoder_module, "select_backend", fail)
+        encoder = VideoEncoder(tmp_path / "out.avi", (WIDTH, HEIGHT), 10)
+        await encoder.start()
+        await encoder.write_frame(MockFrame(make_i420()))
+        await encoder.stop()
+
+        assert encoder.frame_count == 1
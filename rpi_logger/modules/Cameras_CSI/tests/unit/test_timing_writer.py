@@ -5,8 +5,22 @@ from pathlib import Path
 from dataclasses import dataclass
 import time
 
+from rpi_logger.modules.base.timing_sink import FlushPolicy
 from recording.timing_writer import TimingCSVWriter
 
+# Flush window used by the persistence tests; rows must reach disk within it
+FAST_POLICY = FlushPolicy(max_rows=1, max_delay=0.05)
+
+
+async def read_lines_within(path: Path, expected: int, timeout: float = 1.0) -> list[str]:
+    """Poll until the file has at least `expected` lines or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while True:
+        lines = path.read_text().strip().split('\n')
+        if len(lines) >= expected or time.monotonic() >= deadline:
+            return lines
+        await asyncio.sleep(0.01)
+
 
 @dataclass
 class MockFrame:
@@ -23,7 +37,8 @@ class TestTimingWriterPersistence:
     """Tests that would have caught the timing CSV buffering bug.
 
     Bug: Data was buffered in memory and only written to disk when stop()
-    was called. If recording stopped abnormally, data was lost.
+    was called. If recording stopped abnormally, data was lost. Rows are
+    now batched, but must reach disk within the flush policy's window.
     """
 
     @pytest.mark.asyncio
@@ -48,6 +63,7 @@ class TestTimingWriterPersistence:
         """Frame data should be on disk after write_frame(), even without stop().
 
         This is the critical test that would have caught the buffering bug.
+        Uses the default policy: the row must land within max_delay.
         """
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "timing.csv"
@@ -64,8 +80,7 @@ class TestTimingWriterPersistence:
             await writer.write_frame(frame)
 
             # Check data is on disk WITHOUT calling stop()
-            content = path.read_text()
-            lines = content.strip().split('\n')
+            lines = await read_lines_within(path, 2, timeout=2.0)
 
             assert len(lines) >= 2, \
                 f"Expected header + data row, got {len(lines)} lines. " \
@@ -75,10 +90,10 @@ class TestTimingWriterPersistence:
 
     @pytest.mark.asyncio
     async def test_multiple_frames_persisted_incrementally(self):
-        """Each frame should be persisted immediately, not batched."""
+        """With a one-row policy, each frame is persisted before the next."""
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "timing.csv"
-            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam")
+            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam", policy=FAST_POLICY)
 
             await writer.start()
 
@@ -91,9 +106,8 @@ class TestTimingWriterPersistence:
                 await writer.write_frame(frame)
 
                 # Check after EACH write
-                content = path.read_text()
-                lines = content.strip().split('\n')
                 expected_lines = 1 + (i + 1)  # header + frames written so far
+                lines = await read_lines_within(path, expected_lines)
 
                 assert len(lines) == expected_lines, \
                     f"After frame {i+1}, expected {expected_lines} lines, got {len(lines)}. " \
@@ -106,7 +120,7 @@ class TestTimingWriterPersistence:
         """Data written before 'crash' (no stop()) should be recoverable."""
         with tempfile.TemporaryDirectory() as tmpdir:
             path = Path(tmpdir) / "timing.csv"
-            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam")
+            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam", policy=FAST_POLICY)
 
             await writer.start()
 
@@ -123,14 +137,54 @@ class TestTimingWriterPersistence:
             # In real scenario, process would exit here
 
             # Verify data is on disk
-            content = path.read_text()
-            lines = content.strip().split('\n')
+            lines = await read_lines_within(path, 4)
 
             assert len(lines) == 4, \
                 f"Expected 4 lines (1 header + 3 frames), got {len(lines)}. " \
                 "Data was lost due to buffering!"
 
 
+class TestTimingWriterBatching:
+    """Tests for batched writes through the shared timing sink."""
+
+    @pytest.mark.asyncio
+    async def test_rows_batched_by_count(self):
+        """Rows below max_rows stay buffered until the count is reached."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "timing.csv"
+            policy = FlushPolicy(max_rows=10, max_delay=60.0)
+            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam", policy=policy)
+
+            await writer.start()
+            frame = MockFrame(wall_time=time.time(), monotonic_time=time.perf_counter(), sensor_timestamp_ns=0)
+            for _ in range(9):
+                await writer.write_frame(frame)
+            await asyncio.sleep(0.05)
+            assert len(path.read_text().strip().split('\n')) == 1
+
+            await writer.write_frame(frame)
+            lines = await read_lines_within(path, 11)
+            assert len(lines) == 11
+
+            await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_pending_rows(self):
+        """stop() writes everything still buffered before closing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "timing.csv"
+            policy = FlushPolicy(max_rows=1000, max_delay=60.0)
+            writer = TimingCSVWriter(path, trial_number=1, device_id="test_cam", policy=policy)
+
+            await writer.start()
+            frame = MockFrame(wall_time=time.time(), monotonic_time=time.perf_counter(), sensor_timestamp_ns=0)
+            for _ in range(25):
+                await writer.write_frame(frame)
+            await writer.stop()
+
+            assert len(path.read_text().strip().split('\n')) == 26
+
+
 class TestTimingWriterContent:
     """Tests for timing CSV content correctness."""
 
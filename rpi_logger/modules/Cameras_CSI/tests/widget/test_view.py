@@ -369,7 +369,7 @@ class TestFrameRendering:
         view.push_frame(ppm)
         tk_root.update()
 
-        assert view._photo is not None
+        assert view._preview_surface.photo is not None
 
     def test_push_frame_creates_canvas_image(self, view_with_dispatch, tk_root):
         view, actions = view_with_dispatch
@@ -377,7 +377,18 @@ class TestFrameRendering:
         view.push_frame(ppm)
         tk_root.update()
 
-        assert view._canvas_image_id is not None
+        assert view._preview_surface.image_id is not None
+
+    def test_frames_reuse_photo_image(self, view_with_dispatch, tk_root):
+        view, actions = view_with_dispatch
+        view.push_frame(b"P6\n2 2\n255\n" + b"\xff\x00\x00" * 4)
+        tk_root.update()
+        photo = view._preview_surface.photo
+        view.push_frame(b"P6\n4 2\n255\n" + b"\x00\xff\x00" * 8)
+        tk_root.update()
+
+        assert view._preview_surface.photo is photo
+        assert photo.width() == 4
 
     def test_push_multiple_frames(self, view_with_dispatch, tk_root):
         view, actions = view_with_dispatch
@@ -11,6 +11,7 @@ import threading
 from typing import Any, Callable, Awaitable, Dict, Optional
 
 from rpi_logger.core.logging_utils import LoggerLike, ensure_structured_logger
+from rpi_logger.modules.base.preview import PreviewPacer, PreviewSurface
 
 try:
     from rpi_logger.core.ui.theme.colors import Colors
@@ -61,8 +62,8 @@ class CSICameraView:
         self._ui_thread = threading.current_thread()
 
         self._canvas = None
-        self._photo = None
-        self._canvas_image_id = None
+        self._preview_surface: Optional[PreviewSurface] = None
+        self.preview_pacer = PreviewPacer()
         self._canvas_width = 0
         self._canvas_height = 0
         self._has_ui = False
@@ -109,6 +110,7 @@ class CSICameraView:
         self._canvas = tk.Canvas(parent, bg="black", highlightthickness=0)
         self._canvas.grid(row=0, column=0, sticky="nsew")
         self._canvas.bind("<Configure>", self._on_canvas_configure)
+        self._preview_surface = PreviewSurface(self._canvas, tk, self.preview_pacer)
 
     def _install_metrics_display(self, tk, ttk) -> None:
         builder = getattr(self._stub_view, "build_io_stub_content", None)
@@ -170,7 +172,6 @@ class CSICameraView:
     def _on_canvas_configure(self, event) -> None:
         self._canvas_width = event.width
         self._canvas_height = event.height
-        self._canvas_image_id = None
 
     def get_canvas_size(self) -> tuple:
         if self._canvas_width > 1 and self._canvas_height > 1:
@@ -248,6 +249,7 @@ class CSICameraView:
 
     def push_frame(self, ppm_data: Optional[bytes]) -> None:
         if not self._has_ui or not self._canvas:
+            self.preview_pacer.abandon()
             return
 
         self._frame_count += 1
@@ -259,21 +261,11 @@ class CSICameraView:
 
     def _render_frame(self, ppm_data: Optional[bytes]) -> None:
         try:
-            if ppm_data is None:
+            if ppm_data is None or self._preview_surface is None:
+                self.preview_pacer.abandon()
                 return
 
-            self._photo = self._tk.PhotoImage(data=ppm_data)
-
-            x = self._canvas_width // 2 if self._canvas_width > 1 else 0
-            y = self._canvas_height // 2 if self._canvas_height > 1 else 0
-
-            if self._canvas_image_id is not None:
-                self._canvas.itemconfig(self._canvas_image_id, image=self._photo)
-                self._canvas.coords(self._canvas_image_id, x, y)
-            else:
-                self._canvas_image_id = self._canvas.create_image(
-                    x, y, image=self._photo, anchor="center"
-                )
+            self._preview_surface.render(ppm_data)
 
         except Exception as e:
             if self._frame_count <= 3:
@@ -34,6 +34,9 @@ class DRTConfig:
     device_pid: int = 0x801E
     baudrate: int = 9600
 
+    # Data output settings
+    host_latency_column: bool = False  # Add host_latency_us (serial arrival to write) to CSVs
+
     # Window settings
     window_x: int = 0
     window_y: int = 0
@@ -67,6 +70,8 @@ class DRTConfig:
             device_vid=get_pref_int(prefs, "device_vid", defaults.device_vid),
             device_pid=get_pref_int(prefs, "device_pid", defaults.device_pid),
             baudrate=get_pref_int(prefs, "baudrate", defaults.baudrate),
+            # Data output settings
+            host_latency_column=get_pref_bool(prefs, "host_latency_column", defaults.host_latency_column),
             # Window settings
             window_x=get_pref_int(prefs, "window_x", defaults.window_x),
             window_y=get_pref_int(prefs, "window_y", defaults.window_y),
@@ -107,8 +107,8 @@ DRT CSV Columns (10 fields):
    module                - Module name ("DRT")
    device_id             - Device identifier (e.g., "DRT_dev_ttyacm0")
    label                 - Trial/condition label (blank if not set)
-   record_time_unix      - Host capture time (Unix seconds, 6 decimals)
-   record_time_mono      - Host capture time (seconds, 9 decimals)
+   record_time_unix      - Host arrival time (Unix seconds, 6 decimals)
+   record_time_mono      - Host arrival time (seconds, 9 decimals)
    device_time_unix      - Device absolute time (Unix seconds, if available)
    device_time_offset    - Device timestamp in ms since experiment start
    responses             - Button press count for this stimulus
@@ -119,8 +119,8 @@ wDRT CSV Columns (11 fields):
    module                - Module name ("DRT")
    device_id             - Device identifier (e.g., "wDRT_dev_ttyacm0")
    label                 - Trial/condition label (blank if not set)
-   record_time_unix      - Host capture time (Unix seconds, 6 decimals)
-   record_time_mono      - Host capture time (seconds, 9 decimals)
+   record_time_unix      - Host arrival time (Unix seconds, 6 decimals)
+   record_time_mono      - Host arrival time (seconds, 9 decimals)
    device_time_unix      - Device RTC timestamp (Unix seconds)
    device_time_offset    - Device timestamp in ms since experiment start
    responses             - Button press count for this stimulus
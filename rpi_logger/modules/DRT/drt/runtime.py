@@ -19,6 +19,7 @@ from rpi_logger.modules.DRT.drt_core.handlers import (
 )
 from rpi_logger.modules.DRT.drt_core.transports import USBTransport, XBeeProxyTransport
 from rpi_logger.core.commands import StatusMessage, StatusType
+from rpi_logger.core.telemetry import publish_telemetry
 
 
 class DRTModuleRuntime(ModuleRuntime):
@@ -454,20 +455,29 @@ class DRTModuleRuntime(ModuleRuntime):
             return SDRTHandler(
                 device_id=device_id,
                 output_dir=self.module_data_dir,
-                transport=transport
+                transport=transport,
+                host_latency=self.typed_config.host_latency_column,
             )
         elif device_type in (DRTDeviceType.WDRT_USB, DRTDeviceType.WDRT_WIRELESS):
             return WDRTUSBHandler(
                 device_id=device_id,
                 output_dir=self.module_data_dir,
                 transport=transport,
-                device_type=device_type
+                device_type=device_type,
+                host_latency=self.typed_config.host_latency_column,
             )
         else:
             self.logger.warning("Unknown device type: %s", device_type)
             return None
 
     async def _on_device_data(self, port: str, data_type: str, payload: Dict[str, Any]) -> None:
+        if data_type in ("trial", "data", "reaction_time") and "reaction_time" in payload:
+            publish_telemetry("drt.trial", {
+                "device_id": port,
+                "trial_number": payload.get("trial_number"),
+                "reaction_time": payload.get("reaction_time"),
+                "clicks": payload.get("clicks"),
+            })
         if self.view:
             self.view.on_device_data(port, data_type, payload)
 
@@ -6,9 +6,10 @@ import time
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable, Awaitable
 
+from rpi_logger.core.devices.transports import RawLine
 from rpi_logger.core.logging_utils import get_module_logger
 from rpi_logger.modules.base.storage_utils import derive_session_token, sanitize_device_id
-from .protocols import SDRT_CSV_HEADER, WDRT_CSV_HEADER, RT_TIMEOUT_VALUE
+from .protocols import HOST_LATENCY_COLUMN, SDRT_CSV_HEADER, WDRT_CSV_HEADER, RT_TIMEOUT_VALUE
 
 logger = get_module_logger(__name__)
 
@@ -22,6 +23,7 @@ class DRTDataLogger:
         device_id: str,
         device_type: str,
         event_callback: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+        host_latency: bool = False,
     ):
         """Initialize the data logger.
 
@@ -30,11 +32,13 @@ class DRTDataLogger:
             device_id: Device identifier (typically port name)
             device_type: Device type ('sdrt' or 'wdrt')
             event_callback: Optional async callback for log events
+            host_latency: Append a host_latency_us column (serial arrival to write)
         """
         self.output_dir = output_dir
         self.device_id = device_id
         self.device_type = device_type.lower()
         self._event_callback = event_callback
+        self.host_latency = host_latency
 
         # CSV file handle caching for reduced I/O overhead
         self._csv_file = None
@@ -48,9 +52,10 @@ class DRTDataLogger:
     @property
     def csv_header(self) -> str:
         """Return the CSV header for this device type."""
-        if self.device_type == 'wdrt':
-            return WDRT_CSV_HEADER
-        return SDRT_CSV_HEADER
+        header = WDRT_CSV_HEADER if self.device_type == 'wdrt' else SDRT_CSV_HEADER
+        if self.host_latency:
+            return f"{header},{HOST_LATENCY_COLUMN}"
+        return header
 
     @property
     def filepath(self) -> Optional[Path]:
@@ -146,7 +151,12 @@ class DRTDataLogger:
         self._trial_label = ""
         self._current_trial_number = None
 
-    def log_trial(self, data: Dict[str, Any], click_count: int = 0) -> bool:
+    def log_trial(
+        self,
+        data: Dict[str, Any],
+        click_count: int = 0,
+        arrival: Optional[RawLine] = None,
+    ) -> bool:
         """Log trial data to CSV file.
 
         Args:
@@ -158,6 +168,8 @@ class DRTDataLogger:
                 - battery: Battery percentage (wDRT only)
                 - device_utc: Device UTC time (wDRT only)
             click_count: Fallback click count if not in data
+            arrival: Serial line the trial was reported in; its arrival time
+                becomes the record time (default: now)
 
         Returns:
             True if logging succeeded
@@ -181,8 +193,12 @@ class DRTDataLogger:
 
             # Common fields
             device_id_csv = self._format_device_id_for_csv()
-            unix_time = time.time()
-            record_time_mono = time.perf_counter()
+            if arrival is not None:
+                unix_time = arrival.arrival_unix
+                record_time_mono = arrival.arrival_mono
+            else:
+                unix_time = time.time()
+                record_time_mono = time.perf_counter()
             device_timestamp = data.get('timestamp', 0)
             clicks = data.get('clicks', click_count)
             reaction_time = data.get('reaction_time', RT_TIMEOUT_VALUE)
@@ -207,6 +223,9 @@ class DRTDataLogger:
                     device_time_unix, device_timestamp, clicks, reaction_time
                 ]
 
+            if self.host_latency:
+                row.append(f"{arrival.host_latency_us():.0f}" if arrival is not None else "")
+
             # Write using csv.writer for proper escaping of special characters
             buffer = io.StringIO()
             writer = csv.writer(buffer)
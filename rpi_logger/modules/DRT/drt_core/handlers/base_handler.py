@@ -7,10 +7,14 @@ import asyncio
 
 from rpi_logger.core.logging_utils import get_module_logger
 from rpi_logger.core.connection import ReconnectingMixin, ReconnectConfig
+from rpi_logger.core.devices.transports import RawLine
 from ..device_types import DRTDeviceType
 
 logger = get_module_logger(__name__)
 
+# Longest idle wait for data between connection checks
+READ_IDLE_TIMEOUT = 0.5
+
 
 def _task_exception_handler(task: asyncio.Task) -> None:
     """Handle exceptions from fire-and-forget tasks."""
@@ -58,6 +62,9 @@ class BaseDRTHandler(ABC, ReconnectingMixin):
         self._click_count = 0
         self._trial_number = 0
         self._buffered_trial_data: Optional[Dict[str, Any]] = None
+        self._buffered_trial_arrival: Optional[RawLine] = None
+        # Line being processed; its arrival time becomes the CSV record time
+        self._current_line: Optional[RawLine] = None
         self._trial_label: str = ""  # Condition/experiment label for CSV output
         self._active_trial_number: int = 1
 
@@ -241,19 +248,23 @@ class BaseDRTHandler(ABC, ReconnectingMixin):
                 # Process all available data in the buffer
                 lines_processed = 0
                 while lines_processed < 50:  # Limit to prevent infinite loop
-                    line = await self.transport.read_line()
-                    if line:
-                        self._process_response(line.strip())
-                        lines_processed += 1
-                    else:
+                    raw = await self.transport.read_raw_line()
+                    if raw is None:
                         break
+                    self._current_line = raw
+                    self._process_response(raw.text)
+                    lines_processed += 1
 
                 # Reset error counter on successful iteration
                 if lines_processed > 0:
                     self._consecutive_errors = 0
 
-                # Yield to other tasks
-                await asyncio.sleep(0.01)
+                if lines_processed < 50:
+                    # Buffer drained: sleep until the transport has new data
+                    await self.transport.wait_for_data(READ_IDLE_TIMEOUT)
+                else:
+                    # Yield to other tasks before draining the rest
+                    await asyncio.sleep(0)
 
             except asyncio.CancelledError:
                 break
@@ -388,6 +399,7 @@ class BaseDRTHandler(ABC, ReconnectingMixin):
             self._click_count = 0
             self._trial_number = 0
             self._buffered_trial_data = None
+            self._buffered_trial_arrival = None
 
     def update_output_dir(self, output_dir: Path) -> None:
         """
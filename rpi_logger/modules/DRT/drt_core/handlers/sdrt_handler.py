@@ -27,7 +27,8 @@ class SDRTHandler(BaseDRTHandler):
         self,
         device_id: str,
         output_dir: Path,
-        transport: USBTransport
+        transport: USBTransport,
+        host_latency: bool = False,
     ):
         """
         Initialize the sDRT handler.
@@ -36,6 +37,7 @@ class SDRTHandler(BaseDRTHandler):
             device_id: Unique identifier (typically the serial port)
             output_dir: Directory for CSV data files
             transport: USB transport for device communication
+            host_latency: Add the host_latency_us column to the CSV
         """
         super().__init__(device_id, output_dir, transport)
 
@@ -57,6 +59,7 @@ class SDRTHandler(BaseDRTHandler):
             device_id=device_id,
             device_type='sdrt',
             event_callback=self._dispatch_data_event,
+            host_latency=host_latency,
         )
 
     @property
@@ -111,6 +114,7 @@ class SDRTHandler(BaseDRTHandler):
         self._device_click_count = 0
         self._trial_start_click_count = 0
         self._buffered_trial_data = None
+        self._buffered_trial_arrival = None
         self._recording = True
         self._data_logger.set_trial_label(self._trial_label)
         self._data_logger.start_recording(self._active_trial_number)
@@ -273,6 +277,8 @@ class SDRTHandler(BaseDRTHandler):
                     'trial_number': trial_number,
                     'reaction_time': reaction_time,
                 }
+                # Record time is when the trl line arrived, not when stm>0 logs it
+                self._buffered_trial_arrival = self._current_line
 
                 self._create_background_task(self._dispatch_data_event('trial', {
                     'timestamp': timestamp,
@@ -288,11 +294,14 @@ class SDRTHandler(BaseDRTHandler):
         # Log any buffered trial data
         if self._buffered_trial_data:
             trial_number = self._buffered_trial_data.get('trial_number', 0)
-            if self._data_logger.log_trial(self._buffered_trial_data, self._click_count):
+            if self._data_logger.log_trial(
+                self._buffered_trial_data, self._click_count, arrival=self._buffered_trial_arrival
+            ):
                 self._create_background_task(
                     self._data_logger.dispatch_logged_event(trial_number)
                 )
             self._buffered_trial_data = None
+            self._buffered_trial_arrival = None
 
         # Dispatch end event
         self._create_background_task(self._dispatch_data_event('end', {}))
@@ -313,11 +322,14 @@ class SDRTHandler(BaseDRTHandler):
                 # This captures clicks from stimulus ON to stimulus OFF
                 if self._buffered_trial_data:
                     trial_number = self._buffered_trial_data.get('trial_number', 0)
-                    if self._data_logger.log_trial(self._buffered_trial_data, self._click_count):
+                    if self._data_logger.log_trial(
+                        self._buffered_trial_data, self._click_count, arrival=self._buffered_trial_arrival
+                    ):
                         self._create_background_task(
                             self._data_logger.dispatch_logged_event(trial_number)
                         )
                     self._buffered_trial_data = None
+                    self._buffered_trial_arrival = None
 
             self._create_background_task(self._dispatch_data_event('stimulus', {
                 'state': self._stimulus_on
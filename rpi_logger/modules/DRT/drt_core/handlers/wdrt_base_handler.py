@@ -27,7 +27,8 @@ class WDRTBaseHandler(BaseDRTHandler):
         self,
         device_id: str,
         output_dir: Path,
-        transport: Any
+        transport: Any,
+        host_latency: bool = False,
     ):
         super().__init__(device_id, output_dir, transport)
 
@@ -45,6 +46,7 @@ class WDRTBaseHandler(BaseDRTHandler):
             device_id=device_id,
             device_type='wdrt',
             event_callback=self._dispatch_data_event,
+            host_latency=host_latency,
         )
 
     @property
@@ -319,7 +321,7 @@ class WDRTBaseHandler(BaseDRTHandler):
                     'device_utc': device_utc,
                 }
 
-                if self._data_logger.log_trial(trial_data):
+                if self._data_logger.log_trial(trial_data, arrival=self._current_line):
                     self._create_background_task(
                         self._data_logger.dispatch_logged_event(trial_n)
                     )
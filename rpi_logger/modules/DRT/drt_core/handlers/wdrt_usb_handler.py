@@ -16,9 +16,10 @@ class WDRTUSBHandler(WDRTBaseHandler):
         device_id: str,
         output_dir: Path,
         transport: Any,
-        device_type: DRTDeviceType = DRTDeviceType.WDRT_USB
+        device_type: DRTDeviceType = DRTDeviceType.WDRT_USB,
+        host_latency: bool = False,
     ):
-        super().__init__(device_id, output_dir, transport)
+        super().__init__(device_id, output_dir, transport, host_latency=host_latency)
         self._device_type = device_type
         self._rtc_synced = False
 
@@ -88,6 +88,9 @@ WDRT_CSV_HEADER = (
     "device_time_unix,device_time_offset,responses,reaction_time_ms,battery_percent"
 )
 
+# Optional trailing column: microseconds from serial arrival to CSV write
+HOST_LATENCY_COLUMN = "host_latency_us"
+
 WDRT_CONFIG_PARAMS = {
     'ONTM': 'stimDur',
     'ISIH': 'upperISI',
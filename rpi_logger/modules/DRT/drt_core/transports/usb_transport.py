@@ -7,7 +7,7 @@ from typing import Optional
 import serial
 
 from rpi_logger.core.logging_utils import get_module_logger
-from rpi_logger.core.devices.transports import BaseTransport
+from rpi_logger.core.devices.transports import BaseTransport, LineInbox, RawLine, get_serial_reactor
 from ..protocols import DEFAULT_READ_TIMEOUT, DEFAULT_WRITE_TIMEOUT
 
 logger = get_module_logger(__name__)
@@ -17,7 +17,12 @@ MAX_READ_BUFFER_SIZE = 65536  # 64KB
 
 
 class USBTransport(BaseTransport):
-    """Async USB serial transport for DRT devices."""
+    """Async USB serial transport for DRT devices.
+
+    Incoming lines are read and timestamped by the shared serial reactor;
+    ``read_line`` only drains the buffered lines and ``wait_for_data``
+    sleeps until the next one arrives.
+    """
 
     def __init__(
         self,
@@ -41,12 +46,15 @@ class USBTransport(BaseTransport):
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
         self._serial: Optional[serial.Serial] = None
-        self._lock = threading.Lock()  # Serialize access to serial port
-        self._read_buffer = b''  # Buffer for accumulating partial reads
+        self._lock = threading.Lock()  # Serialize writes and close
+        self._inbox: Optional[LineInbox] = None
+        self._reader = None  # Serial reactor handle
 
     @property
     def is_connected(self) -> bool:
-        """Check if the serial port is connected and open."""
+        """Check if the serial port is open and its reader has not failed."""
+        if self._inbox is not None and self._inbox.error is not None:
+            return False
         return self._serial is not None and self._serial.is_open
 
     async def connect(self) -> bool:
@@ -65,6 +73,10 @@ class USBTransport(BaseTransport):
             await asyncio.to_thread(self._serial.reset_input_buffer)
             await asyncio.to_thread(self._serial.reset_output_buffer)
 
+            self._inbox = LineInbox()
+            self._reader = get_serial_reactor().attach(
+                self._serial, self._inbox, name=self.port, max_line_size=MAX_READ_BUFFER_SIZE
+            )
             self._connected = True
             logger.info("Connected to %s at %d baud", self.port, self.baudrate)
             return True
@@ -79,13 +91,15 @@ class USBTransport(BaseTransport):
         if not self._serial:
             return
 
+        reader, self._reader = self._reader, None
+
         def _close_with_lock():
-            """Close serial port while holding lock to prevent read/write races."""
+            """Stop the reader, then close serial port while holding lock to prevent write races."""
+            if reader is not None:
+                get_serial_reactor().detach(reader, timeout=self.read_timeout + 1.0)
             with self._lock:
                 if self._serial and self._serial.is_open:
                     self._serial.close()
-                # Clear any buffered data
-                self._read_buffer = b''
 
         try:
             await asyncio.to_thread(_close_with_lock)
@@ -94,6 +108,7 @@ class USBTransport(BaseTransport):
             logger.error("Error disconnecting from %s: %s", self.port, e)
         finally:
             self._serial = None
+            self._inbox = None
             self._connected = False
 
     async def write(self, data: bytes) -> bool:
@@ -115,49 +130,24 @@ class USBTransport(BaseTransport):
             return False
 
     async def read_line(self) -> Optional[str]:
-        if not self.is_connected:
-            return None
-
-        def _read_with_buffer():
-            """Read data and manage line buffer (single lock acquisition)."""
-            with self._lock:
-                # Read any available data
-                waiting = self._serial.in_waiting
-                if waiting > 0:
-                    new_data = self._serial.read(waiting)
-                    self._read_buffer += new_data
-
-                # Prevent buffer overflow from malformed devices
-                if len(self._read_buffer) > MAX_READ_BUFFER_SIZE:
-                    dropped_bytes = len(self._read_buffer) - MAX_READ_BUFFER_SIZE
-                    logger.warning(
-                        "Read buffer overflow on %s, dropping %d oldest bytes",
-                        self.port,
-                        dropped_bytes
-                    )
-                    # Keep most recent data, drop oldest
-                    self._read_buffer = self._read_buffer[-MAX_READ_BUFFER_SIZE:]
-
-                # Check if we have a complete line in the buffer
-                newline_pos = self._read_buffer.find(b'\n')
-                if newline_pos >= 0:
-                    # Extract the line (including newline)
-                    line = self._read_buffer[:newline_pos + 1]
-                    self._read_buffer = self._read_buffer[newline_pos + 1:]
-                    return line
-                return None
+        raw = await self.read_raw_line()
+        return raw.text if raw is not None else None
 
-        try:
-            line_bytes = await asyncio.to_thread(_read_with_buffer)
-            if line_bytes:
-                line = line_bytes.decode('utf-8', errors='replace').strip()
-                return line if line else None
+    async def read_raw_line(self) -> Optional[RawLine]:
+        """Pop the next non-empty line from the reactor with its arrival time."""
+        inbox = self._inbox
+        if not self.is_connected or inbox is None:
             return None
 
-        except serial.SerialException as e:
-            logger.warning("Read error on %s: %s", self.port, e)
-            return None
-        except Exception as e:
-            logger.warning("Unexpected error reading from %s: %s", self.port, e)
-            return None
+        while True:
+            raw = inbox.get_nowait()
+            if raw is None or raw.text:
+                return raw
 
+    async def wait_for_data(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a line from the reactor."""
+        inbox = self._inbox
+        if not self.is_connected or inbox is None:
+            await asyncio.sleep(min(timeout, self.POLL_INTERVAL))
+            return False
+        return await inbox.wait(timeout)
@@ -232,6 +232,7 @@ class EyeTrackerApiMixin:
                 "fps_record": metrics.get("fps_record"),
                 "target_fps": metrics.get("target_fps"),
             },
+            "load": metrics.get("load", {}),
         }
 
     async def get_eyetracker_stream_settings(self) -> Optional[Dict[str, Any]]:
@@ -12,6 +12,8 @@ import numpy as np
 
 from rpi_logger.core.commands import StatusMessage, StatusType
 from rpi_logger.core.logging_utils import ensure_structured_logger
+from rpi_logger.modules.base.columnar import normalize_data_format
+from rpi_logger.modules.base.preview_shm import PreviewPublisher
 from rpi_logger.modules.base.storage_utils import ensure_module_data_dir
 from vmc import ModuleRuntime, RuntimeContext
 from vmc.runtime_helpers import BackgroundTaskManager, ShutdownGuard
@@ -303,6 +305,11 @@ class EyeTrackerRuntime(ModuleRuntime):
             gaze_color_worn_g=int(getattr(self.args, "gaze_color_worn_g", 0)),
             gaze_color_worn_r=int(getattr(self.args, "gaze_color_worn_r", 255)),
             audio_stream_param=str(getattr(self.args, "audio_stream_param", "audio=scene")),
+            data_format=normalize_data_format(getattr(self.args, "data_format", "csv")),
+            video_backend=str(getattr(self.args, "video_backend", "pyav")),
+            combine_video_streams=self._parse_bool(getattr(self.args, "combine_video_streams", False)),
+            adaptive_load=self._parse_bool(getattr(self.args, "adaptive_load", True)),
+            target_latency_ms=float(getattr(self.args, "target_latency_ms", 100.0)),
             # Stream viewer enable states (persisted via Controls menu)
             stream_video_enabled=self._parse_bool(getattr(self.args, "stream_video_enabled", True)),
             stream_gaze_enabled=self._parse_bool(getattr(self.args, "stream_gaze_enabled", True)),
@@ -318,12 +325,14 @@ class EyeTrackerRuntime(ModuleRuntime):
         self._stream_handler = StreamHandler()
         self._frame_processor = FrameProcessor(config)
         self._recording_manager = RecordingManager(config)
+        instance_id = getattr(self.args, "instance_id", None)
         self._tracker_handler = TrackerHandler(
             config,
             self._device_manager,
             self._stream_handler,
             self._frame_processor,
             self._recording_manager,
+            preview_slot=PreviewPublisher(instance_id) if instance_id else None,
         )
 
     def _clear_device_task(self, completed_task: asyncio.Task) -> None:
@@ -731,8 +740,10 @@ class EyeTrackerRuntime(ModuleRuntime):
 
         # Get display FPS from tracker handler
         fps_display = 0.0
+        load = {}
         if self._tracker_handler:
             fps_display = self._tracker_handler.get_display_fps()
+            load = self._tracker_handler.get_load_stats()
 
         return {
             # Capture: from Neon device (raw 30Hz stream)
@@ -746,6 +757,9 @@ class EyeTrackerRuntime(ModuleRuntime):
             # Display: frames shown in GUI preview
             "fps_display": fps_display,
             "target_display_fps": self._tracker_config.preview_fps,
+
+            # Load shedding: adaptive skip factors and per-stage costs
+            "load": load,
         }
 
     # ------------------------------------------------------------------
@@ -74,6 +74,17 @@ class EyeTrackerConfig:
     # Audio stream
     audio_stream_param: str = "audio=scene"
 
+    # Sample data format (csv | npy)
+    data_format: str = "csv"
+
+    # Video encoding (pyav | ffmpeg | opencv)
+    video_backend: str = "pyav"
+    combine_video_streams: bool = False
+
+    # Adaptive load shedding (preview first, then eyes video)
+    adaptive_load: bool = True
+    target_latency_ms: float = 100.0
+
     # UI visibility (master logger integration)
     gui_io_stub_visible: bool = False
     view_show_io_panel: bool = False
@@ -147,6 +158,11 @@ class EyeTrackerConfig:
             stream_audio_enabled=get_pref_bool(prefs, "stream_audio_enabled", defaults.stream_audio_enabled),
             # Audio
             audio_stream_param=get_pref_str(prefs, "audio_stream_param", defaults.audio_stream_param),
+            data_format=get_pref_str(prefs, "data_format", defaults.data_format),
+            video_backend=get_pref_str(prefs, "video_backend", defaults.video_backend),
+            combine_video_streams=get_pref_bool(prefs, "combine_video_streams", defaults.combine_video_streams),
+            adaptive_load=get_pref_bool(prefs, "adaptive_load", defaults.adaptive_load),
+            target_latency_ms=get_pref_float(prefs, "target_latency_ms", defaults.target_latency_ms),
             # UI visibility
             gui_io_stub_visible=get_pref_bool(prefs, "gui_io_stub_visible", defaults.gui_io_stub_visible),
             view_show_io_panel=get_pref_bool(prefs, "view.show_io_panel", defaults.view_show_io_panel),
@@ -178,6 +194,11 @@ class EyeTrackerConfig:
             "discovery_retry": "discovery_retry",
             "gui_preview_update_hz": "gui_preview_update_hz",
             "audio_stream_param": "audio_stream_param",
+            "data_format": "data_format",
+            "video_backend": "video_backend",
+            "combine_video_streams": "combine_video_streams",
+            "adaptive_load": "adaptive_load",
+            "target_latency_ms": "target_latency_ms",
         }
 
         for arg_name, config_key in arg_mappings.items():
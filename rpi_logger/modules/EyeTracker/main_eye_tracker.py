@@ -141,6 +141,55 @@ def parse_args(argv: Optional[list[str]] = None):
         default=get_config_str(config, "audio_stream_param", defaults["audio_stream_param"]),
         help="RTSP query parameter used to locate audio stream",
     )
+    parser.add_argument(
+        "--data-format",
+        dest="data_format",
+        choices=("csv", "npy"),
+        default=get_config_str(config, "data_format", defaults["data_format"]),
+        help="Gaze/IMU/event data format (npy writes a columnar sidecar)",
+    )
+    parser.add_argument(
+        "--video-backend",
+        dest="video_backend",
+        choices=("pyav", "ffmpeg", "opencv"),
+        default=get_config_str(config, "video_backend", defaults["video_backend"]),
+        help="Video encoder (pyav encodes in-process with device-timestamp PTS)",
+    )
+    combine_group = parser.add_mutually_exclusive_group()
+    combine_group.add_argument(
+        "--combine-video-streams",
+        dest="combine_video_streams",
+        action="store_true",
+        default=get_config_bool(config, "combine_video_streams", defaults["combine_video_streams"]),
+        help="Write the eyes video as a second stream of the WORLD file (pyav only)",
+    )
+    combine_group.add_argument(
+        "--separate-video-streams",
+        dest="combine_video_streams",
+        action="store_false",
+        help="Write WORLD and EYES videos to separate files (default)",
+    )
+    load_group = parser.add_mutually_exclusive_group()
+    load_group.add_argument(
+        "--adaptive-load",
+        dest="adaptive_load",
+        action="store_true",
+        default=get_config_bool(config, "adaptive_load", defaults["adaptive_load"]),
+        help="Lower preview, then eyes video rate to hold the latency target (default)",
+    )
+    load_group.add_argument(
+        "--fixed-load",
+        dest="adaptive_load",
+        action="store_false",
+        help="Keep preview and eyes video at their configured rates",
+    )
+    parser.add_argument(
+        "--target-latency-ms",
+        dest="target_latency_ms",
+        type=positive_float,
+        default=get_config_float(config, "target_latency_ms", defaults["target_latency_ms"]),
+        help="Scene frame latency budget for adaptive load shedding",
+    )
 
     args = parser.parse_args(argv)
 
@@ -49,6 +49,15 @@ class TrackerConfig:
 
     # Data export controls
     audio_stream_param: str = "audio=scene"
+    data_format: str = "csv"  # csv | npy (columnar sidecar for gaze/IMU/events)
+    video_backend: str = "pyav"  # pyav | ffmpeg | opencv
+    combine_video_streams: bool = False  # pyav only: eyes video as a second stream in the WORLD file
+
+    # Adaptive load shedding (preview first, then eyes video; never gaze data)
+    adaptive_load: bool = True
+    target_latency_ms: float = 100.0  # Scene frame arrival -> end of loop iteration
+    max_preview_skip_factor: int = 10  # Preview floor: 3 fps at 30 fps scene
+    max_eyes_skip_factor: int = 20  # Eyes video floor: 10 fps at 200 Hz
 
     # IMU visualization settings
     imu_sparkline_duration_sec: float = 10.0  # Seconds of motion history to display
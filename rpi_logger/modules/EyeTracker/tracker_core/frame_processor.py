@@ -9,6 +9,7 @@ os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
 import cv2
 import numpy as np
 from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.frame_overlay import TextOverlay, get_glyph_atlas
 from .config.tracker_config import TrackerConfig as Config
 
 logger = get_module_logger(__name__)
@@ -26,6 +27,9 @@ class FrameProcessor:
         self._last_processed: Optional[np.ndarray] = None
         self._last_was_grayscale: bool = False
         self._duplicate_count = 0
+        # Recording overlay text, rebuilt only when the overlay style changes
+        self._recording_overlay: Optional[TextOverlay] = None
+        self._recording_overlay_key: Optional[tuple] = None
 
     def _get_gaze_color(self) -> Tuple[int, int, int]:
         """Get gaze indicator color."""
@@ -257,27 +261,12 @@ class FrameProcessor:
         border_thickness = max(1, thickness * 3)
         border_color = (0, 0, 0)
 
-        cv2.putText(
-            frame,
-            frame_text,
-            (margin_left, line_start_y),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            border_color,
-            border_thickness,
-            cv2.LINE_AA
-        )
-
-        cv2.putText(
-            frame,
-            frame_text,
-            (margin_left, line_start_y),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            font_scale,
-            text_color,
-            thickness,
-            cv2.LINE_AA
-        )
+        overlay_key = (font_scale, thickness, text_color, border_thickness, margin_left, line_start_y)
+        if self._recording_overlay_key != overlay_key:
+            atlas = get_glyph_atlas(font_scale, thickness, text_color, border_color, border_thickness)
+            self._recording_overlay = TextOverlay(atlas, (margin_left, line_start_y), max_chars=16)
+            self._recording_overlay_key = overlay_key
+        self._recording_overlay.render(frame, frame_text)
 
         if include_gaze and last_gaze:
             h, w = frame.shape[:2]
@@ -3,10 +3,13 @@ import time
 from typing import Optional
 
 from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.core.telemetry import register_telemetry, unregister_telemetry
+from rpi_logger.modules.base.preview_shm import PreviewPublisher
 from .config.tracker_config import TrackerConfig as Config
 from .device_manager import DeviceManager
 from .stream_handler import StreamHandler, FramePacket
 from .frame_processor import FrameProcessor
+from .load_controller import LoadController
 from .recording import RecordingManager
 from .rolling_fps import RollingFPS
 
@@ -24,15 +27,20 @@ class GazeTracker:
         frame_processor: Optional[FrameProcessor] = None,
         recording_manager: Optional[RecordingManager] = None,
         display_enabled: bool = True,
+        preview_slot: Optional[PreviewPublisher] = None,
     ):
         self.config = config
         self.running = False
         self.display_enabled = display_enabled  # Controls OpenCV window display
+        # Shared-memory preview for the master/API (filled only while read)
+        self.preview_slot = preview_slot
 
         # Phase 1.4: Pause state
         self._paused = False
         # Phase 1.6: Reduced processing mode (when window not visible)
         self._reduced_processing = False
+        # Chooses preview/eyes skip factors from measured stage costs
+        self.load_controller = LoadController(config)
 
         self.frame_count = 0
         self.start_time = None
@@ -53,6 +61,7 @@ class GazeTracker:
         self.stream_handler = stream_handler or StreamHandler()
         self.frame_processor = frame_processor or FrameProcessor(config)
         self.recording_manager = recording_manager or RecordingManager(config)
+        self.stream_handler.set_gaze_listener(self.recording_manager.write_gaze_sample)
         self.stream_handler.set_imu_listener(self.recording_manager.write_imu_sample)
         self.stream_handler.set_event_listener(self.recording_manager.write_event_sample)
 
@@ -87,6 +96,7 @@ class GazeTracker:
     def set_reduced_processing(self, enabled: bool) -> None:
         """Enable reduced processing when window not visible."""
         self._reduced_processing = enabled
+        self.load_controller.set_reduced(enabled)
 
     @property
     def is_reduced_processing(self) -> bool:
@@ -97,6 +107,13 @@ class GazeTracker:
         """Get current display output FPS."""
         return self._display_fps_tracker.get_fps()
 
+    def get_load_stats(self) -> dict:
+        """Get adaptive skip factors, latency and per-stage timings."""
+        stats = self.load_controller.get_stats()
+        stats["stream_dropped_frames"] = self.stream_handler.dropped_frames
+        stats["stream_avg_wait_ms"] = self.stream_handler.avg_wait_ms
+        return stats
+
     async def run(self):
         if not self.device_manager.is_connected:
             logger.error("No device connected")
@@ -104,6 +121,9 @@ class GazeTracker:
 
         self.running = True
         self.start_time = time.time()
+        if self.preview_slot:
+            self.preview_slot.start((self.config.preview_width, self.config.preview_height))
+        register_telemetry("eyetracker.load", self.get_load_stats)
 
         if self.display_enabled:
             self.frame_processor.create_window()
@@ -157,15 +177,6 @@ class GazeTracker:
                     await asyncio.sleep(0.1)
                     continue
 
-                # Phase 1.6: Reduced processing mode when not visible and not recording
-                # Skip processing on 9/10 frames but don't artificially delay
-                if self._reduced_processing and not self.recording_manager.is_recording:
-                    if self.frame_count % 10 != 0:
-                        # Drain the frame without processing
-                        _ = await self.stream_handler.wait_for_frame(timeout=1.0)
-                        self.frame_count += 1
-                        continue
-
                 # Wait for next frame with a reasonable timeout for stream health detection
                 try:
                     frame_packet: Optional[FramePacket] = await self.stream_handler.wait_for_frame(timeout=1.0)
@@ -197,7 +208,10 @@ class GazeTracker:
                 self._preview_frame_counter += 1
                 self._recording_frame_counter += 1
 
-                preview_skip_factor = self.config.preview_skip_factor()
+                # Preview and eyes factors adapt to load (reduced mode included);
+                # the scene recording rate is fixed
+                load = self.load_controller
+                preview_skip_factor = load.preview_skip_factor
                 recording_skip_factor = self.config.recording_skip_factor()
 
                 skip_display = (self._preview_frame_counter % preview_skip_factor != 0)
@@ -205,8 +219,12 @@ class GazeTracker:
                 is_recording = self.recording_manager.is_recording
                 skip_recording = is_recording and (self._recording_frame_counter % recording_skip_factor != 0)
 
+                stage_start = time.perf_counter()
+
                 # === STREAM DRAINING (always runs at 30fps) ===
-                # Must drain all streams to prevent queue buildup, regardless of skip state
+                # Must drain all streams to prevent queue buildup, regardless of skip state.
+                # Only the latest gaze/IMU/event is needed here for overlays; every sample
+                # is recorded through the StreamHandler listeners.
                 latest_gaze = self.stream_handler.get_latest_gaze()
                 while True:
                     next_gaze = await self.stream_handler.next_gaze(timeout=0)
@@ -238,7 +256,7 @@ class GazeTracker:
                 # At 200Hz source, skip most frames before queuing for recording
                 eyes_drained = 0
                 eyes_written = 0
-                eyes_skip_factor = self.config.eyes_recording_skip_factor()
+                eyes_skip_factor = load.eyes_skip_factor
                 while True:
                     next_eyes = await self.stream_handler.next_eyes(timeout=0)
                     if next_eyes is None:
@@ -254,13 +272,15 @@ class GazeTracker:
                             timestamp_ns=next_eyes.timestamp_unix_ns,
                         )
 
-                # Write gaze sample at full rate when recording (for temporal accuracy)
                 if is_recording:
-                    self.recording_manager.write_gaze_sample(latest_gaze)
+                    load.observe_queue_fill(self.recording_manager.get_queue_fill())
+                stage_end = time.perf_counter()
+                load.record_stage("drain", stage_end - stage_start)
 
                 # === SKIP FAST PATH ===
                 # If skipping both display AND recording, skip expensive frame processing
                 if skip_display and (skip_recording or not is_recording):
+                    load.end_frame(frame_packet.received_monotonic, frame_packet.camera_frame_index, stage_end)
                     await asyncio.sleep(0)  # Yield to event loop
                     continue
 
@@ -275,6 +295,8 @@ class GazeTracker:
                 else:
                     processed_frame = self.frame_processor.process_frame(raw_frame)
                     await asyncio.sleep(0)  # Yield to event loop
+                stage_start = time.perf_counter()
+                load.record_stage("process", stage_start - stage_end)
 
                 # === DISPLAY FRAME PREPARATION ===
                 if not skip_display:
@@ -306,19 +328,32 @@ class GazeTracker:
                         )
                     else:
                         recording_frame = processed_frame
+                stage_end = time.perf_counter()
+                load.record_stage("overlay", stage_end - stage_start)
+
+                # Write recording frame (already filtered, no skip check needed)
+                if recording_frame is not None:
+                    self.recording_manager.write_frame(
+                        recording_frame, timestamp_unix=frame_packet.timestamp_unix_seconds
+                    )
+                    stage_start = time.perf_counter()
+                    load.record_stage("encode", stage_start - stage_end)
+                    stage_end = stage_start
 
                 # Store display frame if generated
                 if display_frame is not None:
                     self._latest_display_frame = display_frame
                     self._display_fps_tracker.add_frame()
-
-                # Write recording frame (already filtered, no skip check needed)
-                if recording_frame is not None:
-                    self.recording_manager.write_frame(recording_frame)
+                    if self.preview_slot and self.preview_slot.due():
+                        self.preview_slot.publish(display_frame, self.frame_count)
+                    if self.display_enabled:
+                        self.frame_processor.display_frame(display_frame)
+                    stage_start = time.perf_counter()
+                    load.record_stage("preview", stage_start - stage_end)
+                    stage_end = stage_start
+                load.end_frame(frame_packet.received_monotonic, frame_packet.camera_frame_index, stage_end)
 
                 if self.display_enabled and display_frame is not None:
-                    self.frame_processor.display_frame(display_frame)
-
                     command = self.frame_processor.check_keyboard()
                     if command == 'quit':
                         self.running = False
@@ -343,6 +378,7 @@ class GazeTracker:
     async def cleanup(self):
 
         self.running = False
+        unregister_telemetry("eyetracker.load")
 
         await self.stream_handler.stop_streaming()
 
@@ -350,5 +386,8 @@ class GazeTracker:
 
         await self.device_manager.cleanup()
 
+        if self.preview_slot:
+            self.preview_slot.close()
+
         # Close OpenCV windows
         self.frame_processor.destroy_windows()
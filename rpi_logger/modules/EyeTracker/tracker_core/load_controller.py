@@ -0,0 +1,194 @@
+"""Adaptive load shedding for the GazeTracker frame loop.
+
+The frame loop always drains every stream, so gaze/IMU/event samples reach
+their CSV (or columnar) writers regardless of load. What it can shed is the
+optional work done per scene frame: the preview (scale, overlay, publish) and
+the eyes video decimation. ``LoadController`` measures each stage of the loop
+and the end-to-end latency of scene frames, and raises the preview skip factor
+first, then the eyes skip factor, until latency is back under the target. The
+scene recording rate is never touched.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from rpi_logger.core.logging_utils import get_module_logger
+from .config.tracker_config import TrackerConfig as Config
+
+logger = get_module_logger(__name__)
+
+STAGES = ("drain", "process", "overlay", "encode", "preview")
+
+# Smoothing for the reported per-stage costs
+_EMA_ALPHA = 0.1
+# Encoder queues fuller than this count as back-pressure
+_QUEUE_FILL_LIMIT = 0.5
+# Share of expected camera frames the loop may miss in a window
+_MISSED_FRACTION_LIMIT = 0.05
+# Overloaded windows in a row required before shedding work (hysteresis)
+_SHED_WINDOWS = 2
+# Calm windows required before giving work back (hysteresis)
+_RECOVER_WINDOWS = 4
+
+
+class LoadController:
+    """Feedback controller choosing preview and eyes-video skip factors.
+
+    Every ``window_frames`` scene frames the controller looks at the mean
+    latency from frame arrival to the end of its loop iteration, the share of
+    camera frames the loop never picked up, and the encoder queue fill. After
+    two over-budget windows in a row it sheds preview work first and eyes video
+    second; after a run of calm windows it restores eyes video first and
+    preview last.
+    """
+
+    def __init__(self, config: Config, *, window_frames: int = 15):
+        self.enabled = bool(config.adaptive_load)
+        self.target_latency_ms = float(config.target_latency_ms)
+        self.window_frames = max(1, int(window_frames))
+
+        self.base_preview_skip = config.preview_skip_factor()
+        self.base_eyes_skip = config.eyes_recording_skip_factor()
+        self.max_preview_skip = max(self.base_preview_skip, int(config.max_preview_skip_factor))
+        self.max_eyes_skip = max(self.base_eyes_skip, int(config.max_eyes_skip_factor))
+
+        self._preview_skip = self.base_preview_skip
+        self._eyes_skip = self.base_eyes_skip
+        self._reduced = False
+
+        self._stage_ms: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self._latency_ms = 0.0
+        self._last_frame_index: Optional[int] = None
+        self._frames_missed = 0
+        self._queue_fill = 0.0
+        self.adjustments = 0
+
+        self._window_latency = 0.0
+        self._window_frames = 0
+        self._window_missed = 0
+        self._overloaded_windows = 0
+        self._calm_windows = 0
+
+    # ------------------------------------------------------------------
+    # Factors used by the frame loop
+
+    @property
+    def preview_skip_factor(self) -> int:
+        # Nobody is watching: preview at the floor rate (was "1 in 10")
+        if self._reduced:
+            return self.max_preview_skip
+        return self._preview_skip
+
+    @property
+    def eyes_skip_factor(self) -> int:
+        return self._eyes_skip
+
+    def set_reduced(self, enabled: bool) -> None:
+        """Preview is not visible: run it at the lowest rate."""
+        self._reduced = bool(enabled)
+
+    # ------------------------------------------------------------------
+    # Measurements
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Fold one stage duration into its moving average."""
+        previous = self._stage_ms[stage]
+        self._stage_ms[stage] = previous + _EMA_ALPHA * (seconds * 1000.0 - previous)
+
+    def observe_queue_fill(self, fill: float) -> None:
+        """Record encoder queue fill (0.0 empty .. 1.0 full)."""
+        self._queue_fill = max(0.0, min(1.0, float(fill)))
+
+    def end_frame(self, received_monotonic: float, camera_frame_index: int, now: Optional[float] = None) -> None:
+        """Close one loop iteration and adapt the factors once per window."""
+        if now is None:
+            now = time.perf_counter()
+        latency_ms = max(0.0, (now - received_monotonic) * 1000.0)
+        self._latency_ms += _EMA_ALPHA * (latency_ms - self._latency_ms)
+
+        if self._last_frame_index is not None and camera_frame_index > self._last_frame_index + 1:
+            missed = camera_frame_index - self._last_frame_index - 1
+            self._frames_missed += missed
+            self._window_missed += missed
+        self._last_frame_index = camera_frame_index
+
+        self._window_latency += latency_ms
+        self._window_frames += 1
+        if self._window_frames >= self.window_frames:
+            self._evaluate_window()
+
+    def _evaluate_window(self) -> None:
+        mean_latency = self._window_latency / self._window_frames
+        missed = self._window_missed
+        expected = self._window_frames + missed
+        self._window_latency = 0.0
+        self._window_frames = 0
+        self._window_missed = 0
+
+        if not self.enabled:
+            return
+
+        overloaded = (
+            mean_latency > self.target_latency_ms
+            or missed > expected * _MISSED_FRACTION_LIMIT
+            or self._queue_fill > _QUEUE_FILL_LIMIT
+        )
+        if overloaded:
+            self._calm_windows = 0
+            self._overloaded_windows += 1
+            if self._overloaded_windows >= _SHED_WINDOWS:
+                self._overloaded_windows = 0
+                self._shed(mean_latency, missed)
+        elif mean_latency < self.target_latency_ms / 2:
+            self._overloaded_windows = 0
+            self._calm_windows += 1
+            if self._calm_windows >= _RECOVER_WINDOWS:
+                self._calm_windows = 0
+                self._restore()
+        else:
+            self._overloaded_windows = 0
+            self._calm_windows = 0
+
+    def _shed(self, mean_latency: float, missed: int) -> None:
+        if self._preview_skip < self.max_preview_skip:
+            self._preview_skip = min(self.max_preview_skip, self._preview_skip * 2)
+        elif self._eyes_skip < self.max_eyes_skip:
+            self._eyes_skip = min(self.max_eyes_skip, self._eyes_skip * 2)
+        else:
+            return
+        self.adjustments += 1
+        logger.debug(
+            "Load shedding (latency %.1f ms, missed %d, queue %.0f%%): preview skip %d, eyes skip %d",
+            mean_latency, missed, self._queue_fill * 100, self._preview_skip, self._eyes_skip,
+        )
+
+    def _restore(self) -> None:
+        if self._eyes_skip > self.base_eyes_skip:
+            self._eyes_skip = max(self.base_eyes_skip, self._eyes_skip // 2)
+        elif self._preview_skip > self.base_preview_skip:
+            self._preview_skip = max(self.base_preview_skip, self._preview_skip // 2)
+        else:
+            return
+        self.adjustments += 1
+        logger.debug(
+            "Load restored: preview skip %d, eyes skip %d", self._preview_skip, self._eyes_skip
+        )
+
+    # ------------------------------------------------------------------
+    # Reporting
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Chosen factors and stage timings for metrics, API and telemetry."""
+        return {
+            "adaptive": self.enabled,
+            "target_latency_ms": self.target_latency_ms,
+            "latency_ms": round(self._latency_ms, 2),
+            "preview_skip_factor": self.preview_skip_factor,
+            "eyes_skip_factor": self._eyes_skip,
+            "base_preview_skip_factor": self.base_preview_skip,
+            "base_eyes_skip_factor": self.base_eyes_skip,
+            "frames_missed": self._frames_missed,
+            "encode_queue_fill": round(self._queue_fill, 3),
+            "adjustments": self.adjustments,
+            "stage_ms": {stage: round(value, 3) for stage, value in self._stage_ms.items()},
+        }
@@ -1,10 +1,12 @@
 
 from .manager import RecordingManager
 from .async_csv_writer import AsyncCSVWriter
+from .columnar_writer import ColumnarSampleWriter
 from .video_encoder import VideoEncoder
 
 __all__ = [
     'RecordingManager',
     'AsyncCSVWriter',
+    'ColumnarSampleWriter',
     'VideoEncoder',
 ]
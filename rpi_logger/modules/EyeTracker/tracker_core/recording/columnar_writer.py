@@ -0,0 +1,201 @@
+"""Columnar batch writer for high-rate sample streams (gaze at 200 Hz).
+
+Rows are appended as native values into a preallocated numpy structured
+array; nothing is formatted on the event loop. Each full chunk is handed
+to a worker thread that either formats it column by column into CSV text
+(``data_format="csv"``) or appends it to a binary columnar sidecar
+(``data_format="npy"``, see ``rpi_logger.modules.base.columnar``).
+"""
+
+import asyncio
+import contextlib
+from pathlib import Path
+from typing import Any, Optional, Sequence, TextIO
+
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.columnar import (
+    MISSING_INT,
+    Column,
+    ColumnarFile,
+    columnar_path,
+    columns_dtype,
+    csv_join,
+    format_column,
+    format_csv_rows,
+    normalize_data_format,
+)
+
+logger = get_module_logger(__name__)
+
+
+class ColumnarSampleWriter:
+    """Asynchronous sample writer that buffers rows column-wise in chunks.
+
+    ``prefix_fields`` are the constant leading fields of every row (trial,
+    module, device_id, label); they are formatted once per recording in CSV
+    mode and stored once in the schema in npy mode.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[Column],
+        *,
+        header: Optional[str] = None,
+        prefix_fields: Sequence[Any] = (),
+        chunk_rows: int = 256,
+        max_pending_chunks: int = 64,
+        data_format: str = "csv",
+    ) -> None:
+        self.columns = tuple(columns)
+        self.dtype = columns_dtype(self.columns)
+        self.data_format = normalize_data_format(data_format)
+        self._header = header
+        self._prefix_fields = tuple(prefix_fields)
+        self._line_prefix = csv_join(self._prefix_fields) + "," if self._prefix_fields else ""
+        self._chunk_rows = max(1, chunk_rows)
+        self._max_pending_chunks = max(1, max_pending_chunks)
+
+        self._chunk: Optional[np.ndarray] = None
+        self._fill = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._file: Optional[TextIO] = None
+        self._columnar: Optional[ColumnarFile] = None
+        self._sentinel: object = object()
+        self._path: Optional[Path] = None
+
+        self.rows_appended = 0
+        self.rows_written = 0
+        self.rows_dropped = 0
+
+    async def start(self, path: Path) -> None:
+        """Open the target file and start the background writer.
+
+        In npy mode ``path`` (the CSV name) is replaced by its ``.npy`` sidecar.
+        """
+        if self.data_format == "npy":
+            self._path = columnar_path(path)
+            self._columnar = await asyncio.to_thread(
+                ColumnarFile,
+                self._path,
+                self.columns,
+                csv_header=(self._header or "").split(","),
+                prefix_fields=self._prefix_fields,
+                append=True,  # Like the CSV file, a restart keeps earlier rows
+            )
+        else:
+            exists = await asyncio.to_thread(path.exists)
+            mode = "a" if exists else "w"
+
+            self._path = path
+            self._file = await asyncio.to_thread(open, path, mode, encoding="utf-8")
+            try:
+                if not exists and self._header:
+                    await asyncio.to_thread(self._file.write, self._header + "\n")
+            except Exception:
+                await asyncio.to_thread(self._file.close)
+                self._file = None
+                raise
+
+        self._queue = asyncio.Queue(maxsize=self._max_pending_chunks)
+        self._chunk = np.empty(self._chunk_rows, dtype=self.dtype)
+        self._fill = 0
+        self._task = asyncio.create_task(self._writer_loop())
+
+    def append(self, row: tuple) -> None:
+        """Buffer one row (one value per column, in column order)."""
+        chunk = self._chunk
+        if chunk is None:
+            raise RuntimeError("Columnar writer not started")
+
+        chunk[self._fill] = row
+        self._fill += 1
+        self.rows_appended += 1
+        if self._fill >= self._chunk_rows:
+            self._submit()
+
+    def _submit(self) -> None:
+        if self._chunk is None or self._fill == 0 or self._queue is None:
+            return
+        chunk = self._chunk[:self._fill]
+        self._chunk = np.empty(self._chunk_rows, dtype=self.dtype)
+        self._fill = 0
+        try:
+            self._queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            # Disk has stalled for many chunks; drop this one rather than grow without bound
+            self.rows_dropped += len(chunk)
+            logger.warning(
+                "Columnar writer backlog full for %s, dropped %d rows (total %d)",
+                self._path, len(chunk), self.rows_dropped,
+            )
+
+    async def stop(self) -> None:
+        """Write the partial chunk and outstanding chunks, then close the file."""
+        if self._queue is None:
+            await self._close_file()
+            return
+
+        self._submit()
+        self._chunk = None
+        await self._queue.put(self._sentinel)
+
+        if self._task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        self._queue = None
+
+        await self._close_file()
+
+    async def cleanup(self) -> None:
+        await self.stop()
+
+    async def _writer_loop(self) -> None:
+        assert self._queue is not None
+
+        while True:
+            chunk = await self._queue.get()
+            if chunk is self._sentinel:
+                break
+            try:
+                await asyncio.to_thread(self._write_chunk, chunk)
+                self.rows_written += len(chunk)
+            except Exception as exc:
+                self.rows_dropped += len(chunk)
+                logger.error("Failed to write %d rows to %s: %s", len(chunk), self._path, exc)
+
+    def format_chunk(self, chunk: np.ndarray) -> str:
+        """Format a chunk of rows as CSV text."""
+        return format_csv_rows(chunk, self.columns, self._line_prefix)
+
+    def _write_chunk(self, chunk: np.ndarray) -> None:
+        if self._columnar is not None:
+            self._columnar.write(chunk)
+            self._columnar.flush()
+        elif self._file is not None:
+            self._file.write(self.format_chunk(chunk))
+            self._file.flush()
+
+    async def _close_file(self) -> None:
+        if self._columnar is not None:
+            await asyncio.to_thread(self._columnar.close)
+            self._columnar = None
+        if self._file is None:
+            return
+        await asyncio.to_thread(self._file.flush)
+        await asyncio.to_thread(self._file.close)
+        self._file = None
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    @property
+    def buffered_rows(self) -> int:
+        return self._fill
+
+
+__all__ = ["Column", "ColumnarSampleWriter", "MISSING_INT", "format_column"]
@@ -1,4 +1,10 @@
-"""EyeTracker Recording: 6 files (WORLD.mp4, EYES.mp4, AUDIO.wav, GAZE.csv, IMU.csv, EVENTS.csv)."""
+"""EyeTracker Recording: 6 files (WORLD.mp4, EYES.mp4, AUDIO.wav, GAZE.csv, IMU.csv, EVENTS.csv).
+
+With ``data_format = npy`` the three sample streams are written as columnar
+``.npy`` sidecars instead of CSV (see ``rpi_logger.modules.base.columnar``).
+With ``combine_video_streams`` (PyAV backend only) the eyes video is a second
+stream inside the WORLD file instead of its own EYES.mp4.
+"""
 
 from __future__ import annotations
 
@@ -15,6 +21,7 @@ from typing import Optional, Any, TYPE_CHECKING
 
 import numpy as np
 
+from rpi_logger.modules.base.columnar import MISSING_INT, Column, as_float, as_int
 from rpi_logger.modules.base.recording import RecordingManagerBase
 from rpi_logger.modules.base.storage_utils import (
     ensure_module_data_dir,
@@ -23,8 +30,8 @@ from rpi_logger.modules.base.storage_utils import (
 from rpi_logger.core.logging_utils import get_module_logger
 from ..config.tracker_config import TrackerConfig as Config
 from ..rolling_fps import RollingFPS
-from .async_csv_writer import AsyncCSVWriter
-from .video_encoder import VideoEncoder
+from .columnar_writer import ColumnarSampleWriter
+from .video_encoder import SharedVideoContainer, VideoEncoder, resolve_video_backend
 
 if TYPE_CHECKING:
     from pupil_labs.realtime_api.streaming import AudioFrame
@@ -45,6 +52,33 @@ GAZE_HEADER = (
     "eyelid_angle_top_right,eyelid_angle_bottom_right,eyelid_aperture_right"
 )
 
+# Gaze values after the pupil_labs point columns, read by attribute name
+GAZE_VALUE_FIELDS = (
+    "pupil_diameter_left", "pupil_diameter_right",
+    "eyeball_center_left_x", "eyeball_center_left_y", "eyeball_center_left_z",
+    "optical_axis_left_x", "optical_axis_left_y", "optical_axis_left_z",
+    "eyeball_center_right_x", "eyeball_center_right_y", "eyeball_center_right_z",
+    "optical_axis_right_x", "optical_axis_right_y", "optical_axis_right_z",
+    "eyelid_angle_top_left", "eyelid_angle_bottom_left", "eyelid_aperture_left",
+    "eyelid_angle_top_right", "eyelid_angle_bottom_right", "eyelid_aperture_right",
+)
+
+# Standard record/device time columns shared by GAZE, IMU and EVENTS
+_TIME_COLUMNS = (
+    Column("record_time_unix", "f8", "%.6f"),
+    Column("record_time_mono", "f8", "%.9f"),
+    Column("device_time_unix", "f8"),
+    Column("device_time_ns", "i8"),
+)
+
+# Columns after the constant trial,module,device_id,label prefix
+GAZE_COLUMNS = _TIME_COLUMNS + (
+    Column("stream_type", "S24"),
+    Column("worn", "i8"),
+    *(Column(name, "f8") for name in ("x", "y", "left_x", "left_y", "right_x", "right_y")),
+    *(Column(name, "f8") for name in GAZE_VALUE_FIELDS),
+)
+
 IMU_HEADER = (
     "trial,module,device_id,label,record_time_unix,record_time_mono,"
     "device_time_unix,device_time_ns,gyro_x,gyro_y,gyro_z,accel_x,accel_y,accel_z,"
@@ -59,16 +93,40 @@ EVENTS_HEADER = (
     "mean_velocity,max_velocity"
 )
 
+IMU_COLUMNS = _TIME_COLUMNS + tuple(
+    Column(name, "f8")
+    for name in (
+        "gyro_x", "gyro_y", "gyro_z", "accel_x", "accel_y", "accel_z",
+        "quat_w", "quat_x", "quat_y", "quat_z", "temperature",
+    )
+)
+
+# Eye event values after start/end times, read by attribute name
+EVENT_VALUE_FIELDS = (
+    "start_gaze_x", "start_gaze_y", "end_gaze_x", "end_gaze_y",
+    "mean_gaze_x", "mean_gaze_y", "amplitude_pixels", "amplitude_angle_deg",
+    "mean_velocity", "max_velocity",
+)
+
+EVENT_COLUMNS = _TIME_COLUMNS + (
+    Column("event_type", "U32"),
+    Column("event_subtype", "U32"),
+    Column("confidence", "f8"),
+    Column("duration", "f8"),
+    Column("start_time_ns", "i8"),
+    Column("end_time_ns", "i8"),
+    *(Column(name, "f8") for name in EVENT_VALUE_FIELDS),
+)
+
 
 class RecordingManager(RecordingManagerBase):
     """Records 6 output files matching hardware streams."""
 
     MODULE_SUBDIR_NAME = "EyeTracker-Neon"
 
-    def __init__(self, config: Config, *, use_ffmpeg: bool = True):
+    def __init__(self, config: Config):
         super().__init__(device_id="eye_tracker")
         self.config = config
-        self.use_ffmpeg = use_ffmpeg
 
         # Output filenames (6 files)
         self.world_video_filename: Optional[str] = None
@@ -80,14 +138,15 @@ class RecordingManager(RecordingManagerBase):
 
         # Video encoders
         self._world_video_encoder = VideoEncoder(
-            config.resolution, config.fps, use_ffmpeg=use_ffmpeg
+            config.resolution, config.fps, backend=config.video_backend
         )
         self._eyes_video_encoder: Optional[VideoEncoder] = None
+        self._video_container: Optional[SharedVideoContainer] = None
 
         # CSV writers
-        self._gaze_writer: Optional[AsyncCSVWriter] = None
-        self._imu_writer: Optional[AsyncCSVWriter] = None
-        self._event_writer: Optional[AsyncCSVWriter] = None
+        self._gaze_writer: Optional[ColumnarSampleWriter] = None
+        self._imu_writer: Optional[ColumnarSampleWriter] = None
+        self._event_writer: Optional[ColumnarSampleWriter] = None
 
         # Audio state
         self._audio_frame_queue: Optional[asyncio.Queue[Any]] = None
@@ -107,7 +166,9 @@ class RecordingManager(RecordingManagerBase):
         # Counters
         self._world_frames_written = 0
         self._eyes_frames_written = 0
+        self._gaze_samples_received = 0
         self._gaze_samples_written = 0
+        self._gaze_samples_dropped = 0
         self._imu_samples_written = 0
         self._event_samples_written = 0
         self._last_gaze_timestamp: Optional[float] = None
@@ -208,35 +269,50 @@ class RecordingManager(RecordingManagerBase):
         self.imu_filename = str(target_dir / f"{prefix}_IMU.csv")
         self.events_filename = str(target_dir / f"{prefix}_EVENTS.csv")
 
-        try:
-            # Start world video encoder
-            await self._world_video_encoder.start(Path(self.world_video_filename))
-            self._world_frame_queue = asyncio.Queue(maxsize=max(int(self.config.fps * 2), 30))
-            self._world_writer_task = asyncio.create_task(self._world_writer_loop())
+        combine = (
+            self.config.combine_video_streams
+            and resolve_video_backend(self.config.video_backend) == "pyav"
+        )
+        if combine:
+            self.eyes_video_filename = None
 
-            # Start eyes video encoder
+        try:
+            # Both streams must be added before the first packet is muxed
+            if combine:
+                self._video_container = await asyncio.to_thread(
+                    SharedVideoContainer, Path(self.world_video_filename)
+                )
+
+            # Start world and eyes video encoders
+            await self._world_video_encoder.start(
+                Path(self.world_video_filename), container=self._video_container
+            )
             self._eyes_video_encoder = VideoEncoder(
-                (384, 192), fps=self.config.eyes_fps, use_ffmpeg=self.use_ffmpeg
+                (384, 192), fps=self.config.eyes_fps, backend=self.config.video_backend
+            )
+            await self._eyes_video_encoder.start(
+                Path(self.eyes_video_filename or self.world_video_filename),
+                container=self._video_container,
             )
-            await self._eyes_video_encoder.start(Path(self.eyes_video_filename))
+
+            # Only now can frames reach the encoders
+            self._world_frame_queue = asyncio.Queue(maxsize=max(int(self.config.fps * 2), 30))
+            self._world_writer_task = asyncio.create_task(self._world_writer_loop())
             self._eyes_frame_queue = asyncio.Queue(maxsize=120)
             self._eyes_writer_task = asyncio.create_task(self._eyes_writer_loop())
 
-            # Start CSV writers
-            self._gaze_writer = AsyncCSVWriter(
-                header=GAZE_HEADER, flush_threshold=32, queue_size=512
-            )
+            # Start sample writers (gaze arrives at up to 200 Hz, IMU ~110 Hz)
+            self._gaze_writer = self._sample_writer(GAZE_COLUMNS, GAZE_HEADER, chunk_rows=256)
             await self._gaze_writer.start(Path(self.gaze_filename))
+            self.gaze_filename = str(self._gaze_writer.path)
 
-            self._imu_writer = AsyncCSVWriter(
-                header=IMU_HEADER, flush_threshold=128, queue_size=1024
-            )
+            self._imu_writer = self._sample_writer(IMU_COLUMNS, IMU_HEADER, chunk_rows=128)
             await self._imu_writer.start(Path(self.imu_filename))
+            self.imu_filename = str(self._imu_writer.path)
 
-            self._event_writer = AsyncCSVWriter(
-                header=EVENTS_HEADER, flush_threshold=64, queue_size=512
-            )
+            self._event_writer = self._sample_writer(EVENT_COLUMNS, EVENTS_HEADER, chunk_rows=16)
             await self._event_writer.start(Path(self.events_filename))
+            self.events_filename = str(self._event_writer.path)
 
             # Start audio writer
             self._audio_frame_queue = asyncio.Queue(
@@ -247,7 +323,9 @@ class RecordingManager(RecordingManagerBase):
             # Reset counters
             self._world_frames_written = 0
             self._eyes_frames_written = 0
+            self._gaze_samples_received = 0
             self._gaze_samples_written = 0
+            self._gaze_samples_dropped = 0
             self._imu_samples_written = 0
             self._event_samples_written = 0
             self._last_gaze_timestamp = None
@@ -327,6 +405,8 @@ class RecordingManager(RecordingManagerBase):
             if self.eyes_video_filename and Path(self.eyes_video_filename).exists():
                 output_files.append(Path(self.eyes_video_filename))
             self._eyes_video_encoder = None
+        # Closed by the last encoder to stop
+        self._video_container = None
 
         # Stop audio
         if self._audio_frame_queue is not None:
@@ -342,9 +422,17 @@ class RecordingManager(RecordingManagerBase):
         # Stop CSV writers
         if self._gaze_writer:
             await self._gaze_writer.stop()
+            self._gaze_samples_written = self._gaze_writer.rows_written
+            self._gaze_samples_dropped = self._gaze_writer.rows_dropped
             if self.gaze_filename:
                 output_files.append(Path(self.gaze_filename))
             self._gaze_writer = None
+            logger.info(
+                "Gaze samples: received %d, written %d, dropped %d",
+                self._gaze_samples_received,
+                self._gaze_samples_written,
+                self._gaze_samples_dropped,
+            )
 
         if self._imu_writer:
             await self._imu_writer.stop()
@@ -362,17 +450,26 @@ class RecordingManager(RecordingManagerBase):
             "world_frames": self._world_frames_written,
             "eyes_frames": self._eyes_frames_written,
             "gaze_samples": self._gaze_samples_written,
+            "gaze_samples_received": self._gaze_samples_received,
+            "gaze_samples_dropped": self._gaze_samples_dropped,
             "imu_samples": self._imu_samples_written,
             "event_samples": self._event_samples_written,
             "output_files": [str(f) for f in output_files],
         }
 
-    def write_frame(self, frame: np.ndarray, metadata: Any = None) -> None:
+    def write_frame(
+        self,
+        frame: np.ndarray,
+        metadata: Any = None,
+        *,
+        timestamp_unix: Optional[float] = None,
+    ) -> None:
         """Queue a world video frame for recording.
 
         Args:
             frame: Video frame to record
             metadata: Ignored (kept for base class compatibility)
+            timestamp_unix: Device timestamp of the scene frame (sets its PTS)
         """
         # Capture queue reference to avoid race condition where recording stops
         # between the check and the put_nowait() call
@@ -380,13 +477,14 @@ class RecordingManager(RecordingManagerBase):
         if not self._is_recording or queue is None:
             return
 
+        item = (frame, timestamp_unix)
         try:
-            queue.put_nowait(frame)
+            queue.put_nowait(item)
         except asyncio.QueueFull:
             with contextlib.suppress(asyncio.QueueEmpty):
                 queue.get_nowait()
             try:
-                queue.put_nowait(frame)
+                queue.put_nowait(item)
             except (asyncio.QueueFull, AttributeError):
                 pass  # Queue was closed during operation
         except AttributeError:
@@ -404,13 +502,14 @@ class RecordingManager(RecordingManagerBase):
         if not self._is_recording or queue is None or frame is None:
             return
 
+        item = (frame, timestamp_unix)
         try:
-            queue.put_nowait(frame)
+            queue.put_nowait(item)
         except asyncio.QueueFull:
             with contextlib.suppress(asyncio.QueueEmpty):
                 queue.get_nowait()
             try:
-                queue.put_nowait(frame)
+                queue.put_nowait(item)
             except (asyncio.QueueFull, AttributeError):
                 pass  # Queue was closed during operation
         except AttributeError:
@@ -436,74 +535,59 @@ class RecordingManager(RecordingManagerBase):
             pass  # Queue was set to None during operation
 
     def write_gaze_sample(self, gaze: Optional[Any]) -> None:
-        """Write a gaze sample to CSV."""
-        if not self._is_recording or self._gaze_writer is None or gaze is None:
+        """Buffer a gaze sample for GAZE.csv.
+
+        Called by StreamHandler for every sample the device sends, independent
+        of the scene video loop.
+        """
+        writer = self._gaze_writer
+        if not self._is_recording or writer is None or gaze is None:
             return
 
-        timestamp = getattr(gaze, "timestamp_unix_seconds", None)
+        self._gaze_samples_received += 1
+        timestamp = getattr(gaze, "timestamp_unix_ns", None)
+        if timestamp is None:
+            timestamp = getattr(gaze, "timestamp_unix_seconds", None)
         if timestamp is not None and timestamp == self._last_gaze_timestamp:
             return  # Skip duplicate
 
         try:
-            record_time_unix = time.time()
-            record_time_mono = time.perf_counter()
-            line = self._compose_gaze_line(gaze, record_time_unix, record_time_mono)
-            self._gaze_writer.enqueue(line)
+            writer.append(self._gaze_row(gaze, time.time(), time.perf_counter()))
             self._last_gaze_timestamp = timestamp
-            self._gaze_samples_written += 1
         except Exception as exc:
+            self._gaze_samples_dropped += 1
             logger.warning("Failed to write gaze sample: %s", exc)
 
     def write_imu_sample(self, imu: Optional[Any]) -> None:
-        """Write an IMU sample to CSV."""
-        if not self._is_recording or self._imu_writer is None or imu is None:
+        """Buffer an IMU sample for IMU.csv."""
+        writer = self._imu_writer
+        if not self._is_recording or writer is None or imu is None:
             return
 
         try:
-            record_time_unix = time.time()
-            record_time_mono = time.perf_counter()
-            timestamp = getattr(imu, "timestamp_unix_seconds", None)
-            timestamp_ns = getattr(imu, "timestamp_unix_ns", None)
-
-            gyro = self._extract_xyz(getattr(imu, "gyro_data", None))
-            accel = self._extract_xyz(getattr(imu, "accel_data", None))
-            quat = self._extract_quat(getattr(imu, "quaternion", None))
-            temperature = getattr(imu, "temperature", None)
-
-            fields = [
-                # Standard prefix columns
-                self._fmt(self._current_trial_number),
-                "EyeTracker",
-                self._fmt(self.device_id),
-                self._fmt(self._trial_label or ""),
-                f"{record_time_unix:.6f}",
-                f"{record_time_mono:.9f}",
-                # IMU-specific columns
-                self._fmt(timestamp),
-                self._fmt(timestamp_ns),
-                *gyro,
-                *accel,
-                *quat,
-                self._fmt(temperature),
-            ]
-            self._imu_writer.enqueue(self._csv_line(fields))
+            writer.append((
+                time.time(),
+                time.perf_counter(),
+                as_float(getattr(imu, "timestamp_unix_seconds", None)),
+                as_int(getattr(imu, "timestamp_unix_ns", None)),
+                *self._extract_xyz(getattr(imu, "gyro_data", None)),
+                *self._extract_xyz(getattr(imu, "accel_data", None)),
+                *self._extract_quat(getattr(imu, "quaternion", None)),
+                as_float(getattr(imu, "temperature", None)),
+            ))
             self._imu_samples_written += 1
         except Exception as exc:
             logger.warning("Failed to write IMU sample: %s", exc)
 
     def write_event_sample(self, event: Optional[Any]) -> None:
-        """Write an eye event to CSV."""
-        if not self._is_recording or self._event_writer is None or event is None:
+        """Buffer an eye event for EVENTS.csv."""
+        writer = self._event_writer
+        if not self._is_recording or writer is None or event is None:
             return
 
         try:
-            record_time_unix = time.time()
-            record_time_mono = time.perf_counter()
-            timestamp = getattr(event, "timestamp_unix_seconds", None)
-            timestamp_ns = getattr(event, "timestamp_unix_ns", None)
             event_type = getattr(event, "type", None) or getattr(event, "event_type", None)
             subtype = getattr(event, "category", None) or getattr(event, "event_subtype", None)
-            confidence = getattr(event, "confidence", None)
 
             # Calculate duration if not directly available
             duration = getattr(event, "duration", None)
@@ -512,35 +596,19 @@ class RecordingManager(RecordingManagerBase):
             if duration is None and start_ns is not None and end_ns is not None:
                 duration = (end_ns - start_ns) / 1e9
 
-            fields = [
-                # Standard prefix columns
-                self._fmt(self._current_trial_number),
-                "EyeTracker",
-                self._fmt(self.device_id),
-                self._fmt(self._trial_label or ""),
-                f"{record_time_unix:.6f}",
-                f"{record_time_mono:.9f}",
-                # Event-specific columns
-                self._fmt(timestamp),
-                self._fmt(timestamp_ns),
+            writer.append((
+                time.time(),
+                time.perf_counter(),
+                as_float(getattr(event, "timestamp_unix_seconds", None)),
+                as_int(getattr(event, "timestamp_unix_ns", None)),
                 self._fmt(event_type),
                 self._fmt(subtype),
-                self._fmt(confidence),
-                self._fmt(duration),
-                self._fmt(start_ns),
-                self._fmt(end_ns),
-                self._fmt(getattr(event, "start_gaze_x", None)),
-                self._fmt(getattr(event, "start_gaze_y", None)),
-                self._fmt(getattr(event, "end_gaze_x", None)),
-                self._fmt(getattr(event, "end_gaze_y", None)),
-                self._fmt(getattr(event, "mean_gaze_x", None)),
-                self._fmt(getattr(event, "mean_gaze_y", None)),
-                self._fmt(getattr(event, "amplitude_pixels", None)),
-                self._fmt(getattr(event, "amplitude_angle_deg", None)),
-                self._fmt(getattr(event, "mean_velocity", None)),
-                self._fmt(getattr(event, "max_velocity", None)),
-            ]
-            self._event_writer.enqueue(self._csv_line(fields))
+                as_float(getattr(event, "confidence", None)),
+                as_float(duration),
+                as_int(start_ns),
+                as_int(end_ns),
+                *(as_float(getattr(event, name, None)) for name in EVENT_VALUE_FIELDS),
+            ))
             self._event_samples_written += 1
         except Exception as exc:
             logger.warning("Failed to write event sample: %s", exc)
@@ -570,7 +638,8 @@ class RecordingManager(RecordingManagerBase):
             "is_recording": self._is_recording,
             "world_frames_written": self._world_frames_written,
             "eyes_frames_written": self._eyes_frames_written,
-            "gaze_samples_written": self._gaze_samples_written,
+            "gaze_samples_received": self._gaze_samples_received,
+            "gaze_samples_written": self._gaze_writer.rows_written if self._gaze_writer else self._gaze_samples_written,
             "imu_samples_written": self._imu_samples_written,
             "event_samples_written": self._event_samples_written,
             "world_video_filename": self.world_video_filename,
@@ -608,6 +677,14 @@ class RecordingManager(RecordingManagerBase):
             return 0.0
         return self._record_fps_tracker.get_fps()
 
+    def get_queue_fill(self) -> float:
+        """Fill fraction of the fullest video encoder queue (0.0 when idle)."""
+        fill = 0.0
+        for queue in (self._world_frame_queue, self._eyes_frame_queue):
+            if queue is not None and queue.maxsize:
+                fill = max(fill, queue.qsize() / queue.maxsize)
+        return fill
+
     # === Private Methods ===
 
     async def _world_writer_loop(self) -> None:
@@ -621,11 +698,12 @@ class RecordingManager(RecordingManagerBase):
             return
 
         while True:
-            frame = await self._world_frame_queue.get()
-            if frame is self._world_queue_sentinel:
+            item = await self._world_frame_queue.get()
+            if item is self._world_queue_sentinel:
                 break
 
-            await self._world_video_encoder.write_frame(frame)
+            frame, timestamp_unix = item
+            await self._world_video_encoder.write_frame(frame, timestamp_unix)
             self._world_frames_written += 1
             self._record_fps_tracker.add_frame()
 
@@ -640,11 +718,12 @@ class RecordingManager(RecordingManagerBase):
             return
 
         while True:
-            frame = await self._eyes_frame_queue.get()
-            if frame is self._eyes_queue_sentinel:
+            item = await self._eyes_frame_queue.get()
+            if item is self._eyes_queue_sentinel:
                 break
 
-            await self._eyes_video_encoder.write_frame(frame)
+            frame, timestamp_unix = item
+            await self._eyes_video_encoder.write_frame(frame, timestamp_unix)
             self._eyes_frames_written += 1
 
     async def _audio_writer_loop(self) -> None:
@@ -735,84 +814,58 @@ class RecordingManager(RecordingManagerBase):
             logger.warning("Failed to prepare audio frame: %s", exc)
             return None, None, []
 
-    def _compose_gaze_line(
-        self, gaze: Any, record_time_unix: float, record_time_mono: float
-    ) -> str:
-        """Compose a gaze CSV line with standard prefix columns."""
-        timestamp = getattr(gaze, "timestamp_unix_seconds", None)
-        timestamp_ns = getattr(gaze, "timestamp_unix_ns", None)
-        stream_type = type(gaze).__name__
-        worn = getattr(gaze, "worn", None)
-        worn_int = int(bool(worn)) if worn is not None else ""
-
-        x = getattr(gaze, "x", None)
-        y = getattr(gaze, "y", None)
-
-        # Per-eye coordinates
-        left_x = left_y = right_x = right_y = None
-        left_point = getattr(gaze, "left", None)
-        if left_point:
-            left_x = getattr(left_point, "x", None)
-            left_y = getattr(left_point, "y", None)
-        right_point = getattr(gaze, "right", None)
-        if right_point:
-            right_x = getattr(right_point, "x", None)
-            right_y = getattr(right_point, "y", None)
+    def _sample_writer(self, columns: tuple, header: str, *, chunk_rows: int) -> ColumnarSampleWriter:
+        return ColumnarSampleWriter(
+            columns,
+            header=header,
+            prefix_fields=self._prefix_fields(),
+            chunk_rows=chunk_rows,
+            data_format=self.config.data_format,
+        )
 
-        fields = [
-            # Standard prefix columns
+    def _prefix_fields(self) -> list[str]:
+        """Standard prefix columns: trial,module,device_id,label."""
+        return [
             self._fmt(self._current_trial_number),
             "EyeTracker",
             self._fmt(self.device_id),
             self._fmt(self._trial_label or ""),
-            f"{record_time_unix:.6f}",
-            f"{record_time_mono:.9f}",
-            # Gaze-specific columns
-            self._fmt(timestamp),
-            self._fmt(timestamp_ns),
-            self._fmt(stream_type),
-            self._fmt(worn_int),
-            self._fmt(x),
-            self._fmt(y),
-            self._fmt(left_x),
-            self._fmt(left_y),
-            self._fmt(right_x),
-            self._fmt(right_y),
-            self._fmt(getattr(gaze, "pupil_diameter_left", None)),
-            self._fmt(getattr(gaze, "pupil_diameter_right", None)),
-            self._fmt(getattr(gaze, "eyeball_center_left_x", None)),
-            self._fmt(getattr(gaze, "eyeball_center_left_y", None)),
-            self._fmt(getattr(gaze, "eyeball_center_left_z", None)),
-            self._fmt(getattr(gaze, "optical_axis_left_x", None)),
-            self._fmt(getattr(gaze, "optical_axis_left_y", None)),
-            self._fmt(getattr(gaze, "optical_axis_left_z", None)),
-            self._fmt(getattr(gaze, "eyeball_center_right_x", None)),
-            self._fmt(getattr(gaze, "eyeball_center_right_y", None)),
-            self._fmt(getattr(gaze, "eyeball_center_right_z", None)),
-            self._fmt(getattr(gaze, "optical_axis_right_x", None)),
-            self._fmt(getattr(gaze, "optical_axis_right_y", None)),
-            self._fmt(getattr(gaze, "optical_axis_right_z", None)),
-            self._fmt(getattr(gaze, "eyelid_angle_top_left", None)),
-            self._fmt(getattr(gaze, "eyelid_angle_bottom_left", None)),
-            self._fmt(getattr(gaze, "eyelid_aperture_left", None)),
-            self._fmt(getattr(gaze, "eyelid_angle_top_right", None)),
-            self._fmt(getattr(gaze, "eyelid_angle_bottom_right", None)),
-            self._fmt(getattr(gaze, "eyelid_aperture_right", None)),
         ]
-        return self._csv_line(fields)
 
-    def _extract_components(self, source: Any, *keys: str) -> list[str]:
-        """Extract components from object or dict."""
+    @staticmethod
+    def _gaze_row(gaze: Any, record_time_unix: float, record_time_mono: float) -> tuple:
+        """Gaze values in GAZE_COLUMNS order (NaN / MISSING_INT when absent)."""
+        worn = getattr(gaze, "worn", None)
+        left_point = getattr(gaze, "left", None)
+        right_point = getattr(gaze, "right", None)
+        return (
+            record_time_unix,
+            record_time_mono,
+            as_float(getattr(gaze, "timestamp_unix_seconds", None)),
+            as_int(getattr(gaze, "timestamp_unix_ns", None)),
+            type(gaze).__name__,
+            MISSING_INT if worn is None else int(bool(worn)),
+            as_float(getattr(gaze, "x", None)),
+            as_float(getattr(gaze, "y", None)),
+            as_float(getattr(left_point, "x", None)),
+            as_float(getattr(left_point, "y", None)),
+            as_float(getattr(right_point, "x", None)),
+            as_float(getattr(right_point, "y", None)),
+            *(as_float(getattr(gaze, name, None)) for name in GAZE_VALUE_FIELDS),
+        )
+
+    def _extract_components(self, source: Any, *keys: str) -> list[float]:
+        """Extract numeric components from object or dict (NaN when absent)."""
         if source is None:
-            return [""] * len(keys)
+            return [float("nan")] * len(keys)
         def get_val(k):
             return getattr(source, k, None) if hasattr(source, k) else source.get(k) if isinstance(source, dict) else None
-        return [self._fmt(get_val(k)) for k in keys]
+        return [as_float(get_val(k)) for k in keys]
 
-    def _extract_xyz(self, source: Any) -> list[str]:
+    def _extract_xyz(self, source: Any) -> list[float]:
         return self._extract_components(source, "x", "y", "z")
 
-    def _extract_quat(self, source: Any) -> list[str]:
+    def _extract_quat(self, source: Any) -> list[float]:
         return self._extract_components(source, "w", "x", "y", "z")
 
     @staticmethod
@@ -844,6 +897,11 @@ class RecordingManager(RecordingManagerBase):
             await self._eyes_video_encoder.cleanup()
             self._eyes_video_encoder = None
 
+        if self._video_container is not None:
+            # The encoders released their streams; close a file none was added to
+            self._video_container.discard()
+            self._video_container = None
+
         if self._gaze_writer:
             await self._gaze_writer.cleanup()
             self._gaze_writer = None
@@ -1,30 +1,287 @@
+"""Video encoders for the EyeTracker world and eyes streams.
+
+The default ``"pyav"`` backend encodes in-process: frames pass through a
+bounded queue to a worker thread that resizes, encodes and muxes them with
+PyAV. PTS are taken from the Neon device timestamps (1/90000 time base), so
+frames skipped by ``recording_skip_factor`` or dropped under load leave a
+gap in time instead of shifting every later frame. Encoders given the same
+``SharedVideoContainer`` write their streams into one file.
+
+``"ffmpeg"`` (raw BGR frames piped to an ffmpeg process at a fixed ``-r``)
+and ``"opencv"`` remain as fallbacks when PyAV is not installed.
+"""
+
 import asyncio
-import os
+import queue
 import shutil
+import threading
+from fractions import Fraction
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
 from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.codec_backends import CodecBackend, fallback_chain, get_backend
 
 logger = get_module_logger(__name__)
 
+try:
+    import av
+    _HAS_PYAV = True
+except ImportError:
+    av = None
+    _HAS_PYAV = False
+
+VIDEO_BACKENDS = ("pyav", "ffmpeg", "opencv")
+DEFAULT_VIDEO_BACKEND = "pyav"
+
+# MPEG-TS style clock: fine enough for 200 Hz eye frames
+PTS_TIME_BASE = Fraction(1, 90000)
+
+# Frames buffered per encoder thread (~2 s of world video at 30 fps)
+_DEFAULT_QUEUE_SIZE = 60
+
 
 def _ffmpeg_available() -> bool:
     """Check if ffmpeg is available in PATH."""
     return shutil.which("ffmpeg") is not None
 
 
+def resolve_video_backend(requested: str) -> str:
+    """Return the first usable backend, starting from ``requested``."""
+    requested = (requested or DEFAULT_VIDEO_BACKEND).strip().lower()
+    if requested not in VIDEO_BACKENDS:
+        logger.warning("Unknown video backend %r, using %s", requested, DEFAULT_VIDEO_BACKEND)
+        requested = DEFAULT_VIDEO_BACKEND
+    if requested == "pyav" and not _HAS_PYAV:
+        logger.warning("PyAV not installed, falling back to the ffmpeg pipe encoder")
+        requested = "ffmpeg"
+    if requested == "ffmpeg" and not _ffmpeg_available():
+        logger.warning(
+            "ffmpeg not found in PATH, falling back to OpenCV VideoWriter. "
+            "Install ffmpeg for better compression and performance."
+        )
+        requested = "opencv"
+    return requested
+
+
+def _encoder_backends() -> List[CodecBackend]:
+    return fallback_chain(get_backend("libx264"), container="mp4")
+
+
+class PtsOrigin:
+    """Timestamp mapped to PTS 0 (the first one seen)."""
+
+    def __init__(self) -> None:
+        self._origin: Optional[float] = None
+
+    def resolve(self, timestamp_unix: float) -> float:
+        if self._origin is None:
+            self._origin = timestamp_unix
+        return self._origin
+
+
+class PtsClock:
+    """Maps device timestamps (unix seconds) to strictly increasing PTS.
+
+    ``origin`` is shared by every stream of one container so their
+    timelines line up; a frame without a timestamp is placed one nominal
+    frame interval after the previous one.
+    """
+
+    def __init__(self, fps: float, origin: Optional[PtsOrigin] = None) -> None:
+        self._interval = max(1, round(1.0 / (max(fps, 1e-3) * PTS_TIME_BASE)))
+        self._origin = origin if origin is not None else PtsOrigin()
+        self._last: Optional[int] = None
+
+    def next(self, timestamp_unix: Optional[float]) -> int:
+        if timestamp_unix is None:
+            pts = 0 if self._last is None else self._last + self._interval
+        else:
+            pts = round((timestamp_unix - self._origin.resolve(timestamp_unix)) / PTS_TIME_BASE)
+        if self._last is not None and pts <= self._last:
+            pts = self._last + 1
+        pts = max(pts, 0)
+        self._last = pts
+        return pts
+
+    @property
+    def last(self) -> Optional[int]:
+        return self._last
+
+
+class SharedVideoContainer:
+    """One PyAV output file holding several encoded video streams.
+
+    Streams are added while the encoders start (before the first packet is
+    muxed); packets from every encoder thread are muxed under one lock. The
+    file is closed when the last stream is released.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if not _HAS_PYAV:
+            raise RuntimeError("PyAV not installed. Install with: pip install av")
+        self.path = path
+        self.origin = PtsOrigin()
+        self._container = av.open(str(path), mode="w")
+        self._lock = threading.Lock()
+        self._open_streams = 0
+
+    def add_stream(self, resolution: Tuple[int, int], fps: float) -> Tuple[Any, CodecBackend]:
+        """Add a video stream using the first encoder backend that opens."""
+        errors = []
+        for backend in _encoder_backends():
+            # A stream that fails to open cannot be removed, so probe the codec first
+            try:
+                probe = av.CodecContext.create(backend.codec, "w")
+                _configure(probe, backend, resolution, fps)
+                probe.open()
+            except Exception as exc:
+                errors.append(f"{backend.name}: {exc}")
+                continue
+            with self._lock:
+                stream = self._container.add_stream(backend.codec, rate=_rate(fps))
+                stream.width, stream.height = resolution
+                stream.pix_fmt = backend.pix_fmt
+                stream.time_base = PTS_TIME_BASE
+                _configure(stream.codec_context, backend, resolution, fps)
+                if backend.options:
+                    stream.options = dict(backend.options)
+                self._open_streams += 1
+            return stream, backend
+        raise RuntimeError(f"No video encoder could be opened for {self.path}: {'; '.join(errors)}")
+
+    def mux(self, packets: List[Any]) -> None:
+        with self._lock:
+            if self._container is not None:
+                self._container.mux(packets)
+
+    def discard(self) -> None:
+        """Close the file if no stream was ever added (a failed start)."""
+        with self._lock:
+            if self._open_streams or self._container is None:
+                return
+            container = self._container
+            self._container = None
+        try:
+            container.close()
+        except Exception as exc:
+            logger.debug("Failed to close unused %s: %s", self.path, exc)
+
+    def release(self) -> None:
+        """Release one stream; closes the file after the last one."""
+        with self._lock:
+            self._open_streams -= 1
+            if self._open_streams > 0 or self._container is None:
+                return
+            container = self._container
+            self._container = None
+        try:
+            container.close()
+        except Exception as exc:
+            logger.error("Failed to close %s: %s", self.path, exc)
+
+
+def _rate(fps: float) -> Fraction:
+    return Fraction(fps).limit_denominator(1000)
+
+
+def _configure(context: Any, backend: CodecBackend, resolution: Tuple[int, int], fps: float) -> None:
+    context.width, context.height = resolution
+    context.pix_fmt = backend.pix_fmt
+    context.time_base = PTS_TIME_BASE
+    context.framerate = _rate(fps)
+
+
+class _PyAVOutput:
+    """Worker thread encoding queued ``(frame, pts)`` pairs into one stream."""
+
+    def __init__(
+        self,
+        container: SharedVideoContainer,
+        resolution: Tuple[int, int],
+        fps: float,
+        queue_size: int,
+    ) -> None:
+        self._container = container
+        self._resolution = resolution
+        self._stream, self.backend = container.add_stream(resolution, fps)
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, int]]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name=f"eyetracker-encode-{id(self)}", daemon=True)
+        self.frames_encoded = 0
+        self.frames_dropped = 0
+        self.errors = 0
+        self._thread.start()
+
+    def submit(self, frame: np.ndarray, pts: int) -> bool:
+        try:
+            self._queue.put_nowait((frame, pts))
+            return True
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Encoder thread for %s did not finish in %.0fs", self._container.path, timeout)
+
+    def _run(self) -> None:
+        width, height = self._resolution
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            frame, pts = item
+            try:
+                if frame.shape[:2] != (height, width):
+                    frame = cv2.resize(frame, (width, height))
+                av_frame = av.VideoFrame.from_ndarray(np.ascontiguousarray(frame), format="bgr24")
+                av_frame.pts = pts
+                av_frame.time_base = PTS_TIME_BASE
+                self._container.mux(self._stream.encode(av_frame))
+                self.frames_encoded += 1
+            except Exception as exc:
+                self.errors += 1
+                if self.errors == 1:
+                    logger.error("Failed to encode frame for %s: %s", self._container.path, exc)
+        try:
+            self._container.mux(self._stream.encode(None))
+        except Exception as exc:
+            logger.error("Failed to flush encoder for %s: %s", self._container.path, exc)
+        finally:
+            self._container.release()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+
 class VideoEncoder:
-    """Minimal video encoder wrapper supporting FFmpeg or OpenCV backends."""
+    """Video encoder for one stream: in-process PyAV, ffmpeg pipe or OpenCV.
 
-    def __init__(self, resolution: Tuple[int, int], fps: float, *, use_ffmpeg: bool = True) -> None:
+    ``write_frame`` takes the frame's device timestamp; the ffmpeg and
+    OpenCV backends ignore it and play frames back at the fixed ``fps``.
+    """
+
+    def __init__(
+        self,
+        resolution: Tuple[int, int],
+        fps: float,
+        *,
+        backend: str = DEFAULT_VIDEO_BACKEND,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+    ) -> None:
         self.resolution = resolution
         self.fps = fps
-        self.use_ffmpeg = use_ffmpeg
+        self.backend = backend
+        self._queue_size = max(1, queue_size)
 
+        self._output: Optional[_PyAVOutput] = None
+        self._clock: Optional[PtsClock] = None
         self._process: Optional[asyncio.subprocess.Process] = None
         self._writer: Optional[cv2.VideoWriter] = None
         self._output_path: Optional[Path] = None
@@ -32,21 +289,36 @@ class VideoEncoder:
         self._frames_since_flush = 0
         self._logged_process_death = False
 
-    async def start(self, output_path: Path) -> None:
+    @property
+    def use_ffmpeg(self) -> bool:
+        return self.backend == "ffmpeg"
+
+    async def start(self, output_path: Path, *, container: Optional[SharedVideoContainer] = None) -> None:
+        """Open the output. With ``container``, add a stream to that shared file."""
         width, height = self.resolution
-        self._output_path = output_path
+        self._output_path = container.path if container is not None else output_path
         self._frames_since_flush = 0
         self._logged_process_death = False
+        self.backend = "pyav" if container is not None else resolve_video_backend(self.backend)
 
-        # Check ffmpeg availability and fall back to OpenCV if needed
-        if self.use_ffmpeg and not _ffmpeg_available():
-            logger.warning(
-                "ffmpeg not found in PATH, falling back to OpenCV VideoWriter. "
-                "Install ffmpeg for better compression and performance."
+        if self.backend == "pyav":
+            own_container = container is None
+            if own_container:
+                container = await asyncio.to_thread(SharedVideoContainer, output_path)
+            try:
+                self._output = await asyncio.to_thread(
+                    _PyAVOutput, container, self.resolution, self.fps, self._queue_size
+                )
+            except Exception:
+                if own_container:
+                    container.release()
+                raise
+            self._clock = PtsClock(self.fps, container.origin)
+            logger.debug(
+                "PyAV encoder: %s %s %dx%d (stream %d)",
+                self._output_path, self._output.backend.name, width, height, self._output._stream.index,
             )
-            self.use_ffmpeg = False
-
-        if self.use_ffmpeg:
+        elif self.backend == "ffmpeg":
             cmd = [
                 "ffmpeg",
                 "-y",
@@ -97,8 +369,15 @@ class VideoEncoder:
             frame = cv2.resize(frame, (width, height))
         return np.ascontiguousarray(frame)
 
-    async def write_frame(self, frame: np.ndarray) -> None:
-        if self.use_ffmpeg:
+    async def write_frame(self, frame: np.ndarray, timestamp_unix: Optional[float] = None) -> None:
+        if self.backend == "pyav":
+            # Hand off to the encoder thread; resize and encode happen there
+            if self._output is None or self._clock is None:
+                return
+            self._output.submit(frame, self._clock.next(timestamp_unix))
+            return
+
+        if self.backend == "ffmpeg":
             # Offload resize and byte conversion to thread
             frame_bytes = await asyncio.to_thread(self._resize_and_encode, frame, self.resolution)
 
@@ -136,7 +415,18 @@ class VideoEncoder:
         await asyncio.to_thread(fsync_path, self._output_path)
 
     async def stop(self) -> None:
-        if self.use_ffmpeg:
+        if self.backend == "pyav":
+            output = self._output
+            if output is None:
+                return
+            self._output = None
+            await asyncio.to_thread(output.close)
+            if output.frames_dropped or output.errors:
+                logger.warning(
+                    "Encoder for %s dropped %d frames (queue full), %d failed to encode",
+                    self._output_path, output.frames_dropped, output.errors,
+                )
+        elif self.backend == "ffmpeg":
             if self._process is None:
                 return
             try:
@@ -164,6 +454,29 @@ class VideoEncoder:
         await self.stop()
 
     def is_running(self) -> bool:
-        if self.use_ffmpeg:
+        if self.backend == "pyav":
+            return self._output is not None
+        if self.backend == "ffmpeg":
             return self._process is not None and self._process.returncode is None
         return self._writer is not None
+
+    @property
+    def frames_dropped(self) -> int:
+        """Frames dropped because the encoder thread fell behind (PyAV only)."""
+        return self._output.frames_dropped if self._output is not None else 0
+
+    @property
+    def last_pts(self) -> Optional[int]:
+        """PTS of the last submitted frame, in ``PTS_TIME_BASE`` units."""
+        return self._clock.last if self._clock is not None else None
+
+
+__all__ = [
+    "DEFAULT_VIDEO_BACKEND",
+    "PTS_TIME_BASE",
+    "PtsClock",
+    "SharedVideoContainer",
+    "VIDEO_BACKENDS",
+    "VideoEncoder",
+    "resolve_video_backend",
+]
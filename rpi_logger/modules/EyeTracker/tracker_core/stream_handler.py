@@ -6,6 +6,7 @@ from typing import Optional, Any, List, Callable
 
 import numpy as np
 from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.core.telemetry import register_telemetry, unregister_telemetry
 from pupil_labs.realtime_api import (
     receive_video_frames,
     receive_gaze_data,
@@ -51,6 +52,8 @@ class StreamHandler:
         self.last_audio: Optional[Any] = None
         self.last_eyes_frame: Optional[np.ndarray] = None
 
+        # Listeners receive every sample (recording), unlike the latest-only queues
+        self.gaze_listener: Optional[Callable[[Any], None]] = None
         self.imu_listener: Optional[Callable[[Any], None]] = None
         self.event_listener: Optional[Callable[[Any], None]] = None
         self.camera_frames = 0
@@ -133,6 +136,8 @@ class StreamHandler:
             asyncio.create_task(self._stream_video_frames(video_url), name="video-stream"),
             asyncio.create_task(self._stream_gaze_data(gaze_url), name="gaze-stream"),
         ]
+        # Polled by the telemetry sender; the gaze loop itself does no extra work
+        register_telemetry("eyetracker.gaze", self._telemetry_gaze)
 
         if imu_url:
             self.tasks.append(
@@ -162,6 +167,7 @@ class StreamHandler:
         self._audio_task_active = False
         self._eyes_task_active = False
         self._update_running_flag()
+        unregister_telemetry("eyetracker.gaze")
 
         for task in self.tasks:
             if not task.done():
@@ -233,6 +239,13 @@ class StreamHandler:
                 self._enqueue_latest(self._gaze_queue, gaze, stream_name="gaze")
                 self._gaze_ready_event.set()  # Signal gaze available
 
+                listener = self.gaze_listener
+                if listener is not None:
+                    try:
+                        listener(gaze)
+                    except Exception as exc:
+                        logger.error("Gaze listener error: %s", exc)
+
         except asyncio.CancelledError:
             logger.debug("Gaze stream cancelled after %d samples", gaze_count)
             raise
@@ -394,6 +407,9 @@ class StreamHandler:
     def get_latest_event(self) -> Optional[Any]:
         return self.last_event
 
+    def set_gaze_listener(self, listener: Optional[Callable[[Any], None]]) -> None:
+        self.gaze_listener = listener
+
     def set_imu_listener(self, listener: Optional[Callable[[Any], None]]) -> None:
         self.imu_listener = listener
 
@@ -406,6 +422,20 @@ class StreamHandler:
     def get_latest_eyes_frame(self) -> Optional[np.ndarray]:
         return self.last_eyes_frame
 
+    def _telemetry_gaze(self) -> Optional[dict]:
+        gaze = self.last_gaze
+        if gaze is None:
+            return None
+        return {
+            "x": getattr(gaze, "x", None),
+            "y": getattr(gaze, "y", None),
+            "worn": getattr(gaze, "worn", None),
+            "timestamp_unix_seconds": getattr(gaze, "timestamp_unix_seconds", None),
+            "camera_fps": self.get_camera_fps(),
+            "dropped_frames": self._dropped_frames,
+            "dropped_gaze": self._dropped_gaze,
+        }
+
     def get_camera_fps(self) -> float:
         return self.camera_fps_tracker.get_fps()
 
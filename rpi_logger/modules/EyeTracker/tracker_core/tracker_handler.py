@@ -9,13 +9,14 @@ from .gaze_tracker import GazeTracker
 class TrackerHandler:
     """Coordinator for the gaze tracker runtime loops and state."""
 
-    def __init__(self, config, device_manager, stream_handler, frame_processor, recording_manager):
+    def __init__(self, config, device_manager, stream_handler, frame_processor, recording_manager, preview_slot=None):
         self.logger = get_module_logger("TrackerHandler")
         self.config = config
         self.device_manager = device_manager
         self.stream_handler = stream_handler
         self.frame_processor = frame_processor
         self.recording_manager = recording_manager
+        self.preview_slot = preview_slot
 
         self.gaze_tracker: Optional[GazeTracker] = None
         self._run_task: Optional[asyncio.Task] = None
@@ -30,6 +31,7 @@ class TrackerHandler:
                 frame_processor=self.frame_processor,
                 recording_manager=self.recording_manager,
                 display_enabled=display_enabled,
+                preview_slot=self.preview_slot,
             )
         else:
             self.gaze_tracker.display_enabled = display_enabled
@@ -69,6 +71,12 @@ class TrackerHandler:
             return 0.0
         return self.gaze_tracker.get_display_fps()
 
+    def get_load_stats(self) -> dict:
+        """Get adaptive skip factors and stage timings."""
+        if self.gaze_tracker is None:
+            return {}
+        return self.gaze_tracker.get_load_stats()
+
     async def stop(self) -> None:
         if self._run_task and not self._run_task.done():
             self._run_task.cancel()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from rpi_logger.modules.base.preferences import ScopedPreferences
 from rpi_logger.modules.base.typed_config import (
@@ -41,6 +41,10 @@ class GPSConfig:
     baud_rate: int = 9600
     reconnect_delay_s: float = 3.0
     nmea_history: int = 30
+    host_latency_column: bool = False  # Add host_latency_us (serial arrival to logging) to CSVs
+    nmea_sentences: str = ""  # Sentence types parsed live, e.g. "RMC,GGA" (empty = all)
+    raw_nmea_archive: bool = False  # Keep every received line in a compressed archive
+    raw_nmea_codec: str = "zstd"  # zstd (needs zstandard, else gzip) or gzip
 
     # UI visibility (master logger integration)
     preview_resolution: str = "auto"
@@ -75,6 +79,10 @@ class GPSConfig:
             baud_rate=get_pref_int(prefs, "baud_rate", defaults.baud_rate),
             reconnect_delay_s=get_pref_float(prefs, "reconnect_delay_s", defaults.reconnect_delay_s),
             nmea_history=get_pref_int(prefs, "nmea_history", defaults.nmea_history),
+            host_latency_column=get_pref_bool(prefs, "host_latency_column", defaults.host_latency_column),
+            nmea_sentences=get_pref_str(prefs, "nmea_sentences", defaults.nmea_sentences),
+            raw_nmea_archive=get_pref_bool(prefs, "raw_nmea_archive", defaults.raw_nmea_archive),
+            raw_nmea_codec=get_pref_str(prefs, "raw_nmea_codec", defaults.raw_nmea_codec),
             # UI visibility
             preview_resolution=get_pref_str(prefs, "preview_resolution", defaults.preview_resolution),
             gui_io_stub_visible=get_pref_bool(prefs, "gui_io_stub_visible", defaults.gui_io_stub_visible),
@@ -113,6 +121,12 @@ class GPSConfig:
 
         return GPSConfig(**values)
 
+    @property
+    def enabled_sentences(self) -> Optional[set[str]]:
+        """Sentence types for the live parser, or None to parse all."""
+        types = {part.strip().upper() for part in self.nmea_sentences.split(",") if part.strip()}
+        return types or None
+
     def to_dict(self) -> dict[str, Any]:
         """Export config values as dictionary."""
         return asdict(self)
@@ -25,12 +25,13 @@ from vmc.runtime_helpers import BackgroundTaskManager
 from rpi_logger.modules.base.storage_utils import ensure_module_data_dir
 from rpi_logger.core.commands import StatusMessage, StatusType
 from rpi_logger.core.logging_utils import ensure_structured_logger
+from rpi_logger.core.telemetry import publish_telemetry
 
 from gps_core.constants import DEFAULT_NMEA_HISTORY, get_fix_quality_description
 from gps_core.handlers import GPSHandler
 from gps_core.transports import SerialGPSTransport
-from gps_core.parsers.nmea_types import GPSFixSnapshot
-from gps_core.interfaces.gui import GPSMapRenderer
+from gps_core.parsers.nmea_types import GPSFixSnapshot, NMEAUpdate
+from gps_core.interfaces.gui import GPSMapRenderer, TileService
 from rpi_logger.modules.GPS.preferences import GPSPreferences
 from rpi_logger.modules.GPS.config import GPSConfig
 
@@ -109,8 +110,9 @@ class GPSModuleRuntime(ModuleRuntime):
         self._current_zoom = self._clamp_zoom(initial_zoom)
         self._current_center = (initial_lat, initial_lon)
 
-        # Offline tiles database
+        # Offline tiles database (one connection and tile cache for all devices)
         self._offline_db_path = self._resolve_offline_db_path()
+        self._tile_service: Optional[TileService] = None
 
         # UI state
         self._map_widget = None
@@ -161,6 +163,11 @@ class GPSModuleRuntime(ModuleRuntime):
             await self.unassign_device(device_id)
 
         await self._task_manager.shutdown()
+
+        if self._tile_service is not None:
+            self._tile_service.close()
+            self._tile_service = None
+
         self.logger.info("GPS runtime shutdown complete")
 
     async def cleanup(self) -> None:
@@ -324,7 +331,12 @@ class GPSModuleRuntime(ModuleRuntime):
             self._transports[device_id] = transport
 
             # Create handler
-            handler = GPSHandler(device_id, self.module_data_dir, transport)
+            handler = GPSHandler(
+                device_id, self.module_data_dir, transport,
+                host_latency=self.typed_config.host_latency_column,
+                enabled_sentences=self.typed_config.enabled_sentences,
+                raw_archive_codec=self.typed_config.raw_nmea_codec if self.typed_config.raw_nmea_archive else None,
+            )
             handler.data_callback = self._on_device_data
 
             # Start handler
@@ -333,7 +345,9 @@ class GPSModuleRuntime(ModuleRuntime):
 
             # Create map renderer for this device
             if self._offline_db_path.exists():
-                renderer = GPSMapRenderer(self._offline_db_path)
+                if self._tile_service is None:
+                    self._tile_service = TileService(self._offline_db_path)
+                renderer = GPSMapRenderer(self._offline_db_path, tile_service=self._tile_service)
                 renderer.set_center(*self._current_center)
                 renderer.set_zoom(self._current_zoom)
                 self._map_renderers[device_id] = renderer
@@ -397,7 +411,9 @@ class GPSModuleRuntime(ModuleRuntime):
                 await transport.disconnect()
 
             # Clean up map renderer
-            self._map_renderers.pop(device_id, None)
+            renderer = self._map_renderers.pop(device_id, None)
+            if renderer:
+                renderer.close()
 
             # Notify view
             if self.view:
@@ -469,7 +485,7 @@ class GPSModuleRuntime(ModuleRuntime):
         self,
         device_id: str,
         fix: GPSFixSnapshot,
-        update: Dict[str, Any],
+        update: NMEAUpdate,
     ) -> None:
         # Update map center if we have a valid position
         if fix.fix_valid and fix.latitude is not None and fix.longitude is not None:
@@ -481,7 +497,7 @@ class GPSModuleRuntime(ModuleRuntime):
                 renderer.set_center(fix.latitude, fix.longitude)
 
         # Update NMEA history (always)
-        raw_sentence = update.get("raw_sentence", "")
+        raw_sentence = update.raw_sentence
         if raw_sentence:
             timestamp = datetime.now().strftime("%H:%M:%S")
             self._recent_sentences.append(f"[{timestamp}] {raw_sentence}")
@@ -489,6 +505,20 @@ class GPSModuleRuntime(ModuleRuntime):
         # Update stats tracking
         self._update_stats(fix)
 
+        # Coalesced by the publisher; sent at most ~10 times per second
+        publish_telemetry("gps.fix", {
+            "device_id": device_id,
+            "fix_valid": fix.fix_valid,
+            "latitude": fix.latitude,
+            "longitude": fix.longitude,
+            "altitude_m": fix.altitude_m,
+            "speed_kmh": fix.speed_kmh,
+            "course_deg": fix.course_deg,
+            "fix_quality": fix.fix_quality,
+            "satellites_in_use": fix.satellites_in_use,
+            "hdop": fix.hdop,
+        })
+
         # Throttle UI updates based on update_rate_hz preference
         update_rate_hz = self.preferences.get_update_rate_hz() if self.preferences else 1
         ui_interval = 1.0 / max(1, update_rate_hz)
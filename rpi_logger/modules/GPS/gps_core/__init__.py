@@ -14,7 +14,7 @@ from .constants import (
     DEFAULT_RECONNECT_DELAY,
     DEFAULT_NMEA_HISTORY,
 )
-from .parsers import GPSFixSnapshot, NMEAParser
+from .parsers import GPSFixSnapshot, NMEAParser, NMEAUpdate
 from .transports import BaseGPSTransport, SerialGPSTransport
 from .data_logger import GPSDataLogger
 from .handlers import BaseGPSHandler, GPSHandler
@@ -35,6 +35,7 @@ __all__ = [
     "DEFAULT_NMEA_HISTORY",
     # Types
     "GPSFixSnapshot",
+    "NMEAUpdate",
     # Parser
     "NMEAParser",
     # Transport
@@ -47,11 +47,15 @@ GPS_CSV_HEADER = [
     "raw_sentence",
 ]
 
+# Optional trailing column: microseconds from serial arrival to logging
+HOST_LATENCY_COLUMN = "host_latency_us"
+
 # Default serial configuration
 DEFAULT_BAUD_RATE = 9600
 DEFAULT_RECONNECT_DELAY = 3.0
 DEFAULT_NMEA_HISTORY = 30
 DEFAULT_STALE_THRESHOLD = 5.0  # seconds without valid NMEA before fix_valid=False
+GSV_MAX_AGE = 10.0  # seconds of receiver time before a silent talker leaves satellites_in_view
 
 # GPS fix quality descriptions (GGA sentence, field 6)
 FIX_QUALITY_DESCRIPTIONS = {
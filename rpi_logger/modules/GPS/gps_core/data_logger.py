@@ -9,14 +9,52 @@ from pathlib import Path
 from queue import Queue, Empty
 from typing import Any, List, Optional, TextIO
 
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
 from rpi_logger.core.logging_utils import get_module_logger
 from rpi_logger.modules.base.storage_utils import derive_session_token, sanitize_device_id
-from .constants import GPS_CSV_HEADER, MPS_PER_KNOT
+from .constants import GPS_CSV_HEADER, HOST_LATENCY_COLUMN, MPS_PER_KNOT
 from .parsers.nmea_types import GPSFixSnapshot
 
 logger = get_module_logger(__name__)
 
 
+def format_fix_row(
+    fix: GPSFixSnapshot,
+    sentence_type: str,
+    raw_sentence: str,
+    record_time_unix: float,
+    record_time_mono: float,
+    *,
+    trial_number: int,
+    device_id: str,
+    label: str = "",
+) -> List[Any]:
+    """One GPS CSV row (``GPS_CSV_HEADER`` columns) for the current fix."""
+    speed_mps = None
+    if fix.speed_knots is not None:
+        speed_mps = fix.speed_knots * MPS_PER_KNOT
+    elif fix.speed_kmh is not None:
+        speed_mps = fix.speed_kmh / 3.6
+
+    device_time_unix = ""
+    if fix.timestamp is not None:
+        try:
+            device_time_unix = fix.timestamp.timestamp()
+        except Exception:
+            device_time_unix = ""
+
+    return [
+        trial_number, "GPS", device_id, label,
+        f"{record_time_unix:.6f}", f"{record_time_mono:.9f}",
+        device_time_unix,
+        fix.latitude, fix.longitude, fix.altitude_m, speed_mps,
+        fix.speed_kmh, fix.speed_knots, fix.speed_mph, fix.course_deg,
+        fix.fix_quality, fix.fix_mode or "", 1 if fix.fix_valid else 0,
+        fix.satellites_in_use, fix.satellites_in_view,
+        fix.hdop, fix.pdop, fix.vdop, sentence_type, raw_sentence,
+    ]
+
+
 class GPSDataLogger:
     """CSV logger with buffered async writing and drop detection."""
 
@@ -25,11 +63,17 @@ class GPSDataLogger:
         output_dir: Path,
         device_id: str,
         flush_threshold: int = 32,
+        host_latency: bool = False,
     ):
-        """Initialize logger with output dir, device ID, and flush threshold."""
+        """Initialize logger with output dir, device ID, and flush threshold.
+
+        With ``host_latency`` rows end with a host_latency_us column (serial
+        arrival to logging, in microseconds).
+        """
         self.output_dir = output_dir
         self.device_id = device_id
         self._flush_threshold = flush_threshold
+        self.host_latency = host_latency
         self._record_file: Optional[TextIO] = None
         self._record_writer: Optional[csv.writer] = None
         self._record_path: Optional[Path] = None
@@ -50,6 +94,13 @@ class GPSDataLogger:
         """Return the current CSV file path."""
         return self._record_path
 
+    @property
+    def csv_header(self) -> List[str]:
+        """CSV header, plus host_latency_us when enabled."""
+        if self.host_latency:
+            return [*GPS_CSV_HEADER, HOST_LATENCY_COLUMN]
+        return GPS_CSV_HEADER
+
     @property
     def dropped_records(self) -> int:
         """Number of records dropped due to queue overflow."""
@@ -96,7 +147,7 @@ class GPSDataLogger:
             handle = path.open("a", encoding="utf-8", newline="")
             writer = csv.writer(handle)
             if needs_header:
-                writer.writerow(GPS_CSV_HEADER)
+                writer.writerow(self.csv_header)
 
             self._record_file = handle
             self._record_writer = writer
@@ -162,37 +213,34 @@ class GPSDataLogger:
         if record_path:
             logger.info("Stopped GPS recording: %s", record_path)
 
-    def log_fix(self, fix: GPSFixSnapshot, sentence_type: str, raw_sentence: str) -> bool:
-        """Queue fix record for writing. Returns True if queued, False if dropped."""
+    def log_fix(
+        self,
+        fix: GPSFixSnapshot,
+        sentence_type: str,
+        raw_sentence: str,
+        arrival: Optional[RawLine] = None,
+    ) -> bool:
+        """Queue fix record for writing. Returns True if queued, False if dropped.
+
+        The record time is the serial arrival of ``arrival`` (the sentence
+        that updated the fix), or now if not given.
+        """
         if not self._recording or not self._record_writer:
             return False
 
-        speed_mps = None
-        if fix.speed_knots is not None:
-            speed_mps = fix.speed_knots * MPS_PER_KNOT
-        elif fix.speed_kmh is not None:
-            speed_mps = fix.speed_kmh / 3.6
-
-        record_time_unix = time.time()
-        record_time_mono = time.perf_counter()
-
-        device_time_unix = ""
-        if fix.timestamp is not None:
-            try:
-                device_time_unix = fix.timestamp.timestamp()
-            except Exception:
-                device_time_unix = ""
-
-        row = [
-            self._trial_number, "GPS", self.device_id, self._trial_label,
-            f"{record_time_unix:.6f}", f"{record_time_mono:.9f}",
-            device_time_unix,
-            fix.latitude, fix.longitude, fix.altitude_m, speed_mps,
-            fix.speed_kmh, fix.speed_knots, fix.speed_mph, fix.course_deg,
-            fix.fix_quality, fix.fix_mode or "", 1 if fix.fix_valid else 0,
-            fix.satellites_in_use, fix.satellites_in_view,
-            fix.hdop, fix.pdop, fix.vdop, sentence_type, raw_sentence,
-        ]
+        if arrival is not None:
+            record_time_unix = arrival.arrival_unix
+            record_time_mono = arrival.arrival_mono
+        else:
+            record_time_unix = time.time()
+            record_time_mono = time.perf_counter()
+
+        row = format_fix_row(
+            fix, sentence_type, raw_sentence, record_time_unix, record_time_mono,
+            trial_number=self._trial_number, device_id=self.device_id, label=self._trial_label,
+        )
+        if self.host_latency:
+            row.append(f"{arrival.host_latency_us():.0f}" if arrival is not None else "")
 
         try:
             self._write_queue.put_nowait(row)
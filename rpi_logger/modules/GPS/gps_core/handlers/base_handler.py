@@ -9,15 +9,17 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
 from rpi_logger.core.connection import ReconnectingMixin, ReconnectConfig
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
 from rpi_logger.core.logging_utils import get_module_logger
 from ..constants import DEFAULT_STALE_THRESHOLD
 from ..parsers.nmea_parser import NMEAParser
-from ..parsers.nmea_types import GPSFixSnapshot
+from ..parsers.nmea_types import GPSFixSnapshot, NMEAUpdate
 from ..transports import BaseGPSTransport
 from ..data_logger import GPSDataLogger
+from ..nmea_archive import ARCHIVE_SUFFIXES, NMEAArchiveWriter, resolve_codec
 
 logger = get_module_logger(__name__)
 
@@ -43,16 +45,34 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
         output_dir: Path,
         transport: BaseGPSTransport,
         stale_threshold: float = DEFAULT_STALE_THRESHOLD,
+        host_latency: bool = False,
+        enabled_sentences: Optional[set[str]] = None,
+        raw_archive_codec: Optional[str] = None,
     ):
-        """Initialize handler with device ID, output directory, and transport."""
+        """Initialize handler with device ID, output directory, and transport.
+
+        ``enabled_sentences`` limits live parsing to those sentence types;
+        with ``raw_archive_codec`` ("zstd" or "gzip") every received line is
+        also archived while recording, so the CSV can be regenerated later.
+        """
         self.device_id = device_id
         self.output_dir = output_dir
         self.transport = transport
         self._stale_threshold = stale_threshold
-
-        self._parser = NMEAParser(on_fix_update=self._on_parser_update, validate_checksums=True)
+        self._host_latency = host_latency
+        # Sentence being parsed; its arrival time becomes the CSV record time
+        self._current_line: Optional[RawLine] = None
+
+        self._parser = NMEAParser(
+            on_fix_update=self._on_parser_update,
+            validate_checksums=True,
+            enabled_sentences=enabled_sentences,
+        )
         self._data_logger: Optional[GPSDataLogger] = None
-        self.data_callback: Optional[Callable[[str, GPSFixSnapshot, Dict[str, Any]], Awaitable[None]]] = None
+        self._raw_archive_codec = raw_archive_codec
+        self._archive: Optional[NMEAArchiveWriter] = None
+        self._trial_label = ""
+        self.data_callback: Optional[Callable[[str, GPSFixSnapshot, NMEAUpdate], Awaitable[None]]] = None
         self._running = False
         self._recording = False
         self._read_task: Optional[asyncio.Task] = None
@@ -110,7 +130,8 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
         self._pending_tasks.clear()
 
         if self._recording:
-            self.stop_recording()
+            # Closing the archive joins its writer thread; keep that off the loop
+            await asyncio.to_thread(self.stop_recording)
 
         logger.info("GPS handler stopped for %s", self.device_id)
 
@@ -122,11 +143,14 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
 
         self._trial_number = trial_number
 
-        self._data_logger = GPSDataLogger(self.output_dir, self.device_id)
+        self._data_logger = GPSDataLogger(self.output_dir, self.device_id, host_latency=self._host_latency)
         path = self._data_logger.start_recording(trial_number, trial_label)
 
         if path:
             self._recording = True
+            self._trial_label = trial_label
+            if self._raw_archive_codec:
+                self._open_archive(path)
             logger.info("Started GPS recording for %s: %s", self.device_id, path)
             return True
 
@@ -143,6 +167,15 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
             self._data_logger.stop_recording()
             self._data_logger = None
 
+        if self._archive is not None:
+            self._archive.close()
+            logger.info(
+                "Archived %d raw NMEA lines for %s (%d -> %d bytes)",
+                self._archive.lines_written, self.device_id,
+                self._archive.raw_bytes, self._archive.compressed_bytes,
+            )
+            self._archive = None
+
         self._recording = False
         logger.info("Stopped GPS recording for %s", self.device_id)
 
@@ -151,6 +184,8 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
         self._trial_number = trial_number
         if self._data_logger:
             self._data_logger.update_trial_number(trial_number)
+        if self._archive is not None:
+            self._archive.write_meta(self._archive_meta())
 
     def update_output_dir(self, output_dir: Path) -> None:
         """Update output directory for data logging."""
@@ -158,6 +193,22 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
         if self._data_logger:
             self._data_logger.update_output_dir(output_dir)
 
+    def _open_archive(self, csv_path: Path) -> None:
+        """Start the raw archive next to the CSV (same name, archive suffix)."""
+        codec = resolve_codec(self._raw_archive_codec)
+        archive = NMEAArchiveWriter(csv_path.with_name(csv_path.stem + ARCHIVE_SUFFIXES[codec]), codec)
+        try:
+            archive.open()
+        except OSError as exc:
+            logger.error("Failed to open raw NMEA archive for %s: %s", self.device_id, exc)
+            return
+        archive.write_meta(self._archive_meta())
+        self._archive = archive
+        logger.info("Archiving raw NMEA for %s to %s", self.device_id, archive.path)
+
+    def _archive_meta(self) -> Dict[str, Any]:
+        return {"device_id": self.device_id, "trial": self._trial_number, "label": self._trial_label}
+
     async def _read_loop(self) -> None:
         """Read loop with self-healing circuit breaker and exponential backoff."""
         logger.debug("Read loop started for %s", self.device_id)
@@ -172,15 +223,21 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
                 continue
 
             try:
-                line = await self.transport.read_line(timeout=1.0)
-                if line:
+                batch = await self._receive_batch()
+                if batch:
                     self._consecutive_errors = 0
                     self._logged_stale = False
-                    if line.startswith("$"):
-                        self._process_sentence(line)
+                    if self._archive is not None:
+                        self._archive.write_lines(batch)
+                    self._process_sentences(self._sentences(batch))
 
                 self._check_staleness()
-                await asyncio.sleep(0.01)
+                if batch:
+                    await asyncio.sleep(0)  # Yield between buffered batches
+                else:
+                    # read_line already waited for data; this only paces
+                    # transports that return immediately
+                    await asyncio.sleep(0.01)
 
             except asyncio.CancelledError:
                 break
@@ -214,6 +271,18 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
             self._reconnect_state.value if hasattr(self, '_reconnect_state') else 'N/A'
         )
 
+    async def _receive_batch(self) -> List[RawLine]:
+        """Every sentence buffered by the transport, waiting up to 1s for one."""
+        return await self.transport.read_raw_lines(timeout=1.0)
+
+    def _sentences(self, batch: List[RawLine]) -> Iterator[str]:
+        """NMEA sentences of ``batch``, tracking the one being parsed."""
+        for raw in batch:
+            line = raw.text
+            if line.startswith("$"):
+                self._current_line = raw
+                yield line
+
     async def _attempt_reconnect(self) -> bool:
         """Reconnect transport. Called by ReconnectingMixin on circuit breaker trigger."""
         try:
@@ -250,10 +319,17 @@ class BaseGPSHandler(ABC, ReconnectingMixin):
         """Process NMEA sentence. Override for device-specific processing."""
         ...
 
-    def _on_parser_update(self, fix: GPSFixSnapshot, update: Dict[str, Any]) -> None:
+    def _process_sentences(self, sentences: Iterable[str]) -> None:
+        """Process sentences that arrived together. Override to parse in batch."""
+        for sentence in sentences:
+            self._process_sentence(sentence)
+
+    def _on_parser_update(self, fix: GPSFixSnapshot, update: NMEAUpdate) -> None:
         """Called when parser updates fix."""
         if self._recording and self._data_logger:
-            self._data_logger.log_fix(fix, update.get("sentence_type", ""), update.get("raw_sentence", ""))
+            self._data_logger.log_fix(
+                fix, update.sentence_type, update.raw_sentence, arrival=self._current_line
+            )
         if self.data_callback:
             self._create_background_task(self.data_callback(self.device_id, fix, update))
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable, Optional
 
 from rpi_logger.core.logging_utils import get_module_logger
 from .base_handler import BaseGPSHandler
@@ -14,15 +15,36 @@ logger = get_module_logger(__name__)
 class GPSHandler(BaseGPSHandler):
     """Default handler for NMEA-0183 receivers (RMC, GGA, VTG, GLL, GSA, GSV)."""
 
-    def __init__(self, device_id: str, output_dir: Path, transport: BaseGPSTransport):
+    def __init__(
+        self,
+        device_id: str,
+        output_dir: Path,
+        transport: BaseGPSTransport,
+        host_latency: bool = False,
+        enabled_sentences: Optional[set[str]] = None,
+        raw_archive_codec: Optional[str] = None,
+    ):
         """Initialize GPS handler."""
-        super().__init__(device_id, output_dir, transport)
+        super().__init__(
+            device_id, output_dir, transport,
+            host_latency=host_latency,
+            enabled_sentences=enabled_sentences,
+            raw_archive_codec=raw_archive_codec,
+        )
         self._logged_first_fix = False
 
     def _process_sentence(self, sentence: str) -> None:
         """Process NMEA sentence and log first valid fix."""
-        result = self._parser.parse_sentence(sentence)
-        if result and not self._logged_first_fix:
+        if self._parser.parse_sentence(sentence):
+            self._log_first_fix()
+
+    def _process_sentences(self, sentences: Iterable[str]) -> None:
+        """Parse a burst of sentences (e.g. one 10-25 Hz epoch) in one call."""
+        if self._parser.parse_many(sentences):
+            self._log_first_fix()
+
+    def _log_first_fix(self) -> None:
+        if not self._logged_first_fix:
             fix = self._parser.fix
             if fix.fix_valid and fix.latitude is not None:
                 self._logged_first_fix = True
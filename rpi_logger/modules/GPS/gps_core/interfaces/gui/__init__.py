@@ -1,5 +1,6 @@
 """GPS GUI interfaces."""
 
 from .gps_map_renderer import GPSMapRenderer
+from .tile_service import TileService
 
-__all__ = ["GPSMapRenderer"]
+__all__ = ["GPSMapRenderer", "TileService"]
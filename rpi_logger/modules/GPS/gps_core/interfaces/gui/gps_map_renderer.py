@@ -6,13 +6,11 @@ It supports trajectory visualization, compass rose, and scale bar overlays.
 
 from __future__ import annotations
 
-import io
 import math
-import sqlite3
-from collections import deque
 from pathlib import Path
-from typing import Deque, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from rpi_logger.core.logging_utils import get_module_logger
@@ -23,6 +21,8 @@ from ...constants import (
     MAX_ZOOM_LEVEL,
 )
 from ...parsers.nmea_types import GPSFixSnapshot
+from .tile_service import TileService
+from .trajectory import Trajectory
 
 logger = get_module_logger(__name__)
 
@@ -31,12 +31,14 @@ class GPSMapRenderer:
     """Renders offline map tiles with GPS position overlay.
 
     Responsibilities:
-    - Load tiles from SQLite database
-    - Render tile mosaic centered on position
+    - Load tiles through a (shareable) TileService
+    - Render tile mosaic centered on position, reusing the previous
+      mosaic and loading only newly exposed tiles when the center moves
     - Draw position marker with heading arrow
     - Draw compass rose and scale bar
     - Support zoom controls
-    - Track and render trajectory history
+    - Track the session's full trajectory and render it simplified
+      for the current zoom, culled to the visible area
 
     Example:
         renderer = GPSMapRenderer(Path("offline_tiles.db"))
@@ -48,18 +50,26 @@ class GPSMapRenderer:
     def __init__(
         self,
         offline_db_path: Path,
-        max_trajectory_points: int = 500,
+        tile_service: Optional[TileService] = None,
     ):
         """Initialize the map renderer.
 
         Args:
             offline_db_path: Path to SQLite tile database
-            max_trajectory_points: Maximum number of trajectory points to keep
+            tile_service: Tile service shared with other renderers (a private
+                one is created when omitted)
         """
         self.db_path = offline_db_path
+        self._owns_tile_service = tile_service is None
+        self.tile_service = tile_service or TileService(offline_db_path)
+        # Unclipped tile mosaic from the last render, reused while the
+        # center stays near the same tiles
+        self._mosaic: Optional[Image.Image] = None
+        self._mosaic_origin: Optional[Tuple[int, int, int]] = None  # (zoom, base_x, base_y)
+        self._mosaic_loaded: Dict[Tuple[int, int], bool] = {}  # unwrapped tile -> found in DB
         self._current_zoom: float = 13.0
         self._center: Tuple[float, float] = (0.0, 0.0)
-        self._trajectory: Deque[Tuple[float, float]] = deque(maxlen=max_trajectory_points)
+        self._trajectory = Trajectory()
         self._trajectory_enabled = True
 
     @property
@@ -125,7 +135,7 @@ class GPSMapRenderer:
             lon: Longitude in decimal degrees
         """
         if self._trajectory_enabled:
-            self._trajectory.append((lat, lon))
+            self._trajectory.append(lat, lon)
 
     def clear_trajectory(self) -> None:
         """Clear trajectory history."""
@@ -166,30 +176,13 @@ class GPSMapRenderer:
         load_grid = display_grid + 2
         display_size = display_grid * TILE_SIZE
         load_size = load_grid * TILE_SIZE
-        image = Image.new("RGB", (load_size, load_size), "#dcdcdc")
 
         xtile, ytile = self._latlon_to_tile(lat, lon, zoom_int)
         base_x = int(math.floor(xtile)) - load_grid // 2
         base_y = int(math.floor(ytile)) - load_grid // 2
 
-        total_loaded = 0
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        n = 2 ** zoom_int
-
-        try:
-            for gx in range(load_grid):
-                for gy in range(load_grid):
-                    tx = (base_x + gx) % max(1, n)
-                    ty = min(max(base_y + gy, 0), max(n - 1, 0))
-                    tile = self._load_tile_image(cur, zoom_int, tx, ty)
-                    if tile is None:
-                        tile = Image.new("RGB", (TILE_SIZE, TILE_SIZE), "#b9c1c9")
-                    else:
-                        total_loaded += 1
-                    image.paste(tile, (gx * TILE_SIZE, gy * TILE_SIZE))
-        finally:
-            conn.close()
+        image = self._update_mosaic(zoom_int, base_x, base_y, load_grid)
+        total_loaded = sum(self._mosaic_loaded.values())
 
         # Calculate center position in pixel coordinates
         tile_center_x = (xtile - base_x) * TILE_SIZE
@@ -223,29 +216,65 @@ class GPSMapRenderer:
         info = f"{total_loaded}/{load_grid * load_grid} tiles (zoom={zoom_int})"
         return image, info
 
-    def _load_tile_image(self, cursor, zoom: int, x: int, y: int) -> Optional[Image.Image]:
-        """Load a single tile from the database.
+    def _update_mosaic(self, zoom: int, base_x: int, base_y: int, load_grid: int) -> Image.Image:
+        """Bring the cached mosaic to the given origin and return it.
+
+        When the origin is unchanged the previous mosaic is returned as is.
+        When it moved by less than the grid, the overlapping part is shifted
+        into place and only the newly exposed tiles are loaded.
 
         Args:
-            cursor: Database cursor
-            zoom: Zoom level
-            x: Tile X coordinate
-            y: Tile Y coordinate
+            zoom: Integer zoom level
+            base_x: Unwrapped tile X of the mosaic's left column
+            base_y: Unwrapped tile Y of the mosaic's top row
+            load_grid: Tiles per mosaic side
 
         Returns:
-            PIL Image or None if not found
+            The (load_grid * TILE_SIZE) square mosaic; callers must not draw on it
         """
-        cursor.execute(
-            "SELECT tile_image FROM tiles WHERE zoom=? AND x=? AND y=? LIMIT 1",
-            (zoom, x, y),
-        )
-        row = cursor.fetchone()
-        if not row:
-            return None
-        try:
-            return Image.open(io.BytesIO(row[0])).convert("RGB")
-        except Exception:
-            return None
+        origin = (zoom, base_x, base_y)
+        if self._mosaic is not None and origin == self._mosaic_origin:
+            return self._mosaic
+
+        load_size = load_grid * TILE_SIZE
+        image = Image.new("RGB", (load_size, load_size), "#dcdcdc")
+        wanted = [
+            (base_x + gx, base_y + gy) for gx in range(load_grid) for gy in range(load_grid)
+        ]
+        loaded: Dict[Tuple[int, int], bool] = {}
+
+        previous = self._mosaic_origin
+        if self._mosaic is not None and previous is not None and previous[0] == zoom:
+            dx = previous[1] - base_x
+            dy = previous[2] - base_y
+            if abs(dx) < load_grid and abs(dy) < load_grid:
+                image.paste(self._mosaic, (dx * TILE_SIZE, dy * TILE_SIZE))
+                # Only found tiles carry over; placeholders are looked up again
+                for coord in wanted:
+                    if self._mosaic_loaded.get(coord):
+                        loaded[coord] = True
+
+        exposed = [coord for coord in wanted if coord not in loaded]
+        if exposed:
+            n = max(1, 2 ** zoom)
+            wrapped = {
+                coord: (coord[0] % n, min(max(coord[1], 0), n - 1)) for coord in exposed
+            }
+            tiles = self.tile_service.get_tiles(zoom, wrapped.values())
+            placeholder = None
+            for coord in exposed:
+                tile = tiles.get(wrapped[coord])
+                loaded[coord] = tile is not None
+                if tile is None:
+                    if placeholder is None:
+                        placeholder = Image.new("RGB", (TILE_SIZE, TILE_SIZE), "#b9c1c9")
+                    tile = placeholder
+                image.paste(tile, ((coord[0] - base_x) * TILE_SIZE, (coord[1] - base_y) * TILE_SIZE))
+
+        self._mosaic = image
+        self._mosaic_origin = origin
+        self._mosaic_loaded = loaded
+        return image
 
     def _latlon_to_tile(self, lat: float, lon: float, zoom: int) -> Tuple[float, float]:
         """Convert lat/lon to tile coordinates.
@@ -315,24 +344,44 @@ class GPSMapRenderer:
         if len(self._trajectory) < 2:
             return
 
-        draw = ImageDraw.Draw(image)
-        points = []
-
-        for lat, lon in self._trajectory:
-            x, y = self._latlon_to_pixel(lat, lon, zoom, base_x, base_y, crop_left, crop_top)
-            # Only include points within or near the visible area
-            if -100 < x < image.width + 100 and -100 < y < image.height + 100:
-                points.append((x, y))
-
-        if len(points) >= 2:
-            # Draw as connected line with gradient effect
-            draw.line(points, fill="#3498db", width=3)
+        # Simplified track for this zoom, projected to image pixels in one pass
+        mx, my = self._trajectory.simplified(zoom)
+        if len(mx) < 2:
+            return
+        scale = 2 ** zoom * TILE_SIZE
+        px = mx * scale - (base_x * TILE_SIZE + crop_left)
+        py = my * scale - (base_y * TILE_SIZE + crop_top)
+
+        # Keep segments whose bounding box touches the visible area
+        margin = 10
+        x0, x1 = px[:-1], px[1:]
+        y0, y1 = py[:-1], py[1:]
+        visible = (
+            (np.minimum(x0, x1) < image.width + margin)
+            & (np.maximum(x0, x1) > -margin)
+            & (np.minimum(y0, y1) < image.height + margin)
+            & (np.maximum(y0, y1) > -margin)
+        )
+        segments = np.flatnonzero(visible)
+        if not len(segments):
+            return
 
-            # Draw dots at trajectory points (every N points for performance)
-            step = max(1, len(points) // 50)
-            for i in range(0, len(points), step):
-                x, y = points[i]
-                draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill="#2980b9")
+        draw = ImageDraw.Draw(image)
+        # Draw each run of consecutive visible segments as one polyline
+        breaks = np.flatnonzero(np.diff(segments) != 1)
+        run_starts = np.concatenate(([segments[0]], segments[breaks + 1]))
+        run_ends = np.concatenate((segments[breaks], [segments[-1]])) + 1
+        points = np.column_stack((px, py))
+        dot_indices = []
+        for start, end in zip(run_starts, run_ends):
+            draw.line(points[start:end + 1].ravel().tolist(), fill="#3498db", width=3)
+            dot_indices.append(np.arange(start, end + 1))
+
+        # Draw dots at trajectory points (about 50 for performance)
+        dots = np.concatenate(dot_indices)
+        step = max(1, len(dots) // 50)
+        for x, y in points[dots[::step]].tolist():
+            draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill="#2980b9")
 
     def _draw_center_marker(
         self,
@@ -509,3 +558,11 @@ class GPSMapRenderer:
             True if database file exists
         """
         return self.db_path.exists()
+
+    def close(self) -> None:
+        """Drop the cached mosaic and close a privately owned tile service."""
+        self._mosaic = None
+        self._mosaic_origin = None
+        self._mosaic_loaded = {}
+        if self._owns_tile_service:
+            self.tile_service.close()
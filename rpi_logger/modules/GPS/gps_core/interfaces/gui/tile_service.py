@@ -0,0 +1,173 @@
+"""Shared read-only access to the offline map tile database.
+
+One ``TileService`` is shared by every device's map renderer. It keeps a
+single read-only SQLite connection open, fetches all tiles a render needs with
+one batched query, and keeps decoded RGB tiles in a bounded LRU so that a
+vehicle moving a few pixels does not decode the same PNGs again.
+"""
+
+from __future__ import annotations
+
+import io
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from PIL import Image
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+TileKey = Tuple[int, int, int]  # (zoom, x, y)
+
+# 64 decoded 256x256 RGB tiles is ~12.5 MB: enough for two devices at the
+# default 5x5 load grid plus the tiles around them.
+DEFAULT_CACHE_TILES = 64
+
+
+class TileService:
+    """Batched tile lookups with an LRU of decoded tiles.
+
+    Missing tiles are cached as ``None`` too, so holes in the offline
+    database are not queried on every render. A failed query caches
+    nothing; the next render asks again on a fresh connection.
+
+    Example:
+        service = TileService(Path("offline_tiles.db"))
+        tiles = service.get_tiles(13, [(1234, 3001), (1235, 3001)])
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        cache_tiles: int = DEFAULT_CACHE_TILES,
+        *,
+        immutable: bool = True,
+    ):
+        """Initialize the tile service.
+
+        Args:
+            db_path: Path to SQLite tile database
+            cache_tiles: Maximum number of decoded tiles kept in memory
+            immutable: Open with ``immutable=1`` (no locking or change
+                detection). Disable when tiles are downloaded while running.
+        """
+        self.db_path = Path(db_path)
+        self.cache_tiles = max(1, int(cache_tiles))
+        self._immutable = immutable
+        self._conn: Optional[sqlite3.Connection] = None
+        self._cache: "OrderedDict[TileKey, Optional[Image.Image]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            if self._immutable:
+                uri += "&immutable=1"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        return self._conn
+
+    def get_tile(self, zoom: int, x: int, y: int) -> Optional[Image.Image]:
+        """Get one decoded tile, or None if the database has no such tile."""
+        return self.get_tiles(zoom, [(x, y)])[(x, y)]
+
+    def get_tiles(
+        self, zoom: int, coords: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Optional[Image.Image]]:
+        """Get decoded tiles for ``coords`` at ``zoom``.
+
+        Cached tiles are returned directly; the rest are fetched with a single
+        ``IN`` query and decoded once.
+
+        Args:
+            zoom: Zoom level
+            coords: Tile (x, y) coordinates
+
+        Returns:
+            Mapping of every requested (x, y) to its RGB image or None
+        """
+        result: Dict[Tuple[int, int], Optional[Image.Image]] = {}
+        with self._lock:
+            missing = []
+            for coord in coords:
+                if coord in result:
+                    continue
+                key = (zoom, coord[0], coord[1])
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    result[coord] = self._cache[key]
+                    self.hits += 1
+                else:
+                    result[coord] = None
+                    missing.append(coord)
+
+            if missing:
+                self.misses += len(missing)
+                fetched = self._fetch(zoom, missing)
+                if fetched is None:
+                    return result
+                for coord in missing:
+                    tile = fetched.get(coord)
+                    result[coord] = tile
+                    self._store((zoom, coord[0], coord[1]), tile)
+        return result
+
+    def _fetch(
+        self, zoom: int, coords: list[Tuple[int, int]]
+    ) -> Optional[Dict[Tuple[int, int], Image.Image]]:
+        """Query and decode ``coords``; None if the query failed."""
+        xs = sorted({x for x, _ in coords})
+        ys = sorted({y for _, y in coords})
+        wanted = set(coords)
+        query = (
+            "SELECT x, y, tile_image FROM tiles WHERE zoom=? "
+            f"AND x IN ({','.join('?' * len(xs))}) AND y IN ({','.join('?' * len(ys))})"
+        )
+        tiles: Dict[Tuple[int, int], Image.Image] = {}
+        try:
+            rows = self._connection().execute(query, (zoom, *xs, *ys)).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning("Tile query failed: %s", exc)
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            return None
+
+        for x, y, blob in rows:
+            coord = (x, y)
+            # Several tile servers may store the same tile; keep the first
+            if coord not in wanted or coord in tiles:
+                continue
+            try:
+                tiles[coord] = Image.open(io.BytesIO(blob)).convert("RGB")
+            except Exception:
+                continue
+        return tiles
+
+    def _store(self, key: TileKey, tile: Optional[Image.Image]) -> None:
+        self._cache[key] = tile
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_tiles:
+            self._cache.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self._cache)}
+
+    def clear(self) -> None:
+        """Drop all decoded tiles."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the database connection and drop the cache."""
+        with self._lock:
+            self._cache.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
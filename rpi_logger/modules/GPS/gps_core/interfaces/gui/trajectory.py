@@ -0,0 +1,190 @@
+"""Session-long GPS trajectory storage with per-zoom simplification.
+
+Positions are appended to chunked float64 arrays and projected to Web
+Mercator in batches. For each zoom level the map asks for, a Douglas-Peucker
+simplification at sub-pixel tolerance is cached and extended incrementally as
+new points arrive, so drawing a multi-hour drive only touches the few hundred
+points that are distinguishable on screen.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ...constants import TILE_SIZE
+
+# Initial array capacity; doubled whenever it fills up
+_CHUNK_POINTS = 4096
+# Points closer than this to the simplified line are dropped (screen pixels)
+DEFAULT_TOLERANCE_PX = 1.0
+
+
+def project_mercator(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Project lat/lon (degrees) to normalized Web Mercator (0..1 per axis).
+
+    Multiply by ``2 ** zoom`` to get tile coordinates.
+    """
+    lat_rad = np.radians(lat)
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0
+    return x, y
+
+
+def douglas_peucker(x: np.ndarray, y: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of the points kept by Douglas-Peucker simplification.
+
+    Iterative, with each segment's distance test vectorized. The first and
+    last points are always kept.
+
+    Args:
+        x: Point X coordinates
+        y: Point Y coordinates
+        tolerance: Maximum distance of a dropped point from the kept line
+
+    Returns:
+        Sorted int64 array of kept indices
+    """
+    count = len(x)
+    if count <= 2:
+        return np.arange(count, dtype=np.int64)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack: List[Tuple[int, int]] = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        seg_x = x[start + 1:end] - x[start]
+        seg_y = y[start + 1:end] - y[start]
+        dx = x[end] - x[start]
+        dy = y[end] - y[start]
+        length = np.hypot(dx, dy)
+        if length == 0.0:
+            dist = np.hypot(seg_x, seg_y)
+        else:
+            dist = np.abs(seg_x * dy - seg_y * dx) / length
+        worst = int(np.argmax(dist))
+        if dist[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+class _ZoomLevel:
+    """Cached simplification of the trajectory at one zoom level."""
+
+    __slots__ = ("stable", "tail")
+
+    def __init__(self) -> None:
+        # Kept indices that later points can no longer change
+        self.stable = np.zeros(0, dtype=np.int64)
+        # Kept indices from the last pass over the open end of the track
+        self.tail = np.zeros(0, dtype=np.int64)
+
+
+class Trajectory:
+    """Append-only trajectory with cached per-zoom simplification.
+
+    Example:
+        trajectory = Trajectory()
+        trajectory.append(40.7608, -111.8910)
+        x, y = trajectory.simplified(13)  # normalized Mercator coordinates
+    """
+
+    def __init__(self, tolerance_px: float = DEFAULT_TOLERANCE_PX):
+        self.tolerance_px = tolerance_px
+        self._lat = np.empty(_CHUNK_POINTS, dtype=np.float64)
+        self._lon = np.empty(_CHUNK_POINTS, dtype=np.float64)
+        self._x = np.empty(_CHUNK_POINTS, dtype=np.float64)
+        self._y = np.empty(_CHUNK_POINTS, dtype=np.float64)
+        self._count = 0
+        self._projected = 0
+        self._levels: Dict[int, _ZoomLevel] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def latitudes(self) -> np.ndarray:
+        return self._lat[:self._count]
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        return self._lon[:self._count]
+
+    def append(self, lat: float, lon: float) -> None:
+        """Add one position (decimal degrees)."""
+        if self._count == len(self._lat):
+            self._grow()
+        self._lat[self._count] = lat
+        self._lon[self._count] = lon
+        self._count += 1
+
+    def clear(self) -> None:
+        """Forget all positions and cached simplifications."""
+        self._count = 0
+        self._projected = 0
+        self._levels.clear()
+
+    def _grow(self) -> None:
+        capacity = len(self._lat) * 2
+        for name in ("_lat", "_lon", "_x", "_y"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=np.float64)
+            new[:self._count] = old[:self._count]
+            setattr(self, name, new)
+
+    def _project_pending(self) -> None:
+        if self._projected == self._count:
+            return
+        start, end = self._projected, self._count
+        self._x[start:end], self._y[start:end] = project_mercator(
+            self._lat[start:end], self._lon[start:end]
+        )
+        self._projected = end
+
+    def simplified(self, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Simplified track at ``zoom`` as normalized Mercator (x, y) arrays.
+
+        Only the open end of the track (from the last point that can no
+        longer change) is re-simplified on each call.
+        """
+        self._project_pending()
+        count = self._count
+        if count == 0:
+            empty = np.zeros(0, dtype=np.float64)
+            return empty, empty
+
+        level = self._levels.get(zoom)
+        if level is None:
+            level = self._levels[zoom] = _ZoomLevel()
+
+        last_tail = level.tail[-1] if len(level.tail) else -1
+        if last_tail != count - 1:
+            start = int(level.stable[-1]) if len(level.stable) else 0
+            tolerance = self.tolerance_px / (TILE_SIZE * 2 ** zoom)
+            kept = start + douglas_peucker(
+                self._x[start:count], self._y[start:count], tolerance
+            )
+            # Everything before the last interior kept point is settled
+            if len(kept) > 2:
+                level.stable = np.concatenate((level.stable[:-1], kept[:-1])) if len(level.stable) else kept[:-1]
+                level.tail = kept[-1:]
+            else:
+                if not len(level.stable):
+                    level.stable = kept[:1]
+                level.tail = kept[-1:]
+
+        indices = np.concatenate((level.stable, level.tail))
+        if len(indices) > 1 and indices[-1] == indices[-2]:
+            indices = indices[:-1]
+        return self._x[indices], self._y[indices]
+
+    def simplified_count(self, zoom: int) -> int:
+        """Number of points drawn at ``zoom``."""
+        return len(self.simplified(zoom)[0])
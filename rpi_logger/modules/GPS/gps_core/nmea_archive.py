@@ -0,0 +1,310 @@
+"""Append-only raw NMEA archive and offline re-parsing.
+
+Every line received from the receiver (including sentences the live parser
+skips or cannot parse) is stored with its arrival timestamps. Records are
+collected into blocks, and each block is written as one independent zstd
+frame or gzip member. A file is therefore a plain multi-frame stream
+(``zstdcat``/``zcat`` print it), and a crash loses at most the block that
+was being filled.
+
+Record layout (decompressed)::
+
+    #{"device_id": "GPS:serial0", "trial": 1, "label": ""}\\n   metadata
+    <arrival_mono_ns> <arrival_unix_ns> <length>\\n              line header
+    <length bytes exactly as received>[\\n if they did not end with one]
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import threading
+import time
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
+from rpi_logger.core.logging_utils import get_module_logger
+from .constants import GPS_CSV_HEADER
+from .data_logger import format_fix_row
+from .parsers.nmea_parser import NMEAParser
+from .parsers.nmea_types import GPSFixSnapshot, NMEAUpdate
+
+logger = get_module_logger(__name__)
+
+try:
+    import zstandard  # type: ignore
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore
+    ZSTD_AVAILABLE = False
+
+ARCHIVE_SUFFIXES = {"zstd": ".nmea.zst", "gzip": ".nmea.gz"}
+# Uncompressed bytes per block; a 115200 baud receiver fills one in ~20s
+DEFAULT_BLOCK_BYTES = 256 * 1024
+# Partial blocks are written after this long, bounding loss on a crash
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def resolve_codec(codec: str) -> str:
+    """Codec actually used for ``codec`` ("zstd" falls back to gzip)."""
+    codec = (codec or "").strip().lower()
+    if codec in ("zstd", "zst") and ZSTD_AVAILABLE:
+        return "zstd"
+    if codec in ("zstd", "zst"):
+        logger.info("zstandard not installed; raw NMEA archive uses gzip")
+    return "gzip"
+
+
+def archive_codec(path: Path) -> Optional[str]:
+    """Codec of an archive file, from its name; None if not an archive."""
+    for codec, suffix in ARCHIVE_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            return codec
+    return None
+
+
+def find_archives(path: Path) -> List[Path]:
+    """Archive files at ``path`` (a file, or a directory searched recursively)."""
+    if path.is_file():
+        return [path] if archive_codec(path) else []
+    return sorted(
+        candidate
+        for suffix in ARCHIVE_SUFFIXES.values()
+        for candidate in path.rglob(f"*{suffix}")
+    )
+
+
+def encode_line(raw: RawLine) -> bytes:
+    """One archive record for ``raw``."""
+    data = raw.data
+    header = b"%d %d %d\n" % (raw.arrival_mono_ns, raw.arrival_unix_ns, len(data))
+    return header + data if data.endswith(b"\n") else header + data + b"\n"
+
+
+class NMEAArchiveWriter:
+    """Block-compressed, append-only raw line archive.
+
+    ``write_lines`` only appends to an in-memory block; compression and disk
+    writes happen on a background thread.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        codec: str = "zstd",
+        block_bytes: int = DEFAULT_BLOCK_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.path = path
+        self.codec = resolve_codec(codec)
+        self._block_bytes = block_bytes
+        self._flush_interval = flush_interval
+        self._block = bytearray()
+        self._block_started = 0.0
+        self._lock = threading.Lock()
+        self._queue: Queue[Optional[bytes]] = Queue(maxsize=64)
+        self._thread: Optional[threading.Thread] = None
+        self._file: Optional[BinaryIO] = None
+        self.lines_written = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.dropped_blocks = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self) -> None:
+        """Open the file for appending and start the writer thread."""
+        if self._file is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("ab")
+        self._block_started = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._writer_loop, name=f"NMEAArchive-{self.path.stem}", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Write the pending block, stop the thread and close the file."""
+        if self._file is None:
+            return
+        self._submit(self._take_block())
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            if self._thread.is_alive():
+                logger.warning("Archive writer for %s did not stop in time", self.path.name)
+        self._thread = None
+        try:
+            self._file.close()
+        except OSError as exc:
+            logger.debug("Error closing %s: %s", self.path, exc)
+        self._file = None
+
+    def write_meta(self, meta: Dict[str, Any]) -> None:
+        """Record metadata (device, trial, label) that applies to later lines."""
+        self._append(b"#" + json.dumps(meta).encode("utf-8") + b"\n", 0)
+
+    def write_lines(self, lines: Iterable[RawLine]) -> None:
+        """Append received lines; a full block is handed to the writer thread."""
+        records = [encode_line(raw) for raw in lines]
+        if records:
+            self._append(b"".join(records), len(records))
+
+    def _append(self, data: bytes, line_count: int) -> None:
+        if self._file is None:
+            return
+        with self._lock:
+            self._block += data
+            self.lines_written += line_count
+            full = len(self._block) >= self._block_bytes
+        if full:
+            self._submit(self._take_block())
+
+    def _take_block(self) -> bytes:
+        with self._lock:
+            block = bytes(self._block)
+            self._block.clear()
+            self._block_started = time.monotonic()
+        return block
+
+    def _submit(self, block: bytes) -> None:
+        if not block:
+            return
+        try:
+            self._queue.put_nowait(block)
+        except Full:
+            self.dropped_blocks += 1
+            logger.warning("Raw NMEA archive queue full for %s; dropped a block", self.path.name)
+
+    def _compress(self, block: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(block)
+        return gzip.compress(block, compresslevel=6)
+
+    def _writer_loop(self) -> None:
+        while True:
+            try:
+                block = self._queue.get(timeout=0.5)
+            except Empty:
+                if time.monotonic() - self._block_started >= self._flush_interval:
+                    self._submit(self._take_block())
+                continue
+            if block is None:
+                break
+            try:
+                frame = self._compress(block)
+                self._file.write(frame)
+                self._file.flush()
+                self.raw_bytes += len(block)
+                self.compressed_bytes += len(frame)
+            except Exception as exc:
+                logger.error("Failed to write raw NMEA block to %s: %s", self.path, exc)
+
+
+def _open_stream(path: Path) -> BinaryIO:
+    if archive_codec(path) == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError(f"{path.name} is zstd compressed; install zstandard to read it")
+        handle = path.open("rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(handle, read_across_frames=True, closefd=True)
+        return io.BufferedReader(reader)
+    return gzip.open(path, "rb")
+
+
+def read_archive(path: Path) -> Iterator[Tuple[Dict[str, Any], RawLine]]:
+    """Yield ``(metadata, line)`` for every line in an archive.
+
+    ``metadata`` is the latest metadata record before the line. A block cut
+    short by a crash ends the iteration with a warning.
+    """
+    meta: Dict[str, Any] = {}
+    port = ""
+    with _open_stream(path) as stream:
+        try:
+            while True:
+                header = stream.readline()
+                if not header:
+                    break
+                if header.startswith(b"#"):
+                    meta = json.loads(header[1:])
+                    port = str(meta.get("device_id", ""))
+                    continue
+                mono_ns, unix_ns, length = (int(value) for value in header.split())
+                data = stream.read(length)
+                if len(data) < length:
+                    raise EOFError("record cut short")
+                if not data.endswith(b"\n"):
+                    stream.read(1)
+                yield meta, RawLine(data, mono_ns, unix_ns, port)
+        except (EOFError, ValueError, OSError) as exc:
+            logger.warning("%s ends with an incomplete block (%s); stopping there", path.name, exc)
+
+
+def reparse_archive(
+    path: Path,
+    target: Path,
+    enabled_sentences: Optional[set[str]] = None,
+) -> int:
+    """Regenerate a GPS CSV from a raw archive.
+
+    Rows match the live logger's: one per sentence that updates the fix,
+    stamped with the sentence's serial arrival time.
+
+    Args:
+        path: Archive to read
+        target: CSV file to write (replaced if it exists)
+        enabled_sentences: Sentence types to parse (None = all supported)
+
+    Returns:
+        Number of rows written
+    """
+    rows = 0
+    current: Dict[str, Any] = {"meta": {}, "raw": None}
+
+    with target.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(GPS_CSV_HEADER)
+
+        def on_update(fix: GPSFixSnapshot, update: NMEAUpdate) -> None:
+            nonlocal rows
+            meta, raw = current["meta"], current["raw"]
+            writer.writerow(format_fix_row(
+                fix, update.sentence_type, update.raw_sentence,
+                raw.arrival_unix, raw.arrival_mono,
+                trial_number=meta.get("trial", 1),
+                device_id=meta.get("device_id", ""),
+                label=meta.get("label", ""),
+            ))
+            rows += 1
+
+        parser = NMEAParser(on_fix_update=on_update, enabled_sentences=enabled_sentences)
+
+        def sentences() -> Iterator[str]:
+            for meta, raw in read_archive(path):
+                line = raw.text
+                if line.startswith("$"):
+                    current["meta"], current["raw"] = meta, raw
+                    yield line
+
+        parser.parse_many(sentences())
+    return rows
+
+
+__all__ = [
+    "ARCHIVE_SUFFIXES",
+    "NMEAArchiveWriter",
+    "ZSTD_AVAILABLE",
+    "archive_codec",
+    "encode_line",
+    "find_archives",
+    "read_archive",
+    "reparse_archive",
+    "resolve_codec",
+]
@@ -1,6 +1,6 @@
 """NMEA parsing components."""
 
-from .nmea_types import GPSFixSnapshot
+from .nmea_types import GPSFixSnapshot, NMEAUpdate
 from .nmea_parser import NMEAParser
 
-__all__ = ["GPSFixSnapshot", "NMEAParser"]
+__all__ = ["GPSFixSnapshot", "NMEAParser", "NMEAUpdate"]
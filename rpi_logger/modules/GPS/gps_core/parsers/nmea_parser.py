@@ -1,17 +1,28 @@
 """NMEA sentence parsing for GPS receivers.
 
 This module provides stateful NMEA sentence parsing that accumulates
-GPS fix data across multiple sentence types.
+GPS fix data across multiple sentence types. Sentences from any talker
+(GP, GN, GL, GA, GB, ...) are dispatched through a table built once per
+parser, so multi-constellation receivers at 10-25 Hz stay cheap to follow.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import operator
 import time
-from typing import Any, Callable, Dict, Optional
+from functools import reduce
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..constants import FIX_MODE_MAP, KMH_PER_KNOT, MPH_PER_KNOT
-from .nmea_types import GPSFixSnapshot
+from ..constants import FIX_MODE_MAP, GSV_MAX_AGE, KMH_PER_KNOT, MPH_PER_KNOT
+from .nmea_types import GPSFixSnapshot, NMEAUpdate
+
+# Header -> (talker, sentence type, parser) entries kept per parser; bounds
+# the cache against garbage headers from a noisy line
+_MAX_CACHED_HEADERS = 64
+
+# Sentence parser: (fields after the header, talker ID) -> update or None
+SentenceParser = Callable[[List[str], str], Optional[NMEAUpdate]]
 
 
 def _parse_float(value: str | None) -> Optional[float]:
@@ -108,19 +119,24 @@ def _combine_datetime(
     return dt.datetime.combine(date_value, time_obj)
 
 
+def _checksum_matches(sentence: str, star: int) -> bool:
+    """Compare the XOR of the payload bytes with the hex digits after ``*``."""
+    try:
+        expected = int(sentence[star + 1:star + 3], 16)
+        calculated = reduce(operator.xor, sentence[1:star].encode("ascii"), 0)
+    except ValueError:  # Bad hex digits or non-ASCII payload
+        return False
+    return calculated == expected
+
+
 def validate_checksum(sentence: str) -> bool:
     """Validate NMEA checksum."""
-    if not sentence.startswith("$") or "*" not in sentence:
+    if not sentence.startswith("$"):
         return False
-    try:
-        payload, checksum_str = sentence[1:].split("*", 1)
-        expected = int(checksum_str[:2], 16)
-        calculated = 0
-        for char in payload:
-            calculated ^= ord(char)
-        return calculated == expected
-    except (ValueError, IndexError):
+    star = sentence.find("*")
+    if star < 0:
         return False
+    return _checksum_matches(sentence, star)
 
 
 class NMEAParser:
@@ -132,7 +148,7 @@ class NMEAParser:
 
     def __init__(
         self,
-        on_fix_update: Optional[Callable[[GPSFixSnapshot, Dict[str, Any]], None]] = None,
+        on_fix_update: Optional[Callable[[GPSFixSnapshot, NMEAUpdate], None]] = None,
         validate_checksums: bool = True,
         enabled_sentences: Optional[set[str]] = None,
     ):
@@ -141,9 +157,26 @@ class NMEAParser:
         self._on_fix_update = on_fix_update
         self._validate_checksums = validate_checksums
         self._enabled_sentences = enabled_sentences
+        self._parsers: Dict[str, SentenceParser] = {
+            "RMC": self._parse_rmc,
+            "GGA": self._parse_gga,
+            "VTG": self._parse_vtg,
+            "GLL": self._parse_gll,
+            "GSA": self._parse_gsa,
+            "GSV": self._parse_gsv,
+        }
+        self._headers: Dict[str, Tuple[str, str, Optional[SentenceParser]]] = {}
+        # Latest GSV count per talker and the receiver time it was last
+        # seen at; satellites in view is the sum over talkers still reporting
+        self._satellites_in_view: Dict[str, Tuple[int, Optional[dt.datetime]]] = {}
+        self._total_in_view: Optional[int] = None
+        # RMC, GGA and GLL of one epoch share their time field
+        self._time_key: Optional[Tuple[str, dt.date]] = None
+        self._time_value: Optional[dt.datetime] = None
 
     def set_enabled_sentences(self, sentences: Optional[set[str]]) -> None:
         self._enabled_sentences = sentences
+        self._headers.clear()
 
     @property
     def fix(self) -> GPSFixSnapshot:
@@ -159,240 +192,254 @@ class NMEAParser:
         """Reset parser state to initial values."""
         self._fix = GPSFixSnapshot()
         self._last_known_date = None
+        self._satellites_in_view.clear()
+        self._total_in_view = None
+        self._time_key = None
+        self._time_value = None
 
-    def parse_sentence(self, sentence: str) -> Optional[Dict[str, Any]]:
+    def parse_sentence(self, sentence: str) -> Optional[NMEAUpdate]:
         """Parse NMEA sentence and update fix. Returns parsed values or None."""
-        if not sentence or not sentence.startswith("$"):
+        if not sentence or sentence[0] != "$":
             return None
 
-        # Validate checksum if enabled
-        if self._validate_checksums and not validate_checksum(sentence):
-            return None
-
-        # Extract payload (between $ and *)
-        payload = sentence[1:]
-        if "*" in payload:
-            payload = payload.split("*", 1)[0]
-
-        parts = payload.split(",")
-        if not parts:
+        star = sentence.find("*")
+        if self._validate_checksums and (star < 0 or not _checksum_matches(sentence, star)):
             return None
 
-        # Get message type (last 3 chars of header, e.g., "RMC" from "GPRMC")
-        header = parts[0]
-        message_type = header[-3:].upper()
-
-        # Filter by enabled sentences
-        if self._enabled_sentences is not None and message_type not in self._enabled_sentences:
+        # Payload between $ and *; header is e.g. "GNRMC"
+        payload = sentence[1:star] if star >= 0 else sentence[1:]
+        comma = payload.find(",")
+        if comma < 0:
             return None
+        header = payload[:comma]
 
-        # Find and call appropriate parser method
-        handler = getattr(self, f"_parse_{message_type.lower()}", None)
-        if not handler:
+        entry = self._headers.get(header)
+        if entry is None:
+            entry = self._resolve_header(header)
+        talker, message_type, handler = entry
+        if handler is None:
             return None
 
-        data = handler(parts[1:])
-        if data is None:
+        update = handler(payload[comma + 1:].split(","), talker)
+        if update is None:
             return None
 
-        data["sentence_type"] = message_type
-        data["raw_sentence"] = sentence
+        update.sentence_type = message_type
+        update.talker = talker
+        update.raw_sentence = sentence
 
-        # Apply update to fix
-        self._apply_update(data)
+        self._apply_update(update)
 
-        # Call callback if registered
         if self._on_fix_update:
-            self._on_fix_update(self._fix, data)
+            self._on_fix_update(self._fix, update)
+
+        return update
+
+    def parse_many(self, lines: Iterable[str]) -> List[NMEAUpdate]:
+        """Parse a batch of sentences in arrival order.
+
+        The fix callback still runs once per sentence, before the next line
+        is taken from ``lines``.
 
-        return data
+        Returns:
+            Updates for the sentences that parsed
+        """
+        parse = self.parse_sentence
+        updates = []
+        for line in lines:
+            update = parse(line)
+            if update is not None:
+                updates.append(update)
+        return updates
 
-    def _apply_update(self, update: Dict[str, Any]) -> None:
+    def _resolve_header(self, header: str) -> Tuple[str, str, Optional[SentenceParser]]:
+        """Build (and cache) the dispatch entry for a sentence header."""
+        message_type = header[-3:].upper()
+        talker = header[:-3].upper()
+        handler = self._parsers.get(message_type)
+        if self._enabled_sentences is not None and message_type not in self._enabled_sentences:
+            handler = None
+        entry = (talker, message_type, handler)
+        if len(self._headers) < _MAX_CACHED_HEADERS:
+            self._headers[header] = entry
+        return entry
+
+    def _timestamp(self, time_str: str) -> Optional[dt.datetime]:
+        """UTC timestamp for an NMEA time field, using the last known date."""
+        date_value = self._last_known_date
+        if date_value is not None and self._time_key == (time_str, date_value):
+            return self._time_value
+        time_obj = _parse_hms(time_str)
+        timestamp = _combine_datetime(date_value, time_obj, self._fix.timestamp)
+        if time_obj is not None and date_value is not None:
+            self._time_key = (time_str, date_value)
+            self._time_value = timestamp
+        return timestamp
+
+    def _apply_update(self, update: NMEAUpdate) -> None:
         """Apply parsed data to the fix snapshot."""
         fix = self._fix
 
         # Position
-        lat = update.get("latitude")
-        lon = update.get("longitude")
-        if lat is not None and lon is not None:
-            fix.latitude = lat
-            fix.longitude = lon
+        if update.latitude is not None and update.longitude is not None:
+            fix.latitude = update.latitude
+            fix.longitude = update.longitude
 
-        # Timestamp
-        timestamp = update.get("timestamp")
-        if timestamp:
-            fix.timestamp = timestamp
+        if update.timestamp:
+            fix.timestamp = update.timestamp
 
         # Fix quality and mode
-        fix_quality = update.get("fix_quality")
-        if fix_quality is not None:
-            fix.fix_quality = fix_quality
-
-        if "fix_mode" in update and update["fix_mode"]:
-            fix.fix_mode = update["fix_mode"]
-
-        if "fix_valid" in update:
-            fix.fix_valid = bool(update["fix_valid"])
+        if update.fix_quality is not None:
+            fix.fix_quality = update.fix_quality
+        if update.fix_mode:
+            fix.fix_mode = update.fix_mode
+        if update.fix_valid is not None:
+            fix.fix_valid = update.fix_valid
 
         # Satellites
-        if "satellites_in_use" in update and update["satellites_in_use"] is not None:
-            fix.satellites_in_use = int(update["satellites_in_use"])
-
-        if "satellites_in_view" in update and update["satellites_in_view"] is not None:
-            fix.satellites_in_view = int(update["satellites_in_view"])
+        if update.satellites_in_use is not None:
+            fix.satellites_in_use = update.satellites_in_use
+        if update.satellites_in_view is not None:
+            fix.satellites_in_view = update.satellites_in_view
 
-        # Altitude
-        if "altitude_m" in update and update["altitude_m"] is not None:
-            fix.altitude_m = float(update["altitude_m"])
+        if update.altitude_m is not None:
+            fix.altitude_m = update.altitude_m
 
         # DOP values
-        if "hdop" in update and update["hdop"] is not None:
-            fix.hdop = float(update["hdop"])
-
-        if "pdop" in update and update["pdop"] is not None:
-            fix.pdop = float(update["pdop"])
+        if update.hdop is not None:
+            fix.hdop = update.hdop
+        if update.pdop is not None:
+            fix.pdop = update.pdop
+        if update.vdop is not None:
+            fix.vdop = update.vdop
 
-        if "vdop" in update and update["vdop"] is not None:
-            fix.vdop = float(update["vdop"])
-
-        # Course
-        if "course_deg" in update and update["course_deg"] is not None:
-            fix.course_deg = float(update["course_deg"])
+        if update.course_deg is not None:
+            fix.course_deg = update.course_deg
 
         # Speed (with unit conversions)
-        speed_knots = update.get("speed_knots")
+        speed_knots = update.speed_knots
         if speed_knots is not None:
-            fix.speed_knots = float(speed_knots)
-            fix.speed_kmh = fix.speed_knots * KMH_PER_KNOT
-            fix.speed_mph = fix.speed_knots * MPH_PER_KNOT
-        elif update.get("speed_kmh") is not None:
-            fix.speed_kmh = float(update["speed_kmh"])
-            fix.speed_mph = fix.speed_kmh / 1.609344
-            fix.speed_knots = fix.speed_kmh / KMH_PER_KNOT
+            fix.speed_knots = speed_knots
+            fix.speed_kmh = speed_knots * KMH_PER_KNOT
+            fix.speed_mph = speed_knots * MPH_PER_KNOT
+        elif update.speed_kmh is not None:
+            fix.speed_kmh = update.speed_kmh
+            fix.speed_mph = update.speed_kmh / 1.609344
+            fix.speed_knots = update.speed_kmh / KMH_PER_KNOT
 
         # Metadata
-        fix.last_sentence = update.get("sentence_type") or fix.last_sentence
-        fix.raw_sentence = update.get("raw_sentence") or fix.raw_sentence
+        fix.last_sentence = update.sentence_type or fix.last_sentence
+        fix.raw_sentence = update.raw_sentence or fix.raw_sentence
         fix.last_update_monotonic = time.monotonic()
 
     # ------------------------------------------------------------------
     # Sentence-specific parsers
     # ------------------------------------------------------------------
 
-    def _parse_rmc(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPRMC: time, status, position, speed, course, date."""
+    def _parse_rmc(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--RMC: time, status, position, speed, course, date."""
         if len(fields) < 9:
             return None
 
-        time_str = fields[0]
-        status = (fields[1] or "").upper()
-        lat = _parse_latlon(fields[2], fields[3], is_lat=True)
-        lon = _parse_latlon(fields[4], fields[5], is_lat=False)
-        speed_knots = _parse_float(fields[6])
-        course_deg = _parse_float(fields[7])
-        date_str = fields[8]
-        mode = fields[11] if len(fields) > 11 else None
-
-        date_obj = _parse_date(date_str)
+        date_obj = _parse_date(fields[8])
         if date_obj:
             self._last_known_date = date_obj
-        time_obj = _parse_hms(time_str)
-        timestamp = _combine_datetime(self._last_known_date, time_obj, self._fix.timestamp)
-
-        return {
-            "latitude": lat,
-            "longitude": lon,
-            "speed_knots": speed_knots,
-            "course_deg": course_deg,
-            "timestamp": timestamp,
-            "fix_valid": status == "A",
-            "fix_mode": mode or None,
-        }
+        mode = fields[11] if len(fields) > 11 else None
 
-    def _parse_gga(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPGGA: time, position, fix quality, satellites, HDOP, altitude."""
+        return NMEAUpdate(
+            latitude=_parse_latlon(fields[2], fields[3], is_lat=True),
+            longitude=_parse_latlon(fields[4], fields[5], is_lat=False),
+            speed_knots=_parse_float(fields[6]),
+            course_deg=_parse_float(fields[7]),
+            timestamp=self._timestamp(fields[0]),
+            fix_valid=fields[1].upper() == "A",
+            fix_mode=mode or None,
+        )
+
+    def _parse_gga(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--GGA: time, position, fix quality, satellites, HDOP, altitude."""
         if len(fields) < 9:
             return None
 
-        time_str = fields[0]
-        lat = _parse_latlon(fields[1], fields[2], is_lat=True)
-        lon = _parse_latlon(fields[3], fields[4], is_lat=False)
         fix_quality = _parse_int(fields[5])
-        satellites = _parse_int(fields[6])
-        hdop = _parse_float(fields[7])
-        altitude = _parse_float(fields[8])
-
-        time_obj = _parse_hms(time_str)
-        timestamp = _combine_datetime(self._last_known_date, time_obj, self._fix.timestamp)
-
-        return {
-            "latitude": lat,
-            "longitude": lon,
-            "fix_quality": fix_quality,
-            "satellites_in_use": satellites,
-            "hdop": hdop,
-            "altitude_m": altitude,
-            "timestamp": timestamp,
-            "fix_valid": (fix_quality or 0) > 0,
-        }
 
-    def _parse_vtg(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPVTG: course and ground speed."""
+        return NMEAUpdate(
+            latitude=_parse_latlon(fields[1], fields[2], is_lat=True),
+            longitude=_parse_latlon(fields[3], fields[4], is_lat=False),
+            fix_quality=fix_quality,
+            satellites_in_use=_parse_int(fields[6]),
+            hdop=_parse_float(fields[7]),
+            altitude_m=_parse_float(fields[8]),
+            timestamp=self._timestamp(fields[0]),
+            fix_valid=(fix_quality or 0) > 0,
+        )
+
+    def _parse_vtg(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--VTG: course and ground speed."""
         if len(fields) < 7:
             return None
 
-        course_deg = _parse_float(fields[0])
-        speed_knots = _parse_float(fields[4])
-        speed_kmh = _parse_float(fields[6])
-
-        return {
-            "course_deg": course_deg,
-            "speed_knots": speed_knots,
-            "speed_kmh": speed_kmh,
-        }
+        return NMEAUpdate(
+            course_deg=_parse_float(fields[0]),
+            speed_knots=_parse_float(fields[4]),
+            speed_kmh=_parse_float(fields[6]),
+        )
 
-    def _parse_gll(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPGLL: position, time, status."""
+    def _parse_gll(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--GLL: position, time, status."""
         if len(fields) < 5:
             return None
 
-        lat = _parse_latlon(fields[0], fields[1], is_lat=True)
-        lon = _parse_latlon(fields[2], fields[3], is_lat=False)
-        time_obj = _parse_hms(fields[4])
-        status = (fields[5] or "").upper() if len(fields) > 5 else ""
-        timestamp = _combine_datetime(self._last_known_date, time_obj, self._fix.timestamp)
-
-        return {
-            "latitude": lat,
-            "longitude": lon,
-            "timestamp": timestamp,
-            "fix_valid": status == "A",
-        }
+        status = fields[5].upper() if len(fields) > 5 else ""
 
-    def _parse_gsa(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPGSA: fix mode, PDOP, HDOP, VDOP."""
-        if len(fields) < 17:
-            return None
+        return NMEAUpdate(
+            latitude=_parse_latlon(fields[0], fields[1], is_lat=True),
+            longitude=_parse_latlon(fields[2], fields[3], is_lat=False),
+            timestamp=self._timestamp(fields[4]),
+            fix_valid=status == "A",
+        )
 
-        fix_type = _parse_int(fields[1])
-        pdop = _parse_float(fields[14]) if len(fields) > 14 else None
-        hdop = _parse_float(fields[15]) if len(fields) > 15 else None
-        vdop = _parse_float(fields[16]) if len(fields) > 16 else None
+    def _parse_gsa(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--GSA: fix mode, PDOP, HDOP, VDOP.
 
-        fix_mode = FIX_MODE_MAP.get(fix_type or 0)
-
-        return {
-            "fix_mode": fix_mode,
-            "pdop": pdop,
-            "hdop": hdop,
-            "vdop": vdop,
-        }
+        GN receivers send one GSA per constellation with the same DOPs.
+        """
+        if len(fields) < 17:
+            return None
 
-    def _parse_gsv(self, fields: list[str]) -> Optional[Dict[str, Any]]:
-        """Parse $GPGSV: satellites in view."""
+        return NMEAUpdate(
+            fix_mode=FIX_MODE_MAP.get(_parse_int(fields[1]) or 0),
+            pdop=_parse_float(fields[14]),
+            hdop=_parse_float(fields[15]),
+            vdop=_parse_float(fields[16]),
+        )
+
+    def _parse_gsv(self, fields: list[str], talker: str) -> Optional[NMEAUpdate]:
+        """Parse $--GSV: satellites in view.
+
+        Each constellation reports its own GSV burst (GPGSV, GLGSV, GAGSV,
+        GBGSV, ...); the fix gets the total over all talkers. The count is
+        repeated in every message of a burst, so only the first is parsed.
+        A talker with no burst for GSV_MAX_AGE seconds of receiver time
+        (RMC/GGA/GLL) drops out of the total. Receiver time rather than host
+        time keeps re-parsed archives identical to the live CSV.
+        """
         if len(fields) < 3:
             return None
 
-        satellites_in_view = _parse_int(fields[2])
-
-        return {"satellites_in_view": satellites_in_view}
+        if fields[1] != "1":
+            return NMEAUpdate(satellites_in_view=self._total_in_view)
+        in_view = _parse_int(fields[2])
+        if in_view is None:
+            return NMEAUpdate()
+        counts = self._satellites_in_view
+        now = self._fix.timestamp
+        counts[talker] = (in_view, now)
+        if now is not None:
+            for other, (count, seen) in list(counts.items()):
+                if seen is None:
+                    counts[other] = (count, now)  # Reported before the receiver had a time
+                elif (now - seen).total_seconds() > GSV_MAX_AGE:
+                    del counts[other]
+        self._total_in_view = sum(count for count, _ in counts.values())
+        return NMEAUpdate(satellites_in_view=self._total_in_view)
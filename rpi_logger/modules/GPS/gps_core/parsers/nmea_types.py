@@ -1,9 +1,9 @@
 """GPS data types and structures."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import datetime as dt
 import time
-from typing import Optional
+from typing import Any, Optional
 
 
 @dataclass(slots=True)
@@ -71,3 +71,46 @@ class GPSFixSnapshot:
             error=self.error,
             last_update_monotonic=self.last_update_monotonic,
         )
+
+
+@dataclass(slots=True)
+class NMEAUpdate:
+    """Values parsed from one NMEA sentence; None means not carried by it.
+
+    Supports the read-only mapping access (``update["latitude"]``,
+    ``update.get("raw_sentence", "")``) of the dicts it replaces.
+    """
+
+    sentence_type: str = ""
+    talker: str = ""
+    raw_sentence: str = ""
+    timestamp: Optional[dt.datetime] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    altitude_m: Optional[float] = None
+    speed_knots: Optional[float] = None
+    speed_kmh: Optional[float] = None
+    course_deg: Optional[float] = None
+    fix_quality: Optional[int] = None
+    fix_mode: Optional[str] = None
+    fix_valid: Optional[bool] = None
+    satellites_in_use: Optional[int] = None
+    satellites_in_view: Optional[int] = None
+    hdop: Optional[float] = None
+    pdop: Optional[float] = None
+    vdop: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of ``key``, or ``default`` if unset or unknown."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def copy(self) -> "NMEAUpdate":
+        """Create a shallow copy of this update."""
+        return replace(self)
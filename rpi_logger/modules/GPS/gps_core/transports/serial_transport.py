@@ -1,31 +1,41 @@
-"""Serial UART transport using serial_asyncio for non-blocking GPS I/O."""
+"""Serial UART transport for GPS receivers, read through the shared serial reactor."""
 
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+from typing import List, Optional
 
 from rpi_logger.core.logging_utils import get_module_logger
-# Import directly from base_transport to avoid triggering XBee imports
+# Import directly from base_transport/serial_reactor to avoid triggering XBee imports
 from rpi_logger.core.devices.transports.base_transport import BaseReadOnlyTransport as BaseGPSTransport
+from rpi_logger.core.devices.transports.serial_reactor import LineInbox, RawLine, get_serial_reactor
 from ..constants import DEFAULT_BAUD_RATE, DEFAULT_RECONNECT_DELAY
 
 logger = get_module_logger(__name__)
 
 try:
     import serial  # type: ignore
-    import serial_asyncio  # type: ignore
     SERIAL_AVAILABLE = True
     SERIAL_IMPORT_ERROR = None
 except ImportError as exc:
     serial = None  # type: ignore
-    serial_asyncio = None  # type: ignore
     SERIAL_AVAILABLE = False
     SERIAL_IMPORT_ERROR = exc
 
+# Blocking read timeout of the reactor's reader thread; bounds how long
+# disconnect waits for it to exit on ports without cancel_read
+READ_TIMEOUT = 0.5
+# Most sentences handed to the handler per read; a 25 Hz multi-constellation
+# receiver sends roughly 400 sentences per second
+MAX_BATCH_LINES = 64
+
 
 class SerialGPSTransport(BaseGPSTransport):
-    """Serial UART transport for GPS receivers using serial_asyncio."""
+    """Serial UART transport for GPS receivers.
+
+    NMEA sentences are read and timestamped on arrival by the shared serial
+    reactor; ``read_line`` waits on the reactor's inbox instead of polling.
+    """
 
     def __init__(
         self,
@@ -39,14 +49,17 @@ class SerialGPSTransport(BaseGPSTransport):
         self.baudrate = baudrate
         self.reconnect_delay = reconnect_delay
 
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._serial = None
+        self._inbox: Optional[LineInbox] = None
+        self._reader = None  # Serial reactor handle
         self._last_error: Optional[str] = None
 
     @property
     def is_connected(self) -> bool:
-        """Check if the serial connection is open."""
-        return self._connected and self._reader is not None
+        """Check if the serial connection is open and its reader has not failed."""
+        if self._inbox is not None and self._inbox.error is not None:
+            return False
+        return self._connected and self._serial is not None
 
     @property
     def last_error(self) -> Optional[str]:
@@ -65,10 +78,14 @@ class SerialGPSTransport(BaseGPSTransport):
             return True
 
         try:
-            self._reader, self._writer = await serial_asyncio.open_serial_connection(
-                url=self.port,
+            self._serial = await asyncio.to_thread(
+                serial.Serial,
+                port=self.port,
                 baudrate=self.baudrate,
+                timeout=READ_TIMEOUT,
             )
+            self._inbox = LineInbox()
+            self._reader = get_serial_reactor().attach(self._serial, self._inbox, name=self.port)
             self._connected = True
             self._last_error = None
             logger.info("Connected to GPS on %s at %d baud", self.port, self.baudrate)
@@ -83,63 +100,75 @@ class SerialGPSTransport(BaseGPSTransport):
                 "%s connecting to %s at %d baud: %s",
                 event_type, self.port, self.baudrate, exc
             )
+            self._serial = None
             self._connected = False
             return False
 
     async def disconnect(self) -> None:
-        """Close serial connection with verification."""
-        if self._writer is None:
+        """Stop the reader and close the serial port."""
+        if self._serial is None:
             self._connected = False
             return
 
-        writer = self._writer
-        self._writer = None
-        self._reader = None
+        port, self._serial = self._serial, None
+        reader, self._reader = self._reader, None
+        self._inbox = None
         self._connected = False
 
+        def _close() -> None:
+            if reader is not None:
+                get_serial_reactor().detach(reader, timeout=READ_TIMEOUT + 1.0)
+            port.close()
+
         try:
-            writer.close()
+            await asyncio.to_thread(_close)
         except OSError as e:
-            logger.debug("Expected error closing serial writer on %s: %s", self.port, e)
+            logger.debug("Expected error closing serial port %s: %s", self.port, e)
         except Exception as e:
-            logger.warning("Error closing serial writer on %s: %s", self.port, e)
-
-        if hasattr(writer, "wait_closed"):
-            try:
-                await asyncio.wait_for(writer.wait_closed(), timeout=2.0)
-            except asyncio.TimeoutError:
-                logger.warning("Timeout waiting for serial close on %s (port may still be held)", self.port)
-                await asyncio.sleep(0.2)
-            except Exception as e:
-                logger.debug("Error in wait_closed for serial on %s: %s", self.port, e)
-        else:
-            await asyncio.sleep(0.1)
+            logger.warning("Error closing serial port %s: %s", self.port, e)
 
         logger.info("Disconnected from GPS on %s", self.port)
 
     async def read_line(self, timeout: float = 1.0) -> Optional[str]:
         """Read NMEA sentence from GPS. Returns decoded line or None."""
-        if not self.is_connected or self._reader is None:
-            return None
-
-        try:
-            line = await asyncio.wait_for(self._reader.readline(), timeout=timeout)
-        except asyncio.TimeoutError:
-            return None
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:
-            self._last_error = str(exc)
-            logger.warning("Read error on %s: %s", self.port, exc)
+        raw = await self.read_raw_line(timeout=timeout)
+        if raw is None:
             return None
+        decoded = raw.data.decode("ascii", errors="ignore").strip()
+        return decoded if decoded else None
 
-        if not line:
-            logger.warning("Serial stream ended on %s (EOF)", self.port)
-            self._last_error = "Stream ended (EOF)"
+    async def read_raw_line(self, timeout: float = 1.0) -> Optional[RawLine]:
+        """Read the next sentence with its arrival time, or None on timeout."""
+        inbox = self._inbox
+        if not self.is_connected or inbox is None:
             return None
 
-        decoded = line.decode("ascii", errors="ignore").strip()
-        return decoded if decoded else None
+        raw = inbox.get_nowait()
+        if raw is None:
+            await inbox.wait(timeout)
+            if inbox.error is not None:
+                self._last_error = str(inbox.error)
+                return None
+            raw = inbox.get_nowait()
+        return raw
+
+    async def read_raw_lines(self, timeout: float = 1.0, max_lines: int = MAX_BATCH_LINES) -> List[RawLine]:
+        """Wait like ``read_raw_line``, then take every buffered sentence.
+
+        Returns:
+            Up to ``max_lines`` sentences in arrival order (empty on timeout)
+        """
+        first = await self.read_raw_line(timeout=timeout)
+        inbox = self._inbox
+        if first is None or inbox is None:
+            return []
+        batch = [first]
+        while len(batch) < max_lines:
+            raw = inbox.get_nowait()
+            if raw is None:
+                break
+            batch.append(raw)
+        return batch
 
     async def read_sentences(self, timeout: float = 1.0):
         """Async generator yielding NMEA sentences starting with '$'."""
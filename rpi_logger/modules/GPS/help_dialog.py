@@ -78,7 +78,7 @@ During Recording
 
 File Naming Convention
    {timestamp}_GPS_{device_id}.csv     - Parsed GPS data (appended per session)
-   {timestamp}_NMEA_trial{NNN}.txt     - Raw NMEA sentences
+   {timestamp}_GPS_{device_id}.nmea.zst - Raw serial capture (optional, .nmea.gz without zstandard)
 
    Example: 20251208_143022_GPS_serial0.csv (trial number is stored in the CSV data column)
 
@@ -96,8 +96,8 @@ GPS CSV Columns (25 fields):
    module                - Module name ("GPS")
    device_id             - GPS device identifier
    label                 - Optional label (blank if unused)
-   record_time_unix      - Host capture time (Unix seconds, 6 decimals)
-   record_time_mono      - Host capture time (seconds, 9 decimals)
+   record_time_unix      - Host arrival time (Unix seconds, 6 decimals)
+   record_time_mono      - Host arrival time (seconds, 9 decimals)
    device_time_unix      - GPS UTC time (Unix seconds)
    latitude_deg          - Latitude (decimal degrees, + = North)
    longitude_deg         - Longitude (decimal degrees, + = East)
@@ -27,6 +27,7 @@ class VOGConfig:
     session_prefix: str = "vog"
     log_level: str = "info"
     console_output: bool = False
+    host_latency_column: bool = False  # Add host_latency_us (serial arrival to write) to CSVs
 
     # UI visibility (master logger integration)
     preview_resolution: str = "auto"
@@ -53,6 +54,7 @@ class VOGConfig:
             session_prefix=get_pref_str(prefs, "session_prefix", defaults.session_prefix),
             log_level=get_pref_str(prefs, "log_level", defaults.log_level),
             console_output=get_pref_bool(prefs, "console_output", defaults.console_output),
+            host_latency_column=get_pref_bool(prefs, "host_latency_column", defaults.host_latency_column),
             # UI visibility
             preview_resolution=get_pref_str(prefs, "preview_resolution", defaults.preview_resolution),
             view_show_io_panel=get_pref_bool(prefs, "view.show_io_panel", defaults.view_show_io_panel),
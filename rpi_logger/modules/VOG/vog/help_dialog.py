@@ -98,8 +98,8 @@ sVOG CSV Columns (8 fields):
    module                - Module name ("VOG")
    device_id             - Device identifier (e.g., "sVOG")
    label                 - Trial/condition label (blank if not set)
-   record_time_unix      - Host capture time (Unix seconds, 6 decimals)
-   record_time_mono      - Host capture time (seconds, 9 decimals)
+   record_time_unix      - Host arrival time (Unix seconds, 6 decimals)
+   record_time_mono      - Host arrival time (seconds, 9 decimals)
    shutter_open          - Total Shutter Open Time (milliseconds)
    shutter_closed        - Total Shutter Close Time (milliseconds)
 
@@ -108,8 +108,8 @@ wVOG CSV Columns (11 fields):
    module                - Module name ("VOG")
    device_id             - Device identifier (e.g., "wVOG")
    label                 - Trial/condition label (blank if not set)
-   record_time_unix      - Host capture time (Unix seconds, 6 decimals)
-   record_time_mono      - Host capture time (seconds, 9 decimals)
+   record_time_unix      - Host arrival time (Unix seconds, 6 decimals)
+   record_time_mono      - Host arrival time (seconds, 9 decimals)
    shutter_open          - Total Shutter Open Time (milliseconds)
    shutter_closed        - Total Shutter Close Time (milliseconds)
    shutter_total         - Combined shutter time (milliseconds)
@@ -206,7 +206,8 @@ class VOGModuleRuntime(ModuleRuntime):
                 device_id,  # Use device_id for consistency (works for both port and node_id)
                 self.module_data_dir,
                 system=self,
-                protocol=protocol
+                protocol=protocol,
+                host_latency=self.typed_config.host_latency_column,
             )
             handler.set_data_callback(self._on_device_data)
 
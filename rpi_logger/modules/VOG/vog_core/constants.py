@@ -1,4 +1,5 @@
 """VOG module constants. Timing and protocol constants."""
 
 COMMAND_DELAY = 0.05  # Delay after sending command (seconds)
-
+READ_IDLE_TIMEOUT = 0.5  # Longest idle wait for data between connection checks (seconds)
+HOST_LATENCY_COLUMN = "host_latency_us"  # Optional CSV column: serial arrival to write (microseconds)
@@ -8,9 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable, Awaitable
 
+from rpi_logger.core.devices.transports import RawLine
 from rpi_logger.core.logging_utils import get_module_logger
 from rpi_logger.modules.base.storage_utils import derive_session_token, sanitize_device_id
 
+from .constants import HOST_LATENCY_COLUMN
 from .protocols import BaseVOGProtocol, VOGDataPacket
 
 
@@ -18,15 +20,28 @@ class VOGDataLogger:
     """CSV logging for VOG trial data (directory/file creation, headers, rows, events)."""
 
     def __init__(self, output_dir: Path, port: str, protocol: BaseVOGProtocol,
-                 event_callback: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None):
-        """Initialize logger with output directory, port, protocol, and optional event callback."""
+                 event_callback: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+                 host_latency: bool = False):
+        """Initialize logger with output directory, port, protocol, and optional event callback.
+
+        With ``host_latency`` rows end with a host_latency_us column (serial
+        arrival to write, in microseconds).
+        """
         self.output_dir = output_dir
         self.port = port
         self.protocol = protocol
         self._event_callback = event_callback
+        self.host_latency = host_latency
         self._recording_start_time: Optional[float] = None
         self.logger = get_module_logger(f"VOGDataLogger[{protocol.device_type}]")
 
+    @property
+    def csv_header(self) -> str:
+        """CSV header of the protocol, plus host_latency_us when enabled."""
+        if self.host_latency:
+            return f"{self.protocol.csv_header},{HOST_LATENCY_COLUMN}"
+        return self.protocol.csv_header
+
     @property
     def device_type(self) -> str:
         """Return device type from protocol."""
@@ -53,16 +68,27 @@ class VOGDataLogger:
         return self.output_dir / f"{token}_VOG_{port_name}.csv"
 
     async def log_trial_data(self, packet: VOGDataPacket, trial_number: int,
-                            label: Optional[str] = None) -> Optional[Path]:
-        """Log trial data to CSV. Returns path to data file or None if failed."""
+                            label: Optional[str] = None,
+                            arrival: Optional[RawLine] = None) -> Optional[Path]:
+        """Log trial data to CSV. Returns path to data file or None if failed.
+
+        The record time is the serial arrival of ``arrival`` (the line the
+        packet was parsed from), or now if not given.
+        """
         try:
             data_file = self._resolve_data_file()
             label = label if label is not None else ""
-            record_time_unix = time.time()
-            record_time_mono = time.perf_counter()
+            if arrival is not None:
+                record_time_unix = arrival.arrival_unix
+                record_time_mono = arrival.arrival_mono
+            else:
+                record_time_unix = time.time()
+                record_time_mono = time.perf_counter()
 
             row = self.protocol.format_csv_row(packet, label, record_time_unix, record_time_mono)
-            header = self.protocol.csv_header
+            if self.host_latency:
+                row.append(f"{arrival.host_latency_us():.0f}" if arrival is not None else "")
+            header = self.csv_header
 
             created_new = await asyncio.to_thread(
                 self._batch_write, self.output_dir, data_file, header, row)
@@ -6,17 +6,17 @@ from typing import Optional
 
 import serial
 
-from rpi_logger.core.devices.transports import BaseTransport
+from rpi_logger.core.devices.transports import BaseTransport, LineInbox, RawLine, get_serial_reactor
 from rpi_logger.core.logging_utils import get_module_logger
 
-# Timeouts (read: short to not block loop, write: standard)
+# Timeouts (read: bounds how long the reactor's reader takes to stop, write: standard)
 DEFAULT_READ_TIMEOUT = 0.1
 DEFAULT_WRITE_TIMEOUT = 1.0
 MAX_READ_BUFFER_SIZE = 65536  # 64KB max buffer to prevent memory exhaustion
 
 
 class USBTransport(BaseTransport):
-    """USB Serial transport for VOG devices with async read/write."""
+    """USB Serial transport for VOG devices; lines arrive via the shared serial reactor."""
 
     def __init__(self, port: str, baudrate: int = 57600,
                  read_timeout: float = DEFAULT_READ_TIMEOUT,
@@ -29,12 +29,15 @@ class USBTransport(BaseTransport):
         self.write_timeout = write_timeout
         self._serial: Optional[serial.Serial] = None
         self._lock = threading.Lock()
-        self._read_buffer = b''
+        self._inbox: Optional[LineInbox] = None
+        self._reader = None  # Serial reactor handle
         self.logger = get_module_logger("USBTransport")
 
     @property
     def is_connected(self) -> bool:
-        """Check if the serial port is connected and open."""
+        """Check if the serial port is open and its reader has not failed."""
+        if self._inbox is not None and self._inbox.error is not None:
+            return False
         return self._serial is not None and self._serial.is_open
 
     async def connect(self) -> bool:
@@ -48,6 +51,9 @@ class USBTransport(BaseTransport):
                 timeout=self.read_timeout, write_timeout=self.write_timeout)
             await asyncio.to_thread(self._serial.reset_input_buffer)
             await asyncio.to_thread(self._serial.reset_output_buffer)
+            self._inbox = LineInbox()
+            self._reader = get_serial_reactor().attach(
+                self._serial, self._inbox, name=self.port, max_line_size=MAX_READ_BUFFER_SIZE)
             self._connected = True
             self.logger.info("Connected to %s at %d baud", self.port, self.baudrate)
             return True
@@ -62,13 +68,15 @@ class USBTransport(BaseTransport):
         if not self._serial:
             return
 
+        reader, self._reader = self._reader, None
+
         def _close_with_lock():
-            """Close serial port while holding lock to prevent read/write races."""
+            """Stop the reader, then close serial port while holding lock to prevent write races."""
+            if reader is not None:
+                get_serial_reactor().detach(reader, timeout=self.read_timeout + 1.0)
             with self._lock:
                 if self._serial and self._serial.is_open:
                     self._serial.close()
-                # Clear any buffered data
-                self._read_buffer = b''
 
         try:
             await asyncio.to_thread(_close_with_lock)
@@ -77,6 +85,7 @@ class USBTransport(BaseTransport):
             self.logger.warning("Error disconnecting from %s: %s", self.port, e)
         finally:
             self._serial = None
+            self._inbox = None
             self._connected = False
 
     async def write(self, data: bytes) -> bool:
@@ -96,34 +105,24 @@ class USBTransport(BaseTransport):
             return False
 
     async def read_line(self) -> Optional[str]:
-        """Read line from serial port using internal buffering. Returns decoded line or None."""
-        if not self.is_connected:
-            return None
-        def _read_with_buffer():
-            with self._lock:
-                waiting = self._serial.in_waiting
-                if waiting > 0:
-                    self._read_buffer += self._serial.read(waiting)
-                if len(self._read_buffer) > MAX_READ_BUFFER_SIZE:
-                    dropped = len(self._read_buffer) - MAX_READ_BUFFER_SIZE
-                    self.logger.warning("Read buffer overflow on %s, dropping %d bytes",
-                                      self.port, dropped)
-                    self._read_buffer = self._read_buffer[-MAX_READ_BUFFER_SIZE:]
-                newline_pos = self._read_buffer.find(b'\n')
-                if newline_pos >= 0:
-                    line = self._read_buffer[:newline_pos + 1]
-                    self._read_buffer = self._read_buffer[newline_pos + 1:]
-                    return line
-                return None
-        try:
-            line_bytes = await asyncio.to_thread(_read_with_buffer)
-            if line_bytes:
-                line = line_bytes.decode('utf-8', errors='replace').strip()
-                return line if line else None
-            return None
-        except serial.SerialException as e:
-            self.logger.warning("Read error on %s: %s", self.port, e)
-            return None
-        except Exception as e:
-            self.logger.warning("Unexpected error reading from %s: %s", self.port, e)
+        """Pop the next buffered line from the reactor. Returns decoded line or None."""
+        raw = await self.read_raw_line()
+        return raw.text if raw is not None else None
+
+    async def read_raw_line(self) -> Optional[RawLine]:
+        """Pop the next non-empty line from the reactor with its arrival time."""
+        inbox = self._inbox
+        if not self.is_connected or inbox is None:
             return None
+        while True:
+            raw = inbox.get_nowait()
+            if raw is None or raw.text:
+                return raw
+
+    async def wait_for_data(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for a line from the reactor."""
+        inbox = self._inbox
+        if not self.is_connected or inbox is None:
+            await asyncio.sleep(min(timeout, self.POLL_INTERVAL))
+            return False
+        return await inbox.wait(timeout)
@@ -12,11 +12,12 @@ from typing import Optional, Dict, Any, Callable
 from rpi_logger.core.logging_utils import get_module_logger
 from rpi_logger.core.commands import StatusMessage
 from rpi_logger.core.connection import ReconnectingMixin, ReconnectConfig
+from rpi_logger.core.devices.transports import RawLine
 from .transports import BaseTransport
 
 from .protocols import BaseVOGProtocol, VOGDataPacket
 from .protocols.base_protocol import ResponseType
-from .constants import COMMAND_DELAY
+from .constants import COMMAND_DELAY, READ_IDLE_TIMEOUT
 from .data_logger import VOGDataLogger
 
 
@@ -37,7 +38,8 @@ class VOGHandler(ReconnectingMixin):
         port: str,
         output_dir: Path,
         system: Optional[Any] = None,
-        protocol: BaseVOGProtocol = None
+        protocol: BaseVOGProtocol = None,
+        host_latency: bool = False
     ):
         if protocol is None:
             raise ValueError("Protocol must be provided")
@@ -51,6 +53,8 @@ class VOGHandler(ReconnectingMixin):
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._running = False
         self._data_callback: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
+        # Line being processed; its arrival time becomes the CSV record time
+        self._current_line: Optional[RawLine] = None
 
         # Device state
         self._config: Dict[str, Any] = {}
@@ -75,6 +79,7 @@ class VOGHandler(ReconnectingMixin):
             port=port,
             protocol=self.protocol,
             event_callback=self._on_data_logged,
+            host_latency=host_latency,
         )
 
     @property
@@ -350,14 +355,17 @@ class VOGHandler(ReconnectingMixin):
                 continue
 
             try:
-                line = await self.device.read_line()
+                raw = await self.device.read_raw_line()
 
-                if line:
+                if raw is not None:
                     # Reset error counter on successful read
                     self._consecutive_errors = 0
-                    await self._process_response(line)
-
-                await asyncio.sleep(0.001)  # 1ms for responsiveness
+                    self._current_line = raw
+                    await self._process_response(raw.text)
+                    await asyncio.sleep(0)  # Yield between buffered lines
+                else:
+                    # Sleep until the transport has new data
+                    await self.device.wait_for_data(READ_IDLE_TIMEOUT)
 
             except asyncio.CancelledError:
                 self.logger.debug("Read loop cancelled for %s", self.port)
@@ -516,7 +524,7 @@ class VOGHandler(ReconnectingMixin):
         # Log to CSV via data logger
         trial_number = self._determine_trial_number(packet)
         label = self._get_trial_label(trial_number)
-        await self._data_logger.log_trial_data(packet, trial_number, label)
+        await self._data_logger.log_trial_data(packet, trial_number, label, arrival=self._current_line)
 
     def _get_trial_label(self, trial_number: int) -> str:
         """Get trial label from system (experimenter-provided label)."""
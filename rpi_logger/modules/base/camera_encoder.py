@@ -1,15 +1,16 @@
 """
 Video encoder for camera modules.
 
-Supports PyAV (preferred) with OpenCV fallback.
-Handles overlay rendering and CSV timing logs.
+Supports PyAV (preferred) with OpenCV fallback. The PyAV codec is a
+CodecBackend from codec_backends ("auto" benchmarks and picks one).
+Handles overlay rendering (glyph-atlas text blended into the frame ROI,
+see frame_overlay) and CSV timing logs (batched via the shared timing sink).
 
 Uses a long-lived worker thread with bounded queue for backpressure.
 This encoder is backend-agnostic and works with both USB and CSI cameras.
 """
 from __future__ import annotations
 
-import csv
 import os
 import queue
 import threading
@@ -22,6 +23,19 @@ import cv2
 import numpy as np
 
 from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.codec_backends import (
+    CodecBackend,
+    fallback_chain,
+    get_backend,
+    open_video_output,
+    select_backend,
+)
+from rpi_logger.modules.base.frame_overlay import (
+    TextOverlay,
+    TimestampFormatter,
+    get_glyph_atlas,
+)
+from rpi_logger.modules.base.timing_sink import TimingStream, open_timing_stream
 
 logger = get_module_logger(__name__)
 
@@ -36,6 +50,18 @@ except ImportError:
 # Default queue size - provides ~1 second of buffering at 30fps
 _DEFAULT_QUEUE_SIZE = 30
 
+_CSV_HEADER = ",".join([
+    "trial",
+    "module",
+    "device_id",
+    "label",
+    "record_time_unix",  # wall clock time when frame was captured
+    "record_time_mono",  # monotonic time when frame was encoded
+    "frame_index",  # 1-indexed frame number in video file
+    "sensor_timestamp_ns",  # hardware sensor timestamp (if available)
+    "video_pts",  # presentation timestamp in video stream
+]) + "\r\n"
+
 
 @dataclass(slots=True)
 class _FrameItem:
@@ -46,6 +72,11 @@ class _FrameItem:
     color_format: str
 
 
+def _csv_field(value: Any) -> str:
+    """Format a CSV value the way csv.writer does for None."""
+    return "" if value is None else str(value)
+
+
 class _EncodeWorker:
     """Long-lived encoding thread with bounded queue.
 
@@ -210,17 +241,42 @@ class Encoder:
         module_name: str = "Cameras",
         use_pyav: Optional[bool] = None,
         queue_size: Optional[int] = None,
+        codec: str = "mjpeg",
+        fingerprint: Optional[str] = None,
     ) -> None:
+        """Initialize encoder.
+
+        Args:
+            video_path: Output video file; its extension selects the container
+            resolution: Frame size (width, height)
+            fps: Nominal frame rate
+            overlay_enabled: Draw the timestamp/frame-number overlay
+            csv_path: Per-frame timing CSV (None to disable)
+            trial_number: Trial number written to the timing CSV
+            device_id: Device identifier written to the timing CSV
+            module_name: Module name written to the timing CSV
+            use_pyav: Force PyAV on/off (default: PyAV if installed)
+            queue_size: Frames buffered ahead of the encode worker
+            codec: Registered codec backend name, or "auto" to benchmark the
+                available backends and pick the cheapest meeting ``fps``
+            fingerprint: Camera fingerprint keying the "auto" benchmark cache
+        """
         self.video_path = video_path
         self.csv_path = csv_path
         self._resolution = resolution
         self._fps = fps
         self._overlay_enabled = overlay_enabled
+        self._overlay = TextOverlay(get_glyph_atlas(0.5, 1, (255, 255, 255)), (8, 24))
+        self._overlay_frame: Optional[np.ndarray] = None  # OpenCV path's drawing buffer
+        self._timestamp_fmt = TimestampFormatter()
         self._trial_number = trial_number
         self._device_id = device_id or ""
         self._module_name = module_name
         self._use_pyav = use_pyav if use_pyav is not None else _HAS_PYAV
         self._queue_size = queue_size if queue_size is not None else _DEFAULT_QUEUE_SIZE
+        self._codec = codec
+        self._fingerprint = fingerprint
+        self._backend: Optional[CodecBackend] = None
 
         # Encoder state
         self._container: Any = None
@@ -238,9 +294,8 @@ class Encoder:
         self._flush_interval = 600
         self._frames_since_flush = 0
 
-        # CSV logger
-        self._csv_file = None
-        self._csv_writer = None
+        # CSV logger (rows batched by the process-wide timing sink)
+        self._csv_stream: Optional[TimingStream] = None
 
         # Worker thread
         self._worker: Optional[_EncodeWorker] = None
@@ -263,6 +318,11 @@ class Encoder:
             return self._worker.frames_dropped
         return 0
 
+    @property
+    def codec_name(self) -> str:
+        """Name of the codec backend in use ("" for OpenCV or before start)."""
+        return self._backend.name if self._backend else ""
+
     @property
     def queue_depth(self) -> int:
         """Current number of frames waiting to be encoded."""
@@ -274,10 +334,7 @@ class Encoder:
         """Initialize encoder and start worker thread."""
         self._start_time_ns = time.monotonic_ns()
 
-        if self._use_pyav and _HAS_PYAV:
-            self._start_pyav()
-        else:
-            self._start_opencv()
+        self._open_output()
 
         if self.csv_path:
             self._start_csv()
@@ -286,21 +343,40 @@ class Encoder:
         self._worker = _EncodeWorker(self, queue_size=self._queue_size)
         self._worker.start()
 
+    def _open_output(self) -> None:
+        if self._use_pyav and _HAS_PYAV:
+            self._start_pyav()
+        else:
+            self._start_opencv()
+
     def _start_pyav(self) -> None:
-        self._container = av.open(self.video_path, "w")
         fps_fraction = Fraction(self._fps).limit_denominator(1000)
-
-        # Use mjpeg codec - works best with .avi and .mkv containers
-        self._stream = self._container.add_stream("mjpeg", rate=fps_fraction)
-        self._stream.width = self._resolution[0]
-        self._stream.height = self._resolution[1]
-        self._stream.pix_fmt = "yuvj420p"
+        container_ext = os.path.splitext(self.video_path)[1].lstrip(".").lower() or None
+
+        if self._codec == "auto":
+            backend = select_backend(
+                self._resolution,
+                self._fps,
+                fingerprint=self._fingerprint,
+                container=container_ext,
+            )
+        else:
+            backend = get_backend(self._codec)
+            if backend is None:
+                raise ValueError(f"Unknown codec backend: {self._codec}")
 
         # Let PyAV manage time_base automatically - don't override it
         # The stream inherits time_base from the framerate (1/fps)
+        self._container, self._stream, self._backend = open_video_output(
+            self.video_path,
+            fallback_chain(backend, container=container_ext),
+            self._resolution,
+            fps_fraction,
+        )
 
-        logger.debug("PyAV encoder: %s %dx%d @ %s fps",
-                self.video_path, self._resolution[0], self._resolution[1], fps_fraction)
+        logger.debug("PyAV encoder: %s %s %dx%d @ %s fps",
+                self.video_path, self._backend.name,
+                self._resolution[0], self._resolution[1], fps_fraction)
         self._kind = "pyav"
 
     def _start_opencv(self) -> None:
@@ -314,19 +390,7 @@ class Encoder:
         self._kind = "opencv"
 
     def _start_csv(self) -> None:
-        self._csv_file = open(self.csv_path, "w", newline="")
-        self._csv_writer = csv.writer(self._csv_file)
-        self._csv_writer.writerow([
-            "trial",
-            "module",
-            "device_id",
-            "label",
-            "record_time_unix",  # wall clock time when frame was captured
-            "record_time_mono",  # monotonic time when frame was encoded
-            "frame_index",  # 1-indexed frame number in video file
-            "sensor_timestamp_ns",  # hardware sensor timestamp (if available)
-            "video_pts",  # presentation timestamp in video stream
-        ])
+        self._csv_stream = open_timing_stream(self.csv_path, _CSV_HEADER)
 
     def write_frame(
         self,
@@ -361,15 +425,16 @@ class Encoder:
         # Tentatively increment frame count (will be used for PTS)
         next_frame_num = self._frame_count + 1
 
-        # Apply overlay if enabled
+        # Overlay is blended into the encoder's copy of the frame, never the caller's
+        overlay_text = None
         if self._overlay_enabled:
-            frame = self._apply_overlay(frame, timestamp, next_frame_num)
+            overlay_text = self._timestamp_fmt.format(timestamp, next_frame_num)
 
         # Encode the frame - returns True only if actually written to video
         if self._kind == "pyav":
-            success = self._encode_pyav(frame, pts_time_ns, timestamp, next_frame_num)
+            success = self._encode_pyav(frame, pts_time_ns, timestamp, next_frame_num, overlay_text)
         else:
-            success = self._encode_opencv(frame)
+            success = self._encode_opencv(frame, overlay_text)
 
         if not success:
             return False
@@ -378,30 +443,38 @@ class Encoder:
         self._frame_count = next_frame_num
 
         # CSV logging - only for successfully encoded frames
-        if self._csv_writer:
+        if self._csv_stream:
             monotonic = time.perf_counter()
             pts_us = self._last_pts if self._kind == "pyav" else None
-            self._csv_writer.writerow([
-                self._trial_number,
-                self._module_name,
-                self._device_id,
-                "",
-                f"{timestamp:.6f}",
-                f"{monotonic:.9f}",
-                self._frame_count,
-                pts_time_ns,
-                pts_us,
-            ])
+            self._csv_stream.write_row(
+                f"{_csv_field(self._trial_number)},{self._module_name},{self._device_id},,"
+                f"{timestamp:.6f},{monotonic:.9f},{self._frame_count},"
+                f"{_csv_field(pts_time_ns)},{_csv_field(pts_us)}\r\n"
+            )
 
         return True
 
-    def _encode_pyav(self, frame: np.ndarray, pts_time_ns: Optional[int], timestamp: float, frame_num: int) -> bool:
+    def _encode_pyav(
+        self,
+        frame: np.ndarray,
+        pts_time_ns: Optional[int],
+        timestamp: float,
+        frame_num: int,
+        overlay_text: Optional[str] = None,
+    ) -> bool:
         """Encode frame with PyAV. Returns True if frame was successfully muxed."""
         try:
             av_frame = av.VideoFrame.from_ndarray(frame, format="bgr24")
         except Exception:
             return False
 
+        if overlay_text is not None:
+            # from_ndarray already copied the pixels; draw into that copy
+            plane = av_frame.planes[0]
+            height, width = frame.shape[:2]
+            pixels = np.frombuffer(plane, dtype=np.uint8).reshape(height, plane.line_size)
+            self._overlay.render(pixels[:, : width * 3].reshape(height, width, 3), overlay_text)
+
         # Use frame index for PTS (time_base is 1/fps from stream rate)
         # This ensures consistent playback timing at the specified fps
         pts = frame_num
@@ -422,11 +495,19 @@ class Encoder:
 
         return True
 
-    def _encode_opencv(self, frame: np.ndarray) -> bool:
+    def _encode_opencv(self, frame: np.ndarray, overlay_text: Optional[str] = None) -> bool:
         """Encode frame with OpenCV. Returns True if frame was successfully written."""
         if not self._writer or not self._writer.isOpened():
             return False
 
+        # VideoWriter has no frame of its own, and the caller's buffer may be
+        # shared (preview, pre-roll, other encoders): draw into our own copy.
+        if overlay_text is not None:
+            if self._overlay_frame is None or self._overlay_frame.shape != frame.shape:
+                self._overlay_frame = np.empty_like(frame)
+            np.copyto(self._overlay_frame, frame)
+            frame = self._overlay.render(self._overlay_frame, overlay_text)
+
         try:
             self._writer.write(frame)
         except Exception:
@@ -452,24 +533,6 @@ class Encoder:
         from rpi_logger.core.file_sync_utils import fsync_path
         fsync_path(self.video_path)
 
-    def _apply_overlay(self, frame: np.ndarray, timestamp: float, frame_number: int) -> np.ndarray:
-        from datetime import datetime, timezone
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        text = f"{dt.strftime('%Y-%m-%dT%H:%M:%S')}.{int((timestamp % 1) * 1000):03d} #{frame_number}"
-
-        frame = frame.copy()
-        cv2.putText(
-            frame,
-            text,
-            (8, 24),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.5,
-            (255, 255, 255),
-            1,
-            cv2.LINE_AA,
-        )
-        return frame
-
     def stop(self) -> None:
         """Finalize and close encoder (blocking).
 
@@ -481,19 +544,19 @@ class Encoder:
             self._worker.stop()
             self._worker = None
 
+        self._finalize_output()
+
+        if self._csv_stream:
+            # Drains batched rows and fsyncs the timing file
+            self._csv_stream.close()
+            self._csv_stream = None
+
+    def _finalize_output(self) -> None:
         if self._kind == "pyav":
             self._finalize_pyav()
         else:
             self._finalize_opencv()
 
-        if self._csv_file:
-            try:
-                self._csv_file.close()
-            except Exception:
-                pass
-            self._csv_file = None
-            self._csv_writer = None
-
     def _finalize_pyav(self) -> None:
         if not self._container:
             return
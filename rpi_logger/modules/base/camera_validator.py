@@ -12,6 +12,7 @@ Used by both USB and CSI camera modules to ensure:
 
 from __future__ import annotations
 
+import hashlib
 import math
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -621,15 +622,16 @@ class CapabilityValidator:
         """Generate a fingerprint for capability comparison.
 
         Used to detect when a different camera has been connected with the
-        same stable_id. The fingerprint is a hash of the mode signatures
-        and control names.
+        same stable_id, and as a persistent cache key (e.g. codec benchmarks),
+        so it must be stable across processes. The fingerprint is a SHA-1 of
+        the mode signatures and control names.
 
         Returns:
             String fingerprint that uniquely identifies this capability set.
         """
         modes_sig = tuple(sorted(self._mode_signatures))
         controls_sig = tuple(sorted(self._caps.controls.keys()))
-        return str(hash((modes_sig, controls_sig)))
+        return hashlib.sha1(repr((modes_sig, controls_sig)).encode("utf-8")).hexdigest()[:16]
 
     @property
     def capabilities(self) -> CameraCapabilities:
@@ -0,0 +1,495 @@
+"""
+Video codec backend registry for camera encoders.
+
+Probes which PyAV encoders are usable on this machine (hardware H.264 via
+V4L2 M2M on the Pi or VAAPI on PCs, then software fallbacks), benchmarks
+each for a few frames at the actual recording resolution, and picks the
+backend with the lowest CPU cost per frame that still sustains the target
+frame rate.
+
+Benchmark results are cached in memory and on disk, keyed by camera
+fingerprint (CapabilityValidator.fingerprint) and resolution, so the probe
+only runs once per camera/mode/FFmpeg build. When nothing benchmarks
+successfully the software encoders are used, so this works (and is
+testable) on any plain Linux box with PyAV installed.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+try:
+    import av
+    _HAS_PYAV = True
+except ImportError:
+    av = None
+    _HAS_PYAV = False
+
+
+# Frames encoded per backend benchmark (after one warm-up frame)
+BENCHMARK_FRAMES = 8
+# Required speed margin over the target fps (encode is not the only load)
+FPS_HEADROOM = 1.25
+
+CACHE_SCHEMA_VERSION = 2  # 2: per-thread CPU, wall time for hardware
+CACHE_FILENAME = "codec_benchmarks.json"
+
+
+@dataclass(frozen=True, slots=True)
+class CodecBackend:
+    """One way of encoding video with PyAV."""
+
+    name: str  # Registry key
+    codec: str  # PyAV/FFmpeg encoder name
+    family: str  # Bitstream family: "h264", "mjpeg", "ffv1"
+    pix_fmt: str  # Pixel format fed to the encoder
+    options: Dict[str, str] = field(default_factory=dict)
+    containers: tuple[str, ...] = ("mp4", "mkv", "avi")
+    hardware: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """Measured cost of one backend at one resolution."""
+
+    backend: str
+    ok: bool
+    fps: float = 0.0  # Wall-clock encode throughput
+    cpu_ms_per_frame: float = 0.0  # Encoding thread CPU (wall time for hardware) per frame
+    error: str = ""
+
+
+_REGISTRY: Dict[str, CodecBackend] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register_backend(backend: CodecBackend) -> None:
+    """Add or replace a backend. Registration order is preference order for ties."""
+    with _REGISTRY_LOCK:
+        _REGISTRY[backend.name] = backend
+
+
+def get_backend(name: str) -> Optional[CodecBackend]:
+    """Look up a registered backend by name."""
+    with _REGISTRY_LOCK:
+        return _REGISTRY.get(name)
+
+
+def registered_backends() -> List[CodecBackend]:
+    """All registered backends in preference order."""
+    with _REGISTRY_LOCK:
+        return list(_REGISTRY.values())
+
+
+register_backend(CodecBackend(
+    name="h264_v4l2m2m",
+    codec="h264_v4l2m2m",
+    family="h264",
+    pix_fmt="yuv420p",
+    options={"b": "8M"},
+    hardware=True,
+))
+register_backend(CodecBackend(
+    name="h264_vaapi",
+    codec="h264_vaapi",
+    family="h264",
+    pix_fmt="yuv420p",
+    hardware=True,
+))
+register_backend(CodecBackend(
+    name="libx264",
+    codec="libx264",
+    family="h264",
+    pix_fmt="yuv420p",
+    options={"preset": "ultrafast", "tune": "zerolatency"},
+))
+register_backend(CodecBackend(
+    name="mjpeg",
+    codec="mjpeg",
+    family="mjpeg",
+    pix_fmt="yuvj420p",
+    containers=("avi", "mkv", "mp4"),
+))
+register_backend(CodecBackend(
+    name="ffv1",
+    codec="ffv1",
+    family="ffv1",
+    pix_fmt="yuv420p",
+    containers=("mkv", "avi"),
+))
+
+# Always-available fallbacks, in order, when nothing else qualifies
+SOFTWARE_FALLBACKS = ("libx264", "mjpeg")
+
+
+# ---------------------------------------------------------------------------
+# Probing and benchmarking
+
+
+def probe_available() -> List[CodecBackend]:
+    """Registered backends whose encoder exists in this PyAV/FFmpeg build."""
+    if not _HAS_PYAV:
+        return []
+    available = av.codecs_available
+    return [b for b in registered_backends() if b.codec in available]
+
+
+def benchmark_backend(
+    backend: CodecBackend,
+    resolution: tuple[int, int],
+    *,
+    frames: int = BENCHMARK_FRAMES,
+    fps: float = 30.0,
+    source_format: str = "bgr24",
+) -> BenchmarkResult:
+    """Encode synthetic frames at ``resolution`` and measure the cost.
+
+    ``source_format`` is the layout the caller will feed ("bgr24" for
+    OpenCV frames, "yuv420p" for I420 camera buffers). The measurement
+    includes any conversion to the encoder's pixel format, since that is
+    part of the per-frame cost in the recording path.
+
+    CPU is measured on the calling thread only, so other work in the process
+    (capture, preview, other cameras) does not count against the encoder.
+    Hardware encoders block the thread while the device works, so their
+    cost is the wall time per frame.
+    """
+    if not _HAS_PYAV:
+        return BenchmarkResult(backend.name, ok=False, error="PyAV not installed")
+
+    width, height = resolution
+    try:
+        ctx = av.CodecContext.create(backend.codec, "w")
+        ctx.width = width
+        ctx.height = height
+        ctx.pix_fmt = backend.pix_fmt
+        ctx.time_base = Fraction(1, max(1, int(round(fps))))
+        ctx.framerate = Fraction(fps).limit_denominator(1000)
+        if backend.options:
+            ctx.options = dict(backend.options)
+        ctx.open()
+
+        rng = np.random.default_rng(0)
+        if source_format == "bgr24":
+            image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+            def make_frame():
+                return av.VideoFrame.from_ndarray(image, format="bgr24")
+        else:
+            image = rng.integers(0, 256, (height * 3 // 2, width), dtype=np.uint8)
+
+            def make_frame():
+                return av.VideoFrame.from_numpy_buffer(image, format=source_format, width=width)
+
+        def encode(pts: int) -> None:
+            frame = make_frame()
+            if frame.format.name != backend.pix_fmt:
+                frame = frame.reformat(format=backend.pix_fmt)
+            frame.pts = pts
+            ctx.encode(frame)
+
+        encode(0)  # Warm-up: allocations, encoder init
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        for pts in range(1, frames + 1):
+            encode(pts)
+        ctx.encode(None)
+        wall = time.perf_counter() - wall_start
+        cpu = wall if backend.hardware else time.thread_time() - cpu_start
+    except Exception as exc:
+        return BenchmarkResult(backend.name, ok=False, error=f"{type(exc).__name__}: {exc}")
+
+    return BenchmarkResult(
+        backend.name,
+        ok=True,
+        fps=frames / wall if wall > 0 else float("inf"),
+        cpu_ms_per_frame=cpu / frames * 1000.0,
+    )
+
+
+def choose_backend(
+    results: Iterable[BenchmarkResult],
+    target_fps: float,
+    *,
+    families: Optional[Sequence[str]] = None,
+    container: Optional[str] = None,
+) -> Optional[CodecBackend]:
+    """Pick the cheapest backend meeting ``target_fps`` from benchmark results.
+
+    Falls back to the fastest working backend, then to the software
+    fallbacks, if none meets the target.
+    """
+    candidates: list[tuple[BenchmarkResult, CodecBackend]] = []
+    for result in results:
+        backend = get_backend(result.backend)
+        if backend is None or not result.ok:
+            continue
+        if not _compatible(backend, families, container):
+            continue
+        candidates.append((result, backend))
+
+    required = target_fps * FPS_HEADROOM
+    meeting = [c for c in candidates if c[0].fps >= required]
+    if meeting:
+        return min(meeting, key=lambda c: c[0].cpu_ms_per_frame)[1]
+    if candidates:
+        return max(candidates, key=lambda c: c[0].fps)[1]
+
+    for name in SOFTWARE_FALLBACKS:
+        backend = get_backend(name)
+        if backend and _compatible(backend, families, container) and _HAS_PYAV \
+                and backend.codec in av.codecs_available:
+            return backend
+    return None
+
+
+def _compatible(
+    backend: CodecBackend,
+    families: Optional[Sequence[str]],
+    container: Optional[str],
+) -> bool:
+    if families is not None and backend.family not in families:
+        return False
+    if container is not None and container.lower().lstrip(".") not in backend.containers:
+        return False
+    return True
+
+
+def fallback_chain(
+    backend: Optional[CodecBackend],
+    *,
+    container: Optional[str] = None,
+) -> List[CodecBackend]:
+    """``backend`` followed by the compatible software fallbacks (deduplicated)."""
+    chain: List[CodecBackend] = [backend] if backend is not None else []
+    for name in SOFTWARE_FALLBACKS:
+        fallback = get_backend(name)
+        if fallback is not None and fallback not in chain and _compatible(fallback, None, container):
+            chain.append(fallback)
+    return chain
+
+
+def open_video_output(
+    path: str,
+    backends: Sequence[CodecBackend],
+    resolution: tuple[int, int],
+    rate: Fraction | int,
+    *,
+    time_base: Optional[Fraction] = None,
+) -> tuple[Any, Any, CodecBackend]:
+    """Open ``path`` with a video stream from the first backend that opens.
+
+    A stream whose encoder fails to open cannot be removed from a PyAV
+    container, so the container is reopened for each attempt.
+
+    Returns:
+        (container, video_stream, backend)
+
+    Raises:
+        RuntimeError: If PyAV is missing or no backend could be opened.
+    """
+    if not _HAS_PYAV:
+        raise RuntimeError("PyAV not installed. Install with: pip install av")
+
+    errors = []
+    for backend in backends:
+        container = av.open(path, mode="w")
+        try:
+            stream = container.add_stream(backend.codec, rate=rate)
+            stream.width = resolution[0]
+            stream.height = resolution[1]
+            stream.pix_fmt = backend.pix_fmt
+            if time_base is not None:
+                stream.codec_context.time_base = time_base
+            if backend.options:
+                stream.options = dict(backend.options)
+            stream.codec_context.open()
+            return container, stream, backend
+        except Exception as exc:
+            errors.append(f"{backend.name}: {exc}")
+            logger.warning("Encoder %s unavailable, trying next: %s", backend.name, exc)
+            try:
+                container.close()
+            except Exception:
+                pass
+
+    raise RuntimeError(f"No video encoder could be opened for {path}: {'; '.join(errors)}")
+
+
+# ---------------------------------------------------------------------------
+# Cached selection
+
+
+class CodecBenchmarkCache:
+    """Benchmark results per (camera fingerprint, resolution), memory + JSON file.
+
+    Entries are discarded when the FFmpeg build changes, since encoder
+    availability and speed depend on it.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    @staticmethod
+    def key(
+        fingerprint: Optional[str],
+        resolution: tuple[int, int],
+        source_format: str = "bgr24",
+    ) -> str:
+        key = f"{fingerprint or 'default'}|{resolution[0]}x{resolution[1]}"
+        return key if source_format == "bgr24" else f"{key}|{source_format}"
+
+    def get(self, key: str) -> Optional[List[BenchmarkResult]]:
+        with self._lock:
+            entries = self._load()
+            raw = entries.get(key)
+        if not raw:
+            return None
+        try:
+            return [BenchmarkResult(**item) for item in raw]
+        except TypeError:
+            return None
+
+    def put(self, key: str, results: Sequence[BenchmarkResult]) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = [asdict(r) for r in results]
+            self._save(entries)
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self._path is None or not self._path.exists():
+            return self._entries
+        try:
+            payload = json.loads(self._path.read_text("utf-8"))
+        except Exception:
+            logger.warning("Codec benchmark cache unreadable; starting fresh")
+            return self._entries
+        if (
+            isinstance(payload, dict)
+            and payload.get("schema") == CACHE_SCHEMA_VERSION
+            and payload.get("ffmpeg") == _ffmpeg_build()
+            and isinstance(payload.get("entries"), dict)
+        ):
+            self._entries = payload["entries"]
+        return self._entries
+
+    def _save(self, entries: Dict[str, List[Dict[str, Any]]]) -> None:
+        if self._path is None:
+            return
+        payload = {"schema": CACHE_SCHEMA_VERSION, "ffmpeg": _ffmpeg_build(), "entries": entries}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(payload, indent=2, sort_keys=True), "utf-8")
+        except Exception:
+            logger.warning("Failed to write codec benchmark cache %s", self._path, exc_info=True)
+
+
+def _ffmpeg_build() -> str:
+    if not _HAS_PYAV:
+        return ""
+    versions = getattr(av, "library_versions", {}) or {}
+    libavcodec = versions.get("libavcodec")
+    return f"{av.__version__}/{'.'.join(str(v) for v in libavcodec) if libavcodec else '?'}"
+
+
+_default_cache: Optional[CodecBenchmarkCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache() -> CodecBenchmarkCache:
+    """Process-wide cache persisted under the user state directory."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            from rpi_logger.core.paths import USER_STATE_DIR
+            _default_cache = CodecBenchmarkCache(USER_STATE_DIR / CACHE_FILENAME)
+        return _default_cache
+
+
+def select_backend(
+    resolution: tuple[int, int],
+    target_fps: float,
+    *,
+    fingerprint: Optional[str] = None,
+    families: Optional[Sequence[str]] = None,
+    container: Optional[str] = None,
+    source_format: str = "bgr24",
+    cache: Optional[CodecBenchmarkCache] = None,
+) -> Optional[CodecBackend]:
+    """Select the encoder backend for a camera (blocking; may benchmark).
+
+    Args:
+        resolution: Recording resolution (width, height)
+        target_fps: Frame rate the encoder must sustain
+        fingerprint: Camera fingerprint (CapabilityValidator.fingerprint)
+        families: Restrict to these bitstream families (e.g. ("h264",))
+        container: Restrict to backends muxable into this container ("mp4")
+        source_format: Pixel layout frames arrive in ("bgr24" or "yuv420p")
+        cache: Benchmark cache (defaults to the process-wide on-disk cache)
+
+    Returns:
+        Chosen backend, or None when PyAV is unavailable.
+    """
+    if not _HAS_PYAV:
+        return None
+
+    cache = cache if cache is not None else default_cache()
+    key = CodecBenchmarkCache.key(fingerprint, resolution, source_format)
+    results = cache.get(key)
+    if results is None:
+        # Benchmark every available backend once so later calls with other
+        # filters (e.g. mp4 vs avi) are served from the cache
+        results = []
+        for backend in probe_available():
+            result = benchmark_backend(
+                backend, resolution, fps=target_fps or 30.0, source_format=source_format,
+            )
+            logger.debug(
+                "Codec benchmark %s @ %dx%d: ok=%s fps=%.1f cpu=%.1fms %s",
+                backend.name, resolution[0], resolution[1],
+                result.ok, result.fps, result.cpu_ms_per_frame, result.error,
+            )
+            results.append(result)
+        cache.put(key, results)
+
+    chosen = choose_backend(results, target_fps, families=families, container=container)
+    if chosen is not None:
+        logger.info(
+            "Selected %s encoder for %dx%d @ %.1f fps",
+            chosen.name, resolution[0], resolution[1], target_fps,
+        )
+    return chosen
+
+
+__all__ = [
+    "CodecBackend",
+    "BenchmarkResult",
+    "CodecBenchmarkCache",
+    "register_backend",
+    "get_backend",
+    "registered_backends",
+    "probe_available",
+    "benchmark_backend",
+    "choose_backend",
+    "select_backend",
+    "fallback_chain",
+    "open_video_output",
+    "default_cache",
+    "SOFTWARE_FALLBACKS",
+]
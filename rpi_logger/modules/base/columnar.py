@@ -0,0 +1,370 @@
+"""
+Columnar sidecar format for high-rate sample streams.
+
+A stream recorded with ``data_format = npy`` is written as:
+
+- ``<name>.npy`` - a standard NumPy ``.npy`` file holding one structured
+  array (one field per variable column). Rows are appended in chunks and
+  the header's row count is rewritten on flush/close; readers derive the
+  row count from the file size, so a file cut short by a crash still loads.
+  ``numpy.load(path, mmap_mode="r")`` works on a cleanly closed file.
+  A restarted recording of the same stream extends the file.
+- ``<name>.npy.json`` - the schema: the legacy CSV header, the constant
+  leading fields (trial, module, device_id, label) and the CSV format of
+  each column.
+
+Rows are stored as native values (NaN / ``MISSING_INT`` when a value is
+absent), so recording costs a memcpy per chunk instead of string
+formatting per field. ``columnar_to_csv`` (or ``rpi-logger-csv``)
+regenerates the exact legacy CSV offline.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+DATA_FORMATS = ("csv", "npy")
+DEFAULT_DATA_FORMAT = "csv"
+
+FORMAT_NAME = "rpi_logger.columnar"
+FORMAT_VERSION = 1
+SCHEMA_SUFFIX = ".json"
+
+# Marker for a missing value in integer columns (floats use NaN)
+MISSING_INT = np.iinfo(np.int64).min
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+@dataclass(frozen=True)
+class Column:
+    """One variable CSV column.
+
+    ``dtype`` is a numpy dtype string: ``"f8"``, ``"i8"``, ``"S<n>"`` or
+    ``"U<n>"``. ``fmt`` is a printf format for float columns; None formats
+    ``%.9f`` with trailing zeros trimmed (the modules' ``_fmt`` style).
+    """
+
+    name: str
+    dtype: str
+    fmt: Optional[str] = None
+
+
+def normalize_data_format(value: Any) -> str:
+    """Return ``value`` as a known data format, falling back to CSV."""
+    text = str(value or "").strip().lower()
+    if text in DATA_FORMATS:
+        return text
+    if text:
+        logger.warning("Unknown data_format %r, using %s", value, DEFAULT_DATA_FORMAT)
+    return DEFAULT_DATA_FORMAT
+
+
+def columns_dtype(columns: Sequence[Column]) -> np.dtype:
+    return np.dtype([(column.name, column.dtype) for column in columns])
+
+
+def as_float(value: Any) -> float:
+    """Value for a float column (NaN when absent or not numeric)."""
+    if value is None:
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def as_int(value: Any) -> int:
+    """Value for an int column (MISSING_INT when absent or not numeric)."""
+    if value is None:
+        return MISSING_INT
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return MISSING_INT
+
+
+# =============================================================================
+# CSV formatting
+# =============================================================================
+
+
+def _quote(text: str) -> str:
+    if any(ch in text for ch in ',"\n\r'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def csv_join(fields: Iterable[Any]) -> str:
+    """Join fields into one CSV line (no terminator), quoting as needed."""
+    return ",".join(_quote("" if field is None else str(field)) for field in fields)
+
+
+def format_column(values: np.ndarray, column: Column) -> List[str]:
+    """Format one column of a chunk; missing values become empty fields."""
+    kind = values.dtype.kind
+    if kind == "f":
+        text = np.char.mod(column.fmt or "%.9f", values)
+        if column.fmt is None:
+            text = np.char.rstrip(np.char.rstrip(text, "0"), ".")
+        text[np.isnan(values)] = ""
+        return text.tolist()
+    if kind in "iu":
+        text = np.char.mod("%d", values)
+        if kind == "i":
+            text[values == MISSING_INT] = ""
+        return text.tolist()
+    if kind == "S":
+        return [_quote(value.decode("utf-8", "replace")) for value in values.tolist()]
+    return [_quote(str(value)) for value in values.tolist()]
+
+
+def format_csv_rows(chunk: np.ndarray, columns: Sequence[Column], line_prefix: str = "") -> str:
+    """Format a structured chunk as newline-terminated CSV rows."""
+    formatted = [format_column(chunk[column.name], column) for column in columns]
+    return "".join(line_prefix + ",".join(fields) + "\n" for fields in zip(*formatted))
+
+
+# =============================================================================
+# .npy sidecar
+# =============================================================================
+
+
+def columnar_path(csv_path: Union[str, Path]) -> Path:
+    """Sidecar data path that replaces ``csv_path`` in npy mode."""
+    return Path(csv_path).with_suffix(".npy")
+
+
+def schema_path(data_path: Union[str, Path]) -> Path:
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.name + SCHEMA_SUFFIX)
+
+
+def _npy_header(dtype: np.dtype, rows: int, size: Optional[int] = None) -> bytes:
+    """Version 1.0 .npy header; ``size`` pins its length so it can be rewritten."""
+    text = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(dtype),
+        rows,
+    )
+    if size is None:
+        # Leave room for a 20-digit row count and align data to 64 bytes
+        size = -(-(len(_NPY_MAGIC) + 2 + len(text) + 20 + 1) // 64) * 64
+    padding = size - len(_NPY_MAGIC) - 2 - len(text) - 1
+    if padding < 0:
+        raise ValueError("npy header does not fit its reserved size")
+    text = text + " " * padding + "\n"
+    if len(text) > 0xFFFF:
+        raise ValueError("Too many columns for a version 1.0 npy header")
+    return _NPY_MAGIC + struct.pack("<H", len(text)) + text.encode("latin1")
+
+
+class ColumnarFile:
+    """Append-only structured ``.npy`` file plus its JSON schema.
+
+    Not thread-safe: use from one writer thread (or the event loop).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        columns: Sequence[Column],
+        *,
+        csv_header: Sequence[str],
+        prefix_fields: Sequence[Any] = (),
+        metadata: Optional[Dict[str, Any]] = None,
+        append: bool = False,
+    ) -> None:
+        """Create the file, or with ``append`` extend an existing one.
+
+        Appending keeps every complete row already on disk (dropping a
+        partial row left by a crash) and raises ValueError if the existing
+        file holds a different stream (columns, header or prefix).
+        """
+        self.path = Path(path)
+        self.columns = tuple(columns)
+        self.dtype = columns_dtype(self.columns)
+        self._schema = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "csv_name": self.path.with_suffix(".csv").name,
+            "csv_header": list(csv_header),
+            "prefix": ["" if value is None else str(value) for value in prefix_fields],
+            "columns": [asdict(column) for column in self.columns],
+            "metadata": dict(metadata or {}),
+            "rows": 0,
+        }
+        if len(self._schema["prefix"]) + len(self.columns) != len(self._schema["csv_header"]):
+            raise ValueError("CSV header must cover the prefix fields and every column")
+
+        self._header_size = len(_npy_header(self.dtype, 0))
+        self.rows_written = 0
+        if append and self.path.exists() and schema_path(self.path).exists():
+            self._file = self._reopen()
+            self.flush()
+        else:
+            self._file = open(self.path, "w+b")
+            self._file.write(_npy_header(self.dtype, 0, self._header_size))
+        self._write_schema()
+
+    def _reopen(self) -> BinaryIO:
+        existing = json.loads(schema_path(self.path).read_text(encoding="utf-8"))
+        for key in ("format", "csv_header", "prefix", "columns"):
+            if existing.get(key) != self._schema[key]:
+                raise ValueError(f"{self.path} holds a different stream ({key} differs); not appending")
+        file = open(self.path, "r+b")
+        try:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                np.lib.format.read_array_header_1_0(file)
+            else:
+                np.lib.format.read_array_header_2_0(file)
+            if file.tell() != self._header_size:
+                raise ValueError(f"{self.path} has an unexpected npy header; not appending")
+            size = file.seek(0, os.SEEK_END)
+            self.rows_written = (size - self._header_size) // self.dtype.itemsize
+            file.truncate(self._header_size + self.rows_written * self.dtype.itemsize)
+            file.seek(0, os.SEEK_END)
+        except Exception:
+            file.close()
+            raise
+        return file
+
+    def write(self, rows: Union[np.ndarray, Sequence[tuple]]) -> int:
+        """Append rows (a chunk of ``dtype`` or tuples in column order)."""
+        if self._file is None:
+            raise RuntimeError("Columnar file is closed")
+        if isinstance(rows, np.ndarray) and rows.dtype == self.dtype:
+            chunk = rows
+        else:
+            chunk = np.array(list(rows), dtype=self.dtype)
+        if len(chunk):
+            self._file.write(np.ascontiguousarray(chunk).tobytes())
+            self.rows_written += len(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        """Write buffered rows and update the header's row count."""
+        file = self._file
+        if file is None:
+            return
+        file.seek(0)
+        file.write(_npy_header(self.dtype, self.rows_written, self._header_size))
+        file.seek(0, os.SEEK_END)
+        file.flush()
+
+    def fileno(self) -> int:
+        if self._file is None:
+            raise ValueError("Columnar file is closed")
+        return self._file.fileno()
+
+    def close(self, fsync: bool = False) -> None:
+        file = self._file
+        if file is None:
+            return
+        try:
+            self.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        finally:
+            file.close()
+            self._file = None
+        self._schema["rows"] = self.rows_written
+        self._write_schema()
+
+    def _write_schema(self) -> None:
+        schema_path(self.path).write_text(json.dumps(self._schema, indent=2), encoding="utf-8")
+
+    @property
+    def bytes_written(self) -> int:
+        return self._header_size + self.rows_written * self.dtype.itemsize
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+
+def load_columnar(path: Union[str, Path]) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Memory-map a columnar file; returns ``(rows, schema)``.
+
+    The row count comes from the file size, so a file whose writer died
+    before closing loads every complete row.
+    """
+    path = Path(path)
+    schema = json.loads(schema_path(path).read_text(encoding="utf-8"))
+    if schema.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} is not a {FORMAT_NAME} file")
+    with open(path, "rb") as fp:
+        version = np.lib.format.read_magic(fp)
+        if version == (1, 0):
+            _shape, _fortran, dtype = np.lib.format.read_array_header_1_0(fp)
+        else:
+            _shape, _fortran, dtype = np.lib.format.read_array_header_2_0(fp)
+        offset = fp.tell()
+    rows = (path.stat().st_size - offset) // dtype.itemsize
+    if rows <= 0:
+        return np.empty(0, dtype=dtype), schema
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,)), schema
+
+
+def columnar_to_csv(
+    path: Union[str, Path],
+    csv_path: Optional[Union[str, Path]] = None,
+    *,
+    chunk_rows: int = 65536,
+) -> Path:
+    """Regenerate the legacy CSV for a columnar file.
+
+    Returns:
+        Path of the CSV written (next to the ``.npy`` unless ``csv_path``)
+    """
+    path = Path(path)
+    rows, schema = load_columnar(path)
+    target = Path(csv_path) if csv_path is not None else path.with_name(schema["csv_name"])
+    columns = [Column(**column) for column in schema["columns"]]
+    line_prefix = csv_join(schema["prefix"]) + "," if schema["prefix"] else ""
+
+    with open(target, "w", encoding="utf-8", newline="") as handle:
+        handle.write(csv_join(schema["csv_header"]) + "\n")
+        for start in range(0, len(rows), max(1, chunk_rows)):
+            handle.write(format_csv_rows(rows[start:start + chunk_rows], columns, line_prefix))
+    return target
+
+
+def find_columnar_files(root: Union[str, Path]) -> List[Path]:
+    """Every columnar data file (``.npy`` with a schema) under ``root``."""
+    root = Path(root)
+    if root.is_file():
+        return [root] if schema_path(root).exists() else []
+    return sorted(path for path in root.rglob("*.npy") if schema_path(path).exists())
+
+
+__all__ = [
+    "Column",
+    "ColumnarFile",
+    "DATA_FORMATS",
+    "DEFAULT_DATA_FORMAT",
+    "MISSING_INT",
+    "as_float",
+    "as_int",
+    "columnar_path",
+    "columnar_to_csv",
+    "columns_dtype",
+    "csv_join",
+    "find_columnar_files",
+    "format_column",
+    "format_csv_rows",
+    "load_columnar",
+    "normalize_data_format",
+    "schema_path",
+]
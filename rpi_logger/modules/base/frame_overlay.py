@@ -0,0 +1,342 @@
+"""
+Text overlay engine for burned-in frame annotations.
+
+Drawing the timestamp with cv2.putText (anti-aliased) on a copy of every
+frame costs time proportional to the frame size plus the rasterization of
+every glyph. This engine instead:
+
+- Rasterizes each character of a fixed set once into a GlyphAtlas
+  (premultiplied colour + alpha per glyph, optional outline).
+- Keeps a TextOverlay strip of the last rendered text and re-blits only
+  the character cells that changed (typically the last few digits).
+- Blends just the strip's region of interest into the frame in place
+  (two saturating cv2 ops on uint8), so the cost depends on the text
+  length, not the frame resolution.
+
+Glyphs sit in fixed-width cells, so changing digits never shift their
+neighbours.
+"""
+from __future__ import annotations
+
+import string
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Characters needed for timestamps, frame numbers and short labels
+DEFAULT_CHARSET = string.digits + string.ascii_letters + " -:.#/_()%+,"
+
+
+class GlyphAtlas:
+    """Pre-rasterized glyphs for one font, scale, stroke and colour scheme."""
+
+    def __init__(
+        self,
+        font_scale: float = 0.5,
+        thickness: int = 1,
+        color: tuple[int, int, int] = (255, 255, 255),
+        *,
+        outline_color: Optional[tuple[int, int, int]] = None,
+        outline_thickness: int = 0,
+        font: int = cv2.FONT_HERSHEY_SIMPLEX,
+        charset: str = DEFAULT_CHARSET,
+    ) -> None:
+        """Rasterize ``charset``.
+
+        Args:
+            font_scale: cv2.putText font scale
+            thickness: Stroke thickness of the text
+            color: Text colour in the frame's channel order (e.g. BGR)
+            outline_color: Colour of an outline drawn under the text (None = no outline)
+            outline_thickness: Stroke thickness of the outline
+            font: OpenCV Hershey font
+            charset: Characters available; others render as blanks
+        """
+        has_outline = outline_color is not None and outline_thickness > 0
+        stroke = max(thickness, outline_thickness if has_outline else 0)
+        # Anti-aliased strokes spill past the advance; glyphs carry this margin
+        self.pad = stroke // 2 + 2
+
+        sizes = {ch: cv2.getTextSize(ch, font, font_scale, thickness) for ch in charset}
+        self.ascent = max(h for (_, h), _ in sizes.values()) + self.pad
+        descent = max(b for _, b in sizes.values()) + self.pad
+        self.cell_height = self.ascent + descent
+
+        # In-string advance (a lone glyph's text size includes end bearings)
+        advances = {
+            ch: cv2.getTextSize(ch * 2, font, font_scale, thickness)[0][0] - sizes[ch][0][0]
+            for ch in charset
+        }
+        self.max_advance = max(max(advances.values()), max(w for (w, _), _ in sizes.values()))
+
+        self._advance: dict[str, int] = {}
+        self._inv_alpha: dict[str, np.ndarray] = {}
+        self._premul: dict[str, np.ndarray] = {}
+        for ch, advance in advances.items():
+            width = max(advance, sizes[ch][0][0])
+            shape = (self.cell_height, width + 2 * self.pad)
+            inv_alpha, premul = self._rasterize(
+                ch, shape, font, font_scale, thickness, color,
+                outline_color if has_outline else None, outline_thickness,
+            )
+            self._advance[ch] = advance
+            self._inv_alpha[ch] = inv_alpha
+            self._premul[ch] = premul
+
+        space = self._advance.get(" ", self.max_advance)
+        self._blank = (
+            space,
+            np.full((self.cell_height, space + 2 * self.pad, 3), 255, np.uint8),
+            np.zeros((self.cell_height, space + 2 * self.pad, 3), np.uint8),
+        )
+
+    def _rasterize(
+        self,
+        ch: str,
+        shape: tuple[int, int],
+        font: int,
+        font_scale: float,
+        thickness: int,
+        color: tuple[int, int, int],
+        outline_color: Optional[tuple[int, int, int]],
+        outline_thickness: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """255 - alpha and colour premultiplied by alpha (both uint8, 3 channels) for one glyph."""
+        origin = (self.pad, self.ascent)
+
+        def mask(stroke: int) -> np.ndarray:
+            canvas = np.zeros(shape, np.uint8)
+            cv2.putText(canvas, ch, origin, font, font_scale, 255, stroke, cv2.LINE_AA)
+            return canvas.astype(np.float32)[..., None] / 255.0
+
+        text_a = mask(thickness)
+        text_c = np.asarray(color, np.float32)
+        if outline_color is not None:
+            out_a = mask(outline_thickness)
+            out_c = np.asarray(outline_color, np.float32)
+            # Text composited over its outline
+            alpha = text_a + out_a * (1.0 - text_a)
+            premul = text_c * text_a + out_c * out_a * (1.0 - text_a)
+        else:
+            alpha = text_a
+            premul = text_c * text_a
+
+        inv_alpha = np.rint((1.0 - alpha) * 255.0).astype(np.uint8)
+        return (
+            np.repeat(inv_alpha, 3, axis=2),
+            np.rint(premul).clip(0, 255).astype(np.uint8),
+        )
+
+    def glyph(self, ch: str) -> tuple[int, np.ndarray, np.ndarray]:
+        """(advance, 255 - alpha, premultiplied colour) for ``ch``.
+
+        The bitmaps have ``pad`` columns left of the glyph origin and at
+        least ``pad`` right of the advance. Characters outside the charset
+        render as blanks.
+        """
+        inv_alpha = self._inv_alpha.get(ch)
+        if inv_alpha is None:
+            return self._blank
+        return self._advance[ch], inv_alpha, self._premul[ch]
+
+
+@lru_cache(maxsize=16)
+def get_glyph_atlas(
+    font_scale: float = 0.5,
+    thickness: int = 1,
+    color: tuple[int, int, int] = (255, 255, 255),
+    outline_color: Optional[tuple[int, int, int]] = None,
+    outline_thickness: int = 0,
+) -> GlyphAtlas:
+    """Shared atlas for a style (atlases are read-only once built)."""
+    return GlyphAtlas(
+        font_scale,
+        thickness,
+        color,
+        outline_color=outline_color,
+        outline_thickness=outline_thickness,
+    )
+
+
+class TextOverlay:
+    """One line of text composited into frames at a fixed position.
+
+    Not thread-safe; use one instance per producer (e.g. per encoder).
+    """
+
+    def __init__(self, atlas: GlyphAtlas, origin: tuple[int, int], max_chars: int = 48) -> None:
+        """Initialize overlay.
+
+        Args:
+            atlas: Glyphs to draw with
+            origin: Baseline-left text position, as for cv2.putText
+            max_chars: Longest text supported; longer text is truncated
+        """
+        self._atlas = atlas
+        # Strip column 0 maps to frame column _x (one pad left of the origin)
+        self._x = origin[0] - atlas.pad
+        self._y = origin[1] - atlas.ascent
+        self._max_chars = max_chars
+        width = atlas.max_advance * (max_chars + 1) + 3 * atlas.pad
+        self._inv_alpha = np.full((atlas.cell_height, width, 3), 255, np.uint8)
+        self._premul = np.zeros((atlas.cell_height, width, 3), np.uint8)
+        self._scratch = np.empty_like(self._premul)
+        self._text = ""
+        self._offsets: list[int] = []  # Strip column of each glyph's origin
+        self._width = 0  # Strip columns in use
+        self.glyphs_rendered = 0  # Glyph blits so far (diagnostics)
+
+    def set_text(self, text: str) -> None:
+        """Update the strip, re-blitting only from the first changed glyph on.
+
+        Timestamps and counters change at the end, so usually only the last
+        few digits (and the neighbour whose fringe they touch) are redrawn.
+        """
+        text = text[: self._max_chars]
+        previous = self._text
+        if text == previous:
+            return
+        atlas = self._atlas
+
+        first = 0
+        while first < min(len(text), len(previous)) and text[first] == previous[first]:
+            first += 1
+
+        offsets = self._offsets[:first]
+        x = offsets[-1] + atlas.glyph(text[first - 1])[0] if first else atlas.pad
+        glyphs = []
+        for ch in text[first:]:
+            glyph = atlas.glyph(ch)
+            offsets.append(x)
+            glyphs.append(glyph)
+            x += glyph[0]
+        width = x + 2 * atlas.pad
+
+        # Clear everything from the left edge of the first changed glyph's
+        # bitmap (``pad`` left of its origin); the neighbour is redrawn below
+        clear_from = self._offsets[first] if first < len(self._offsets) else width
+        clear_from = min(clear_from, offsets[first] if first < len(offsets) else clear_from)
+        clear_from = max(clear_from - atlas.pad, 0)
+        self._inv_alpha[:, clear_from:max(width, self._width)] = 255
+        self._premul[:, clear_from:max(width, self._width)] = 0
+
+        # Redraw the previous glyph too: its fringe may reach into the cleared part
+        if first:
+            self._blit(offsets[first - 1], atlas.glyph(text[first - 1]))
+        for offset, glyph in zip(offsets[first:], glyphs):
+            self._blit(offset, glyph)
+
+        self._text = text
+        self._offsets = offsets
+        self._width = width if text else 0
+
+    def _blit(self, offset: int, glyph: tuple[int, np.ndarray, np.ndarray]) -> None:
+        """Composite one glyph into the strip.
+
+        Glyph bitmaps only overlap in their anti-aliased fringes, so taking
+        the more opaque alpha and brighter colour there is indistinguishable
+        from exact compositing (and exact everywhere else).
+        """
+        _, inv_alpha, premul = glyph
+        x0 = offset - self._atlas.pad
+        cols = slice(x0, x0 + inv_alpha.shape[1])
+        strip_inv = self._inv_alpha[:, cols]
+        strip_premul = self._premul[:, cols]
+        np.minimum(strip_inv, inv_alpha, out=strip_inv)
+        np.maximum(strip_premul, premul, out=strip_premul)
+        self.glyphs_rendered += 1
+
+    def bounds(self, frame_shape: tuple[int, ...]) -> Optional[tuple[slice, slice]]:
+        """(rows, cols) slices of the frame the current text covers, or None."""
+        if not self._width:
+            return None
+        fh, fw = frame_shape[:2]
+        x0, y0 = max(self._x, 0), max(self._y, 0)
+        x1 = min(self._x + self._width, fw)
+        y1 = min(self._y + self._atlas.cell_height, fh)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return slice(y0, y1), slice(x0, x1)
+
+    def render(self, frame: np.ndarray, text: Optional[str] = None) -> np.ndarray:
+        """Blend the text into ``frame`` in place and return it.
+
+        Only the text's bounding region is touched. Frames may be any
+        resolution; the region is clipped to the frame.
+        """
+        if text is not None:
+            self.set_text(text)
+        region = self.bounds(frame.shape)
+        if region is None:
+            return frame
+
+        rows, cols = region
+        sy0, sx0 = rows.start - self._y, cols.start - self._x
+        strip = (
+            slice(sy0, sy0 + rows.stop - rows.start),
+            slice(sx0, sx0 + cols.stop - cols.start),
+        )
+        inv_alpha = self._inv_alpha[strip]
+        premul = self._premul[strip]
+
+        roi = frame[rows, cols]
+        if roi.ndim == 3 and roi.shape[2] == 3 and roi.dtype == np.uint8:
+            # roi = roi * (255 - alpha) / 255 + premul, saturating, in place
+            scratch = self._scratch[strip]
+            cv2.multiply(roi, inv_alpha, dst=scratch, scale=1.0 / 255.0)
+            cv2.add(scratch, premul, dst=roi)
+        elif roi.ndim == 2:
+            # Grayscale frame: blend the mean of the colour channels
+            blended = (
+                roi.astype(np.uint16) * inv_alpha[..., 0] // 255
+                + premul.mean(axis=2).astype(np.uint16)
+            )
+            roi[...] = np.minimum(blended, 255)
+        else:
+            roi = roi[..., :3]
+            blended = roi.astype(np.uint16) * inv_alpha // 255 + premul
+            roi[...] = np.minimum(blended, 255)
+        return frame
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+
+class TimestampFormatter:
+    """Formats ``YYYY-MM-DDTHH:MM:SS.mmm #N`` with the date part cached per second."""
+
+    def __init__(self) -> None:
+        self._second: Optional[int] = None
+        self._prefix = ""
+        self._lock = threading.Lock()
+
+    def format(self, timestamp: float, frame_number: Optional[int] = None) -> str:
+        second = int(timestamp // 1)
+        millis = int((timestamp % 1) * 1000)
+        with self._lock:
+            if second != self._second:
+                dt = datetime.fromtimestamp(second, tz=timezone.utc)
+                self._prefix = dt.strftime("%Y-%m-%dT%H:%M:%S")
+                self._second = second
+            prefix = self._prefix
+        if frame_number is None:
+            return f"{prefix}.{millis:03d}"
+        return f"{prefix}.{millis:03d} #{frame_number}"
+
+
+__all__ = [
+    "DEFAULT_CHARSET",
+    "GlyphAtlas",
+    "TextOverlay",
+    "TimestampFormatter",
+    "get_glyph_atlas",
+]
@@ -0,0 +1,152 @@
+"""
+Pre-trigger ("pre-roll") buffering shared by recording modules.
+
+A PreRollBuffer keeps the most recent ``window`` seconds of already-encoded
+data (video packets, PCM blocks) so a recording can start with what
+happened just before the record command. Memory is bounded twice: by the
+time window and by ``max_bytes``, whichever is hit first.
+
+Items carry a ``keyframe`` flag. Eviction always leaves a keyframe at the
+head, so a drained buffer can be decoded from its first item (for audio,
+every item is a keyframe).
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PREROLL_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class PreRollStats:
+    """Snapshot of a pre-roll buffer's contents."""
+
+    items: int = 0
+    bytes: int = 0
+    seconds: float = 0.0  # Span from oldest to newest item
+    max_bytes: int = 0
+    evicted: int = 0  # Items dropped so far (window or memory cap)
+    capped: int = 0  # Of those, items dropped because of max_bytes
+
+
+@dataclass(slots=True)
+class _Entry(Generic[T]):
+    item: T
+    timestamp: float
+    nbytes: int
+    keyframe: bool
+
+
+class PreRollBuffer(Generic[T]):
+    """Thread-safe time-window ring of encoded items, capped in bytes."""
+
+    def __init__(self, window: float, max_bytes: int = DEFAULT_PREROLL_MAX_BYTES) -> None:
+        """Initialize buffer.
+
+        Args:
+            window: Seconds of data to keep (by item timestamp)
+            max_bytes: Hard memory cap for buffered payloads
+        """
+        self._window = max(0.0, float(window))
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: deque[_Entry[T]] = deque()
+        self._bytes = 0
+        self._evicted = 0
+        self._capped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def append(self, item: T, timestamp: float, nbytes: int, keyframe: bool = True) -> None:
+        """Add an item (``timestamp`` is monotonic seconds) and evict old data.
+
+        Non-keyframe items are dropped while the buffer is empty: they
+        cannot be decoded without the keyframe before them.
+        """
+        with self._lock:
+            if not self._entries and not keyframe:
+                self._evicted += 1
+                return
+            self._entries.append(_Entry(item, timestamp, nbytes, keyframe))
+            self._bytes += nbytes
+            self._evict(timestamp)
+
+    def _evict(self, now: float) -> None:
+        entries = self._entries
+        while entries and (now - entries[0].timestamp > self._window or self._bytes > self._max_bytes):
+            over_cap = self._bytes > self._max_bytes
+            self._drop_head(over_cap)
+            # Never leave the buffer starting mid-GOP
+            while entries and not entries[0].keyframe:
+                self._drop_head(over_cap)
+
+    def _drop_head(self, over_cap: bool) -> None:
+        entry = self._entries.popleft()
+        self._bytes -= entry.nbytes
+        self._evicted += 1
+        if over_cap:
+            self._capped += 1
+
+    def drain(self) -> list[T]:
+        """Remove and return all buffered items, oldest first."""
+        with self._lock:
+            items = [entry.item for entry in self._entries]
+            self._entries.clear()
+            self._bytes = 0
+            return items
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> PreRollStats:
+        with self._lock:
+            seconds = self._entries[-1].timestamp - self._entries[0].timestamp if self._entries else 0.0
+            return PreRollStats(
+                items=len(self._entries),
+                bytes=self._bytes,
+                seconds=seconds,
+                max_bytes=self._max_bytes,
+                evicted=self._evicted,
+                capped=self._capped,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def log_preroll_flush(log: Any, name: str, stats: PreRollStats) -> None:
+    """Log what a pre-roll flush contributed to a recording."""
+    log.info(
+        "%s pre-roll: %d items, %.2f s, %.1f MiB (cap %.0f MiB, %d evicted by cap)",
+        name,
+        stats.items,
+        stats.seconds,
+        stats.bytes / (1024 * 1024),
+        stats.max_bytes / (1024 * 1024),
+        stats.capped,
+    )
+
+
+__all__ = [
+    "DEFAULT_PREROLL_MAX_BYTES",
+    "PreRollBuffer",
+    "PreRollStats",
+    "log_preroll_flush",
+]
@@ -0,0 +1,350 @@
+"""
+Shared camera preview pipeline: frame -> PPM -> Tk canvas.
+
+Preview frames are tiny compared to capture frames, so every step works at
+preview size:
+
+- Conversion resizes first and converts colour afterwards. I420 frames are
+  downscaled plane by plane (Y, U, V) and converted from a small I420
+  buffer, never from the full frame.
+- PreviewSurface keeps one PhotoImage per canvas and reloads it in place
+  instead of creating a new image (and canvas item) per frame.
+- PreviewPacer decides whether a preview frame is wanted at all: not while
+  the canvas is hidden (other tab, minimized window), not while the previous
+  frame is still queued for the UI thread, and not faster than the UI thread
+  can draw within its budget (measured Tk render time).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+
+logger = get_module_logger(__name__)
+
+
+def preview_size(size: tuple[int, int], scale: float, *, even: bool = False) -> tuple[int, int]:
+    """Preview (width, height) for a frame ``size`` at ``scale``; never upscales.
+
+    ``even`` rounds down to even dimensions (required for I420 buffers).
+    """
+    width, height = size
+    scale = min(scale, 1.0)
+    new_w = max(1, int(width * scale))
+    new_h = max(1, int(height * scale))
+    if even:
+        new_w = max(2, new_w & ~1)
+        new_h = max(2, new_h & ~1)
+    return new_w, new_h
+
+
+def _ppm(rgb: np.ndarray) -> bytes:
+    height, width = rgb.shape[:2]
+    return f"P6\n{width} {height}\n255\n".encode("ascii") + rgb.tobytes()
+
+
+def bgr_to_ppm(data: np.ndarray, scale: float = 1.0) -> bytes:
+    """BGR (or grayscale) frame to an RGB PPM, resized before conversion."""
+    height, width = data.shape[:2]
+    target = preview_size((width, height), scale)
+    if target != (width, height):
+        data = cv2.resize(data, target, interpolation=cv2.INTER_NEAREST)
+    if data.ndim == 2:
+        return _ppm(cv2.cvtColor(data, cv2.COLOR_GRAY2RGB))
+    return _ppm(cv2.cvtColor(data, cv2.COLOR_BGR2RGB))
+
+
+def yuv420_to_ppm(data: np.ndarray, size: tuple[int, int], scale: float = 1.0) -> bytes:
+    """I420 frame (optionally stride-padded) to an RGB PPM at preview size.
+
+    ``data`` is the (height * 3 / 2, stride) buffer as delivered by the
+    camera, or its flat equivalent; ``size`` is the visible (width, height).
+    """
+    return _ppm(_yuv420_preview(data, size, scale, cv2.COLOR_YUV2RGB_I420))
+
+
+def _yuv420_preview(data: np.ndarray, size: tuple[int, int], scale: float, code: int) -> np.ndarray:
+    width, height = size
+    if data.ndim != 2:
+        data = data.reshape((height + height // 2, -1))
+    stride = data.shape[1]
+    target_w, target_h = preview_size(size, scale, even=True)
+
+    if (target_w, target_h) == (width, height) or height % 4 or stride % 2 or not data.flags.c_contiguous:
+        image = cv2.cvtColor(data, code)[:height, :width]
+        if (target_w, target_h) != (width, height):
+            image = cv2.resize(image, (target_w, target_h), interpolation=cv2.INTER_NEAREST)
+        return image
+
+    # Each chroma plane is height/4 buffer rows, i.e. height/2 rows of stride/2
+    quarter = height // 4
+    u = data[height:height + quarter].reshape(height // 2, stride // 2)[:, : width // 2]
+    v = data[height + quarter:height + 2 * quarter].reshape(height // 2, stride // 2)[:, : width // 2]
+
+    small = np.empty((target_h * 3 // 2, target_w), np.uint8)
+    cv2.resize(data[:height, :width], (target_w, target_h), dst=small[:target_h],
+               interpolation=cv2.INTER_NEAREST)
+    chroma = small[target_h:].reshape(2, target_h // 2, target_w // 2)
+    cv2.resize(u, (target_w // 2, target_h // 2), dst=chroma[0], interpolation=cv2.INTER_NEAREST)
+    cv2.resize(v, (target_w // 2, target_h // 2), dst=chroma[1], interpolation=cv2.INTER_NEAREST)
+    return cv2.cvtColor(small, code)
+
+
+def frame_to_ppm(
+    data: np.ndarray,
+    size: tuple[int, int],
+    color_format: str = "bgr",
+    scale: float = 1.0,
+) -> bytes:
+    """Convert a captured frame to PPM bytes for ``tk.PhotoImage``.
+
+    Args:
+        data: Frame buffer
+        size: Visible (width, height); stride padding beyond it is dropped
+        color_format: "bgr" (or grayscale) or "yuv420"
+        scale: Preview scale relative to ``size``; values above 1 are ignored
+    """
+    if color_format == "yuv420":
+        return yuv420_to_ppm(data, size, scale)
+    width, height = size
+    return bgr_to_ppm(data[:height, :width], scale)
+
+
+def frame_to_bgr(
+    data: np.ndarray,
+    size: tuple[int, int],
+    color_format: str = "bgr",
+    scale: float = 1.0,
+) -> np.ndarray:
+    """Convert a captured frame to a BGR (or grayscale) image at preview size.
+
+    Same arguments as ``frame_to_ppm``; for consumers that encode frames
+    themselves (shared-memory preview slots, MJPEG). The result may be a
+    view of ``data`` when no resize or conversion is needed.
+    """
+    if color_format == "yuv420":
+        return _yuv420_preview(data, size, scale, cv2.COLOR_YUV2BGR_I420)
+    width, height = size
+    data = data[:height, :width]
+    target = preview_size((width, height), scale)
+    if target != (width, height):
+        data = cv2.resize(data, target, interpolation=cv2.INTER_NEAREST)
+    return data
+
+
+class PreviewPacer:
+    """Decides when the capture side should produce a preview frame.
+
+    Thread-safe: ``acquire`` is called by the capture loop, ``complete`` and
+    ``set_visible`` by the UI thread.
+    """
+
+    def __init__(self, max_fps: float = 10.0, *, ui_budget: float = 0.25, smoothing: float = 0.2) -> None:
+        """Initialize pacer.
+
+        Args:
+            max_fps: Upper bound on preview rate (from settings)
+            ui_budget: Fraction of UI thread time previews may use; the
+                preview rate drops when Tk rendering gets slower
+            smoothing: EMA weight of the newest render time sample
+        """
+        self._lock = threading.Lock()
+        self._max_fps = max(max_fps, 0.1)
+        self._ui_budget = ui_budget
+        self._smoothing = smoothing
+        self._render_time = 0.0
+        self._visible = True
+        self._next_due = 0.0
+        self._in_flight_since: Optional[float] = None
+        self.skipped_hidden = 0  # Frames not converted because nothing shows them
+        self.skipped_busy = 0  # Frames not converted because the UI is behind
+
+    @property
+    def max_fps(self) -> float:
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, value: float) -> None:
+        self._max_fps = max(value, 0.1)
+
+    @property
+    def interval(self) -> float:
+        """Current seconds between preview frames."""
+        return max(1.0 / self._max_fps, self._render_time / self._ui_budget)
+
+    @property
+    def fps(self) -> float:
+        """Preview rate the pacer currently allows."""
+        return 1.0 / self.interval
+
+    @property
+    def render_time_ms(self) -> float:
+        return self._render_time * 1000.0
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    def set_visible(self, visible: bool) -> None:
+        with self._lock:
+            if visible and not self._visible:
+                self._next_due = 0.0  # Show a fresh frame right away
+                self._in_flight_since = None
+            self._visible = visible
+
+    def acquire(self, now: Optional[float] = None) -> bool:
+        """True if a preview frame should be produced now (monotonic ``now``).
+
+        A True result must be followed by ``complete`` (or ``abandon``);
+        an unanswered frame is forgotten after a few intervals.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._visible:
+                self.skipped_hidden += 1
+                return False
+            if now < self._next_due:
+                return False
+            interval = self.interval
+            if self._in_flight_since is not None and now - self._in_flight_since < max(1.0, 4 * interval):
+                self.skipped_busy += 1
+                return False
+            self._in_flight_since = now
+            # Advance by interval (not actual time) to prevent drift
+            next_due = self._next_due + interval if self._next_due else now + interval
+            self._next_due = next_due if next_due >= now else now + interval
+            return True
+
+    def complete(self, render_seconds: float) -> None:
+        """The UI thread finished drawing the frame in ``render_seconds``."""
+        with self._lock:
+            self._in_flight_since = None
+            if self._render_time:
+                self._render_time += self._smoothing * (render_seconds - self._render_time)
+            else:
+                self._render_time = render_seconds
+
+    def abandon(self) -> None:
+        """The acquired frame will not be drawn (conversion failed, no UI)."""
+        with self._lock:
+            self._in_flight_since = None
+
+
+class PreviewSurface:
+    """A persistent PhotoImage centred on a Tk canvas.
+
+    All methods must be called on the UI thread.
+    """
+
+    VISIBILITY_POLL_MS = 250
+
+    def __init__(self, canvas: Any, tk_module: Any, pacer: Optional[PreviewPacer] = None) -> None:
+        """Initialize surface.
+
+        Args:
+            canvas: Canvas to draw on (resize/map events are bound with add="+")
+            tk_module: The tkinter module
+            pacer: Pacer to report visibility and render time to
+        """
+        self._canvas = canvas
+        self._tk = tk_module
+        self._pacer = pacer
+        self._photo: Any = None
+        self._image_id: Any = None
+        self._photo_size = (0, 0)
+        self._poll_id: Any = None
+        self._closed = False
+        self.frames_rendered = 0
+
+        canvas.bind("<Configure>", self._on_configure, add="+")
+        canvas.bind("<Map>", lambda _e: self._update_visibility(), add="+")
+        canvas.bind("<Unmap>", lambda _e: self._set_visible(False), add="+")
+        self._poll_visibility()
+
+    def render(self, ppm_data: bytes) -> None:
+        """Load a PPM frame into the surface's PhotoImage."""
+        if self._closed:
+            return
+        start = time.perf_counter()
+        try:
+            if self._photo is None:
+                self._photo = self._tk.PhotoImage(master=self._canvas, data=ppm_data)
+            else:
+                # Reload in place; the canvas item keeps referencing the same image
+                self._photo.configure(data=ppm_data)
+
+            size = (self._photo.width(), self._photo.height())
+            if self._image_id is None:
+                self._image_id = self._canvas.create_image(*self._center(), image=self._photo, anchor="center")
+            elif size != self._photo_size:
+                self._canvas.coords(self._image_id, *self._center())
+            self._photo_size = size
+            self.frames_rendered += 1
+        finally:
+            if self._pacer:
+                self._pacer.complete(time.perf_counter() - start)
+
+    @property
+    def photo(self) -> Any:
+        return self._photo
+
+    @property
+    def image_id(self) -> Any:
+        return self._image_id
+
+    def close(self) -> None:
+        self._closed = True
+        if self._poll_id is not None:
+            try:
+                self._canvas.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._set_visible(False)
+
+    def _center(self) -> tuple[int, int]:
+        width = self._canvas.winfo_width()
+        height = self._canvas.winfo_height()
+        return (width // 2 if width > 1 else 0, height // 2 if height > 1 else 0)
+
+    def _on_configure(self, _event: Any) -> None:
+        if self._image_id is not None:
+            self._canvas.coords(self._image_id, *self._center())
+
+    def _update_visibility(self) -> None:
+        try:
+            viewable = bool(self._canvas.winfo_viewable())
+        except Exception:
+            viewable = False
+        self._set_visible(viewable)
+
+    def _set_visible(self, visible: bool) -> None:
+        if self._pacer and self._pacer.visible != visible:
+            logger.debug("Preview %s", "shown" if visible else "hidden")
+            self._pacer.set_visible(visible)
+
+    def _poll_visibility(self) -> None:
+        # Iconifying a window does not unmap its children; poll viewability
+        if self._closed:
+            return
+        self._update_visibility()
+        try:
+            self._poll_id = self._canvas.after(self.VISIBILITY_POLL_MS, self._poll_visibility)
+        except Exception:
+            self._poll_id = None
+
+
+__all__ = [
+    "PreviewPacer",
+    "PreviewSurface",
+    "bgr_to_ppm",
+    "frame_to_bgr",
+    "frame_to_ppm",
+    "preview_size",
+    "yuv420_to_ppm",
+]
@@ -0,0 +1,391 @@
+"""
+Shared-memory preview slots: a module's latest preview frame for any reader.
+
+Camera modules publish their newest preview frame (BGR or grayscale, at
+preview size) into a named shared-memory block. The master and its HTTP API
+read it in place instead of asking the module for a frame over stdin/stdout
+and shipping it back base64-encoded.
+
+Layout (little-endian)::
+
+    slot header   magic, version, state, latest buffer, capacity,
+                  frames published, reader heartbeat
+    buffer 0      seq, width, height, format, nbytes, frame number,
+                  timestamp | pixels (capacity bytes)
+    buffer 1      same
+
+- Double buffer: the writer fills the buffer ``latest`` does not point at
+  and flips ``latest`` afterwards, so a reader working on the current frame
+  is not overwritten underneath it unless it takes longer than a frame.
+- Seqlock per buffer: ``seq`` is odd while the writer is inside and grows by
+  two per frame. Readers compare it before and after; a changed ``seq``
+  means the read (or whatever was done with a view) must be discarded.
+- Readers stamp a heartbeat. Writers only convert and publish frames while
+  a reader looked within ``READER_TIMEOUT``, so unwatched cameras pay nothing.
+- Slot names derive from the module instance id; the master finds a
+  module's slot without asking the module.
+- A writer that needs a bigger buffer (resolution change) marks the old slot
+  closed and creates a new one; readers see the flag and reopen.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import struct
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Iterator, Optional
+
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.preview import frame_to_bgr, preview_size
+
+logger = get_module_logger(__name__)
+
+MAGIC = b"RPLP"
+VERSION = 1
+
+FORMAT_BGR24 = 1
+FORMAT_GRAY8 = 2
+_CHANNELS = {FORMAT_BGR24: 3, FORMAT_GRAY8: 1}
+
+STATE_OPEN = 1
+STATE_CLOSED = 2
+
+# Writers stop publishing when no reader stamped the heartbeat for this long
+READER_TIMEOUT = 2.0
+
+# magic, version, state, latest, capacity, frames published, reader heartbeat (monotonic ns)
+_SLOT_HEADER = struct.Struct("<4sHBBIQQ")
+# seq, width, height, format, nbytes, frame number, timestamp
+_BUFFER_HEADER = struct.Struct("<QIIIIQd")
+_SEQ = struct.Struct("<Q")
+_LATEST_OFFSET = 7
+_FRAMES_OFFSET = 12
+_HEARTBEAT_OFFSET = 20
+_STATE_OFFSET = 6
+# Pixel data starts 64-byte aligned
+_BUFFER_HEADER_SIZE = 64
+_SLOT_HEADER_SIZE = 64
+
+_READ_RETRIES = 4
+
+# Slots created by writers in this process (tests, in-process readers)
+_created_here: set[str] = set()
+
+
+def preview_slot_name(instance_id: str) -> str:
+    """Shared-memory name of the preview slot for a module instance.
+
+    Hashed: instance ids contain characters (":" "/") that are not valid in
+    shared-memory names, and macOS limits names to 31 characters.
+    """
+    digest = hashlib.sha1(instance_id.encode("utf-8")).hexdigest()[:16]
+    return f"rpl_prev_{digest}"
+
+
+def _slot_size(capacity: int) -> int:
+    return _SLOT_HEADER_SIZE + 2 * (_BUFFER_HEADER_SIZE + capacity)
+
+
+def _buffer_offset(index: int, capacity: int) -> int:
+    return _SLOT_HEADER_SIZE + index * (_BUFFER_HEADER_SIZE + capacity)
+
+
+@dataclass
+class PreviewFrame:
+    """One frame read from a slot; ``image`` may be a view into shared memory."""
+
+    image: np.ndarray
+    width: int
+    height: int
+    format: int
+    frame_number: int
+    timestamp: float
+    sequence: int  # Frames published when this one was current
+
+
+class PreviewSlotWriter:
+    """Module side of a preview slot; single writer, not thread-safe."""
+
+    def __init__(self, name: str, capacity: int) -> None:
+        """Create the slot, replacing a stale one left by a crashed module.
+
+        Args:
+            name: Shared-memory name (see ``preview_slot_name``)
+            capacity: Largest frame in bytes the slot holds
+        """
+        self.name = name
+        self.capacity = -(-capacity // 64) * 64  # Keeps both pixel buffers aligned
+        capacity = self.capacity
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=_slot_size(capacity))
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=_slot_size(capacity))
+        _created_here.add(name)
+        self._buf = self._shm.buf
+        self._latest = 0
+        self._frames = 0
+        self._seqs = [0, 0]
+        _SLOT_HEADER.pack_into(self._buf, 0, MAGIC, VERSION, STATE_OPEN, 0, capacity, 0, 0)
+        self.frames_published = 0
+
+    def wanted(self, now_ns: Optional[int] = None) -> bool:
+        """True if a reader looked at the slot within ``READER_TIMEOUT``."""
+        if self._buf is None:
+            return False
+        (heartbeat,) = _SEQ.unpack_from(self._buf, _HEARTBEAT_OFFSET)
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        return heartbeat != 0 and now_ns - heartbeat < READER_TIMEOUT * 1e9
+
+    def fits(self, image: np.ndarray) -> bool:
+        return image.nbytes <= self.capacity
+
+    def publish(self, image: np.ndarray, frame_number: int = 0, timestamp: Optional[float] = None) -> bool:
+        """Copy a uint8 BGR (h, w, 3) or grayscale (h, w) image into the slot.
+
+        Returns:
+            False if the slot is closed or the image does not fit
+        """
+        if self._buf is None or image.nbytes > self.capacity:
+            return False
+        height, width = image.shape[:2]
+        fmt = FORMAT_GRAY8 if image.ndim == 2 else FORMAT_BGR24
+        index = 1 - self._latest
+        offset = _buffer_offset(index, self.capacity)
+        seq = self._seqs[index] + 1  # Odd: write in progress
+
+        _SEQ.pack_into(self._buf, offset, seq)
+        target = np.ndarray(image.shape, np.uint8, self._buf, offset + _BUFFER_HEADER_SIZE)
+        np.copyto(target, image, casting="no")
+        _BUFFER_HEADER.pack_into(
+            self._buf, offset, seq, width, height, fmt, image.nbytes, frame_number,
+            time.time() if timestamp is None else timestamp,
+        )
+        _SEQ.pack_into(self._buf, offset, seq + 1)
+        self._seqs[index] = seq + 1
+
+        self._latest = index
+        self._frames += 1
+        self._buf[_LATEST_OFFSET] = index
+        _SEQ.pack_into(self._buf, _FRAMES_OFFSET, self._frames)
+        self.frames_published += 1
+        return True
+
+    def close(self) -> None:
+        """Mark the slot closed for readers and remove it."""
+        if self._buf is None:
+            return
+        self._buf[_STATE_OFFSET] = STATE_CLOSED
+        self._buf = None
+        self._shm.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._shm.unlink()
+        _created_here.discard(self.name)
+
+
+class PreviewSlotReader:
+    """Master side of a preview slot. Use ``open`` to attach."""
+
+    def __init__(self, shm: shared_memory.SharedMemory) -> None:
+        self._shm = shm
+        self._buf = shm.buf
+        magic, version, _state, _latest, capacity, _frames, _hb = _SLOT_HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError(f"{shm.name} is not a preview slot")
+        self.name = shm.name
+        self.capacity = capacity
+        self._view_check: Optional[tuple[int, int]] = None
+
+    @classmethod
+    def open(cls, name: str) -> Optional["PreviewSlotReader"]:
+        """Attach to an existing slot; None if the module has not created it."""
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except (FileNotFoundError, ValueError):
+            return None
+        # Before Python 3.13 attaching registers the block with this process's
+        # resource tracker, which would unlink the module's slot when we exit
+        if name not in _created_here:
+            with contextlib.suppress(Exception):
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        try:
+            return cls(shm)
+        except ValueError as exc:
+            logger.debug("Ignoring %s: %s", name, exc)
+            return None
+
+    @property
+    def closed(self) -> bool:
+        """True once the writer closed (or replaced) the slot."""
+        return self._buf is None or self._buf[_STATE_OFFSET] != STATE_OPEN
+
+    @property
+    def sequence(self) -> int:
+        """Frames published so far; changes whenever a new frame is available."""
+        if self._buf is None:
+            return 0
+        return _SEQ.unpack_from(self._buf, _FRAMES_OFFSET)[0]
+
+    def touch(self, now_ns: Optional[int] = None) -> None:
+        """Tell the writer someone is watching."""
+        if self._buf is not None:
+            _SEQ.pack_into(self._buf, _HEARTBEAT_OFFSET, time.monotonic_ns() if now_ns is None else now_ns)
+
+    def _begin(self) -> Optional[tuple[int, int, PreviewFrame]]:
+        sequence = self.sequence
+        index = self._buf[_LATEST_OFFSET]
+        offset = _buffer_offset(index, self.capacity)
+        seq, width, height, fmt, nbytes, frame_number, timestamp = _BUFFER_HEADER.unpack_from(self._buf, offset)
+        if seq == 0 or seq & 1 or fmt not in _CHANNELS or nbytes > self.capacity:
+            return None
+        channels = _CHANNELS[fmt]
+        shape = (height, width, 3) if channels == 3 else (height, width)
+        if width * height * channels != nbytes:
+            return None
+        image = np.ndarray(shape, np.uint8, self._buf, offset + _BUFFER_HEADER_SIZE)
+        image.flags.writeable = False
+        return offset, seq, PreviewFrame(image, width, height, fmt, frame_number, timestamp, sequence)
+
+    def _unchanged(self, offset: int, seq: int) -> bool:
+        return self._buf is not None and _SEQ.unpack_from(self._buf, offset)[0] == seq
+
+    @contextlib.contextmanager
+    def view(self) -> Iterator[Optional[PreviewFrame]]:
+        """Borrow the latest frame without copying it.
+
+        Yields None when there is no complete frame. Whatever was computed
+        from the view is only valid if ``frame_valid`` is still True after
+        use; the writer may have reused the buffer meanwhile.
+        """
+        if self.closed:
+            yield None
+            return
+        self.touch()
+        begun = self._begin()
+        if begun is None:
+            yield None
+            return
+        offset, seq, frame = begun
+        self._view_check = (offset, seq)
+        yield frame
+
+    @property
+    def frame_valid(self) -> bool:
+        """True if the frame from the last ``view`` was not overwritten."""
+        return self._view_check is not None and self._unchanged(*self._view_check)
+
+    def read(self) -> Optional[PreviewFrame]:
+        """Copy out the latest complete frame, or None."""
+        if self.closed:
+            return None
+        self.touch()
+        for _ in range(_READ_RETRIES):
+            begun = self._begin()
+            if begun is None:
+                return None
+            offset, seq, frame = begun
+            frame.image = frame.image.copy()
+            if self._unchanged(offset, seq):
+                return frame
+        return None
+
+    def close(self) -> None:
+        if self._buf is None:
+            return
+        self._buf = None
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+
+
+class PreviewPublisher:
+    """Publishes a module's preview frames into its slot when someone watches.
+
+    Owns the slot for one streaming session: ``start`` when the camera opens,
+    ``close`` when it stops. ``due`` is cheap (one header read), so capture
+    loops can call it for every frame.
+    """
+
+    def __init__(self, instance_id: str, max_fps: float = 10.0) -> None:
+        self.name = preview_slot_name(instance_id)
+        self.max_fps = max_fps
+        self._writer: Optional[PreviewSlotWriter] = None
+        self._next_due = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._writer is not None
+
+    def start(self, size: tuple[int, int], scale: float = 1.0) -> bool:
+        """Create the slot for frames of ``size`` at preview ``scale``."""
+        width, height = preview_size(size, scale)
+        return self._open(width * height * 3)
+
+    def _open(self, capacity: int) -> bool:
+        self.close()
+        try:
+            self._writer = PreviewSlotWriter(self.name, capacity)
+        except OSError as exc:
+            logger.warning("Shared-memory preview unavailable: %s", exc)
+            self._writer = None
+            return False
+        return True
+
+    def due(self, now: Optional[float] = None) -> bool:
+        """True if a reader is watching and the rate cap allows a frame."""
+        if self._writer is None:
+            return False
+        now = time.monotonic() if now is None else now
+        if now < self._next_due or not self._writer.wanted(int(now * 1e9)):
+            return False
+        self._next_due = now + 1.0 / max(self.max_fps, 0.1)
+        return True
+
+    def publish(self, image: np.ndarray, frame_number: int = 0, timestamp: Optional[float] = None) -> bool:
+        """Publish a BGR or grayscale image, growing the slot if needed."""
+        if self._writer is None:
+            return False
+        if not self._writer.fits(image) and not self._open(image.nbytes):
+            return False
+        return self._writer.publish(np.ascontiguousarray(image), frame_number, timestamp)
+
+    def publish_frame(
+        self,
+        data: np.ndarray,
+        size: tuple[int, int],
+        color_format: str = "bgr",
+        scale: float = 1.0,
+        frame_number: int = 0,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """Convert a captured frame to preview size and publish it."""
+        try:
+            image = frame_to_bgr(data, size, color_format, scale)
+        except Exception as exc:
+            logger.debug("Preview slot conversion failed: %s", exc)
+            return False
+        return self.publish(image, frame_number, timestamp)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+__all__ = [
+    "FORMAT_BGR24",
+    "FORMAT_GRAY8",
+    "PreviewFrame",
+    "PreviewPublisher",
+    "PreviewSlotReader",
+    "PreviewSlotWriter",
+    "READER_TIMEOUT",
+    "preview_slot_name",
+]
@@ -16,10 +16,14 @@ class SyncMetadataWriter:
         session_dir: Path,
         trial_number: int,
         session_timestamp: str,
-        modules_data: Dict[str, Dict[str, Any]]
+        modules_data: Dict[str, Dict[str, Any]],
+        timeline: Optional[Dict[str, Any]] = None,
     ) -> Optional[Path]:
-        """Write unified sync metadata file for trial. Returns path or None on error."""
-        if not modules_data:
+        """Write unified sync metadata file for trial. Returns path or None on error.
+
+        ``timeline`` is the aligned timebase summary (``Timeline.summary()``).
+        """
+        if not modules_data and not timeline:
             logger.warning("No modules data to write to sync file")
             return None
 
@@ -43,6 +47,8 @@ class SyncMetadataWriter:
             "start_time_monotonic": earliest_monotonic_time,
             "modules": modules_data
         }
+        if timeline:
+            sync_metadata["timeline"] = timeline
 
         filename = f"{session_timestamp}_SYNC_trial{trial_number:03d}.json"
         sync_path = session_dir / filename
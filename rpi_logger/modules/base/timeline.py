@@ -0,0 +1,698 @@
+"""
+Cross-module timeline alignment.
+
+Every module's data file (CSV, or columnar ``.npy``) starts with
+``trial,module,device_id,label,record_time_unix,record_time_mono``.
+``record_time_mono`` is the host monotonic clock when a sample reached the
+logger. All module processes share it, but it carries transport jitter
+(USB packets, serial batching, scheduling). Most streams also carry the
+device's own clock: camera sensor timestamps, audio sample counts, eye
+tracker and DRT device times, GPS UTC. That clock is smooth but has its own
+origin and rate.
+
+For each stream ``fit_clock`` fits ``host = intercept + slope * device`` by
+robust (Tukey bisquare) regression. It starts a new segment wherever the
+device clock resets. The fitted host time of each sample is its aligned
+time: free of arrival jitter, corrected for drift, and on the shared host
+monotonic timebase. Streams without a device clock (Notes, sVOG) keep
+``record_time_mono``. A robust fit of ``record_time_unix`` on
+``record_time_mono`` over all streams maps the timebase to wall-clock time.
+The constant part of each stream's transport latency cannot be observed
+and stays in its intercept.
+
+``build_timeline`` loads every stream of a trial. ``write_index`` exports
+one table, sorted by aligned time, mapping every sample (stream + source
+row) to the common timebase.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import operator
+import re
+import warnings
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from rpi_logger.core.logging_utils import get_module_logger
+from .columnar import (
+    Column,
+    ColumnarFile,
+    columnar_path,
+    columns_dtype,
+    csv_join,
+    find_columnar_files,
+    format_column,
+    load_columnar,
+)
+
+logger = get_module_logger(__name__)
+
+STANDARD_PREFIX = ("trial", "module", "device_id", "label", "record_time_unix", "record_time_mono")
+# Prefix columns read for every sample
+_NUMERIC_PREFIX = ("trial", "record_time_unix", "record_time_mono")
+INDEX_NAME = "TIMELINE"
+
+
+@dataclass(frozen=True)
+class DeviceClock:
+    """A device clock column and the length of one tick in seconds.
+
+    ``seconds_per_tick`` None marks a sample counter whose nominal rate is
+    estimated from the data.
+    """
+
+    column: str
+    seconds_per_tick: Optional[float]
+
+
+# Device clock of a stream: the first column present with enough valid values.
+# Values <= 0 are missing (USB cameras write 0 for the sensor timestamp).
+DEVICE_CLOCKS: Tuple[DeviceClock, ...] = (
+    DeviceClock("sensor_timestamp_ns", 1e-9),  # Cameras
+    DeviceClock("device_time_ns", 1e-9),  # EyeTracker GAZE/IMU/EVENTS
+    DeviceClock("total_frames", None),  # Audio sample count at the end of each block
+    DeviceClock("device_time_offset", 1e-3),  # DRT device milliseconds
+    DeviceClock("device_time_unix", 1.0),  # GPS UTC, wVOG RTC
+)
+
+COMMON_SAMPLE_RATES = np.array(
+    [8000, 11025, 16000, 22050, 24000, 32000, 44100, 48000, 88200, 96000, 176400, 192000],
+    dtype=np.float64,
+)
+
+MIN_FIT_POINTS = 8
+MAX_FIT_POINTS = 250_000  # Longer segments are fitted on an even subsample
+RESET_THRESHOLD = 1.0  # Seconds a device clock may run ahead of the host between samples
+BISQUARE_C = 4.685
+MAD_TO_SIGMA = 1.4826
+OUTLIER_SIGMAS = 5.0
+MAX_ITERATIONS = 30
+CSV_CHUNK_ROWS = 65536
+
+
+# =============================================================================
+# Clock models
+# =============================================================================
+
+
+def robust_line(x: np.ndarray, y: np.ndarray, slope: float = 1.0) -> Tuple[float, float, float]:
+    """Fit ``y = intercept + slope * x`` by iteratively reweighted least squares.
+
+    Starts from the nominal ``slope`` and the median offset, then applies
+    Tukey bisquare weights, so samples far from the line (late arrivals,
+    stalls) get no weight at all.
+
+    Returns:
+        ``(intercept, slope, sigma)``; sigma is the MAD scale of the residuals
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) == 0:
+        raise ValueError("robust_line needs at least one point")
+    intercept = float(np.median(y - slope * x))
+    span = float(np.ptp(x))
+
+    for _ in range(MAX_ITERATIONS):
+        residuals = y - intercept - slope * x
+        sigma = _mad_sigma(residuals)
+        if sigma == 0.0 or span == 0.0:
+            break
+        u = residuals / (BISQUARE_C * sigma)
+        weights = np.where(np.abs(u) < 1.0, (1.0 - u * u) ** 2, 0.0)
+        total = weights.sum()
+        if np.count_nonzero(weights) < 2:
+            break
+        mean_x = weights @ x / total
+        mean_y = weights @ y / total
+        dx = x - mean_x
+        sxx = (weights * dx) @ dx
+        if sxx <= 0.0:
+            break
+        new_slope = float((weights * dx) @ (y - mean_y) / sxx)
+        new_intercept = float(mean_y - new_slope * mean_x)
+        change = abs(new_intercept - intercept) + abs(new_slope - slope) * span
+        intercept, slope = new_intercept, new_slope
+        if change < 1e-10:
+            break
+
+    return intercept, slope, _mad_sigma(y - intercept - slope * x)
+
+
+def _mad_sigma(residuals: np.ndarray) -> float:
+    if len(residuals) == 0:
+        return 0.0
+    return float(MAD_TO_SIGMA * np.median(np.abs(residuals - np.median(residuals))))
+
+
+@dataclass(frozen=True)
+class ClockSegment:
+    """Fit of one stretch of a device clock between resets."""
+
+    first_row: int  # Index into the stream's rows
+    last_row: int
+    intercept: float  # Host seconds at device time 0
+    slope: float  # Host seconds per device second
+    points: int
+
+
+@dataclass(frozen=True)
+class ClockModel:
+    """How a stream's device clock maps onto the host monotonic clock."""
+
+    source: str = ""  # Device clock column ("" = host arrival time only)
+    seconds_per_tick: float = 1.0
+    segments: Tuple[ClockSegment, ...] = ()
+    points: int = 0  # Samples with a device time
+    jitter_s: float = 0.0  # Robust std of arrival times around the fit
+    outliers: int = 0  # Arrivals more than OUTLIER_SIGMAS * jitter off the fit
+    counter: bool = False  # Device clock counts from 0 at the stream's start
+
+    @property
+    def rate(self) -> float:
+        """Host seconds per device second, averaged over the segments."""
+        fitted = [segment for segment in self.segments if segment.points >= MIN_FIT_POINTS]
+        if not fitted:
+            return 1.0
+        return sum(s.slope * s.points for s in fitted) / sum(s.points for s in fitted)
+
+    @property
+    def drift_ppm(self) -> float:
+        """Device clock drift against the host: positive when it runs slow."""
+        return (self.rate - 1.0) * 1e6
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "clock_source": self.source or "host",
+            "seconds_per_tick": self.seconds_per_tick,
+            "drift_ppm": round(self.drift_ppm, 3),
+            "jitter_ms": round(self.jitter_s * 1e3, 6),
+            "segments": len(self.segments),
+            "fitted_samples": self.points,
+            "outliers": self.outliers,
+        }
+
+
+def fit_clock(
+    device: np.ndarray,
+    host: np.ndarray,
+    *,
+    reset_threshold: float = RESET_THRESHOLD,
+) -> Tuple[np.ndarray, ClockModel]:
+    """Fit host arrival times against a device clock.
+
+    Args:
+        device: Device time of each sample in seconds (NaN when missing)
+        host: Host monotonic arrival time of each sample in seconds
+        reset_threshold: A device step this far ahead of the host step, or
+            this far backwards, starts a new segment
+
+    Returns:
+        ``(aligned, model)``: the fitted host time of each sample (the
+        arrival time where the device time is missing) and the model
+    """
+    device = np.asarray(device, dtype=np.float64)
+    host = np.asarray(host, dtype=np.float64)
+    aligned = host.copy()
+    rows = np.flatnonzero(np.isfinite(device) & np.isfinite(host))
+    if len(rows) < MIN_FIT_POINTS:
+        return aligned, ClockModel()
+
+    d = device[rows]
+    h = host[rows]
+    step_d = np.diff(d)
+    breaks = np.flatnonzero((step_d - np.diff(h) > reset_threshold) | (step_d < -reset_threshold)) + 1
+    bounds = np.concatenate(([0], breaks, [len(rows)]))
+
+    residuals = np.empty(len(rows))
+    segments = []
+    for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        seg_d = d[start:stop]
+        seg_h = h[start:stop]
+        if stop - start >= MIN_FIT_POINTS:
+            stride = max(1, (stop - start) // MAX_FIT_POINTS)
+            intercept, slope, _sigma = robust_line(seg_d[::stride], seg_h[::stride])
+        else:
+            slope = 1.0
+            intercept = float(np.median(seg_h - seg_d))
+        fitted = intercept + slope * seg_d
+        aligned[rows[start:stop]] = fitted
+        residuals[start:stop] = seg_h - fitted
+        segments.append(ClockSegment(int(rows[start]), int(rows[stop - 1]), intercept, slope, stop - start))
+
+    sigma = _mad_sigma(residuals)
+    outliers = int(np.count_nonzero(np.abs(residuals - np.median(residuals)) > OUTLIER_SIGMAS * sigma)) if sigma else 0
+    return aligned, ClockModel(
+        segments=tuple(segments),
+        points=len(rows),
+        jitter_s=sigma,
+        outliers=outliers,
+    )
+
+
+# =============================================================================
+# Streams
+# =============================================================================
+
+
+@dataclass
+class StreamTimeline:
+    """One data file's samples for a trial, with their aligned times."""
+
+    name: str  # Path relative to the session directory
+    path: Path
+    module: str
+    device_id: str
+    rows: np.ndarray  # Data row of each sample in the source file (0-based)
+    record_time_unix: np.ndarray
+    record_time_mono: np.ndarray
+    aligned_time_mono: np.ndarray
+    clock: ClockModel = field(default_factory=ClockModel)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def start_time_mono(self) -> float:
+        """Aligned time of the stream's first sample.
+
+        For a sample counter this is sample 0, the start of the first
+        block, rather than the first row.
+        """
+        if self.clock.counter and self.clock.segments:
+            return self.clock.segments[0].intercept
+        return float(self.aligned_time_mono[0])
+
+
+def find_stream_files(session_dir: Union[str, Path], trial_number: Optional[int] = None) -> List[Path]:
+    """Module data files under ``session_dir``.
+
+    A columnar ``.npy`` replaces the CSV regenerated from it. Files named
+    for another trial (``_trial###``) are skipped when ``trial_number`` is
+    given, as are timeline indexes.
+    """
+    session_dir = Path(session_dir)
+    columnar = find_columnar_files(session_dir)
+    replaced = {path.with_suffix(".csv") for path in columnar}
+    files = [path for path in session_dir.rglob("*.csv") if path not in replaced] + columnar
+
+    selected = []
+    for path in sorted(files):
+        if f"_{INDEX_NAME}_" in path.name:
+            continue
+        match = re.search(r"_trial(\d+)", path.name)
+        if trial_number is not None and match and int(match.group(1)) != trial_number:
+            continue
+        selected.append(path)
+    return selected
+
+
+def _read_csv(path: Path) -> Optional[Tuple[Dict[str, np.ndarray], np.ndarray, Dict[str, str]]]:
+    """Trial, record time and device clock columns of a CSV.
+
+    Record times are parsed as floats; device clock columns stay strings
+    (they may be empty) until ``_numeric`` converts the one in use.
+
+    Returns:
+        ``(columns, rows, text)`` with each kept row's 0-based data row
+        number and the first row's module/device_id, or None if the file
+        has no standard prefix
+    """
+    with path.open("r", encoding="utf-8", errors="replace", newline="") as handle:
+        reader = csv.reader(handle)
+        header = [name.strip() for name in next(reader, [])]
+        first = next(reader, [])
+    if tuple(header[:len(STANDARD_PREFIX)]) != STANDARD_PREFIX:
+        return None
+    text = {name: first[header.index(name)] if len(first) > header.index(name) else "" for name in ("module", "device_id")}
+
+    names = [name for name in _NUMERIC_PREFIX + tuple(clock.column for clock in DEVICE_CLOCKS) if name in header]
+    indices = [header.index(name) for name in names]
+    dtype = np.dtype([(name, "f8" if name in _NUMERIC_PREFIX else "U32") for name in names])
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # Header-only file
+            table = np.loadtxt(
+                path, dtype=dtype, delimiter=",", quotechar='"', comments=None,
+                skiprows=1, usecols=indices, ndmin=1, encoding="utf-8",
+            )
+        return {name: table[name] for name in names}, np.arange(len(table)), text
+    except ValueError:
+        # Empty record times, short or undecodable rows (e.g. a line cut off by a crash)
+        strings, numbers = _read_csv_rows(path, indices)
+        return {name: strings[:, i] for i, name in enumerate(names)}, numbers, text
+
+
+def _read_csv_rows(path: Path, indices: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Slow path of ``_read_csv``: every field as a string, skipping rows too short for ``indices``."""
+    width = max(indices) + 1
+    getter = operator.itemgetter(*indices)
+    chunks: List[np.ndarray] = []
+    numbers: List[np.ndarray] = []
+    base = 0
+    with path.open("r", encoding="utf-8", errors="replace", newline="") as handle:
+        reader = csv.reader(handle)
+        next(reader, None)
+        while True:
+            lines = list(itertools.islice(reader, CSV_CHUNK_ROWS))
+            if not lines:
+                break
+            kept = [i for i, row in enumerate(lines) if len(row) >= width]
+            if kept:
+                chunks.append(np.array([getter(lines[i]) for i in kept], dtype=str).reshape(len(kept), len(indices)))
+                numbers.append(base + np.array(kept, dtype=np.int64))
+            base += len(lines)
+    if not chunks:
+        return np.empty((0, len(indices)), dtype=str), np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks), np.concatenate(numbers)
+
+
+def _numeric(values: np.ndarray) -> np.ndarray:
+    """Numbers from a string column (numeric columns pass through).
+
+    int64 when the first value is an integer (0 when empty), so nanosecond
+    timestamps keep full precision; float64 otherwise (NaN when empty).
+    """
+    if values.dtype.kind not in "US":
+        return values
+    blank = values == ""
+    first = str(values[np.argmin(blank)]) if len(values) else ""
+    if first and first.lstrip("-").isdigit():
+        try:
+            return np.where(blank, "0", values).astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+    try:
+        return np.where(blank, "nan", values).astype(np.float64)
+    except ValueError:
+        return np.array([_to_float(value) for value in values.tolist()], dtype=np.float64)
+
+
+def _to_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
+
+def _load_columns(path: Path) -> Optional[Tuple[Dict[str, np.ndarray], np.ndarray, Dict[str, str]]]:
+    """Trial, record time and device clock columns, source rows and module/device_id of a data file."""
+    if path.suffix != ".npy":
+        return _read_csv(path)
+
+    rows, schema = load_columnar(path)
+    header = schema.get("csv_header", [])
+    if tuple(header[:len(STANDARD_PREFIX)]) != STANDARD_PREFIX:
+        return None
+    prefix = dict(zip(header, schema.get("prefix", [])))
+    text = {name: prefix.get(name, "") for name in ("module", "device_id")}
+    columns: Dict[str, np.ndarray] = {}
+    for name in _NUMERIC_PREFIX + tuple(clock.column for clock in DEVICE_CLOCKS):
+        if rows.dtype.names and name in rows.dtype.names:
+            columns[name] = np.asarray(rows[name])
+        elif name in prefix:
+            # Constant prefix field (trial)
+            columns[name] = np.full(len(rows), _numeric(np.array([prefix[name]]))[0])
+    return columns, np.arange(len(rows)), text
+
+
+def _device_seconds(values: np.ndarray, clock: DeviceClock, host: np.ndarray) -> Optional[Tuple[np.ndarray, float]]:
+    """Device times in seconds (NaN when missing) and the seconds per tick."""
+    valid = np.isfinite(values) & (values > 0)
+    if np.count_nonzero(valid) < MIN_FIT_POINTS:
+        return None
+    # Counters keep their natural zero; timestamps are measured from the first
+    # valid value (in int64 for nanoseconds, before float64 rounding)
+    origin = 0 if clock.seconds_per_tick is None else values[valid][0]
+    ticks = (values - origin).astype(np.float64)
+    ticks[~valid] = np.nan
+
+    seconds_per_tick = clock.seconds_per_tick
+    if seconds_per_tick is None:
+        seconds_per_tick = 1.0 / _nominal_sample_rate(ticks[valid], host[valid])
+    return ticks * seconds_per_tick, seconds_per_tick
+
+
+def _nominal_sample_rate(frames: np.ndarray, host: np.ndarray) -> float:
+    """Standard sample rate nearest the measured one (within 5%)."""
+    elapsed = float(host[-1] - host[0])
+    measured = float(frames[-1] - frames[0]) / elapsed if elapsed > 0 else 0.0
+    if measured <= 0:
+        return 48000.0
+    nearest = float(COMMON_SAMPLE_RATES[np.argmin(np.abs(np.log(COMMON_SAMPLE_RATES / measured)))])
+    return nearest if abs(nearest / measured - 1.0) < 0.05 else measured
+
+
+def load_stream(
+    path: Union[str, Path],
+    trial_number: Optional[int] = None,
+    *,
+    session_dir: Optional[Union[str, Path]] = None,
+) -> Optional[StreamTimeline]:
+    """Load one data file and fit its device clock.
+
+    Returns:
+        The stream, or None if the file has no standard prefix or no rows
+        for ``trial_number``
+    """
+    path = Path(path)
+    loaded = _load_columns(path)
+    if loaded is None:
+        logger.debug("Skipping %s: no standard CSV prefix", path.name)
+        return None
+    columns, numbers, text = loaded
+
+    if trial_number is not None:
+        keep = _numeric(columns["trial"]) == trial_number
+        if not keep.all():
+            columns = {name: values[keep] for name, values in columns.items()}
+            numbers = numbers[keep]
+    if len(numbers) == 0:
+        return None
+
+    host = _numeric(columns["record_time_mono"]).astype(np.float64)
+    aligned, model = host.copy(), ClockModel()
+    for clock in DEVICE_CLOCKS:
+        if clock.column not in columns:
+            continue
+        device = _device_seconds(_numeric(columns[clock.column]), clock, host)
+        if device is None:
+            continue
+        seconds, seconds_per_tick = device
+        aligned, model = fit_clock(seconds, host)
+        if model.points:
+            model = replace(
+                model,
+                source=clock.column,
+                seconds_per_tick=seconds_per_tick,
+                counter=clock.seconds_per_tick is None,
+            )
+            break
+
+    name = path.relative_to(session_dir).as_posix() if session_dir is not None else path.name
+    return StreamTimeline(
+        name=name,
+        path=path,
+        module=text["module"],
+        device_id=text["device_id"],
+        rows=numbers,
+        record_time_unix=_numeric(columns["record_time_unix"]).astype(np.float64),
+        record_time_mono=host,
+        aligned_time_mono=aligned,
+        clock=model,
+    )
+
+
+# =============================================================================
+# Timeline
+# =============================================================================
+
+INDEX_COLUMNS = (
+    Column("stream", "i8"),
+    Column("row", "i8"),
+    Column("record_time_mono", "f8", "%.9f"),
+    Column("aligned_time_mono", "f8", "%.9f"),
+    Column("aligned_time_unix", "f8", "%.6f"),
+    Column("trial_time", "f8", "%.6f"),
+)
+INDEX_HEADER = ["trial", *(column.name for column in INDEX_COLUMNS)]
+
+
+@dataclass
+class Timeline:
+    """Every stream of a trial on the shared host monotonic timebase."""
+
+    trial_number: int
+    streams: List[StreamTimeline]
+    wall_clock_origin: float = 0.0  # Host monotonic time of wall_clock_intercept
+    wall_clock_intercept: float = 0.0
+    wall_clock_rate: float = 1.0
+
+    @property
+    def start_time_mono(self) -> float:
+        """Earliest aligned sample time over all streams (NaN without streams)."""
+        if not self.streams:
+            return float("nan")
+        return min(float(np.min(stream.aligned_time_mono)) for stream in self.streams)
+
+    def to_unix(self, mono: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Wall-clock time of a host monotonic time."""
+        return self.wall_clock_intercept + self.wall_clock_rate * (mono - self.wall_clock_origin)
+
+    def stream(self, path: Union[str, Path]) -> Optional[StreamTimeline]:
+        """The stream loaded from ``path`` (its CSV or columnar file)."""
+        path = Path(path)
+        for stream in self.streams:
+            if stream.path == path or stream.path.with_suffix(".csv") == path.with_suffix(".csv"):
+                return stream
+        return None
+
+    def index(self) -> np.ndarray:
+        """Every sample, sorted by aligned time (``INDEX_COLUMNS`` fields)."""
+        lengths = [len(stream) for stream in self.streams]
+        index = np.empty(sum(lengths), dtype=columns_dtype(INDEX_COLUMNS))
+        if not len(index):
+            return index
+        aligned = np.concatenate([stream.aligned_time_mono for stream in self.streams])
+        order = np.argsort(aligned, kind="stable")
+        aligned = aligned[order]
+        index["stream"] = np.repeat(np.arange(len(self.streams)), lengths)[order]
+        index["row"] = np.concatenate([stream.rows for stream in self.streams])[order]
+        index["record_time_mono"] = np.concatenate([stream.record_time_mono for stream in self.streams])[order]
+        index["aligned_time_mono"] = aligned
+        index["aligned_time_unix"] = self.to_unix(aligned)
+        index["trial_time"] = aligned - self.start_time_mono
+        return index
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-ready description of the timebase and each stream's clock."""
+        start = self.start_time_mono
+        return {
+            "start_time_mono": start,
+            "start_time_unix": float(self.to_unix(start)),
+            "wall_clock_drift_ppm": round((self.wall_clock_rate - 1.0) * 1e6, 3),
+            "streams": [
+                {
+                    "stream": stream.name,
+                    "module": stream.module,
+                    "device_id": stream.device_id,
+                    "samples": len(stream),
+                    "start_time_mono": stream.start_time_mono,
+                    "start_time_unix": float(self.to_unix(stream.start_time_mono)),
+                    **stream.clock.as_dict(),
+                }
+                for stream in self.streams
+            ],
+        }
+
+
+def _fit_wall_clock(streams: Sequence[StreamTimeline]) -> Tuple[float, float, float]:
+    """Robust fit of record_time_unix on record_time_mono over all streams."""
+    total = sum(len(stream) for stream in streams)
+    stride = max(1, total // MAX_FIT_POINTS)
+    mono = np.concatenate([stream.record_time_mono[::stride] for stream in streams])
+    unix = np.concatenate([stream.record_time_unix[::stride] for stream in streams])
+    valid = np.isfinite(mono) & np.isfinite(unix)
+    if not valid.any():
+        return 0.0, 0.0, 1.0
+    origin = float(np.min(mono[valid]))
+    intercept, rate, _sigma = robust_line(mono[valid] - origin, unix[valid])
+    return origin, intercept, rate
+
+
+def build_timeline(session_dir: Union[str, Path], trial_number: int) -> Timeline:
+    """Load and align every module data file of a trial in a session."""
+    session_dir = Path(session_dir)
+    streams = []
+    for path in find_stream_files(session_dir, trial_number):
+        try:
+            stream = load_stream(path, trial_number, session_dir=session_dir)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Skipping %s: %s", path, exc)
+            continue
+        if stream is not None:
+            streams.append(stream)
+
+    timeline = Timeline(trial_number, streams)
+    if streams:
+        origin, intercept, rate = _fit_wall_clock(streams)
+        timeline.wall_clock_origin = origin
+        timeline.wall_clock_intercept = intercept
+        timeline.wall_clock_rate = rate
+    return timeline
+
+
+def index_path(session_dir: Path, session_token: str, trial_number: int, data_format: str = "csv") -> Path:
+    """Where the aligned index of a trial is written (``.npy`` for the columnar format)."""
+    path = session_dir / f"{session_token}_{INDEX_NAME}_trial{trial_number:03d}.csv"
+    return columnar_path(path) if data_format == "npy" else path
+
+
+def write_index(
+    timeline: Timeline,
+    path: Union[str, Path],
+    data_format: str = "csv",
+    *,
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> Path:
+    """Write the aligned index of ``timeline``.
+
+    CSV rows name their stream by its path relative to the session. The
+    columnar file stores stream numbers; its schema metadata lists the
+    stream names in that order.
+
+    Returns:
+        Path written
+    """
+    path = Path(path)
+    index = timeline.index()
+    names = [stream.name for stream in timeline.streams]
+
+    if data_format == "npy":
+        columnar = ColumnarFile(
+            columnar_path(path),
+            INDEX_COLUMNS,
+            csv_header=INDEX_HEADER,
+            prefix_fields=(timeline.trial_number,),
+            metadata={"streams": names},
+        )
+        try:
+            for start in range(0, len(index), chunk_rows):
+                columnar.write(index[start:start + chunk_rows])
+        finally:
+            columnar.close()
+        return columnar.path
+
+    quoted = np.array([csv_join([name]) for name in names] or [""], dtype=object)
+    line_prefix = f"{timeline.trial_number},"
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(csv_join(INDEX_HEADER) + "\n")
+        for start in range(0, len(index), chunk_rows):
+            chunk = index[start:start + chunk_rows]
+            fields = [quoted[chunk["stream"]].tolist()]
+            fields += [format_column(chunk[column.name], column) for column in INDEX_COLUMNS[1:]]
+            handle.write("".join(line_prefix + ",".join(row) + "\n" for row in zip(*fields)))
+    return path
+
+
+__all__ = [
+    "ClockModel",
+    "ClockSegment",
+    "DEVICE_CLOCKS",
+    "DeviceClock",
+    "INDEX_COLUMNS",
+    "INDEX_HEADER",
+    "StreamTimeline",
+    "Timeline",
+    "build_timeline",
+    "find_stream_files",
+    "fit_clock",
+    "index_path",
+    "load_stream",
+    "robust_line",
+    "write_index",
+]
@@ -0,0 +1,378 @@
+"""
+Shared, batched writer for per-frame timing CSVs.
+
+Camera modules produce one timing row per recorded frame. Writing and
+flushing each row individually costs an executor hop and a syscall per
+frame, which competes with the encoders at high frame rates. Instead, every
+timing file in a process is a TimingStream owned by one TimingSink with a
+single writer thread:
+
+- Producers append pre-formatted rows to a bounded per-stream buffer
+  (non-blocking, safe from any thread or the event loop).
+- The writer thread flushes a stream when it holds FlushPolicy.max_rows
+  rows or its oldest row is FlushPolicy.max_delay seconds old, so at most
+  that much data is lost if the process dies.
+- Closing a stream drains it, fsyncs it (end of trial) and closes the file.
+- Stopping the sink (at interpreter exit) flushes every stream once more
+  and ends the writer thread.
+
+A stream opened with ``open_columnar_timing_stream`` takes tuples of native
+values instead of formatted rows and writes them to a columnar ``.npy``
+sidecar (see ``rpi_logger.modules.base.columnar``).
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence, TextIO, Union
+
+from rpi_logger.core.file_sync_utils import fsync_file
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.columnar import Column, ColumnarFile, columnar_path
+
+logger = get_module_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FlushPolicy:
+    """When buffered timing rows are written to disk.
+
+    The crash-loss window is bounded by whichever limit is hit first:
+    ``max_rows`` rows or ``max_delay`` seconds of data.
+    """
+
+    max_rows: int = 64  # Flush once this many rows are pending
+    max_delay: float = 0.5  # Flush once the oldest pending row is this old (seconds)
+    capacity: int = 8192  # Rows buffered before new rows are dropped
+
+
+DEFAULT_FLUSH_POLICY = FlushPolicy()
+
+
+class TimingStream:
+    """One timing CSV (or columnar) file fed through the process-wide TimingSink."""
+
+    def __init__(
+        self,
+        sink: "TimingSink",
+        path: Path,
+        file: Union[TextIO, ColumnarFile],
+        policy: FlushPolicy,
+    ) -> None:
+        self._sink = sink
+        self._path = path
+        self._file: Optional[Union[TextIO, ColumnarFile]] = file
+        self._columnar = isinstance(file, ColumnarFile)
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._pending: list[Any] = []
+        self._first_pending_at = 0.0
+        self._flush_requested = False
+        self._closing = False
+        self._fsync_on_close = True
+        self._done = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+
+        self._rows_written = 0
+        self._rows_dropped = 0
+        self._flushes = 0
+
+    def write_row(self, row: Union[str, tuple]) -> bool:
+        """Queue a formatted CSV row (newline-terminated), or a tuple of
+        column values on a columnar stream. Non-blocking.
+
+        Returns False if the stream is closed or its buffer is full.
+        """
+        with self._lock:
+            if self._closing or self._file is None:
+                return False
+            if len(self._pending) >= self._policy.capacity:
+                self._rows_dropped += 1
+                return False
+            if not self._pending:
+                self._first_pending_at = time.monotonic()
+                self._idle.clear()
+            self._pending.append(row)
+            wake = len(self._pending) >= self._policy.max_rows
+        if wake:
+            self._sink._wake.set()
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Ask the writer thread to flush now and wait until it has."""
+        with self._lock:
+            if self._file is None:
+                return True
+            self._flush_requested = True
+        if not self._sink._kick():
+            self._service()
+        return self._idle.wait(timeout)
+
+    def close(self, *, fsync: bool = True, timeout: Optional[float] = 5.0) -> None:
+        """Drain pending rows, optionally fsync, and close the file (blocking)."""
+        with self._lock:
+            if self._closing:
+                already = True
+            else:
+                already = False
+                self._closing = True
+                self._fsync_on_close = fsync
+        if not already and not self._sink._kick():
+            self._service()  # Sink stopped: drain on the caller's thread
+        if not self._done.wait(timeout):
+            logger.warning("Timing stream close timed out: %s", self._path)
+
+    # ------------------------------------------------------------------
+    # Writer thread side
+
+    def _due(self, now: float) -> float:
+        """Seconds until this stream must be flushed (0 if due now)."""
+        with self._lock:
+            if self._closing or self._flush_requested:
+                return 0.0
+            if not self._pending:
+                return float("inf")
+            if len(self._pending) >= self._policy.max_rows:
+                return 0.0
+            return max(0.0, self._first_pending_at + self._policy.max_delay - now)
+
+    def _service(self) -> bool:
+        """Write pending rows; close if requested. Returns True once closed."""
+        with self._lock:
+            rows = self._pending
+            self._pending = []
+            self._flush_requested = False
+            closing = self._closing
+        file = self._file
+        if file is None:
+            return True
+
+        try:
+            if rows:
+                file.write(rows if self._columnar else "".join(rows))
+                file.flush()
+                self._rows_written += len(rows)
+                self._flushes += 1
+        except (OSError, ValueError) as e:
+            logger.error("Timing write failed for %s: %s", self._path, e)
+
+        if not closing:
+            with self._lock:
+                if not self._pending:
+                    self._idle.set()
+            return False
+
+        try:
+            if self._fsync_on_close:
+                fsync_file(file)
+            file.close()  # A columnar file writes its final schema here
+        except (OSError, ValueError) as e:
+            logger.error("Timing close failed for %s: %s", self._path, e)
+        if self._rows_dropped:
+            logger.warning(
+                "Timing stream %s dropped %d rows (buffer of %d full)",
+                self._path, self._rows_dropped, self._policy.capacity,
+            )
+        self._file = None
+        self._idle.set()
+        self._done.set()
+        return True
+
+    # ------------------------------------------------------------------
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def rows_written(self) -> int:
+        """Rows handed to the OS so far."""
+        return self._rows_written
+
+    @property
+    def rows_dropped(self) -> int:
+        """Rows rejected because the buffer was full."""
+        return self._rows_dropped
+
+    @property
+    def flushes(self) -> int:
+        """Number of batched write+flush calls made."""
+        return self._flushes
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None and not self._closing
+
+
+class TimingSink:
+    """Process-wide writer thread servicing all open TimingStreams."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._streams: list[TimingStream] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def open_stream(
+        self,
+        path: Union[str, Path],
+        header: str = "",
+        policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+    ) -> TimingStream:
+        """Create the file, write its header to disk, and register it."""
+        path = Path(path)
+        file = open(path, "w", newline="")
+        if header:
+            file.write(header)
+            file.flush()
+        return self._register(TimingStream(self, path, file, policy))
+
+    def open_columnar_stream(
+        self,
+        path: Union[str, Path],
+        columns: Sequence[Column],
+        header: str,
+        prefix_fields: Sequence[Any] = (),
+        policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+    ) -> TimingStream:
+        """Create the ``.npy`` sidecar for CSV ``path`` and register it."""
+        data_path = columnar_path(path)
+        file = ColumnarFile(
+            data_path,
+            columns,
+            csv_header=header.strip().split(","),
+            prefix_fields=prefix_fields,
+        )
+        return self._register(TimingStream(self, data_path, file, policy))
+
+    def _register(self, stream: TimingStream) -> TimingStream:
+        with self._lock:
+            self._streams.append(stream)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="timing-sink",
+                    daemon=True,
+                )
+                self._thread.start()
+        return stream
+
+    def flush_all(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush every open stream (used at interpreter exit)."""
+        with self._lock:
+            streams = list(self._streams)
+        for stream in streams:
+            stream.flush(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush every stream one last time and end the writer thread.
+
+        Streams stay open; closing one afterwards drains it on the caller's
+        thread. Opening a new stream starts the writer again.
+        """
+        with self._lock:
+            thread = self._thread
+            self._stop.set()
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("Timing sink did not stop within %.1fs", timeout)
+
+    def _kick(self) -> bool:
+        """Wake the writer thread.
+
+        Returns False once the sink is stopped, after waiting for the writer
+        thread to finish, so the caller can service its stream itself.
+        """
+        with self._lock:
+            thread = self._thread
+            stopped = self._stop.is_set()
+        if thread is not None and thread.is_alive() and not stopped:
+            self._wake.set()
+            return True
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            wait = self._service_streams(force=False)
+            self._wake.wait(wait)
+            self._wake.clear()
+        # Final flush so nothing buffered is lost when the thread ends
+        self._service_streams(force=True)
+
+    def _service_streams(self, force: bool) -> float:
+        """Service due streams (all of them if ``force``); returns the next wait."""
+        with self._lock:
+            streams = list(self._streams)
+
+        now = time.monotonic()
+        wait = 1.0
+        for stream in streams:
+            due = 0.0 if force else stream._due(now)
+            if due > 0.0:
+                wait = min(wait, due)
+                continue
+            if stream._service():
+                with self._lock:
+                    if stream in self._streams:
+                        self._streams.remove(stream)
+        return wait
+
+    @property
+    def stream_count(self) -> int:
+        with self._lock:
+            return len(self._streams)
+
+
+_sink: Optional[TimingSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_timing_sink() -> TimingSink:
+    """Return the process-wide TimingSink, creating it on first use."""
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = TimingSink()
+            atexit.register(_sink.stop, 2.0)
+        return _sink
+
+
+def open_timing_stream(
+    path: Union[str, Path],
+    header: str = "",
+    policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+) -> TimingStream:
+    """Open a timing CSV on the process-wide sink."""
+    return get_timing_sink().open_stream(path, header, policy)
+
+
+def open_columnar_timing_stream(
+    path: Union[str, Path],
+    columns: Sequence[Column],
+    header: str,
+    prefix_fields: Sequence[Any] = (),
+    policy: FlushPolicy = DEFAULT_FLUSH_POLICY,
+) -> TimingStream:
+    """Open the columnar sidecar of timing CSV ``path`` on the process-wide sink."""
+    return get_timing_sink().open_columnar_stream(path, columns, header, prefix_fields, policy)
+
+
+__all__ = [
+    "FlushPolicy",
+    "DEFAULT_FLUSH_POLICY",
+    "TimingStream",
+    "TimingSink",
+    "get_timing_sink",
+    "open_columnar_timing_stream",
+    "open_timing_stream",
+]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Regenerate legacy CSVs from columnar (``data_format = npy``) recordings."""
+
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from rpi_logger.core.logging_config import configure_logging
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.base.columnar import columnar_to_csv, find_columnar_files, load_columnar
+
+configure_logging()
+logger = get_module_logger("columnar_to_csv")
+
+
+def _target_path(data_path: Path, output_dir: Optional[Path]) -> Path:
+    _rows, schema = load_columnar(data_path)
+    directory = output_dir if output_dir is not None else data_path.parent
+    return directory / schema["csv_name"]
+
+
+def convert(paths: list[Path], output_dir: Optional[Path] = None, overwrite: bool = False) -> int:
+    """Convert every columnar file under ``paths``. Returns the number of failures."""
+    failures = 0
+    files = [data_path for path in paths for data_path in find_columnar_files(path)]
+    if not files:
+        logger.warning("No columnar files found in %s", ", ".join(str(path) for path in paths))
+        return 0
+
+    for data_path in files:
+        try:
+            target = _target_path(data_path, output_dir)
+            if target.exists() and not overwrite:
+                logger.info("Skipping %s (%s exists, use --overwrite)", data_path.name, target.name)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            columnar_to_csv(data_path, target)
+            logger.info("Wrote %s", target)
+        except (OSError, ValueError, KeyError) as exc:
+            failures += 1
+            logger.error("Failed to convert %s: %s", data_path, exc)
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Regenerate legacy CSV files from columnar .npy recordings"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Columnar .npy files or session directories to search",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Write CSVs here instead of next to each .npy file",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace CSV files that already exist",
+    )
+    args = parser.parse_args()
+
+    return 1 if convert(args.paths, args.output_dir, args.overwrite) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
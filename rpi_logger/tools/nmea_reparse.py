@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Regenerate GPS CSVs from raw NMEA archives (``raw_nmea_archive = true``)."""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from rpi_logger.core.logging_config import configure_logging
+from rpi_logger.core.logging_utils import get_module_logger
+from rpi_logger.modules.GPS.gps_core.nmea_archive import (
+    ARCHIVE_SUFFIXES,
+    archive_codec,
+    find_archives,
+    reparse_archive,
+)
+
+configure_logging()
+logger = get_module_logger("nmea_reparse")
+
+
+# The archive's own stem is the live CSV; re-parsed output never replaces it
+REPARSED_SUFFIX = "_reparsed.csv"
+
+
+def _target_path(archive: Path, output_dir: Optional[Path]) -> Path:
+    name = archive.name[: -len(ARCHIVE_SUFFIXES[archive_codec(archive)])] + REPARSED_SUFFIX
+    directory = output_dir if output_dir is not None else archive.parent
+    return directory / name
+
+
+def _reparse_one(archive: Path, target: Path, sentences: Optional[set[str]]) -> int:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return reparse_archive(archive, target, sentences)
+
+
+def reparse(
+    paths: list[Path],
+    output_dir: Optional[Path] = None,
+    sentences: Optional[set[str]] = None,
+    overwrite: bool = False,
+    jobs: int = 1,
+) -> int:
+    """Re-parse every archive under ``paths``. Returns the number of failures."""
+    archives = [archive for path in paths for archive in find_archives(path)]
+    if not archives:
+        logger.warning("No raw NMEA archives found in %s", ", ".join(str(path) for path in paths))
+        return 0
+
+    work = []
+    for archive in archives:
+        target = _target_path(archive, output_dir)
+        if target.exists() and not overwrite:
+            logger.info("Skipping %s (%s exists, use --overwrite)", archive.name, target.name)
+            continue
+        work.append((archive, target))
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [(archive, target, pool.submit(_reparse_one, archive, target, sentences)) for archive, target in work]
+        for archive, target, future in futures:
+            try:
+                rows = future.result()
+                logger.info("Wrote %s (%d rows)", target, rows)
+            except (OSError, ValueError) as exc:
+                failures += 1
+                logger.error("Failed to re-parse %s: %s", archive, exc)
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Regenerate GPS CSV files from raw NMEA archives (.nmea.zst / .nmea.gz)"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Archive files or session directories to search",
+    )
+    parser.add_argument(
+        "--sentences",
+        help="Comma-separated sentence types to parse, e.g. RMC,GGA,GSA (default: all supported)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Write CSVs here instead of next to each archive",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Replace re-parsed CSV files that already exist",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Archives processed in parallel (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    sentences = None
+    if args.sentences:
+        sentences = {part.strip().upper() for part in args.sentences.split(",") if part.strip()}
+
+    return 1 if reparse(args.paths, args.output_dir, sentences, args.overwrite, args.jobs) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
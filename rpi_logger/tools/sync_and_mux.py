@@ -3,13 +3,16 @@
 Synchronization and Muxing Utility
 
 This script processes recorded sessions to:
-1. Generate SYNC.json files with timing metadata
-2. Automatically mux audio and video files with proper synchronization
+1. Align every module's samples on one timebase (see ``modules.base.timeline``)
+   and export the aligned index (``*_TIMELINE_trial###.csv``)
+2. Generate SYNC.json files with timing metadata and per-stream clock models
+3. Automatically mux audio and video files with proper synchronization
 
 Usage:
     python -m rpi_logger.tools.sync_and_mux <session_directory>
     python -m rpi_logger.tools.sync_and_mux <session_directory> --trial 1
     python -m rpi_logger.tools.sync_and_mux <session_directory> --all-trials
+    python -m rpi_logger.tools.sync_and_mux <session_directory> --index-format npy
 """
 
 import asyncio
@@ -25,6 +28,8 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from rpi_logger.modules.base.sync_metadata import SyncMetadataWriter
 from rpi_logger.modules.base.av_muxer import AVMuxer
+from rpi_logger.modules.base.columnar import DATA_FORMATS, DEFAULT_DATA_FORMAT
+from rpi_logger.modules.base.timeline import Timeline, build_timeline, index_path, write_index
 from rpi_logger.modules.base.constants import AV_MUXING_TIMEOUT_SECONDS, AV_DELETE_SOURCE_FILES
 from rpi_logger.core.logging_config import configure_logging
 from rpi_logger.core.logging_utils import get_module_logger
@@ -32,6 +37,10 @@ from rpi_logger.core.logging_utils import get_module_logger
 configure_logging()
 logger = get_module_logger(__name__)
 
+# Filename codes of the modules whose media are muxed
+AUDIO_CODE = "AUD"
+CAMERA_CODE = "CAM"
+
 
 async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
     """
@@ -48,18 +57,13 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
         'session_timestamp': None
     }
 
-    pattern_trial = f"*trial{trial_number:03d}*"
-
-    audio_files = list(session_dir.glob(f"{pattern_trial}*.wav"))
+    audio_files = _module_media(session_dir, AUDIO_CODE, trial_number, ".wav")
     if audio_files:
         files['audio'] = audio_files[0]
 
-    video_files = [
-        path for path in session_dir.glob(f"{pattern_trial}*.mp4")
-        if "_AV_" not in path.name
-    ]
+    video_files = _module_media(session_dir, CAMERA_CODE, trial_number, ".mp4")
     if not video_files:
-        h264_files = list(session_dir.glob(f"{pattern_trial}*.h264"))
+        h264_files = _module_media(session_dir, CAMERA_CODE, trial_number, ".h264")
         if h264_files:
             logger.info("Waiting for mp4 conversion (%d files)...", len(h264_files))
 
@@ -70,10 +74,7 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
 
             while asyncio.get_event_loop().time() - start_time < timeout_seconds:
                 await asyncio.sleep(0.5)
-                video_files = [
-                    path for path in session_dir.glob(f"{pattern_trial}*.mp4")
-                    if "_AV_" not in path.name
-                ]
+                video_files = _module_media(session_dir, CAMERA_CODE, trial_number, ".mp4")
 
                 if len(video_files) >= len(h264_files):
                     current_sizes = {f: f.stat().st_size for f in video_files if f.exists()}
@@ -91,11 +92,8 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
             if not video_files or len(video_files) < len(h264_files):
                 logger.warning("MP4 conversion incomplete after %d seconds, converting h264 sources locally", timeout_seconds)
                 converted: list[tuple[int, Path]] = []
-                for h264_file in h264_files:
-                    match = re.search(r'CAM(\d+)', h264_file.name)
-                    if not match:
-                        continue
-                    cam_id = int(match.group(1))
+                for index, h264_file in enumerate(h264_files):
+                    cam_id = _camera_id(h264_file, index)
                     mp4_path = await _remux_h264_to_mp4(h264_file)
                     if mp4_path is None:
                         logger.warning(
@@ -108,11 +106,8 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
                 files['videos'].extend(converted)
 
     if not files['videos']:
-        for video_file in video_files:
-            match = re.search(r'CAM(\d+)', video_file.name)
-            if not match:
-                continue
-            cam_id = int(match.group(1))
+        for index, video_file in enumerate(sorted(video_files)):
+            cam_id = _camera_id(video_file, index)
             if video_file.suffix.lower() == '.h264':
                 mp4_path = await _remux_h264_to_mp4(video_file)
                 if mp4_path is not None:
@@ -129,15 +124,12 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
 
     files['videos'].sort(key=lambda x: x[0])
 
-    audio_timing_files = list(session_dir.glob(f"*AUDIOTIMING*trial{trial_number:03d}*.csv"))
-    if audio_timing_files:
-        files['audio_csv'] = audio_timing_files[0]
+    if files['audio']:
+        files['audio_csv'] = _timing_file(files['audio'])
 
-    video_timing_files = list(session_dir.glob(f"*CAMTIMING*trial{trial_number:03d}*.csv"))
-    for timing_file in video_timing_files:
-        match = re.search(r'CAM(\d+)', timing_file.name)
-        if match:
-            cam_id = int(match.group(1))
+    for cam_id, video_file in files['videos']:
+        timing_file = _timing_file(video_file)
+        if timing_file is not None:
             files['video_csvs'][cam_id] = timing_file
 
     session_name = session_dir.name
@@ -147,6 +139,31 @@ async def find_trial_files(session_dir: Path, trial_number: int) -> dict:
     return files
 
 
+def _module_media(session_dir: Path, code: str, trial_number: int, suffix: str) -> list[Path]:
+    """Media recorded by one module for a trial (``{token}_{code}_trial###_*``).
+
+    Matching the module code keeps other modules' media (e.g. the eye
+    tracker's world video and audio) out of the mux.
+    """
+    pattern = f"*_{code}_trial{trial_number:03d}_*{suffix}"
+    return sorted(path for path in session_dir.rglob(pattern) if "_AV_" not in path.name)
+
+
+def _camera_id(video_path: Path, default: int) -> int:
+    """Camera number from a ``CAM<n>`` name, else ``default`` (e.g. ``_CAM_trial001_<name>``)."""
+    match = re.search(r'CAM(\d+)', video_path.name)
+    return int(match.group(1)) if match else default
+
+
+def _timing_file(media_path: Path) -> Optional[Path]:
+    """Timing CSV (or columnar .npy) recorded next to an audio or video file."""
+    for suffix in (".csv", ".npy"):
+        candidate = media_path.with_name(f"{media_path.stem}_timing{suffix}")
+        if candidate.exists():
+            return candidate
+    return None
+
+
 def _extract_fps_from_name(video_path: Path) -> Optional[float]:
     match = re.search(r'(\d+(?:\.\d+)?)fps', video_path.stem)
     if match:
@@ -216,51 +233,42 @@ async def _remux_h264_to_mp4(h264_path: Path) -> Optional[Path]:
         return None
 
 
-async def extract_timing_from_csv(csv_path: Path, module_type: str) -> dict:
-    """
-    Extract timing information from CSV file.
-
-    Returns:
-        Dict with start_time_unix and other metadata
-    """
-    def read_csv_first_line():
-        with open(csv_path, 'r') as f:
-            header = f.readline()
-            first_data = f.readline()
-            return first_data.strip().split(',')
-
-    try:
-        first_row = await asyncio.to_thread(read_csv_first_line)
-
-        if module_type == 'audio':
-            trial, chunk_num, write_time_unix, frames_in_chunk, total_frames = first_row
-            return {
-                'start_time_unix': float(write_time_unix),
-                'first_chunk_frames': int(frames_in_chunk)
-            }
-        elif module_type == 'camera':
-            trial, frame_num, write_time_unix, sensor_timestamp_ns, dropped, total_drops = first_row
-            return {
-                'start_time_unix': float(write_time_unix),
-                'sensor_timestamp_ns': int(sensor_timestamp_ns) if sensor_timestamp_ns else None
-            }
-    except Exception as e:
-        logger.warning("Failed to read timing from %s: %s", csv_path, e)
+def _stream_timing(timeline: Timeline, timing_path: Path) -> dict:
+    """Aligned start time and clock model of the stream recorded in ``timing_path``."""
+    stream = timeline.stream(timing_path)
+    if stream is None:
+        logger.warning("No usable timing rows in %s", timing_path)
         return {}
+    start = stream.start_time_mono
+    return {
+        'start_time_unix': float(timeline.to_unix(start)),
+        'start_time_monotonic': start,
+        'drift_ppm': round(stream.clock.drift_ppm, 3),
+        'clock_source': stream.clock.source,
+    }
 
 
-async def generate_sync_metadata(session_dir: Path, trial_number: int) -> dict:
+async def generate_sync_metadata(
+    session_dir: Path,
+    trial_number: int,
+    timeline: Optional[Timeline] = None,
+) -> dict:
     """
     Generate sync metadata from trial files.
 
+    Media start times come from ``timeline`` (built here when not given), so
+    audio and video offsets use drift-corrected clocks rather than the first
+    timing row.
+
     Returns:
         Sync metadata dict
     """
     files = await find_trial_files(session_dir, trial_number)
+    if timeline is None:
+        timeline = await asyncio.to_thread(build_timeline, session_dir, trial_number)
 
     if not files['audio'] and not files['videos']:
-        logger.warning("No audio or video files found for trial %d", trial_number)
-        return {}
+        logger.info("No audio or video files found for trial %d", trial_number)
 
     modules_data = {}
 
@@ -270,9 +278,8 @@ async def generate_sync_metadata(session_dir: Path, trial_number: int) -> dict:
             'audio_file': str(files['audio']),
         }
         if files['audio_csv']:
-            audio_timing = await extract_timing_from_csv(files['audio_csv'], 'audio')
             audio_data['timing_csv'] = str(files['audio_csv'])
-            audio_data.update(audio_timing)
+            audio_data.update(_stream_timing(timeline, files['audio_csv']))
         else:
             logger.warning("Audio timing CSV not found for trial %d, sync metadata will be incomplete", trial_number)
         modules_data['AudioRecorder_0'] = audio_data
@@ -283,9 +290,8 @@ async def generate_sync_metadata(session_dir: Path, trial_number: int) -> dict:
             'video_file': str(video_file),
         }
         if cam_id in files['video_csvs']:
-            video_timing = await extract_timing_from_csv(files['video_csvs'][cam_id], 'camera')
             video_data['timing_csv'] = str(files['video_csvs'][cam_id])
-            video_data.update(video_timing)
+            video_data.update(_stream_timing(timeline, files['video_csvs'][cam_id]))
         else:
             logger.warning("Camera timing CSV not found for CAM%d trial %d, sync metadata will be incomplete", cam_id, trial_number)
         modules_data[f'Camera_{cam_id}'] = video_data
@@ -293,7 +299,8 @@ async def generate_sync_metadata(session_dir: Path, trial_number: int) -> dict:
     return {
         'trial_number': trial_number,
         'modules': modules_data,
-        'session_timestamp': files['session_timestamp']
+        'session_timestamp': files['session_timestamp'],
+        'timeline': timeline.summary() if timeline.streams else None,
     }
 
 
@@ -350,25 +357,41 @@ def _extract_trials_from_csv(csv_path: Path, trial_indices: tuple[int, ...]) ->
     return trials
 
 
-async def process_trial(session_dir: Path, trial_number: int, mux: bool = True):
+async def process_trial(
+    session_dir: Path,
+    trial_number: int,
+    mux: bool = True,
+    index_format: str = DEFAULT_DATA_FORMAT,
+):
     """
-    Process a single trial: generate sync file and optionally mux all cameras.
+    Process a single trial: align all streams, write the timeline index and
+    sync file, and optionally mux all cameras.
     """
     logger.info("Processing trial %d in %s", trial_number, session_dir)
 
-    sync_metadata = await generate_sync_metadata(session_dir, trial_number)
+    timeline = await asyncio.to_thread(build_timeline, session_dir, trial_number)
+    sync_metadata = await generate_sync_metadata(session_dir, trial_number, timeline)
 
-    if not sync_metadata.get('modules'):
+    if not sync_metadata['modules'] and not timeline.streams:
         logger.info("No data found for trial %d, skipping", trial_number)
         return
 
-    session_timestamp = sync_metadata.get('session_timestamp', 'session')
+    session_timestamp = sync_metadata.get('session_timestamp') or 'session'
+
+    if timeline.streams:
+        target = index_path(session_dir, session_timestamp, trial_number, index_format)
+        try:
+            written = await asyncio.to_thread(write_index, timeline, target, index_format)
+            logger.info("Wrote timeline index: %s (%d streams)", written.name, len(timeline.streams))
+        except OSError as exc:
+            logger.error("Failed to write timeline index for trial %d: %s", trial_number, exc)
 
     sync_path = await SyncMetadataWriter.write_sync_file(
         session_dir,
         trial_number,
         session_timestamp,
-        sync_metadata['modules']
+        sync_metadata['modules'],
+        timeline=sync_metadata['timeline'],
     )
 
     if not sync_path:
@@ -445,6 +468,7 @@ async def process_session(
     session_dir: Path,
     trial_numbers: Optional[Iterable[int]] = None,
     mux: bool = True,
+    index_format: str = DEFAULT_DATA_FORMAT,
 ) -> bool:
     """Process one or more trials within a session directory."""
 
@@ -463,7 +487,7 @@ async def process_session(
         return False
 
     for trial_num in numbers:
-        await process_trial(session_dir, trial_num, mux=mux)
+        await process_trial(session_dir, trial_num, mux=mux, index_format=index_format)
 
     return True
 
@@ -476,6 +500,12 @@ async def main():
     parser.add_argument('--trial', type=int, help='Process specific trial number')
     parser.add_argument('--all-trials', action='store_true', help='Process all trials in session')
     parser.add_argument('--no-mux', action='store_true', help='Skip A/V muxing, only generate sync files')
+    parser.add_argument(
+        '--index-format',
+        choices=DATA_FORMATS,
+        default=DEFAULT_DATA_FORMAT,
+        help='Format of the aligned timeline index (default: %(default)s)',
+    )
 
     args = parser.parse_args()
 
@@ -488,7 +518,7 @@ async def main():
     elif args.trial:
         trial_numbers = [args.trial]
 
-    success = await process_session(args.session_dir, trial_numbers, mux=mux)
+    success = await process_session(args.session_dir, trial_numbers, mux=mux, index_format=args.index_format)
     return 0 if success else 1
 
 
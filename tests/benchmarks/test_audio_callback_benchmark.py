@@ -0,0 +1,84 @@
+"""Audio callback cost and allocations per block: queued chunks vs PcmRing.
+
+The old callback built a float32 copy, a clipped copy, an int16 array, a
+bytes object and an AudioChunk per block and queued it for a writer that
+called writeframes/writerow per block. The ring converts in place into
+preallocated storage; the writer drains it with one write per pass.
+
+Run: pytest tests/benchmarks/test_audio_callback_benchmark.py -m slow -s
+"""
+
+import queue
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.Audio.services.pcm_ring import PcmRing
+
+BLOCKS = 2000
+FRAMES = 480  # 10 ms at 48 kHz
+
+
+def _legacy_callback(q: queue.Queue, mono: np.ndarray) -> None:
+    array = np.asarray(mono, dtype=np.float32)
+    scaled = np.clip(array, -1.0, 1.0)
+    data = (scaled * 32767).astype(np.int16).tobytes()
+    try:
+        q.put_nowait((data, FRAMES, time.time(), time.perf_counter(), None))
+    except queue.Full:
+        pass
+
+
+def _ring_callback(ring: PcmRing, mono: np.ndarray) -> None:
+    ring.push(mono, time.time(), time.perf_counter(), None)
+
+
+def _measure(callback, target, drain, mono):
+    start = time.perf_counter()
+    for i in range(BLOCKS):
+        callback(target, mono)
+        if i % 5 == 4:
+            drain()
+    per_block_us = (time.perf_counter() - start) / BLOCKS * 1e6
+
+    # Peak transient allocation of one callback (Python objects and numpy buffers)
+    tracemalloc.start()
+    callback(target, mono)
+    drain()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    callback(target, mono)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    drain()
+    return per_block_us, peak - baseline
+
+
+@pytest.mark.slow
+def test_audio_callback_cost():
+    indata = np.random.default_rng(0).uniform(-1.2, 1.2, (FRAMES, 2)).astype(np.float32)
+    mono = indata[:, 0]
+
+    q: queue.Queue = queue.Queue(maxsize=128)
+
+    def drain_queue():
+        while not q.empty():
+            q.get_nowait()
+
+    ring = PcmRing(48000 * 4)
+
+    def drain_ring():
+        _, count, _ = ring.peek()
+        ring.release(count)
+
+    legacy_us, legacy_bytes = _measure(_legacy_callback, q, drain_queue, mono)
+    ring_us, ring_bytes = _measure(_ring_callback, ring, drain_ring, mono)
+
+    print(
+        f"\naudio callback ({FRAMES} frames): "
+        f"{legacy_us:.1f} -> {ring_us:.1f} us/block, "
+        f"{legacy_bytes} -> {ring_bytes} bytes peak allocation/block"
+    )
+    assert ring_bytes < legacy_bytes
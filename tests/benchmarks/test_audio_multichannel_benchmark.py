@@ -0,0 +1,77 @@
+"""CPU cost of recording N microphones: one N-channel stream vs N mono streams.
+
+Both setups record the same samples from MockInputStream in real time
+(blocks of 240 frames at 48 kHz) through AudioDeviceRecorder and its
+writer thread. N mono streams need N callbacks per block period, N writer
+threads, N WAVs and N timing CSVs; one interleaved stream needs one of each.
+
+Run: pytest tests/benchmarks/test_audio_multichannel_benchmark.py -m slow -s
+"""
+
+import logging
+import time
+import wave
+
+import pytest
+
+from rpi_logger.modules.Audio.domain import AudioDeviceInfo, LevelMeter
+from rpi_logger.modules.Audio.services import device_recorder
+from rpi_logger.modules.Audio.services.device_recorder import AudioDeviceRecorder
+from tests.infrastructure.mocks.audio_mocks import MockInputStream
+
+CHANNELS = 4
+SECONDS = 2.0
+BLOCK = 240
+
+
+class _BlockStream(MockInputStream):
+    def __init__(self, **kwargs):
+        kwargs["blocksize"] = BLOCK
+        super().__init__(**kwargs)
+
+
+def _record(recorders, session_dir) -> tuple[float, int]:
+    """Run the recorders for SECONDS; returns (CPU seconds, frames written per channel)."""
+    for recorder in recorders:
+        recorder.start_stream()
+    cpu_start = time.process_time()
+    for index, recorder in enumerate(recorders):
+        recorder.begin_recording(session_dir / str(index), trial_number=1)
+    time.sleep(SECONDS)
+    handles = [recorder.finish_recording() for recorder in recorders]
+    cpu = time.process_time() - cpu_start
+    for recorder in recorders:
+        recorder.stop_stream()
+    frames = []
+    for handle in handles:
+        with wave.open(str(handle.file_path), "rb") as wav:
+            frames.append(wav.getnframes())
+    return cpu, min(frames)
+
+
+@pytest.mark.slow
+def test_multichannel_vs_mono_streams(tmp_path, monkeypatch):
+    monkeypatch.setattr(device_recorder.sd, "InputStream", _BlockStream, raising=False)
+    log = logging.getLogger("bench")
+
+    array = AudioDeviceInfo(device_id=0, name="Array", channels=CHANNELS, sample_rate=48000.0)
+    interleaved = [
+        AudioDeviceRecorder(array, 48000, LevelMeter(), log, channel_map=tuple(range(CHANNELS)))
+    ]
+    mono = [
+        AudioDeviceRecorder(
+            AudioDeviceInfo(device_id=i, name=f"Mic{i}", channels=1, sample_rate=48000.0),
+            48000, LevelMeter(), log,
+        )
+        for i in range(CHANNELS)
+    ]
+
+    interleaved_cpu, interleaved_frames = _record(interleaved, tmp_path / "interleaved")
+    mono_cpu, mono_frames = _record(mono, tmp_path / "mono")
+
+    print(
+        f"\n{CHANNELS} mics, {SECONDS:.0f} s: "
+        f"{CHANNELS} mono streams {mono_cpu * 1e3 / SECONDS:.1f} ms CPU/s ({mono_frames} frames each), "
+        f"1 x {CHANNELS}-channel stream {interleaved_cpu * 1e3 / SECONDS:.1f} ms CPU/s ({interleaved_frames} frames)"
+    )
+    assert interleaved_frames > 0 and mono_frames > 0
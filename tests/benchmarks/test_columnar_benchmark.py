@@ -0,0 +1,83 @@
+"""Gaze recording throughput and size: CSV text vs columnar .npy sidecar.
+
+The same 200 Hz-style gaze rows are written through ColumnarSampleWriter in
+both data formats; each variant reports rows/s through append()+stop() and
+bytes per row on disk. The .npy file is then converted back to CSV and
+compared with the CSV writer's output.
+
+Run: pytest tests/benchmarks/test_columnar_benchmark.py -m slow -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from rpi_logger.modules.base.columnar import columnar_to_csv
+from rpi_logger.modules.EyeTracker.tracker_core.recording import ColumnarSampleWriter
+from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import GAZE_COLUMNS, GAZE_HEADER
+
+ROWS = 20_000
+
+
+def _gaze_rows(count: int) -> list[tuple]:
+    rows = []
+    for i in range(count):
+        t = 1_700_000_000.0 + i / 200.0
+        values = [0.5 + (i % 97) * 0.001] * (len(GAZE_COLUMNS) - 6)
+        rows.append((t, 100.0 + i / 200.0, t, int(t * 1e9), b"GazeData", 1, *values))
+    return rows
+
+
+async def _write(tmp_path: Path, data_format: str, rows: list[tuple]) -> tuple[float, Path, int]:
+    writer = ColumnarSampleWriter(
+        GAZE_COLUMNS,
+        header=GAZE_HEADER,
+        prefix_fields=("1", "EyeTracker", "eye_tracker", ""),
+        data_format=data_format,
+        max_pending_chunks=ROWS,  # Measure throughput, not the drop policy
+    )
+    formatted = 0
+    format_chunk = writer.format_chunk
+
+    def counting_format(chunk):
+        nonlocal formatted
+        formatted += len(chunk)
+        return format_chunk(chunk)
+
+    writer.format_chunk = counting_format
+    await writer.start(tmp_path / f"gaze_{data_format}.csv")
+    start = time.perf_counter()
+    for row in rows:
+        writer.append(row)
+    await writer.stop()
+    elapsed = time.perf_counter() - start
+    assert writer.rows_written == len(rows)
+    return len(rows) / elapsed, writer.path, formatted
+
+
+@pytest.mark.slow
+async def test_columnar_vs_csv_gaze(tmp_path: Path):
+    rows = _gaze_rows(ROWS)
+
+    csv_rate, csv_path, csv_formatted = await _write(tmp_path, "csv", rows)
+    npy_rate, npy_path, npy_formatted = await _write(tmp_path, "npy", rows)
+    csv_bytes = csv_path.stat().st_size / ROWS
+    npy_bytes = npy_path.stat().st_size / ROWS
+
+    start = time.perf_counter()
+    converted = columnar_to_csv(npy_path, tmp_path / "converted.csv")
+    convert_rate = ROWS / (time.perf_counter() - start)
+
+    print(
+        f"\ngaze rows ({len(GAZE_COLUMNS)} columns) over {ROWS} rows: "
+        f"csv {csv_rate:,.0f} rows/s {csv_bytes:.0f} B/row, "
+        f"npy {npy_rate:,.0f} rows/s {npy_bytes:.0f} B/row "
+        f"({npy_rate / csv_rate:.1f}x rows/s); offline conversion {convert_rate:,.0f} rows/s"
+    )
+
+    assert converted.read_text() == csv_path.read_text()
+    # Rows formatted as text while recording, not timings: the .npy path
+    # defers all formatting to the offline conversion
+    assert csv_formatted == ROWS
+    assert npy_formatted == 0
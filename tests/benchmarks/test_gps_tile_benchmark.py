@@ -0,0 +1,136 @@
+"""GPS map render cost: per-render connect/query/decode vs shared tile service.
+
+A synthetic offline tile database is filled with noisy PNG tiles (so decoding
+costs roughly what real map tiles do). A vehicle track is replayed that moves
+a few pixels per render and occasionally crosses a tile boundary. The legacy
+path opens a connection, runs one SELECT and decodes every tile on each
+render; the new path uses GPSMapRenderer with a shared TileService.
+
+Run: pytest tests/benchmarks/test_gps_tile_benchmark.py -m slow -s
+"""
+
+import io
+import math
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from rpi_logger.modules.GPS.gps_core.constants import GRID_SIZE, TILE_SIZE
+from rpi_logger.modules.GPS.gps_core.interfaces.gui import GPSMapRenderer, TileService
+
+ZOOM = 13
+RENDERS = 150
+START = (40.7608, -111.8910)
+
+
+def _make_db(path: Path) -> Path:
+    rng = np.random.default_rng(0)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE tiles (zoom int, x int, y int, server text, tile_image blob, "
+        "PRIMARY KEY (zoom, x, y, server))"
+    )
+    rows = []
+    for x in range(1545, 1557):
+        for y in range(3074, 3084):
+            pixels = rng.integers(0, 255, (TILE_SIZE, TILE_SIZE, 3), dtype=np.uint8)
+            pixels[:, :, 2] = 200  # Some compressible structure
+            buf = io.BytesIO()
+            Image.fromarray(pixels).save(buf, format="PNG")
+            rows.append((ZOOM, x, y, "osm", buf.getvalue()))
+    conn.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _track() -> list[tuple[float, float]]:
+    # ~4 px per render eastward: crosses a tile boundary every ~64 renders
+    step = 4 * 360.0 / (2 ** ZOOM * TILE_SIZE)
+    return [(START[0], START[1] + i * step) for i in range(RENDERS)]
+
+
+def _legacy_mosaic(db_path: Path, lat: float, lon: float) -> Image.Image:
+    """The pre-TileService tile loop from GPSMapRenderer._render_tile_mosaic."""
+    load_grid = GRID_SIZE + 2
+    image = Image.new("RGB", (load_grid * TILE_SIZE, load_grid * TILE_SIZE), "#dcdcdc")
+    n = 2 ** ZOOM
+    lat_rad = math.radians(lat)
+    xtile = (lon + 180.0) / 360.0 * n
+    ytile = (1.0 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2.0 * n
+    base_x = int(math.floor(xtile)) - load_grid // 2
+    base_y = int(math.floor(ytile)) - load_grid // 2
+    conn = sqlite3.connect(db_path)
+    cur = conn.cursor()
+    try:
+        for gx in range(load_grid):
+            for gy in range(load_grid):
+                cur.execute(
+                    "SELECT tile_image FROM tiles WHERE zoom=? AND x=? AND y=? LIMIT 1",
+                    (ZOOM, (base_x + gx) % n, min(max(base_y + gy, 0), n - 1)),
+                )
+                row = cur.fetchone()
+                tile = Image.open(io.BytesIO(row[0])).convert("RGB") if row else None
+                if tile is None:
+                    tile = Image.new("RGB", (TILE_SIZE, TILE_SIZE), "#b9c1c9")
+                image.paste(tile, (gx * TILE_SIZE, gy * TILE_SIZE))
+    finally:
+        conn.close()
+    return image
+
+
+@pytest.mark.slow
+def test_tile_service_vs_legacy(tmp_path: Path):
+    db_path = _make_db(tmp_path / "tiles.db")
+    track = _track()
+
+    start = time.perf_counter()
+    for lat, lon in track:
+        _legacy_mosaic(db_path, lat, lon)
+    legacy_ms = (time.perf_counter() - start) * 1000 / RENDERS
+
+    service = TileService(db_path)
+    renderers = [GPSMapRenderer(db_path, tile_service=service) for _ in range(2)]
+    for renderer in renderers:
+        renderer.set_zoom(ZOOM)
+    start = time.perf_counter()
+    for lat, lon in track:
+        for renderer in renderers:
+            renderer.set_center(lat, lon)
+            renderer._update_mosaic(ZOOM, *_origin(renderer, lat, lon))
+    cached_ms = (time.perf_counter() - start) * 1000 / (RENDERS * len(renderers))
+    decodes = service.stats()["misses"]
+    legacy_decodes = RENDERS * (GRID_SIZE + 2) ** 2  # Every tile, every render
+
+    # Full render (mosaic + crop + overlays) for context
+    start = time.perf_counter()
+    for lat, lon in track:
+        renderers[0].set_center(lat, lon)
+        renderers[0].render()
+    full_ms = (time.perf_counter() - start) * 1000 / RENDERS
+    stats = service.stats()
+    service.close()
+
+    print(
+        f"\nmosaic per render over {RENDERS} renders: legacy {legacy_ms:.2f} ms, "
+        f"tile service {cached_ms:.3f} ms (2 devices sharing, {legacy_ms / cached_ms:.0f}x); "
+        f"full render {full_ms:.2f} ms; cache {stats}; "
+        f"tile decodes {decodes} vs legacy {legacy_decodes}"
+    )
+    # Decode counts, not timings: each tile on the track is decoded once
+    # for both devices instead of on every render
+    assert decodes * 10 < legacy_decodes
+
+
+def _origin(renderer: GPSMapRenderer, lat: float, lon: float) -> tuple[int, int, int]:
+    load_grid = GRID_SIZE + 2
+    xtile, ytile = renderer._latlon_to_tile(lat, lon, ZOOM)
+    return (
+        int(math.floor(xtile)) - load_grid // 2,
+        int(math.floor(ytile)) - load_grid // 2,
+        load_grid,
+    )
@@ -0,0 +1,90 @@
+"""GPS trajectory drawing cost for a multi-hour drive.
+
+A 3-hour random-walk drive at 10 Hz (108k fixes) is drawn on the 768x768
+map. The scalar path reprojects every point with ``math`` calls and draws
+all of them, as the renderer did with its 500-point deque but for the whole
+session. The vectorized path projects in batches, draws the per-zoom
+Douglas-Peucker simplification and culls off-screen segments. Renders are
+interleaved with new fixes, as the live map does at 5 renders/s.
+
+Run: pytest tests/benchmarks/test_gps_trajectory_benchmark.py -m slow -s
+"""
+
+import math
+import time
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from rpi_logger.modules.GPS.gps_core.constants import GRID_SIZE, TILE_SIZE
+from rpi_logger.modules.GPS.gps_core.interfaces.gui.gps_map_renderer import GPSMapRenderer
+
+ZOOM = 13
+FIXES = 3 * 3600 * 10
+RENDERS = 20
+FIXES_PER_RENDER = 2  # 10 Hz receiver, 5 renders/s
+
+
+def _drive() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    heading = np.cumsum(rng.normal(0, 0.05, FIXES))
+    step = 1.5e-5  # ~1.5 m per fix
+    lat = 40.7608 + np.cumsum(step * np.cos(heading))
+    lon = -111.8910 + np.cumsum(step * np.sin(heading))
+    return lat, lon
+
+
+def _scalar_draw(image: Image.Image, lat: np.ndarray, lon: np.ndarray, base_x: int, base_y: int) -> None:
+    draw = ImageDraw.Draw(image)
+    n = 2 ** ZOOM
+    points = []
+    for la, lo in zip(lat.tolist(), lon.tolist()):
+        lat_rad = math.radians(la)
+        x = ((lo + 180.0) / 360.0 * n - base_x) * TILE_SIZE
+        y = ((1.0 - math.log(math.tan(lat_rad) + 1 / math.cos(lat_rad)) / math.pi) / 2.0 * n - base_y) * TILE_SIZE
+        if -100 < x < image.width + 100 and -100 < y < image.height + 100:
+            points.append((x, y))
+    if len(points) >= 2:
+        draw.line(points, fill="#3498db", width=3)
+
+
+@pytest.mark.slow
+def test_trajectory_draw_cost(tmp_path):
+    lat, lon = _drive()
+    size = GRID_SIZE * TILE_SIZE
+    renderer = GPSMapRenderer(tmp_path / "none.db")
+    for la, lo in zip(lat[:-RENDERS * FIXES_PER_RENDER].tolist(), lon[:-RENDERS * FIXES_PER_RENDER].tolist()):
+        renderer.add_position_to_trajectory(la, lo)
+
+    center_x, center_y = renderer._latlon_to_tile(lat[-1], lon[-1], ZOOM)
+    base_x = int(center_x) - GRID_SIZE // 2
+    base_y = int(center_y) - GRID_SIZE // 2
+
+    start = time.perf_counter()
+    _scalar_draw(Image.new("RGB", (size, size)), lat, lon, base_x, base_y)
+    scalar_ms = (time.perf_counter() - start) * 1000
+
+    # First draw at this zoom simplifies the whole session once
+    start = time.perf_counter()
+    renderer._draw_trajectory(Image.new("RGB", (size, size)), ZOOM, base_x, base_y, 0, 0)
+    first_ms = (time.perf_counter() - start) * 1000
+
+    offset = len(lat) - RENDERS * FIXES_PER_RENDER
+    start = time.perf_counter()
+    for i in range(RENDERS):
+        for j in range(FIXES_PER_RENDER):
+            k = offset + i * FIXES_PER_RENDER + j
+            renderer.add_position_to_trajectory(lat[k], lon[k])
+        renderer._draw_trajectory(Image.new("RGB", (size, size)), ZOOM, base_x, base_y, 0, 0)
+    live_ms = (time.perf_counter() - start) * 1000 / RENDERS
+    drawn = renderer._trajectory.simplified_count(ZOOM)
+
+    print(
+        f"\n{FIXES:,} fixes: scalar draw {scalar_ms:.0f} ms/render; vectorized first draw "
+        f"{first_ms:.0f} ms, then {live_ms:.2f} ms/render ({drawn:,} simplified points)"
+    )
+    # Point counts, not timings: the live map draws the simplified path,
+    # not every fix of the session
+    assert len(renderer._trajectory) == FIXES
+    assert drawn * 10 < FIXES
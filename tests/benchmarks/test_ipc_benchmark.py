@@ -0,0 +1,141 @@
+"""Module-to-master status traffic: framed socket channel vs JSON lines.
+
+A child Python process plays the module and sends statuses with
+``StatusMessage.send``, exactly as modules do. Without ``RPI_LOGGER_IPC_FD``
+that is a ``print(json.dumps(...), flush=True)`` per message to stdout,
+which the master reads with ``readline`` and parses into ``StatusMessage``
+(the old path); with it, the same calls go out as batched frames over a
+socketpair, read with ``read_frames``. Reported per path: forwarded
+``log_message`` records per second, write syscalls the module made for
+them, CPU per message in the sending module thread and in the master's
+event loop thread, and the delay from send to the master seeing an urgent
+status while log records stream in the background.
+
+Run: pytest tests/benchmarks/test_ipc_benchmark.py -m slow -s
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import pytest
+
+from rpi_logger.core.commands import StatusMessage
+from rpi_logger.core.commands.ipc_channel import IPC_FD_ENV, create_channel_pair, read_frames
+from rpi_logger.core.paths import PROJECT_ROOT
+
+MESSAGES = 20000
+LATENCY_SAMPLES = 200
+
+MODULE_SCRIPT = """
+import sys, threading, time
+from rpi_logger.core.commands import StatusMessage
+
+messages, samples = int(sys.argv[1]), int(sys.argv[2])
+StatusMessage.send("ready")
+cpu_start = time.thread_time()
+for index in range(messages):
+    StatusMessage.send("log_message", {
+        "level": "INFO",
+        "logger": "rpi_logger.modules.DRT.handler",
+        "message": f"Trial {index} logged: rt=312 ms, clicks=1",
+        "created": time.time(),
+    })
+send_cpu = (time.thread_time() - cpu_start) / messages
+# Without a channel every send is one flushed write
+writes = StatusMessage.channel.writes if StatusMessage.channel else messages
+StatusMessage.send("heartbeat", {"sent_ns": time.perf_counter_ns(), "send_cpu": send_cpu, "writes": writes})
+
+stop = threading.Event()
+def background():
+    while not stop.is_set():
+        StatusMessage.send("log_message", {"level": "DEBUG", "message": "frame written"})
+        time.sleep(0.0002)
+thread = threading.Thread(target=background)
+thread.start()
+for _ in range(samples):
+    time.sleep(0.002)
+    StatusMessage.send("command_ack", {"sent_ns": time.perf_counter_ns(), "success": True})
+stop.set()
+thread.join()
+"""
+
+
+async def _json_statuses(process, _channel):
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            return
+        yield StatusMessage(line.decode("utf-8", errors="replace").strip())
+
+
+async def _framed_statuses(_process, channel):
+    reader, writer = await asyncio.open_connection(sock=channel)
+    try:
+        async for _frame_type, data in read_frames(reader):
+            yield StatusMessage.from_data(data)
+    finally:
+        writer.close()
+
+
+async def _measure(framed):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    env.pop(IPC_FD_ENV, None)
+    channel = module_socket = None
+    pass_fds = ()
+    if framed:
+        channel, module_socket = create_channel_pair()
+        env[IPC_FD_ENV] = str(module_socket.fileno())
+        pass_fds = (module_socket.fileno(),)
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", MODULE_SCRIPT, str(MESSAGES), str(LATENCY_SAMPLES),
+        stdout=asyncio.subprocess.PIPE, env=env, pass_fds=pass_fds,
+    )
+    if module_socket is not None:
+        module_socket.close()
+
+    statuses = (_framed_statuses if framed else _json_statuses)(process, channel)
+    logs = 0
+    start = cpu_start = None
+    rate = writes = send_cpu = master_cpu = None
+    delays = []
+    async for status in statuses:
+        status_type = status.get_status_type()
+        if status_type == "ready":
+            start, cpu_start = time.perf_counter(), time.thread_time()
+        elif status_type == "log_message":
+            logs += 1
+        elif status_type == "heartbeat":
+            rate = logs / (time.perf_counter() - start)
+            master_cpu = (time.thread_time() - cpu_start) / logs
+            send_cpu = status.get_payload()["send_cpu"]
+            writes = status.get_payload()["writes"]
+        elif status_type == "command_ack":
+            delays.append((time.perf_counter_ns() - status.get_payload()["sent_ns"]) / 1e6)
+    await process.wait()
+    return rate, writes, send_cpu, master_cpu, delays
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX socketpair channel")
+def test_framed_channel_vs_json_lines():
+    json_lines = asyncio.run(_measure(framed=False))
+    framed = asyncio.run(_measure(framed=True))
+
+    for name, (rate, writes, send_cpu, master_cpu, delays) in (("json", json_lines), ("framed", framed)):
+        print(
+            f"\n{name:7s} {rate:9.0f} log msgs/s in {writes:6d} writes | CPU/msg module {send_cpu * 1e6:5.1f} us, "
+            f"master {master_cpu * 1e6:5.1f} us | "
+            f"urgent status seen after median {statistics.median(delays):6.3f} ms, "
+            f"p95 {statistics.quantiles(delays, n=20)[-1]:6.3f} ms"
+        )
+
+    assert len(framed[4]) == LATENCY_SAMPLES
+    # Write counts, not timings: JSON lines is one write per message, the
+    # channel batches (a write per message would need 20 ms per send)
+    assert json_lines[1] == MESSAGES
+    assert framed[1] < MESSAGES // 2
@@ -0,0 +1,54 @@
+"""Per-frame cost of the timestamp overlay: copy + cv2.putText vs glyph atlas.
+
+The old path copied the whole frame and rasterized every glyph each frame;
+the atlas path blends pre-rasterized glyphs into the text region only, so
+its cost should stay flat as resolution grows.
+
+Run: pytest tests/benchmarks/test_overlay_benchmark.py -m slow -s
+"""
+
+import time
+from datetime import datetime, timezone
+
+import cv2
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.frame_overlay import TextOverlay, TimestampFormatter, get_glyph_atlas
+
+FRAMES = 300
+RESOLUTIONS = [(640, 480), (1920, 1080), (3840, 2160)]
+
+
+def _legacy_overlay(frame: np.ndarray, timestamp: float, frame_number: int) -> np.ndarray:
+    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    text = f"{dt.strftime('%Y-%m-%dT%H:%M:%S')}.{int((timestamp % 1) * 1000):03d} #{frame_number}"
+    frame = frame.copy()
+    cv2.putText(frame, text, (8, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+    return frame
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("resolution", RESOLUTIONS, ids=lambda r: f"{r[0]}x{r[1]}")
+def test_overlay_cost_independent_of_resolution(resolution):
+    width, height = resolution
+    frame = np.full((height, width, 3), 90, np.uint8)
+    timestamps = [1_700_000_000.0 + n / 30 for n in range(FRAMES)]
+
+    start = time.perf_counter()
+    for n, ts in enumerate(timestamps, 1):
+        _legacy_overlay(frame, ts, n)
+    legacy_us = (time.perf_counter() - start) / FRAMES * 1e6
+
+    overlay = TextOverlay(get_glyph_atlas(0.5, 1, (255, 255, 255)), (8, 24))
+    formatter = TimestampFormatter()
+    start = time.perf_counter()
+    for n, ts in enumerate(timestamps, 1):
+        overlay.render(frame, formatter.format(ts, n))
+    atlas_us = (time.perf_counter() - start) / FRAMES * 1e6
+
+    print(
+        f"\noverlay {width}x{height}: copy+putText {legacy_us:.1f} us, "
+        f"glyph atlas {atlas_us:.1f} us, {overlay.glyphs_rendered / FRAMES:.1f} glyphs/frame"
+    )
+    assert overlay.glyphs_rendered < FRAMES * 12
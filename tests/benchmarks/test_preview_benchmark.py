@@ -0,0 +1,62 @@
+"""Per-frame cost of preview conversion at 1080p: convert-then-resize vs shared pipeline.
+
+The old Cameras/CSI paths converted the full frame to RGB (CSI: full I420
+conversion) and then resized; base.preview resizes first and, for I420,
+converts a small buffer built from downscaled planes.
+
+Run: pytest tests/benchmarks/test_preview_benchmark.py -m slow -s
+"""
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.preview import bgr_to_ppm, yuv420_to_ppm
+
+FRAMES = 100
+WIDTH, HEIGHT, STRIDE = 1920, 1080, 2048
+SCALE = 0.25
+
+
+def _legacy_bgr(frame: np.ndarray) -> bytes:
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    rgb = cv2.resize(rgb, (int(WIDTH * SCALE), int(HEIGHT * SCALE)), interpolation=cv2.INTER_NEAREST)
+    h, w = rgb.shape[:2]
+    return f"P6\n{w} {h}\n255\n".encode() + rgb.tobytes()
+
+
+def _legacy_yuv(data: np.ndarray) -> bytes:
+    rgb = cv2.cvtColor(data, cv2.COLOR_YUV2RGB_I420)[:HEIGHT, :WIDTH]
+    rgb = cv2.resize(rgb, (int(WIDTH * SCALE), int(HEIGHT * SCALE)), interpolation=cv2.INTER_NEAREST)
+    h, w = rgb.shape[:2]
+    return f"P6\n{w} {h}\n255\n".encode() + rgb.tobytes()
+
+
+def _per_frame_ms(convert, *args) -> float:
+    convert(*args)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        convert(*args)
+    return (time.perf_counter() - start) / FRAMES * 1e3
+
+
+@pytest.mark.slow
+def test_preview_conversion_cost():
+    rng = np.random.default_rng(0)
+    bgr = rng.integers(0, 256, (HEIGHT, WIDTH, 3), np.uint8)
+    yuv = rng.integers(0, 256, (HEIGHT * 3 // 2, STRIDE), np.uint8)
+
+    legacy_bgr = _per_frame_ms(_legacy_bgr, bgr)
+    shared_bgr = _per_frame_ms(bgr_to_ppm, bgr, SCALE)
+    legacy_yuv = _per_frame_ms(_legacy_yuv, yuv)
+    shared_yuv = _per_frame_ms(yuv420_to_ppm, yuv, (WIDTH, HEIGHT), SCALE)
+
+    print(
+        f"\npreview {WIDTH}x{HEIGHT} @ {SCALE}: "
+        f"BGR {legacy_bgr:.2f} -> {shared_bgr:.2f} ms, "
+        f"I420 {legacy_yuv:.2f} -> {shared_yuv:.2f} ms"
+    )
+    assert bgr_to_ppm(bgr, SCALE) == _legacy_bgr(bgr)
+    assert shared_yuv < legacy_yuv
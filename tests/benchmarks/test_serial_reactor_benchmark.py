@@ -0,0 +1,135 @@
+"""Serial input: reactor reader thread vs the old poll-and-sleep read loop.
+
+A pseudo-terminal stands in for the USB serial device. The old loop is
+what DRT did before the reactor: an ``asyncio.to_thread`` read of
+``in_waiting`` bytes, then a 10 ms sleep. The reactor loop drains the
+transport and waits on its inbox. Reported per loop: CPU used and loop
+wakeups while the port is idle, and the delay from writing a line to the loop seeing it
+(and, for the reactor, to its arrival stamp).
+
+Run: pytest tests/benchmarks/test_serial_reactor_benchmark.py -m slow -s
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import pytest
+
+from rpi_logger.core.devices.transports import LineInbox, SerialReactor
+
+serial = pytest.importorskip("serial")
+
+IDLE_SECONDS = 2.0
+SAMPLES = 50
+
+
+def _open_pty():
+    master, slave = os.openpty()
+    port = serial.Serial(os.ttyname(slave), baudrate=921600, timeout=1.0)
+    return master, slave, port
+
+
+async def _legacy_loop(port, seen, stop, wakes):
+    buffer = b""
+    while not stop.is_set():
+        wakes[0] += 1
+        waiting = await asyncio.to_thread(lambda: port.in_waiting)
+        if waiting:
+            buffer += await asyncio.to_thread(port.read, waiting)
+        while b"\n" in buffer:
+            _, buffer = buffer.split(b"\n", 1)
+            seen.append((time.perf_counter_ns(), 0))
+        await asyncio.sleep(0.01)
+
+
+async def _reactor_loop(inbox, seen, stop, wakes):
+    while not stop.is_set():
+        wakes[0] += 1
+        arrived = inbox.get_nowait()
+        if arrived is not None:
+            seen.append((time.perf_counter_ns(), arrived.arrival_mono_ns))
+            continue
+        await inbox.wait(0.5)
+
+
+async def _measure(loop_factory, master):
+    seen = []
+    wakes = [0]
+    stop = asyncio.Event()
+    task = asyncio.create_task(loop_factory(seen, stop, wakes))
+    await asyncio.sleep(0.2)
+
+    cpu_start = time.process_time()
+    wakes_start = wakes[0]
+    await asyncio.sleep(IDLE_SECONDS)
+    idle_cpu = (time.process_time() - cpu_start) / IDLE_SECONDS
+    idle_wakes = wakes[0] - wakes_start
+
+    seen_delays, stamp_delays = [], []
+    for index in range(SAMPLES):
+        count = len(seen)
+        written = time.perf_counter_ns()
+        os.write(master, b"trl>%d,1,250\r\n" % index)
+        while len(seen) == count:
+            await asyncio.sleep(0.0005)
+        seen_at, stamped_at = seen[-1]
+        seen_delays.append((seen_at - written) / 1e6)
+        if stamped_at:
+            stamp_delays.append((stamped_at - written) / 1e6)
+        await asyncio.sleep(0.013)  # Land at varying points of the poll period
+
+    stop.set()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    return idle_cpu, seen_delays, stamp_delays, idle_wakes
+
+
+def _report(name, idle_cpu, seen_delays, stamp_delays, idle_wakes):
+    print(
+        f"\n{name:8s} idle CPU {idle_cpu * 1000:6.2f} ms/s, {idle_wakes:4d} wakeups | "
+        f"line seen after median {statistics.median(seen_delays):6.3f} ms, "
+        f"max {max(seen_delays):6.3f} ms"
+        + (f" | arrival stamp after median {statistics.median(stamp_delays):6.3f} ms" if stamp_delays else "")
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs a pty")
+def test_serial_reactor_vs_polling():
+    async def _run():
+        master, slave, port = _open_pty()
+        try:
+            legacy = await _measure(
+                lambda seen, stop, wakes: _legacy_loop(port, seen, stop, wakes), master,
+            )
+
+            reactor = SerialReactor()
+            inbox = LineInbox()
+            reader = reactor.attach(port, inbox, name="pty")
+            try:
+                event_driven = await _measure(
+                    lambda seen, stop, wakes: _reactor_loop(inbox, seen, stop, wakes), master,
+                )
+            finally:
+                await asyncio.to_thread(reactor.detach, reader)
+        finally:
+            port.close()
+            os.close(master)
+            os.close(slave)
+        return legacy, event_driven
+
+    legacy, event_driven = asyncio.run(_run())
+    _report("polling", *legacy)
+    _report("reactor", *event_driven)
+
+    # Counts, not timings: the polling loop wakes every 10 ms while idle, the
+    # reactor loop only on its 0.5 s wait timeout; every line is stamped
+    assert event_driven[3] <= IDLE_SECONDS / 0.5 + 1
+    assert legacy[3] > event_driven[3] * 10
+    assert len(event_driven[2]) == SAMPLES
@@ -0,0 +1,127 @@
+"""Timeline alignment on a multi-hour session.
+
+A 2-hour trial is synthesised: a 30 fps camera whose sensor clock runs
+40 ppm slow, 48 kHz audio in 1024-frame blocks whose sample clock runs
+25 ppm slow, 200 Hz gaze in a columnar .npy and 10 Hz GPS. Arrival times
+carry exponential transport jitter. The benchmark reports how long
+``build_timeline`` and both index formats take, and compares the host time
+of the last audio sample against the old alignment, which took the stream's
+start from its first timing row and assumed the sample clock ran at the
+host rate.
+
+Run: pytest tests/benchmarks/test_timeline_benchmark.py -m slow -s
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.columnar import ColumnarFile
+from rpi_logger.modules.base.timeline import build_timeline, index_path, write_index
+from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import GAZE_COLUMNS, GAZE_HEADER
+
+SECONDS = 2 * 3600
+HOST0 = 1000.0
+UNIX0 = 1_700_000_000.0
+PREFIX = "trial,module,device_id,label,record_time_unix,record_time_mono"
+
+
+def _write_csv(path: Path, header: str, fmt: str, columns: list[np.ndarray]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savetxt(path, np.column_stack(columns), fmt=fmt, header=header, comments="")
+
+
+def _make_session(root: Path) -> dict:
+    rng = np.random.default_rng(0)
+
+    n = SECONDS * 30
+    camera = HOST0 + 0.2 + np.arange(n) / 30
+    sensor = np.round((camera - HOST0) * (1 - 40e-6) * 1e9 + 5e12)
+    arrive = camera + 0.004 + rng.exponential(0.002, n)
+    _write_csv(
+        root / "Cameras/s_CAM_trial001_cam0_timing.csv",
+        f"{PREFIX},frame_index,sensor_timestamp_ns,video_pts",
+        "1,CSICameras,cam0,,%.6f,%.9f,%d,%d,%d",
+        [UNIX0 + arrive - HOST0, arrive, np.arange(1, n + 1), sensor, np.arange(1, n + 1)],
+    )
+
+    blocks = SECONDS * 48000 // 1024
+    total = np.arange(1, blocks + 1) * 1024
+    audio = HOST0 + 0.1 + total / 48000 * (1 + 25e-6)
+    arrive = audio + 0.001 + rng.exponential(0.003, blocks)
+    _write_csv(
+        root / "Audio/s_AUD_trial001_MIC0_mic_timing.csv",
+        f"{PREFIX},device_time_unix,device_time_offset,write_time_unix,write_time_mono,chunk_index,frames,total_frames",
+        "1,Audio,0,,%.6f,%.9f,,,0,0,%d,1024,%d",
+        [UNIX0 + arrive - HOST0, arrive, np.arange(1, blocks + 1), total],
+    )
+
+    n = SECONDS * 200
+    gaze = HOST0 + 0.05 + np.arange(n) / 200
+    device_ns = (1.7e18 + (gaze - HOST0) * 1e9).astype(np.int64)
+    arrive = gaze + 0.02 + rng.exponential(0.005, n)
+    (root / "EyeTracker").mkdir()
+    columnar = ColumnarFile(
+        root / "EyeTracker/s_ET_trial001_GAZE.npy", GAZE_COLUMNS,
+        csv_header=GAZE_HEADER.split(","), prefix_fields=(1, "EyeTracker", "neon", ""),
+    )
+    rows = np.zeros(n, dtype=columnar.dtype)
+    rows["record_time_unix"] = UNIX0 + arrive - HOST0
+    rows["record_time_mono"] = arrive
+    rows["device_time_unix"] = device_ns / 1e9
+    rows["device_time_ns"] = device_ns
+    columnar.write(rows)
+    columnar.close()
+
+    n = SECONDS * 10
+    fix = HOST0 + np.arange(n) / 10
+    arrive = fix + 0.08 + rng.exponential(0.01, n)
+    _write_csv(
+        root / "GPS/s_GPS_serial0.csv",
+        f"{PREFIX},device_time_unix,latitude_deg",
+        "1,GPS,GPS:serial0,,%.6f,%.9f,%.3f,%.6f",
+        [UNIX0 + arrive - HOST0, arrive, UNIX0 + fix - HOST0, np.full(n, -37.8)],
+    )
+    return {"audio_end": audio[-1]}
+
+
+@pytest.mark.slow
+def test_timeline_multi_hour(tmp_path: Path):
+    root = tmp_path / "session_20251208_143022"
+    truth = _make_session(root)
+
+    start = time.perf_counter()
+    timeline = build_timeline(root, 1)
+    build_s = time.perf_counter() - start
+    samples = sum(len(stream) for stream in timeline.streams)
+
+    start = time.perf_counter()
+    write_index(timeline, index_path(root, "s", 1, "npy"), "npy")
+    npy_s = time.perf_counter() - start
+    start = time.perf_counter()
+    write_index(timeline, index_path(root, "s", 1))
+    csv_s = time.perf_counter() - start
+
+    camera = timeline.stream(root / "Cameras/s_CAM_trial001_cam0_timing.csv")
+    audio = timeline.stream(root / "Audio/s_AUD_trial001_MIC0_mic_timing.csv")
+
+    # Host time of the last audio sample: first row + nominal sample rate vs fit
+    first_row_end = audio.record_time_mono[0] - 1024 / 48000 + len(audio) * 1024 / 48000
+    first_row_err = abs(first_row_end - truth["audio_end"])
+    aligned_err = abs(audio.aligned_time_mono[-1] - truth["audio_end"])
+
+    print(
+        f"\n{SECONDS / 3600:.0f} h trial, {len(timeline.streams)} streams, {samples:,} samples: "
+        f"build {build_s:.2f}s ({samples / build_s:,.0f} samples/s), "
+        f"index npy {npy_s:.2f}s, csv {csv_s:.2f}s\n"
+        f"camera drift {camera.clock.drift_ppm:+.2f} ppm (true +40), "
+        f"audio drift {audio.clock.drift_ppm:+.2f} ppm (true +25); "
+        f"last audio sample error: first row {first_row_err * 1e3:.1f} ms, "
+        f"timeline {aligned_err * 1e3:.1f} ms"
+    )
+
+    assert camera.clock.drift_ppm == pytest.approx(40.0, abs=1.0)
+    assert audio.clock.drift_ppm == pytest.approx(25.0, abs=1.0)
+    assert aligned_err < first_row_err / 10
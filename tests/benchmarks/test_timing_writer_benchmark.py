@@ -0,0 +1,99 @@
+"""Per-frame overhead of timing CSV writes: per-frame flush vs batched sink.
+
+Frames come from the mock camera backend; each variant writes the same
+frames and reports mean microseconds spent in write_frame() on the event loop
+and the number of file flushes.
+
+Run: pytest tests/benchmarks/test_timing_writer_benchmark.py -m slow -s
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from rpi_logger.modules.Cameras.capture import CapturedFrame
+from rpi_logger.modules.Cameras.recording import TimingWriter
+from tests.infrastructure.mocks.camera_mocks import MockCameraBackend
+
+FRAMES = 600
+
+
+class LegacyTimingWriter(TimingWriter):
+    """Previous behaviour: one executor hop plus write+flush per frame."""
+
+    async def start(self) -> None:
+        self._file = open(self._path, "w")
+        self._file.write(self.HEADER)
+        self._file.flush()
+        self._frame_index = 0
+        self.flushes = 0
+
+    async def write_frame(self, frame) -> None:
+        self._frame_index += 1
+        row = self._format_row(frame, self._frame_index)
+        await asyncio.to_thread(self._write_and_flush, row)
+
+    def _write_and_flush(self, row: str) -> None:
+        self._file.write(row)
+        self._file.flush()
+        self.flushes += 1
+
+    async def stop(self) -> None:
+        self._file.close()
+
+
+def _mock_frames(count: int) -> list[CapturedFrame]:
+    backend = MockCameraBackend(width=64, height=48, fps=1e9)
+    backend.open()
+    frames = []
+    for n in range(1, count + 1):
+        _, data = backend.read()
+        frames.append(CapturedFrame(
+            data=data,
+            frame_number=n,
+            monotonic_time=time.perf_counter(),
+            wall_time=time.time(),
+            size=(data.shape[1], data.shape[0]),
+        ))
+    backend.release()
+    return frames
+
+
+async def _per_frame_us(writer, frames) -> tuple[float, int]:
+    await writer.start()
+    stream = writer._stream  # None for the legacy writer
+    start = time.perf_counter()
+    for frame in frames:
+        await writer.write_frame(frame)
+    elapsed = time.perf_counter() - start
+    await writer.stop()
+    flushes = stream.flushes if stream is not None else writer.flushes
+    return elapsed / len(frames) * 1e6, flushes
+
+
+@pytest.mark.slow
+async def test_batched_timing_writer_overhead(tmp_path: Path):
+    frames = _mock_frames(FRAMES)
+
+    legacy_us, legacy_flushes = await _per_frame_us(
+        LegacyTimingWriter(tmp_path / "legacy.csv", 1, "cam"), frames,
+    )
+    batched_us, batched_flushes = await _per_frame_us(
+        TimingWriter(tmp_path / "batched.csv", 1, "cam"), frames,
+    )
+
+    print(
+        f"\ntiming write_frame over {FRAMES} mock frames: "
+        f"per-frame flush {legacy_us:.1f} us, batched sink {batched_us:.1f} us "
+        f"({legacy_us / batched_us:.1f}x); flushes {legacy_flushes} vs {batched_flushes}"
+    )
+
+    legacy_rows = (tmp_path / "legacy.csv").read_text().splitlines()
+    batched_rows = (tmp_path / "batched.csv").read_text().splitlines()
+    assert len(batched_rows) == len(legacy_rows) == FRAMES + 1
+    # Flush counts, not timings: one per frame vs one per FlushPolicy batch
+    # (max_rows rows, or fewer when the max_delay timer fires first)
+    assert legacy_flushes == FRAMES
+    assert batched_flushes <= FRAMES // 4
@@ -85,6 +85,12 @@ def sample_gps_csv(test_data_dir) -> Path:
     return test_data_dir / "sample_gps.csv"
 
 
+@pytest.fixture
+def sample_nmea_gnss(test_data_dir) -> Path:
+    """Return path to 5 s of raw NMEA from a 10 Hz multi-constellation receiver."""
+    return test_data_dir / "sample_nmea_gnss_10hz.nmea"
+
+
 @pytest.fixture
 def sample_drt_sdrt_csv(test_data_dir) -> Path:
     """Return path to sample sDRT CSV fixture."""
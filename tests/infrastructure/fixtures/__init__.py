@@ -41,3 +41,6 @@ def get_sample_eyetracker_events_csv() -> Path:
 
 def get_sample_notes_csv() -> Path:
     return FIXTURES_DIR / "sample_notes.csv"
+
+def get_sample_nmea_gnss() -> Path:
+    return FIXTURES_DIR / "sample_nmea_gnss_10hz.nmea"
@@ -7,8 +7,16 @@ data types, and value constraints.
 
 from __future__ import annotations
 
+import csv
+
 import pytest
 
+from rpi_logger.modules.base.columnar import ColumnarFile, as_float, as_int, columnar_to_csv
+from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import (
+    EVENT_COLUMNS,
+    GAZE_COLUMNS,
+    IMU_COLUMNS,
+)
 from tests.infrastructure.schemas.csv_schema import (
     EYETRACKER_GAZE_SCHEMA,
     EYETRACKER_IMU_SCHEMA,
@@ -63,3 +71,39 @@ class TestEyeTrackerSchema:
     def test_events_column_count(self):
         """Test EVENTS has 24 columns."""
         assert EYETRACKER_EVENTS_SCHEMA.column_count == 24
+
+
+class TestEyeTrackerColumnarSchema:
+    """Columnar (data_format = npy) recordings convert to schema-valid CSVs."""
+
+    @pytest.mark.parametrize("get_csv, columns, schema", [
+        (get_sample_eyetracker_gaze_csv, GAZE_COLUMNS, EYETRACKER_GAZE_SCHEMA),
+        (get_sample_eyetracker_imu_csv, IMU_COLUMNS, EYETRACKER_IMU_SCHEMA),
+        (get_sample_eyetracker_events_csv, EVENT_COLUMNS, EYETRACKER_EVENTS_SCHEMA),
+    ])
+    def test_converted_csv_is_valid(self, tmp_path, get_csv, columns, schema):
+        csv_path = get_csv()
+        if not csv_path.exists():
+            pytest.skip("EyeTracker sample fixture not found")
+
+        with csv_path.open(newline="", encoding="utf-8") as handle:
+            header, *rows = list(csv.reader(handle))
+        prefix = rows[0][:4]
+        columnar = ColumnarFile(tmp_path / "data.npy", columns, csv_header=header, prefix_fields=prefix)
+        for row in rows:
+            values = []
+            for column, text in zip(columns, row[4:]):
+                if column.dtype.startswith("f"):
+                    values.append(as_float(text or None))
+                elif column.dtype.startswith("i"):
+                    values.append(as_int(text or None))
+                elif column.dtype.startswith("S"):
+                    values.append(text.encode())
+                else:
+                    values.append(text)
+            columnar.write([tuple(values)])
+        columnar.close()
+
+        result = validate_csv_file(columnar_to_csv(tmp_path / "data.npy"), schema)
+        assert result.is_valid, f"Converted CSV validation failed: {result.errors}"
+        assert result.row_count == len(rows)
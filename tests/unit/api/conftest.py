@@ -17,6 +17,7 @@ from aiohttp.test_utils import AioHTTPTestCase, TestClient, TestServer
 from rpi_logger.core.api.server import APIServer
 from rpi_logger.core.api.controller import APIController
 from rpi_logger.core.api.routes import setup_all_routes
+from rpi_logger.core.telemetry import TelemetryBus
 
 
 T = TypeVar("T")
@@ -41,6 +42,7 @@ class MockLoggerSystem:
         self._modules = self._create_mock_modules()
         self._enabled_states = {m.name: True for m in self._modules[:4]}
         self._running_modules = []
+        self.telemetry = TelemetryBus()
 
     def _create_mock_modules(self) -> List[MagicMock]:
         """Create mock module descriptors."""
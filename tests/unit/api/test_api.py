@@ -954,6 +954,87 @@ class TestLogRoutes:
         run_async(do_test())
 
 
+# =============================================================================
+# Telemetry Stream Routes Tests
+# =============================================================================
+
+
+class TestStreamRoutes:
+    """Tests for /api/v1/stream endpoints."""
+
+    def test_latest_telemetry(self, mock_controller: MockAPIController):
+        """GET /api/v1/stream/latest returns the newest sample per topic."""
+
+        async def do_test():
+            bus = mock_controller.logger_system.telemetry
+            bus.publish("Audio:1", "audio.levels", {"rms_db": -20.0})
+            bus.publish("GPS:1", "gps.fix", {"fix_valid": True})
+            app = create_test_app(mock_controller)
+            async with TestClient(TestServer(app)) as client:
+                resp = await client.get("/api/v1/stream/latest?topics=audio.*")
+                assert resp.status == 200
+                data = await resp.json()
+                assert data["count"] == 1
+                assert data["samples"][0]["values"] == {"rms_db": -20.0}
+
+        run_async(do_test())
+
+    def test_stream_invalid_rate(self, mock_controller: MockAPIController):
+        """GET /api/v1/stream rejects a non-numeric rate."""
+
+        async def do_test():
+            app = create_test_app(mock_controller)
+            async with TestClient(TestServer(app)) as client:
+                resp = await client.get("/api/v1/stream?rate=fast")
+                assert resp.status == 400
+
+        run_async(do_test())
+
+    def test_sse_stream(self, mock_controller: MockAPIController):
+        """GET /api/v1/stream without upgrade streams Server-Sent Events."""
+
+        async def do_test():
+            bus = mock_controller.logger_system.telemetry
+            bus.publish("DRT:1", "drt.trial", {"reaction_time": 350})
+            app = create_test_app(mock_controller)
+            async with TestClient(TestServer(app)) as client:
+                resp = await client.get("/api/v1/stream?topics=drt.*&rate=10")
+                assert resp.status == 200
+                assert resp.headers["Content-Type"].startswith("text/event-stream")
+                text = ""
+                while "event: telemetry" not in text:
+                    text += (await asyncio.wait_for(resp.content.readany(), 2.0)).decode()
+                payload = text.split("event: telemetry\ndata: ", 1)[1].split("\n", 1)[0]
+                assert json.loads(payload)["samples"][0]["values"] == {"reaction_time": 350}
+                resp.close()
+
+        run_async(do_test())
+
+    def test_websocket_stream(self, mock_controller: MockAPIController):
+        """GET /api/v1/stream upgraded to WebSocket accepts subscribe messages."""
+
+        async def do_test():
+            bus = mock_controller.logger_system.telemetry
+            app = create_test_app(mock_controller)
+            async with TestClient(TestServer(app)) as client:
+                ws = await client.ws_connect("/api/v1/stream?topics=audio.*")
+                assert (await ws.receive_json(timeout=2.0))["type"] == "subscribed"
+
+                await ws.send_json({"type": "subscribe", "topics": ["gps.*"], "rate": 20})
+                ack = await ws.receive_json(timeout=2.0)
+                assert ack["topics"] == ["gps.*"]
+                assert ack["rate"] == 20
+
+                bus.publish("Audio:1", "audio.levels", {"rms_db": -20.0})
+                bus.publish("GPS:1", "gps.fix", {"fix_valid": True})
+                message = await ws.receive_json(timeout=2.0)
+                assert message["type"] == "telemetry"
+                assert [s["topic"] for s in message["samples"]] == ["gps.fix"]
+                await ws.close()
+
+        run_async(do_test())
+
+
 # =============================================================================
 # Full Workflow Integration Test
 # =============================================================================
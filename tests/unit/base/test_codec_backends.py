@@ -0,0 +1,135 @@
+"""Tests for the codec backend registry and selection."""
+
+import pytest
+
+from rpi_logger.modules.base.codec_backends import (
+    BenchmarkResult,
+    CodecBenchmarkCache,
+    benchmark_backend,
+    choose_backend,
+    fallback_chain,
+    get_backend,
+    open_video_output,
+    probe_available,
+    registered_backends,
+    select_backend,
+)
+
+av = pytest.importorskip("av")
+
+
+class TestRegistry:
+    def test_preference_order(self):
+        names = [b.name for b in registered_backends()]
+        assert names.index("h264_v4l2m2m") < names.index("libx264")
+        assert names.index("libx264") < names.index("mjpeg")
+
+    def test_probe_only_lists_built_encoders(self):
+        for backend in probe_available():
+            assert backend.codec in av.codecs_available
+
+    def test_fallback_chain_respects_container(self):
+        chain = fallback_chain(get_backend("ffv1"), container="mkv")
+        assert [b.name for b in chain] == ["ffv1", "libx264", "mjpeg"]
+        assert get_backend("ffv1") not in fallback_chain(None, container="mp4")
+
+
+class TestChooseBackend:
+    def test_cheapest_meeting_target_wins(self):
+        results = [
+            BenchmarkResult("libx264", ok=True, fps=120.0, cpu_ms_per_frame=12.0),
+            BenchmarkResult("h264_v4l2m2m", ok=True, fps=90.0, cpu_ms_per_frame=2.0),
+            BenchmarkResult("mjpeg", ok=True, fps=200.0, cpu_ms_per_frame=8.0),
+        ]
+        assert choose_backend(results, 30.0).name == "h264_v4l2m2m"
+        assert choose_backend(results, 30.0, families=("mjpeg",)).name == "mjpeg"
+
+    def test_too_slow_backends_excluded(self):
+        results = [
+            BenchmarkResult("h264_v4l2m2m", ok=True, fps=20.0, cpu_ms_per_frame=1.0),
+            BenchmarkResult("libx264", ok=True, fps=100.0, cpu_ms_per_frame=10.0),
+        ]
+        assert choose_backend(results, 30.0).name == "libx264"
+
+    def test_fastest_when_none_meets_target(self):
+        results = [
+            BenchmarkResult("libx264", ok=True, fps=20.0, cpu_ms_per_frame=40.0),
+            BenchmarkResult("mjpeg", ok=True, fps=25.0, cpu_ms_per_frame=45.0),
+        ]
+        assert choose_backend(results, 60.0).name == "mjpeg"
+
+    def test_failed_backends_fall_back_to_software(self):
+        results = [BenchmarkResult("h264_v4l2m2m", ok=False, error="EINVAL")]
+        chosen = choose_backend(results, 30.0, container="mp4")
+        assert chosen is not None
+        assert chosen.name in ("libx264", "mjpeg")
+
+
+class TestBenchmarkAndSelect:
+    def test_benchmark_software_encoder(self):
+        backend = get_backend("mjpeg")
+        result = benchmark_backend(backend, (160, 120), frames=3)
+        assert result.ok, result.error
+        assert result.fps > 0
+        assert result.cpu_ms_per_frame >= 0
+
+    def test_benchmark_hardware_cost_is_wall_time(self):
+        from rpi_logger.modules.base.codec_backends import CodecBackend
+
+        # Stand-in for a hardware encoder that the host can actually open
+        backend = CodecBackend(name="fake_hw", codec="mjpeg", family="mjpeg",
+                               pix_fmt="yuvj420p", hardware=True)
+        result = benchmark_backend(backend, (160, 120), frames=3)
+        assert result.ok, result.error
+        assert result.cpu_ms_per_frame == pytest.approx(1000.0 / result.fps)
+
+    def test_benchmark_reports_open_failure(self):
+        from rpi_logger.modules.base.codec_backends import CodecBackend
+
+        bogus = CodecBackend(name="bogus", codec="mjpeg", family="mjpeg", pix_fmt="nv12")
+        result = benchmark_backend(bogus, (160, 120), frames=2)
+        assert not result.ok
+        assert result.error
+
+    def test_select_caches_results(self, tmp_path, monkeypatch):
+        import rpi_logger.modules.base.codec_backends as cb
+
+        calls = []
+        real = cb.benchmark_backend
+
+        def counting(backend, resolution, **kwargs):
+            calls.append(backend.name)
+            return real(backend, resolution, frames=2)
+
+        monkeypatch.setattr(cb, "benchmark_backend", counting)
+
+        cache_path = tmp_path / "codec_benchmarks.json"
+        chosen = select_backend((160, 120), 5.0, fingerprint="cam1",
+                                container="mp4", cache=CodecBenchmarkCache(cache_path))
+        assert chosen is not None
+        assert "mp4" in chosen.containers
+        assert cache_path.exists()
+        first = len(calls)
+        assert first > 0
+
+        # Fresh cache object on the same file: served from disk, no re-benchmark
+        again = select_backend((160, 120), 5.0, fingerprint="cam1",
+                               container="mp4", cache=CodecBenchmarkCache(cache_path))
+        assert again == chosen
+        assert len(calls) == first
+
+    def test_open_video_output_falls_back(self, tmp_path):
+        from rpi_logger.modules.base.codec_backends import CodecBackend
+
+        broken = CodecBackend(name="broken", codec="mjpeg", family="mjpeg", pix_fmt="nv12")
+        container, stream, backend = open_video_output(
+            str(tmp_path / "out.mp4"),
+            [broken, get_backend("mjpeg")],
+            (160, 120),
+            10,
+        )
+        try:
+            assert backend.name == "mjpeg"
+            assert len(container.streams.video) == 1
+        finally:
+            container.close()
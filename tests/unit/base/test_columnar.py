@@ -0,0 +1,145 @@
+"""Unit tests for the columnar sidecar format."""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.columnar import (
+    MISSING_INT,
+    Column,
+    ColumnarFile,
+    columnar_path,
+    columnar_to_csv,
+    find_columnar_files,
+    load_columnar,
+    normalize_data_format,
+    schema_path,
+)
+from rpi_logger.modules.base.timing_sink import TimingSink
+
+COLUMNS = (
+    Column("t", "f8", "%.6f"),
+    Column("ns", "i8"),
+    Column("kind", "S8"),
+    Column("v", "f8"),
+)
+HEADER = ["trial", "module", "t", "ns", "kind", "v"]
+
+
+def _open(path):
+    return ColumnarFile(path, COLUMNS, csv_header=HEADER, prefix_fields=(2, "Audio"))
+
+
+class TestColumnarFile:
+    """Test ColumnarFile writing and loading."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "data.npy"
+        columnar = _open(path)
+        columnar.write([(1.5, 10, b"Gaze", 0.5), (2.5, MISSING_INT, b"Imu", math.nan)])
+        columnar.close()
+
+        rows, schema = load_columnar(path)
+        assert len(rows) == 2
+        assert rows["t"].tolist() == [1.5, 2.5]
+        assert rows["kind"].tolist() == [b"Gaze", b"Imu"]
+        assert schema["rows"] == 2
+        assert schema["prefix"] == ["2", "Audio"]
+        # A closed file is a standard .npy file
+        assert np.load(path)["ns"].tolist() == [10, MISSING_INT]
+
+    def test_unclosed_file_loads_complete_rows(self, tmp_path):
+        path = tmp_path / "data.npy"
+        columnar = _open(path)
+        columnar.write([(float(i), i, b"x", 0.0) for i in range(5)])
+        columnar.flush()
+        with open(path, "ab") as fp:
+            fp.write(b"\x00" * 7)  # Partial row from a crashed writer
+
+        rows, schema = load_columnar(path)
+        assert rows["ns"].tolist() == [0, 1, 2, 3, 4]
+        assert schema["rows"] == 0  # Final count is only written on close
+        columnar.close()
+
+    def test_append_extends_existing_file(self, tmp_path):
+        path = tmp_path / "data.npy"
+        columnar = _open(path)
+        columnar.write([(float(i), i, b"x", 0.0) for i in range(3)])
+        columnar.close()
+        with open(path, "ab") as fp:
+            fp.write(b"\x00" * 5)  # Partial row from a crashed writer
+
+        columnar = ColumnarFile(path, COLUMNS, csv_header=HEADER, prefix_fields=(2, "Audio"), append=True)
+        assert columnar.rows_written == 3
+        columnar.write([(3.0, 3, b"y", 0.0)])
+        columnar.close()
+
+        assert np.load(path)["ns"].tolist() == [0, 1, 2, 3]
+        assert json.loads(schema_path(path).read_text())["rows"] == 4
+        # Without append the file is replaced
+        _open(path).close()
+        assert len(load_columnar(path)[0]) == 0
+
+    def test_append_refuses_other_stream(self, tmp_path):
+        path = tmp_path / "data.npy"
+        columnar = _open(path)
+        columnar.write([(1.0, 1, b"x", 0.0)])
+        columnar.close()
+
+        with pytest.raises(ValueError, match="prefix differs"):
+            ColumnarFile(path, COLUMNS, csv_header=HEADER, prefix_fields=(3, "Audio"), append=True)
+        assert np.load(path)["ns"].tolist() == [1]
+
+    def test_header_must_cover_columns(self, tmp_path):
+        with pytest.raises(ValueError, match="CSV header"):
+            ColumnarFile(tmp_path / "bad.npy", COLUMNS, csv_header=["t"])
+
+
+class TestColumnarToCsv:
+    """Test regenerating legacy CSVs."""
+
+    def test_csv_output(self, tmp_path):
+        path = tmp_path / "trial_timing.npy"
+        columnar = _open(path)
+        columnar.write([(1.0, 10, b"a,b", 0.25), (2.0, MISSING_INT, b"c", math.nan)])
+        columnar.close()
+
+        target = columnar_to_csv(path)
+        assert target == tmp_path / "trial_timing.csv"
+        assert target.read_text().splitlines() == [
+            "trial,module,t,ns,kind,v",
+            '2,Audio,1.000000,10,"a,b",0.25',
+            "2,Audio,2.000000,,c,",
+        ]
+
+    def test_find_columnar_files(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        _open(tmp_path / "sub" / "a.npy").close()
+        np.save(tmp_path / "plain.npy", np.zeros(3))  # No schema: not ours
+
+        assert find_columnar_files(tmp_path) == [tmp_path / "sub" / "a.npy"]
+        assert json.loads(schema_path(tmp_path / "sub" / "a.npy").read_text())["csv_name"] == "a.csv"
+
+
+class TestColumnarTimingStream:
+    """Test columnar streams on the timing sink."""
+
+    def test_tuple_rows(self, tmp_path):
+        stream = TimingSink().open_columnar_stream(
+            tmp_path / "cam_timing.csv", COLUMNS, ",".join(HEADER) + "\n", (1, "Cam")
+        )
+        assert stream.path == columnar_path(tmp_path / "cam_timing.csv")
+        for i in range(3):
+            assert stream.write_row((float(i), i, b"f", 0.0))
+        stream.close()
+
+        rows, _schema = load_columnar(stream.path)
+        assert rows["ns"].tolist() == [0, 1, 2]
+
+
+def test_normalize_data_format():
+    assert normalize_data_format("NPY") == "npy"
+    assert normalize_data_format(None) == "csv"
+    assert normalize_data_format("parquet") == "csv"
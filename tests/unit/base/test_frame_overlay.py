@@ -0,0 +1,165 @@
+"""Tests for the glyph-atlas frame overlay."""
+
+from datetime import datetime, timezone
+
+import cv2
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.camera_encoder import Encoder
+from rpi_logger.modules.base.frame_overlay import (
+    GlyphAtlas,
+    TextOverlay,
+    TimestampFormatter,
+    get_glyph_atlas,
+)
+
+
+def _overlay(origin=(8, 24)) -> TextOverlay:
+    return TextOverlay(get_glyph_atlas(0.5, 1, (255, 255, 255)), origin)
+
+
+class TestGlyphAtlas:
+    def test_unknown_character_renders_blank(self):
+        atlas = GlyphAtlas()
+        advance, inv_alpha, premul = atlas.glyph("é")
+        assert advance == atlas.glyph(" ")[0]
+        assert np.all(inv_alpha == 255)
+        assert not premul.any()
+
+    def test_shared_atlas_is_cached(self):
+        assert get_glyph_atlas(0.5, 1, (255, 255, 255)) is get_glyph_atlas(0.5, 1, (255, 255, 255))
+
+
+class TestTextOverlay:
+    def test_only_bounds_are_touched(self):
+        overlay = _overlay()
+        frame = np.full((120, 200, 3), 40, np.uint8)
+        overlay.render(frame, "12:34:56.789 #10")
+
+        rows, cols = overlay.bounds(frame.shape)
+        outside = frame.copy()
+        outside[rows, cols] = 40
+        assert np.all(outside == 40)
+        assert frame[rows, cols].max() > 200
+
+    def test_matches_puttext(self):
+        text = "2026-01-01T00:00:00.123 #42"
+        expected = np.full((60, 320, 3), 60, np.uint8)
+        cv2.putText(expected, text, (8, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1, cv2.LINE_AA)
+        frame = np.full((60, 320, 3), 60, np.uint8)
+        _overlay().render(frame, text)
+
+        diff = np.abs(frame.astype(int) - expected.astype(int))
+        assert diff.mean() < 2.0
+
+    def test_incremental_update_reblits_suffix(self):
+        overlay = _overlay()
+        frame = np.zeros((60, 320, 3), np.uint8)
+        overlay.render(frame, "2026-01-01T00:00:00.123 #1")
+        before = overlay.glyphs_rendered
+        overlay.render(frame, "2026-01-01T00:00:00.156 #2")
+        # Two changed ms digits, the '#', space and counter, plus one neighbour
+        assert overlay.glyphs_rendered - before <= 6
+
+        fresh = np.zeros((60, 320, 3), np.uint8)
+        _overlay().render(fresh, "2026-01-01T00:00:00.156 #2")
+        redrawn = np.zeros((60, 320, 3), np.uint8)
+        overlay.render(redrawn)
+        assert np.array_equal(redrawn, fresh)
+
+    def test_shorter_text_clears_tail(self):
+        overlay = _overlay()
+        overlay.render(np.zeros((60, 320, 3), np.uint8), "frame 123456")
+        overlay.set_text("frame 1")
+
+        frame = np.zeros((60, 320, 3), np.uint8)
+        expected = np.zeros((60, 320, 3), np.uint8)
+        overlay.render(frame)
+        _overlay().render(expected, "frame 1")
+        assert np.array_equal(frame, expected)
+
+    def test_changed_glyph_fringe_is_cleared(self):
+        overlay = _overlay()
+        overlay.set_text("1j")
+        overlay.set_text("1 ")  # j's tail reaches left of its origin
+
+        frame = np.zeros((60, 320, 3), np.uint8)
+        expected = np.zeros((60, 320, 3), np.uint8)
+        overlay.render(frame)
+        _overlay().render(expected, "1 ")
+        assert np.array_equal(frame, expected)
+
+    def test_clipped_to_small_frame(self):
+        frame = np.zeros((16, 20, 3), np.uint8)
+        _overlay().render(frame, "123456789")
+        assert frame.any()
+
+    def test_outside_frame_is_noop(self):
+        frame = np.zeros((10, 10, 3), np.uint8)
+        overlay = _overlay(origin=(50, 50))
+        overlay.render(frame, "1")
+        assert overlay.bounds(frame.shape) is None
+        assert not frame.any()
+
+    def test_grayscale_frame(self):
+        frame = np.zeros((60, 200), np.uint8)
+        _overlay().render(frame, "42")
+        assert frame.max() > 200
+
+    def test_strided_view_is_drawn_in_place(self):
+        padded = np.zeros((60, 256 * 3 + 64), np.uint8)
+        view = padded[:, : 256 * 3].reshape(60, 256, 3)
+        _overlay().render(view, "42")
+        assert padded[:, : 256 * 3].any()
+        assert not padded[:, 256 * 3:].any()
+
+
+class TestTimestampFormatter:
+    def test_matches_strftime_format(self):
+        formatter = TimestampFormatter()
+        for ts in (1_700_000_000.0, 1_700_000_000.5, 1_700_000_001.999):
+            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+            expected = f"{dt.strftime('%Y-%m-%dT%H:%M:%S')}.{int((ts % 1) * 1000):03d} #7"
+            assert formatter.format(ts, 7) == expected
+
+    def test_without_frame_number(self):
+        assert TimestampFormatter().format(0.25) == "1970-01-01T00:00:00.250"
+
+
+class TestEncoderOverlay:
+    @pytest.mark.parametrize("use_pyav", [True, False])
+    def test_callers_frame_is_left_untouched(self, tmp_path, use_pyav):
+        encoder = Encoder(str(tmp_path / "out.avi"), (64, 48), 30, use_pyav=use_pyav)
+        encoder._open_output()
+        try:
+            frame = np.zeros((48, 64, 3), np.uint8)
+            assert encoder._write_frame_internal(frame, timestamp=1_700_000_000.0)
+            assert not frame.any()
+        finally:
+            encoder._finalize_output()
+
+    def test_opencv_writer_never_sees_callers_buffer(self, tmp_path):
+        encoder = Encoder(str(tmp_path / "out.avi"), (64, 48), 30, use_pyav=False)
+        encoder._open_output()
+        frame = np.zeros((48, 64, 3), np.uint8)
+        written = []
+
+        class _Writer:
+            def isOpened(self):
+                return True
+
+            def write(self, image):
+                # Another reader of ``frame`` at this moment must see clean pixels
+                written.append((image is frame, frame.any(), image.any()))
+
+            def release(self):
+                pass
+
+        real_writer, encoder._writer = encoder._writer, _Writer()
+        try:
+            assert encoder._write_frame_internal(frame, timestamp=1_700_000_000.0)
+        finally:
+            encoder._writer = real_writer
+            encoder._finalize_output()
+        assert written == [(False, False, True)]
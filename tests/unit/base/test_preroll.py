@@ -0,0 +1,43 @@
+"""Tests for the shared pre-roll buffer."""
+
+import pytest
+
+from rpi_logger.modules.base.preroll import PreRollBuffer, PreRollStats
+
+
+class TestPreRollBuffer:
+    def test_keeps_only_window(self):
+        buffer = PreRollBuffer(window=3.0, max_bytes=1000)
+        for i in range(30):
+            buffer.append(i, timestamp=float(i), nbytes=1)
+        assert buffer.drain() == [26, 27, 28, 29]
+        assert len(buffer) == 0
+
+    def test_byte_cap_counts_capped_items(self):
+        buffer = PreRollBuffer(window=10.0, max_bytes=10)
+        for i in range(5):
+            buffer.append(i, timestamp=i * 0.1, nbytes=4)
+        stats = buffer.stats()
+        assert stats.items == 2
+        assert stats.bytes == 8
+        assert stats.evicted == 3
+        assert stats.capped == 3
+        assert stats.seconds == pytest.approx(0.1)
+
+    def test_head_is_always_a_keyframe(self):
+        buffer = PreRollBuffer(window=2.0, max_bytes=1000)
+        # GOP of 3: keyframes at 0, 3, 6, ...
+        for i in range(8):
+            buffer.append(i, timestamp=float(i), nbytes=1, keyframe=i % 3 == 0)
+        assert buffer.drain() == [6, 7]
+
+    def test_leading_non_keyframes_are_dropped(self):
+        buffer = PreRollBuffer(window=1.0)
+        buffer.append("p", timestamp=0.0, nbytes=1, keyframe=False)
+        buffer.append("i", timestamp=0.1, nbytes=1, keyframe=True)
+        assert buffer.drain() == ["i"]
+        assert buffer.stats().evicted == 1
+
+    def test_empty_stats(self):
+        buffer = PreRollBuffer(window=2.0, max_bytes=64)
+        assert buffer.stats() == PreRollStats(max_bytes=64)
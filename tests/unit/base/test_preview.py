@@ -0,0 +1,120 @@
+"""Tests for the shared preview pipeline."""
+
+import cv2
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.preview import (
+    PreviewPacer,
+    bgr_to_ppm,
+    frame_to_ppm,
+    preview_size,
+    yuv420_to_ppm,
+)
+
+
+def _smooth_bgr(width: int, height: int) -> np.ndarray:
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    return np.dstack([np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)),
+                      np.full((height, width), 128, np.float32)]).astype(np.uint8)
+
+
+def _i420(bgr: np.ndarray, stride: int) -> np.ndarray:
+    height, width = bgr.shape[:2]
+    padded = np.zeros((height, stride, 3), np.uint8)
+    padded[:, :width] = bgr
+    return cv2.cvtColor(padded, cv2.COLOR_BGR2YUV_I420)
+
+
+def _pixels(ppm: bytes) -> tuple[tuple[int, int], np.ndarray]:
+    magic, dims, maxval, data = ppm.split(b"\n", 3)
+    assert (magic, maxval) == (b"P6", b"255")
+    width, height = map(int, dims.split())
+    return (width, height), np.frombuffer(data, np.uint8).reshape(height, width, 3)
+
+
+class TestPreviewSize:
+    def test_never_upscales(self):
+        assert preview_size((640, 480), 2.0) == (640, 480)
+
+    def test_even_for_i420(self):
+        assert preview_size((1456, 1088), 0.33, even=True) == (480, 358)
+        assert preview_size((4, 4), 0.01, even=True) == (2, 2)
+
+
+class TestConversion:
+    def test_bgr_matches_convert_then_resize(self):
+        frame = np.random.default_rng(0).integers(0, 256, (120, 160, 3), np.uint8)
+        expected = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (40, 30), interpolation=cv2.INTER_NEAREST)
+        size, pixels = _pixels(bgr_to_ppm(frame, 0.25))
+        assert size == (40, 30)
+        assert np.array_equal(pixels, expected)
+
+    def test_grayscale(self):
+        size, pixels = _pixels(bgr_to_ppm(np.full((20, 20), 77, np.uint8)))
+        assert size == (20, 20)
+        assert np.all(pixels == 77)
+
+    @pytest.mark.parametrize("scale", [0.25, 0.5])
+    def test_yuv_downscaled_planes_match_full_conversion(self, scale):
+        bgr = _smooth_bgr(160, 120)
+        data = _i420(bgr, stride=192)
+        full = cv2.cvtColor(data, cv2.COLOR_YUV2RGB_I420)[:120, :160]
+
+        size, pixels = _pixels(yuv420_to_ppm(data, (160, 120), scale))
+        expected = cv2.resize(full, size, interpolation=cv2.INTER_NEAREST)
+        assert size == preview_size((160, 120), scale, even=True)
+        assert np.abs(pixels.astype(int) - expected).mean() < 3.0
+
+    def test_yuv_full_scale_drops_stride_padding(self):
+        data = _i420(_smooth_bgr(64, 48), stride=96)
+        size, pixels = _pixels(frame_to_ppm(data.reshape(-1), (64, 48), "yuv420"))
+        expected = cv2.cvtColor(data, cv2.COLOR_YUV2RGB_I420)[:48, :64]
+        assert size == (64, 48)
+        assert np.array_equal(pixels, expected)
+
+    def test_frame_to_ppm_crops_bgr_to_size(self):
+        size, _ = _pixels(frame_to_ppm(np.zeros((50, 70, 3), np.uint8), (64, 48)))
+        assert size == (64, 48)
+
+
+class TestPreviewPacer:
+    def test_caps_rate(self):
+        pacer = PreviewPacer(max_fps=10)
+        granted = 0
+        for i in range(100):  # 1 s of 100 Hz frames, each rendered instantly
+            if pacer.acquire(i * 0.01):
+                granted += 1
+                pacer.complete(0.0)
+        assert granted == 10
+
+    def test_hidden_skips_conversion(self):
+        pacer = PreviewPacer(max_fps=10)
+        pacer.set_visible(False)
+        assert not pacer.acquire(0.0)
+        assert pacer.skipped_hidden == 1
+
+        pacer.set_visible(True)
+        assert pacer.acquire(0.05)
+
+    def test_waits_for_in_flight_frame(self):
+        pacer = PreviewPacer(max_fps=100)
+        assert pacer.acquire(0.0)
+        assert not pacer.acquire(0.5)
+        assert pacer.skipped_busy == 1
+        # A frame that is never answered is forgotten
+        assert pacer.acquire(1.5)
+
+    def test_slow_rendering_lowers_rate(self):
+        pacer = PreviewPacer(max_fps=30, ui_budget=0.25)
+        for _ in range(20):
+            pacer.complete(0.020)
+        assert pacer.render_time_ms == pytest.approx(20.0)
+        assert pacer.fps == pytest.approx(12.5)
+
+    def test_abandon_releases_slot(self):
+        pacer = PreviewPacer(max_fps=100)
+        assert pacer.acquire(0.0)
+        pacer.abandon()
+        assert pacer.acquire(0.02)
@@ -0,0 +1,123 @@
+"""Tests for shared-memory preview slots."""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.preview_shm import (
+    FORMAT_BGR24,
+    FORMAT_GRAY8,
+    PreviewPublisher,
+    PreviewSlotReader,
+    PreviewSlotWriter,
+    preview_slot_name,
+)
+
+
+@pytest.fixture
+def slot_name():
+    return preview_slot_name(f"test:{os.getpid()}:{time.monotonic_ns()}")
+
+
+def _image(value: int, shape=(48, 64, 3)) -> np.ndarray:
+    return np.full(shape, value, np.uint8)
+
+
+class TestPreviewSlot:
+    def test_name_is_short_and_stable(self):
+        name = preview_slot_name("Cameras:/dev/video0")
+        assert name == preview_slot_name("Cameras:/dev/video0")
+        assert len(name) <= 31
+        assert ":" not in name and "/" not in name
+
+    def test_round_trip(self, slot_name):
+        writer = PreviewSlotWriter(slot_name, 64 * 48 * 3)
+        reader = PreviewSlotReader.open(slot_name)
+        try:
+            assert reader.read() is None  # Nothing published yet
+            assert writer.publish(_image(7), frame_number=3, timestamp=12.5)
+            frame = reader.read()
+            assert frame.format == FORMAT_BGR24
+            assert (frame.width, frame.height) == (64, 48)
+            assert frame.frame_number == 3
+            assert frame.timestamp == 12.5
+            assert frame.sequence == 1
+            assert (frame.image == 7).all()
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_grayscale_and_double_buffer(self, slot_name):
+        writer = PreviewSlotWriter(slot_name, 64 * 48 * 3)
+        reader = PreviewSlotReader.open(slot_name)
+        try:
+            writer.publish(_image(1, (48, 64)))
+            with reader.view() as frame:
+                assert frame.format == FORMAT_GRAY8
+                first = frame.image
+                # The next frame goes to the other buffer
+                writer.publish(_image(2, (48, 64)))
+                assert (first == 1).all()
+                assert reader.frame_valid
+            writer.publish(_image(3, (48, 64)))
+            assert not reader.frame_valid  # Buffer of the viewed frame was reused
+            assert (reader.read().image == 3).all()
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_heartbeat_gates_writer(self, slot_name):
+        writer = PreviewSlotWriter(slot_name, 16)
+        reader = PreviewSlotReader.open(slot_name)
+        try:
+            assert not writer.wanted()
+            reader.touch()
+            assert writer.wanted()
+            assert not writer.wanted(time.monotonic_ns() + 10 * 10**9)
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_reader_sees_close(self, slot_name):
+        writer = PreviewSlotWriter(slot_name, 16)
+        reader = PreviewSlotReader.open(slot_name)
+        writer.close()
+        assert reader.closed
+        assert reader.read() is None
+        reader.close()
+        assert PreviewSlotReader.open(slot_name) is None
+
+
+class TestPreviewPublisher:
+    def test_publishes_only_while_watched(self, slot_name):
+        publisher = PreviewPublisher("unused", max_fps=1000)
+        publisher.name = slot_name
+        assert publisher.start((64, 48), scale=0.5)
+        reader = PreviewSlotReader.open(slot_name)
+        try:
+            assert not publisher.due()
+            reader.touch()
+            assert publisher.due()
+            assert publisher.publish_frame(_image(9), (64, 48), scale=0.5, frame_number=1)
+            frame = reader.read()
+            assert (frame.width, frame.height) == (32, 24)
+        finally:
+            reader.close()
+            publisher.close()
+
+    def test_grows_slot_for_larger_frames(self, slot_name):
+        publisher = PreviewPublisher("unused")
+        publisher.name = slot_name
+        publisher.start((8, 8))
+        reader = PreviewSlotReader.open(slot_name)
+        try:
+            assert publisher.publish(_image(5, (32, 32, 3)))
+            assert reader.closed  # Replaced by a bigger slot
+            reader.close()
+            reader = PreviewSlotReader.open(slot_name)
+            assert reader.read().image.shape == (32, 32, 3)
+        finally:
+            reader.close()
+            publisher.close()
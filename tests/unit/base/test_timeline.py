@@ -0,0 +1,238 @@
+"""Unit tests for cross-module timeline alignment."""
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.base.columnar import ColumnarFile, load_columnar
+from rpi_logger.modules.base.timeline import (
+    INDEX_HEADER,
+    build_timeline,
+    find_stream_files,
+    fit_clock,
+    index_path,
+    robust_line,
+    write_index,
+)
+from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import GAZE_COLUMNS, GAZE_HEADER
+from rpi_logger.tools.sync_and_mux import find_trial_files, generate_sync_metadata
+
+HOST0 = 1000.0
+UNIX0 = 1_700_000_000.0
+PREFIX = "trial,module,device_id,label,record_time_unix,record_time_mono"
+
+
+def _make_session(root, seconds=20.0, seed=0):
+    """Camera (+40 ppm), audio counter (+25 ppm), gaze .npy, two-trial GPS, notes."""
+    rng = np.random.default_rng(seed)
+    truth = {}
+
+    cameras = root / "Cameras"
+    cameras.mkdir(parents=True)
+    n = int(seconds * 30)
+    true = HOST0 + 0.2 + np.arange(n) / 30
+    sensor = ((true - HOST0) * (1 - 40e-6) * 1e9 + 5e12).astype(np.int64)
+    arrive = true + 0.004 + rng.exponential(0.002, n)
+    with open(cameras / "s_CAM_trial001_cam0_timing.csv", "w") as f:
+        f.write(f"{PREFIX},frame_index,sensor_timestamp_ns,video_pts\n")
+        for i in range(n):
+            f.write(f"1,CSICameras,cam0,,{UNIX0 + arrive[i] - HOST0:.6f},{arrive[i]:.9f},{i + 1},{sensor[i]},{i + 1}\n")
+    truth["camera"] = true
+
+    audio = root / "Audio"
+    audio.mkdir()
+    blocks = int(seconds * 48000 / 1024)
+    total = np.arange(1, blocks + 1) * 1024
+    true_audio = HOST0 + 0.1 + total / 48000 * (1 + 25e-6)
+    arrive = true_audio + 0.001 + rng.exponential(0.003, blocks)
+    with open(audio / "s_AUD_trial001_MIC0_mic_timing.csv", "w") as f:
+        f.write(f"{PREFIX},device_time_unix,device_time_offset,write_time_unix,write_time_mono,"
+                "chunk_index,frames,total_frames\n")
+        for i in range(blocks):
+            f.write(f"1,Audio,0,,{UNIX0 + arrive[i] - HOST0:.6f},{arrive[i]:.9f},,,0,0,{i + 1},1024,{total[i]}\n")
+
+    eye = root / "EyeTracker"
+    eye.mkdir()
+    n = int(seconds * 200)
+    true = HOST0 + 0.05 + np.arange(n) / 200
+    device_ns = (1.7e18 + (true - HOST0) * 1e9).astype(np.int64)
+    arrive = true + 0.02 + rng.exponential(0.005, n)
+    columnar = ColumnarFile(
+        eye / "s_ET_trial001_GAZE.npy", GAZE_COLUMNS,
+        csv_header=GAZE_HEADER.split(","), prefix_fields=(1, "EyeTracker", "neon", ""),
+    )
+    rows = np.zeros(n, dtype=columnar.dtype)
+    rows["record_time_unix"] = UNIX0 + arrive - HOST0
+    rows["record_time_mono"] = arrive
+    rows["device_time_unix"] = device_ns / 1e9
+    rows["device_time_ns"] = device_ns
+    columnar.write(rows)
+    columnar.close()
+
+    gps = root / "GPS"
+    gps.mkdir()
+    with open(gps / "s_GPS_serial0.csv", "w") as f:
+        f.write(f"{PREFIX},device_time_unix,latitude_deg,raw_sentence\n")
+        for trial, offset in ((1, 0.0), (2, 500.0)):
+            for i in range(int(seconds * 10)):
+                t = HOST0 + offset + i / 10
+                a = t + 0.08 + rng.exponential(0.01)
+                f.write(f'{trial},GPS,GPS:serial0,,{UNIX0 + a - HOST0:.6f},{a:.9f},'
+                        f'{UNIX0 + t - HOST0:.3f},1.0,"$GPRMC,1,2*00"\n')
+        f.write("2,GPS,GPS:serial0,,17000")  # Cut short by a crash
+
+    notes = root / "Notes"
+    notes.mkdir()
+    with open(notes / "s_NOTES.csv", "w") as f:
+        f.write(f"{PREFIX},device_time_unix,content\n")
+        f.write(f'1,Notes,notes,,{UNIX0 + 10:.6f},{HOST0 + 10:.9f},,"hello, world"\n')
+    return truth
+
+
+@pytest.fixture
+def session(tmp_path):
+    root = tmp_path / "session_20251208_143022"
+    truth = _make_session(root)
+    return root, truth
+
+
+class TestClockFit:
+    """Test the robust clock fits."""
+
+    def test_robust_line_ignores_outliers(self):
+        rng = np.random.default_rng(1)
+        x = np.linspace(0.0, 100.0, 2000)
+        y = 3.0 + 1.00005 * x + rng.normal(0.0, 1e-4, len(x))
+        y[::50] += 0.5  # Late arrivals
+        intercept, slope, sigma = robust_line(x, y)
+        assert intercept == pytest.approx(3.0, abs=1e-4)
+        assert slope == pytest.approx(1.00005, abs=1e-6)
+        assert sigma < 2e-4
+
+    def test_fit_clock_drift_and_reset(self):
+        rng = np.random.default_rng(2)
+        true = 50.0 + np.arange(24000) / 100.0 * 1.00002
+        device = np.arange(24000) / 100.0
+        device[12000:] -= 100.0  # Device clock restarted
+        host = true + rng.exponential(0.0005, len(true))
+        device[10] = np.nan
+
+        aligned, model = fit_clock(device, host)
+        assert len(model.segments) == 2
+        assert model.segments[1].first_row == 12000
+        assert model.drift_ppm == pytest.approx(20.0, abs=1.0)
+        assert model.points == 23999
+        assert aligned[10] == host[10]  # No device time: arrival time kept
+        offset = np.median(aligned - true)
+        assert np.std(np.delete(aligned - true - offset, 10)) < 1e-4
+
+
+class TestBuildTimeline:
+    """Test loading and aligning a session."""
+
+    def test_streams_and_clocks(self, session):
+        root, truth = session
+        timeline = build_timeline(root, 1)
+        names = sorted(stream.name for stream in timeline.streams)
+        assert names == [
+            "Audio/s_AUD_trial001_MIC0_mic_timing.csv",
+            "Cameras/s_CAM_trial001_cam0_timing.csv",
+            "EyeTracker/s_ET_trial001_GAZE.npy",
+            "GPS/s_GPS_serial0.csv",
+            "Notes/s_NOTES.csv",
+        ]
+
+        camera = timeline.stream(root / "Cameras/s_CAM_trial001_cam0_timing.csv")
+        assert camera.module == "CSICameras"
+        assert camera.clock.source == "sensor_timestamp_ns"
+        # Aligned times are much closer to the true frame times than arrivals
+        offset = np.median(camera.aligned_time_mono - truth["camera"])
+        assert np.std(camera.aligned_time_mono - truth["camera"] - offset) < 3e-4
+
+        audio = timeline.stream(root / "Audio/s_AUD_trial001_MIC0_mic_timing.csv")
+        assert audio.clock.counter
+        assert audio.start_time_mono == pytest.approx(HOST0 + 0.1, abs=0.01)
+
+        # The eye tracker .npy is read via its own schema and matched by CSV name
+        gaze = timeline.stream(root / "EyeTracker/s_ET_trial001_GAZE.csv")
+        assert gaze.device_id == "neon"
+        assert gaze.clock.source == "device_time_ns"
+
+        notes = timeline.stream(root / "Notes/s_NOTES.csv")
+        assert notes.clock.source == ""
+        assert notes.aligned_time_mono.tolist() == [HOST0 + 10]
+
+        assert timeline.to_unix(HOST0) == pytest.approx(UNIX0, abs=1e-3)
+
+    def test_trial_filter_and_truncated_line(self, session):
+        root, _truth = session
+        gps = build_timeline(root, 2).stream(root / "GPS/s_GPS_serial0.csv")
+        assert len(gps) == 200
+        assert gps.rows[0] == 200  # Source rows, counted from the first data row
+        assert gps.aligned_time_mono[0] == pytest.approx(HOST0 + 500.08, abs=0.02)
+        assert len(find_stream_files(root, 2)) == 2  # Only GPS and Notes lack _trial001
+
+    def test_write_index(self, session):
+        root, _truth = session
+        timeline = build_timeline(root, 1)
+        index = timeline.index()
+        assert len(index) == sum(len(stream) for stream in timeline.streams)
+        assert np.all(np.diff(index["aligned_time_mono"]) >= 0)
+        assert index["trial_time"][0] == 0.0
+
+        csv_path = write_index(timeline, index_path(root, "s", 1), chunk_rows=1000)
+        assert csv_path.name == "s_TIMELINE_trial001.csv"
+        with csv_path.open(newline="") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == INDEX_HEADER
+        assert len(rows) == len(index) + 1
+        assert rows[1][1] == timeline.streams[index["stream"][0]].name
+
+        npy_path = write_index(timeline, index_path(root, "s", 1, "npy"), "npy", chunk_rows=1000)
+        loaded, schema = load_columnar(npy_path)
+        assert np.array_equal(loaded["aligned_time_mono"], index["aligned_time_mono"])
+        assert schema["metadata"]["streams"] == [stream.name for stream in timeline.streams]
+        # A later run does not load the index as a stream
+        assert build_timeline(root, 1).stream(csv_path) is None
+
+
+async def test_sync_metadata_uses_timeline(session):
+    root, _truth = session
+    (root / "Audio/s_AUD_trial001_MIC0_mic.wav").write_bytes(b"")
+    (root / "Cameras/s_CAM_trial001_cam0.mp4").write_bytes(b"")
+
+    metadata = await generate_sync_metadata(root, 1)
+    audio = metadata["modules"]["AudioRecorder_0"]
+    camera = metadata["modules"]["Camera_0"]
+    assert audio["clock_source"] == "total_frames"
+    assert camera["clock_source"] == "sensor_timestamp_ns"
+    # Audio sample 0 at +0.1 s, first frame at +0.2 s (plus arrival latency)
+    assert camera["start_time_unix"] - audio["start_time_unix"] == pytest.approx(0.1, abs=0.01)
+    assert len(metadata["timeline"]["streams"]) == 5
+    json.dumps(metadata)
+
+
+async def test_media_discovery_skips_other_modules(tmp_path):
+    root = tmp_path / "session_20251208_143022"
+    media = [
+        "Audio/143022_AUD_trial001_MIC1_yeti.wav",
+        "Audio/143022_AUD_trial001_MIC0_blue.wav",
+        "Audio/143022_AUD_trial002_MIC0_blue.wav",
+        "Cameras/usb_1_2_3/143022_CAM_trial001_c920.mp4",
+        "Cameras/usb_1_2_3/143022_CAM_trial001_c920_timing.csv",
+        "EyeTracker-Neon/143022_ET_trial001_AUDIO.wav",
+        "EyeTracker-Neon/143022_ET_trial001_WORLD_1280x720_30fps.mp4",
+        "EyeTracker-Neon/143022_ET_trial001_EYES_384x192_30fps.mp4",
+        "20251208_143022_AV_CAM0_trial001.mp4",
+    ]
+    for name in media:
+        (root / name).parent.mkdir(parents=True, exist_ok=True)
+        (root / name).write_bytes(b"")
+
+    files = await find_trial_files(root, 1)
+    assert files["audio"] == root / "Audio/143022_AUD_trial001_MIC0_blue.wav"
+    assert files["videos"] == [(0, root / "Cameras/usb_1_2_3/143022_CAM_trial001_c920.mp4")]
+    assert files["video_csvs"] == {0: root / "Cameras/usb_1_2_3/143022_CAM_trial001_c920_timing.csv"}
+    assert files["audio_csv"] is None
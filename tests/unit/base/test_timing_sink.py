@@ -0,0 +1,163 @@
+"""Unit tests for the shared timing sink."""
+
+import threading
+import time
+
+import pytest
+
+from rpi_logger.modules.base.timing_sink import (
+    FlushPolicy,
+    TimingSink,
+    get_timing_sink,
+    open_timing_stream,
+)
+
+
+def _lines(path):
+    return path.read_text().splitlines()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestTimingSink:
+    """Test TimingSink batching and lifecycle."""
+
+    def test_header_on_disk_at_open(self, tmp_path):
+        path = tmp_path / "t.csv"
+        stream = TimingSink().open_stream(path, "a,b\n")
+
+        assert _lines(path) == ["a,b"]
+        stream.close()
+
+    def test_flush_by_count(self, tmp_path):
+        path = tmp_path / "t.csv"
+        stream = TimingSink().open_stream(path, "h\n", FlushPolicy(max_rows=5, max_delay=60.0))
+
+        for i in range(4):
+            stream.write_row(f"{i}\n")
+        time.sleep(0.05)
+        assert _lines(path) == ["h"]
+
+        stream.write_row("4\n")
+        assert _wait_for(lambda: len(_lines(path)) == 6)
+        assert stream.flushes == 1
+        stream.close()
+
+    def test_flush_by_time_bounds_loss_window(self, tmp_path):
+        path = tmp_path / "t.csv"
+        stream = TimingSink().open_stream(path, "h\n", FlushPolicy(max_rows=1000, max_delay=0.05))
+
+        stream.write_row("1\n")
+
+        assert _wait_for(lambda: len(_lines(path)) == 2, timeout=1.0)
+        stream.close()
+
+    def test_explicit_flush(self, tmp_path):
+        path = tmp_path / "t.csv"
+        stream = TimingSink().open_stream(path, "h\n", FlushPolicy(max_rows=1000, max_delay=60.0))
+        stream.write_row("1\n")
+
+        assert stream.flush()
+        assert _lines(path) == ["h", "1"]
+        stream.close()
+
+    def test_close_drains_and_rejects_writes(self, tmp_path):
+        path = tmp_path / "t.csv"
+        sink = TimingSink()
+        stream = sink.open_stream(path, "h\n", FlushPolicy(max_rows=1000, max_delay=60.0))
+        for i in range(10):
+            stream.write_row(f"{i}\n")
+
+        stream.close()
+
+        assert len(_lines(path)) == 11
+        assert stream.rows_written == 10
+        assert not stream.is_open
+        assert stream.write_row("x\n") is False
+        assert _wait_for(lambda: sink.stream_count == 0)
+
+    def test_close_is_idempotent(self, tmp_path):
+        stream = TimingSink().open_stream(tmp_path / "t.csv", "h\n")
+
+        stream.close()
+        stream.close(timeout=0.1)
+
+    def test_full_buffer_drops_rows(self, tmp_path):
+        path = tmp_path / "t.csv"
+        stream = TimingSink().open_stream(
+            path, "h\n", FlushPolicy(max_rows=1000, max_delay=60.0, capacity=3)
+        )
+
+        results = [stream.write_row(f"{i}\n") for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert stream.rows_dropped == 2
+        stream.close()
+
+    def test_dropped_rows_logged_on_close(self, tmp_path, caplog):
+        stream = TimingSink().open_stream(
+            tmp_path / "t.csv", "h\n", FlushPolicy(max_rows=1000, max_delay=60.0, capacity=1)
+        )
+        stream.write_row("0\n")
+        stream.write_row("1\n")
+
+        with caplog.at_level("WARNING"):
+            stream.close()
+        assert "dropped 1 rows" in caplog.text
+
+    def test_stop_flushes_and_ends_thread(self, tmp_path):
+        path = tmp_path / "t.csv"
+        sink = TimingSink()
+        stream = sink.open_stream(path, "h\n", FlushPolicy(max_rows=1000, max_delay=60.0))
+        stream.write_row("1\n")
+        thread = sink._thread
+
+        sink.stop(timeout=2.0)
+
+        assert not thread.is_alive()
+        assert _lines(path) == ["h", "1"]
+
+        # Closing after the stop drains on the caller's thread without waiting
+        stream.write_row("2\n")
+        start = time.monotonic()
+        stream.close(timeout=1.0)
+        assert time.monotonic() - start < 0.5
+        assert _lines(path) == ["h", "1", "2"]
+        assert not stream.is_open
+
+    def test_open_after_stop_restarts_writer(self, tmp_path):
+        sink = TimingSink()
+        sink.open_stream(tmp_path / "a.csv", "h\n").close()
+        sink.stop(timeout=2.0)
+
+        path = tmp_path / "b.csv"
+        stream = sink.open_stream(path, "h\n", FlushPolicy(max_rows=1, max_delay=60.0))
+        stream.write_row("1\n")
+        assert _wait_for(lambda: len(_lines(path)) == 2)
+        stream.close()
+
+    def test_one_writer_thread_for_many_streams(self, tmp_path):
+        def sink_threads():
+            return sum(1 for t in threading.enumerate() if t.name == "timing-sink")
+
+        sink = TimingSink()
+        before = sink_threads()
+        streams = [sink.open_stream(tmp_path / f"{i}.csv", "h\n") for i in range(4)]
+
+        assert sink_threads() - before == 1
+        assert sink.stream_count == 4
+        for stream in streams:
+            stream.close()
+
+    def test_process_wide_sink_is_shared(self, tmp_path):
+        stream = open_timing_stream(tmp_path / "t.csv", "h\n")
+
+        assert get_timing_sink() is get_timing_sink()
+        stream.close()
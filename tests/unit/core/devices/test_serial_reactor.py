@@ -0,0 +1,249 @@
+"""
+Tests for the serial reactor.
+
+Tests cover:
+- RawLine decoding and latency
+- LineSplitter splitting, arrival stamps and overflow handling
+- LineInbox delivery, waiting and failure wakeups
+- SerialReactor reader threads against a mock serial port
+- BaseTransport default wait_for_data and read_raw_line
+"""
+
+import asyncio
+import time
+
+from rpi_logger.core.devices.transports import (
+    BaseTransport,
+    LineInbox,
+    RawLine,
+    SerialReactor,
+)
+from rpi_logger.core.devices.transports.serial_reactor import LineSplitter
+from tests.infrastructure.mocks.serial_mocks import MockSerialConfig, MockSerialDevice
+
+
+def _open_port(timeout: float = 0.05) -> MockSerialDevice:
+    port = MockSerialDevice(MockSerialConfig(timeout=timeout))
+    port.open()
+    return port
+
+
+def _stamps(lines):
+    return [(line.data, line.arrival_mono_ns, line.arrival_unix_ns) for line in lines]
+
+
+class TestRawLine:
+    """Tests for RawLine."""
+
+    def test_text_and_seconds(self):
+        raw = RawLine(b"  stm>1\r\n", 2_500_000_000, 1_700_000_000_123_456_000, "ttyACM0")
+
+        assert raw.text == "stm>1"
+        assert raw.arrival_mono == 2.5
+        assert raw.arrival_unix == 1_700_000_000.123456
+        assert raw.port == "ttyACM0"
+
+    def test_host_latency(self):
+        raw = RawLine(b"x\n", 1_000_000, 0)
+
+        assert raw.host_latency_us(1_250_000) == 250.0
+
+    def test_now_stamps_current_time(self):
+        before = time.perf_counter_ns()
+        raw = RawLine.now(b"$GPGGA", "serial0")
+
+        assert before <= raw.arrival_mono_ns <= time.perf_counter_ns()
+        assert raw.host_latency_us() >= 0
+
+
+class TestLineSplitter:
+    """Tests for LineSplitter."""
+
+    def test_splits_complete_lines(self):
+        splitter = LineSplitter()
+        lines = splitter.feed(b"trl>1,2,3\r\nclk>5\n", 100, 200)
+
+        assert [line.data for line in lines] == [b"trl>1,2,3\r\n", b"clk>5\n"]
+        assert splitter.pending == 0
+
+    def test_partial_line_keeps_first_chunk_stamp(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"$GPGGA,12", 100, 1000) == []
+        assert splitter.pending == 9
+
+        lines = splitter.feed(b"3519*47\r\n$GPR", 250, 2500)
+        assert _stamps(lines) == [(b"$GPGGA,123519*47\r\n", 100, 1000)]
+
+        lines = splitter.feed(b"MC*6A\n", 400, 4000)
+        # The second sentence started in the 250 ns chunk
+        assert _stamps(lines) == [(b"$GPRMC*6A\n", 250, 2500)]
+
+    def test_lines_starting_in_chunk_get_chunk_stamp(self):
+        splitter = LineSplitter()
+        splitter.feed(b"a", 1, 10)
+        lines = splitter.feed(b"\nb\nc\n", 2, 20)
+
+        assert _stamps(lines) == [(b"a\n", 1, 10), (b"b\n", 2, 20), (b"c\n", 2, 20)]
+
+    def test_overflow_drops_oldest_bytes(self):
+        splitter = LineSplitter(max_size=8)
+        splitter.feed(b"0123456789", 1, 1)
+
+        assert splitter.pending == 8
+        assert splitter.dropped_bytes == 2
+        lines = splitter.feed(b"\n", 2, 2)
+        assert lines[0].data == b"23456789\n"
+
+    def test_clear(self):
+        splitter = LineSplitter()
+        splitter.feed(b"partial", 1, 1)
+        splitter.clear()
+
+        assert splitter.pending == 0
+        assert _stamps(splitter.feed(b"x\n", 2, 2)) == [(b"x\n", 2, 2)]
+
+    def test_lines_carry_port(self):
+        splitter = LineSplitter(port="ttyUSB0")
+
+        assert splitter.feed(b"a\n", 1, 1)[0].port == "ttyUSB0"
+
+
+class TestLineInbox:
+    """Tests for LineInbox."""
+
+    async def test_deliver_and_get(self):
+        inbox = LineInbox()
+        inbox.deliver([RawLine(b"a\n", 1, 1), RawLine(b"b\n", 2, 2)])
+
+        assert len(inbox) == 2
+        assert inbox.get_nowait() == RawLine(b"a\n", 1, 1)
+        assert inbox.get_nowait() == RawLine(b"b\n", 2, 2)
+        assert inbox.get_nowait() is None
+
+    async def test_wait_times_out_without_data(self):
+        inbox = LineInbox()
+        start = time.monotonic()
+
+        assert await inbox.wait(0.05) is False
+        assert time.monotonic() - start >= 0.04
+
+    async def test_wait_wakes_on_delivery(self):
+        inbox = LineInbox()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, inbox.deliver, [RawLine(b"x\n", 1, 1)])
+
+        start = time.monotonic()
+        assert await inbox.wait(5.0) is True
+        assert time.monotonic() - start < 1.0
+
+    async def test_wait_wakes_on_failure(self):
+        inbox = LineInbox()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, inbox.fail, OSError("unplugged"))
+
+        assert await inbox.wait(5.0) is True
+        assert isinstance(inbox.error, OSError)
+
+    async def test_full_inbox_drops_oldest(self):
+        inbox = LineInbox(max_lines=2)
+        inbox.deliver([RawLine(b"1\n", 1, 1), RawLine(b"2\n", 2, 2), RawLine(b"3\n", 3, 3)])
+
+        assert inbox.dropped_lines == 1
+        assert inbox.get_nowait().data == b"2\n"
+
+
+class TestSerialReactor:
+    """Tests for SerialReactor reader threads."""
+
+    async def test_lines_arrive_with_timestamps(self):
+        reactor = SerialReactor()
+        port = _open_port()
+        inbox = LineInbox()
+        reader = reactor.attach(port, inbox, name="ttyMOCK0")
+        try:
+            before = time.perf_counter_ns()
+            port._queue_response(b"stm>1\nstm>0\n")
+            assert await inbox.wait(2.0)
+            while len(inbox) < 2:
+                await inbox.wait(0.1)
+            after = time.perf_counter_ns()
+
+            first = inbox.get_nowait()
+            second = inbox.get_nowait()
+            assert first.data == b"stm>1\n"
+            assert second.data == b"stm>0\n"
+            assert first.port == "ttyMOCK0"
+            assert before <= first.arrival_mono_ns <= after
+            assert first.arrival_mono_ns <= second.arrival_mono_ns
+            assert reactor.stats()["ttyMOCK0"]["lines"] == 2
+        finally:
+            await asyncio.to_thread(reactor.detach, reader)
+            port.close()
+
+        assert not reader.is_alive()
+        assert reactor.port_count == 0
+
+    async def test_read_error_fails_inbox(self):
+        reactor = SerialReactor()
+        port = _open_port()
+        inbox = LineInbox()
+        reader = reactor.attach(port, inbox, name="ttyMOCK0")
+
+        port._is_open = False  # read() now raises IOError
+        assert await inbox.wait(2.0)
+        assert isinstance(inbox.error, IOError)
+
+        await asyncio.to_thread(reactor.detach, reader)
+        assert not reader.is_alive()
+
+    async def test_idle_port_is_not_polled_from_loop(self):
+        reactor = SerialReactor()
+        port = _open_port(timeout=0.2)
+        inbox = LineInbox()
+        reader = reactor.attach(port, inbox, name="ttyMOCK0")
+        try:
+            assert await inbox.wait(0.3) is False
+            assert reader.batches == 0
+        finally:
+            await asyncio.to_thread(reactor.detach, reader)
+
+
+class _PollingTransport(BaseTransport):
+    async def connect(self) -> bool:
+        return True
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def write(self, data: bytes) -> bool:
+        return True
+
+    async def read_line(self):
+        return None
+
+
+class TestBaseTransportDefaults:
+    """Tests for the default wait_for_data and read_raw_line."""
+
+    async def test_wait_for_data_polls(self):
+        transport = _PollingTransport()
+        start = time.monotonic()
+
+        assert await transport.wait_for_data(timeout=5.0)
+
+        # Sleeps POLL_INTERVAL, not the full timeout
+        assert time.monotonic() - start < 0.5
+
+    async def test_read_raw_line_stamps_read_line(self):
+        class _LineTransport(_PollingTransport):
+            async def read_line(self):
+                return "stm>0"
+
+        before = time.perf_counter_ns()
+        raw = await _LineTransport().read_raw_line()
+
+        assert raw.data == b"stm>0"
+        assert raw.arrival_mono_ns >= before
+
+    async def test_empty_read_is_none(self):
+        assert await _PollingTransport().read_raw_line() is None
@@ -0,0 +1,215 @@
+"""
+Tests for the binary IPC channel.
+
+Tests cover:
+- Frame encoding and reading over a socketpair
+- Batching of high-rate status types and ordering with urgent statuses
+- Backpressure drops and broken-channel detection
+- StatusMessage.from_data and fallback to JSON lines
+- ModuleProcess reading statuses from the channel
+"""
+
+import asyncio
+import io
+import json
+import os
+import socket
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from rpi_logger.core.commands import FrameType, FrameWriter, StatusMessage
+from rpi_logger.core.commands.ipc_channel import (
+    HEADER,
+    IPC_FD_ENV,
+    MAX_FRAME_SIZE,
+    encode_frame,
+    read_frames,
+    writer_from_env,
+)
+from rpi_logger.core.module_process import ModuleProcess
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX socketpair channel")
+
+
+def _status(status, **data):
+    return {"type": "status", "status": status, "timestamp": "2025-01-01T12:00:00", "data": data}
+
+
+async def _read_all(sock, count):
+    reader, writer = await asyncio.open_connection(sock=sock)
+    frames = []
+    try:
+        async for frame in read_frames(reader):
+            frames.append(frame)
+            if len(frames) == count:
+                break
+    finally:
+        writer.close()
+    return frames
+
+
+@pytest.fixture
+def channel():
+    master_sock, module_sock = socket.socketpair()
+    writer = FrameWriter(module_sock, batch_interval=60.0)
+    yield master_sock, writer
+    writer.close()
+    master_sock.close()
+
+
+class TestFraming:
+    """Tests for frame encoding and reading."""
+
+    def test_encode_frame_header(self):
+        frame = encode_frame(FrameType.LOG, {"a": 1})
+
+        length, frame_type = HEADER.unpack_from(frame)
+        assert frame_type == FrameType.LOG
+        assert frame[HEADER.size:] == b'{"a":1}'
+        assert length == len(frame) - HEADER.size
+
+    async def test_roundtrip(self, channel):
+        master_sock, writer = channel
+
+        assert writer.send_status(_status("ready"))
+        frames = await _read_all(master_sock, 1)
+
+        assert frames == [(FrameType.STATUS, _status("ready"))]
+
+    async def test_oversized_frame_rejected(self, channel):
+        master_sock, writer = channel
+        writer._sock.sendall(HEADER.pack(MAX_FRAME_SIZE + 1, FrameType.STATUS))
+
+        with pytest.raises(ValueError):
+            await _read_all(master_sock, 1)
+
+    async def test_eof_ends_iteration(self, channel):
+        master_sock, writer = channel
+        writer.send_status(_status("quitting"))
+        writer.close()
+
+        assert len(await _read_all(master_sock, 5)) == 1
+
+
+class TestBatching:
+    """Tests for FrameWriter batching and backpressure."""
+
+    async def test_log_messages_coalesce_into_one_write(self, channel):
+        master_sock, writer = channel
+        for index in range(50):
+            assert writer.send_status(_status("log_message", message=str(index)))
+        assert writer.writes == 0
+
+        assert writer.flush()
+        frames = await _read_all(master_sock, 50)
+
+        assert writer.writes == 1
+        assert writer.frames_sent == 50
+        assert {frame_type for frame_type, _ in frames} == {FrameType.LOG}
+
+    async def test_urgent_status_flushes_batch_in_order(self, channel):
+        master_sock, writer = channel
+        writer.send_status(_status("log_message", message="first"))
+        writer.send_status(_status("vog_event", value=1))
+        writer.send_status(_status("command_ack", success=True))
+
+        frames = await _read_all(master_sock, 3)
+
+        assert [message["status"] for _, message in frames] == ["log_message", "vog_event", "command_ack"]
+        assert [frame_type for frame_type, _ in frames] == [FrameType.LOG, FrameType.EVENT, FrameType.STATUS]
+        assert writer.writes == 1
+
+    async def test_flusher_thread_sends_batch(self):
+        master_sock, module_sock = socket.socketpair()
+        writer = FrameWriter(module_sock, batch_interval=0.01)
+        try:
+            writer.send_status(_status("log_message", message="x"))
+            frames = await asyncio.wait_for(_read_all(master_sock, 1), 2.0)
+            assert frames[0][1]["data"] == {"message": "x"}
+        finally:
+            writer.close()
+            master_sock.close()
+
+    def test_batched_frames_dropped_over_pending_limit(self, channel):
+        _, writer = channel
+        writer.max_pending_bytes = 200
+
+        results = [writer.send_status(_status("log_message", message="y" * 40)) for _ in range(10)]
+
+        assert not all(results)
+        assert writer.dropped_frames == results.count(False)
+        assert not writer.failed
+        # Statuses that are not batched are never dropped
+        assert writer.send_status(_status("error", message="boom"))
+
+    def test_closed_peer_marks_channel_failed(self, channel):
+        master_sock, writer = channel
+        master_sock.close()
+
+        assert writer.send_status(_status("ready")) is False
+        assert writer.failed
+
+
+class TestStatusMessageChannel:
+    """Tests for StatusMessage over the channel."""
+
+    def test_from_data(self):
+        message = StatusMessage.from_data(_status("error", message="Camera init failed"))
+
+        assert message.is_valid()
+        assert message.get_error_message() == "Camera init failed"
+        assert not StatusMessage.from_data({"type": "other"}).is_valid()
+        assert not StatusMessage.from_data([1, 2]).is_valid()
+
+    def test_writer_from_env_without_variable(self, monkeypatch):
+        monkeypatch.delenv(IPC_FD_ENV, raising=False)
+
+        assert writer_from_env() is None
+
+    def test_writer_from_env_bad_fd(self, monkeypatch):
+        monkeypatch.setenv(IPC_FD_ENV, "not-a-number")
+
+        assert writer_from_env() is None
+        assert IPC_FD_ENV not in os.environ
+
+    async def test_send_uses_channel_then_falls_back(self, channel, monkeypatch):
+        master_sock, writer = channel
+        stdout = io.StringIO()
+        monkeypatch.setattr(StatusMessage, "channel", writer)
+        monkeypatch.setattr(StatusMessage, "_channel_checked", True)
+        monkeypatch.setattr(StatusMessage, "output_stream", stdout)
+
+        StatusMessage.send("ready", {"module": "GPS"})
+        frames = await _read_all(master_sock, 1)
+        assert frames[0][1]["data"] == {"module": "GPS"}
+        assert stdout.getvalue() == ""
+
+        master_sock.close()
+        StatusMessage.send("error", {"message": "lost"})
+        assert json.loads(stdout.getvalue())["status"] == "error"
+
+
+class TestModuleProcessChannel:
+    """Tests for ModuleProcess reading the channel."""
+
+    async def test_ipc_reader_dispatches_statuses(self, tmp_path):
+        seen = []
+
+        async def _callback(process, status):
+            seen.append(status.get_status_type())
+
+        info = SimpleNamespace(name="GPS", module_id="gps")
+        process = ModuleProcess(info, tmp_path, status_callback=_callback)
+        process._ipc_socket, module_sock = socket.socketpair()
+        writer = FrameWriter(module_sock, batch_interval=60.0)
+
+        writer.send_status(_status("log_message", message="hello"))
+        writer.send_status(_status("ready"))
+        writer.close()
+        await asyncio.wait_for(process._ipc_reader(), 2.0)
+        process._close_ipc_channel()
+
+        assert seen == ["log_message", "ready"]
+        assert process.get_state().value == "idle"
@@ -0,0 +1,189 @@
+"""
+Tests for forwarding module logs to the master.
+
+Tests cover:
+- TokenBucket refill and burst limits
+- ForwardingHandler queueing, batching, repeat collapsing and rate limiting
+- Dropped and throttled record counts in batches
+- TextHandler ingesting forwarded batches for the log panel
+"""
+
+import logging
+import time
+from unittest.mock import MagicMock
+
+from rpi_logger.core.module_log_manager import ForwardingHandler, TokenBucket
+
+
+def _handler(**kwargs):
+    sent = []
+    kwargs.setdefault("send", sent.append)
+    handler = ForwardingHandler("DRT:ACM0", logging.DEBUG, start=False, **kwargs)
+    log = logging.getLogger(f"tests.forwarding.{id(handler)}")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    log.addHandler(handler)
+    return handler, log, sent
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, burst=3, clock=lambda: now[0])
+
+        assert [bucket.take() for _ in range(4)] == [True, True, True, False]
+        now[0] = 0.5
+        assert bucket.take() is True
+        assert bucket.take() is False
+
+    def test_refill_capped_at_burst(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=100.0, burst=2, clock=lambda: now[0])
+        now[0] = 60.0
+
+        assert [bucket.take() for _ in range(3)] == [True, True, False]
+
+
+class TestForwardingHandler:
+    """Tests for ForwardingHandler."""
+
+    def test_records_sent_as_one_batch(self):
+        handler, log, sent = _handler()
+        log.info("first %d", 1)
+        log.warning("second")
+
+        payload = handler.flush_batch()
+
+        assert sent == [payload]
+        assert payload["module_id"] == "DRT:ACM0"
+        assert [r["message"] for r in payload["records"]] == [
+            f"{log.name} | first 1",
+            f"{log.name} | second",
+        ]
+        assert payload["records"][1]["level"] == "WARNING"
+        assert payload["dropped"] == 0
+        assert payload["throttled"] == 0
+
+    def test_nothing_queued_sends_nothing(self):
+        handler, _, sent = _handler()
+
+        assert handler.flush_batch() is None
+        assert sent == []
+
+    def test_level_filters_before_queueing(self):
+        handler, log, _ = _handler()
+        handler.setLevel(logging.WARNING)
+        log.info("hidden")
+
+        assert handler.queue.qsize() == 0
+
+    def test_full_queue_drops_and_counts(self):
+        handler, log, _ = _handler(max_queue=3)
+        for index in range(5):
+            log.info("record %d", index)
+
+        payload = handler.flush_batch()
+
+        assert len(payload["records"]) == 3
+        assert payload["dropped"] == 2
+        assert handler.dropped_total == 2
+
+    def test_repeats_collapse_into_summary(self):
+        handler, log, _ = _handler(repeat_window=1.0)
+        for _ in range(50):
+            log.warning("Frame dropped")
+
+        first = handler.flush_batch()
+        assert len(first["records"]) == 1
+
+        later = handler.flush_batch(now=time.time() + 2.0)
+        summary = later["records"][0]
+        assert summary["repeat"] == 49
+        assert summary["message"].endswith("Frame dropped (×49 in last 1 s)")
+
+    def test_rate_limit_drops_but_keeps_errors(self):
+        handler, log, _ = _handler(rate_limit=0.0, burst=2)
+        for index in range(5):
+            log.info("info %d", index)
+        log.error("still sent")
+
+        payload = handler.flush_batch()
+
+        assert [r["message"].split(" | ")[1] for r in payload["records"]] == ["info 0", "info 1", "still sent"]
+        assert payload["throttled"] == 3
+        assert payload["dropped"] == 0
+        assert handler.throttled_total == 3
+
+    def test_throttled_record_opens_no_repeat_window(self):
+        handler, log, _ = _handler(rate_limit=0.0, burst=1, repeat_window=1.0)
+        log.info("filler")  # Takes the only token
+        for _ in range(5):
+            log.warning("Frame dropped")
+
+        first = handler.flush_batch()
+        assert [r["message"] for r in first["records"]] == [f"{log.name} | filler"]
+        assert first["throttled"] == 5
+
+        # No window was opened for the throttled record, so nothing to report
+        later = handler.flush_batch(now=time.time() + 2.0)
+        assert later is None
+
+    def test_close_flushes_open_repeat_windows(self):
+        handler, log, sent = _handler()
+        log.info("again")
+        log.info("again")
+
+        handler.close()
+
+        records = [record for batch in sent for record in batch["records"]]
+        assert records[-1]["repeat"] == 1
+
+    def test_sender_thread_sends_periodically(self):
+        sent = []
+        handler = ForwardingHandler("GPS", logging.INFO, batch_interval=0.01, send=sent.append)
+        try:
+            handler.handle(logging.makeLogRecord({"name": "gps", "msg": "fix", "levelno": logging.INFO, "levelname": "INFO"}))
+            deadline = time.monotonic() + 2.0
+            while not sent and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            handler.close()
+
+        assert sent[0]["records"][0]["message"] == "gps | fix"
+
+    def test_send_errors_are_swallowed(self):
+        def _fail(payload):
+            raise BrokenPipeError()
+
+        handler, log, _ = _handler(send=_fail)
+        log.info("lost")
+
+        assert handler.flush_batch() is not None
+
+
+class TestTextHandlerIngest:
+    """Tests for the master log panel ingesting forwarded batches."""
+
+    def test_batch_buffered_without_widget_calls(self):
+        from rpi_logger.core.ui.main_window import TextHandler
+
+        widget = MagicMock()
+        handler = TextHandler(widget)
+        handler.ui_filter.ui_level = logging.INFO
+        handler.ingest_module_batch("DRT:ACM0", {
+            "records": [
+                {"level": "DEBUG", "message": "drt | hidden", "created": 0.0},
+                {"level": "WARNING", "message": "drt | shown", "created": 0.0},
+            ],
+            "dropped": 4,
+            "throttled": 2,
+        })
+
+        lines = list(handler._buffer)
+        assert len(lines) == 3
+        assert "| WARNING  | DRT:ACM0 | drt | shown" in lines[0]
+        assert "DRT:ACM0: 4 log records dropped" in lines[1]
+        assert "DRT:ACM0: 2 log records throttled" in lines[2]
+        widget.insert.assert_not_called()
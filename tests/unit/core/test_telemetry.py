@@ -0,0 +1,139 @@
+"""
+Tests for the module telemetry bus.
+
+Tests cover:
+- TelemetryPublisher coalescing and polled providers
+- TelemetryBus latest values, topic/source filtering and replay
+- TelemetrySubscription coalescing and per-topic rate bound
+- LoggerSystem-style ingest of telemetry status payloads
+"""
+
+import asyncio
+
+import pytest
+
+from rpi_logger.core.telemetry import TelemetryBus, TelemetryPublisher
+
+
+def _publisher():
+    sent = []
+    return TelemetryPublisher("Audio:hw_1_0", send=sent.append, start=False), sent
+
+
+class TestTelemetryPublisher:
+    """Tests for TelemetryPublisher."""
+
+    def test_coalesces_per_topic(self):
+        publisher, sent = _publisher()
+        for i in range(5):
+            publisher.publish("camera.metrics", {"frames": i}, timestamp=float(i))
+        publisher.publish("gps.fix", {"lat": 1.0}, timestamp=9.0)
+
+        payload = publisher.flush()
+        assert payload["source"] == "Audio:hw_1_0"
+        samples = {s["topic"]: s for s in payload["samples"]}
+        assert samples["camera.metrics"] == {"topic": "camera.metrics", "t": 4.0, "values": {"frames": 4}}
+        assert samples["gps.fix"]["values"] == {"lat": 1.0}
+        assert publisher.samples_coalesced == 4
+        assert sent == [payload]
+
+    def test_nothing_to_send(self):
+        publisher, sent = _publisher()
+        assert publisher.flush() is None
+        assert sent == []
+
+    def test_providers_polled_each_flush(self):
+        publisher, sent = _publisher()
+        level = [-40.0]
+        publisher.register("audio.levels", lambda: {"rms_db": level[0]})
+        publisher.register("eyetracker.gaze", lambda: None)  # No sample yet
+
+        assert publisher.flush(now=1.0)["samples"] == [
+            {"topic": "audio.levels", "t": 1.0, "values": {"rms_db": -40.0}}
+        ]
+        level[0] = -20.0
+        assert publisher.flush(now=2.0)["samples"][0]["values"] == {"rms_db": -20.0}
+
+        publisher.unregister("audio.levels")
+        assert publisher.flush() is None
+        assert len(sent) == 2
+
+    def test_failing_provider_is_skipped(self):
+        publisher, _sent = _publisher()
+        publisher.register("bad", lambda: 1 / 0)
+        publisher.publish("good", {"v": 1})
+        payload = publisher.flush()
+        assert [s["topic"] for s in payload["samples"]] == ["good"]
+
+
+class TestTelemetryBus:
+    """Tests for TelemetryBus and TelemetrySubscription."""
+
+    def test_ingest_keeps_latest_per_source_and_topic(self):
+        bus = TelemetryBus()
+        bus.ingest("Audio:1", {"samples": [{"topic": "audio.levels", "t": 1.0, "values": {"rms_db": -30}}]})
+        bus.ingest("Audio:1", {"samples": [{"topic": "audio.levels", "t": 2.0, "values": {"rms_db": -10}}]})
+        bus.ingest("Audio:2", {"samples": [{"topic": "audio.levels", "t": 2.0, "values": {"rms_db": -50}}]})
+        bus.ingest("GPS:1", {"samples": [{"topic": "gps.fix", "t": 2.0, "values": {}}, {"values": {}}]})
+
+        levels = bus.latest(("audio.*",))
+        assert {s["source"]: s["values"]["rms_db"] for s in levels} == {"Audio:1": -10, "Audio:2": -50}
+        assert [s["topic"] for s in bus.latest(sources=("GPS:1",))] == ["gps.fix"]
+        assert bus.samples_received == 4
+
+        bus.forget_source("Audio:1")
+        assert [s["source"] for s in bus.latest(("audio.levels",))] == ["Audio:2"]
+
+    def test_subscription_filters_and_replays(self):
+        async def run():
+            bus = TelemetryBus()
+            bus.publish("GPS:1", "gps.fix", {"lat": 1.0}, timestamp=1.0)
+            subscription = bus.subscribe(("gps.*", "drt.trial"), max_rate=30.0)
+            bus.publish("Audio:1", "audio.levels", {"rms_db": -30})
+            bus.publish("DRT:1", "drt.trial", {"reaction_time": 321})
+
+            batch = await subscription.next_batch(timeout=1.0)
+            assert sorted(s["topic"] for s in batch) == ["drt.trial", "gps.fix"]
+
+            bus.unsubscribe(subscription)
+            bus.publish("DRT:1", "drt.trial", {"reaction_time": 400})
+            assert await subscription.next_batch(timeout=0.05) == []
+            assert bus.subscriber_count == 0
+
+        asyncio.run(run())
+
+    def test_subscription_coalesces_and_decimates(self):
+        async def run():
+            bus = TelemetryBus()
+            subscription = bus.subscribe(max_rate=10.0)
+            loop = asyncio.get_running_loop()
+
+            bus.publish("Cam:1", "camera.metrics", {"frame": 0})
+            assert (await subscription.next_batch(timeout=1.0))[0]["values"] == {"frame": 0}
+
+            # A burst inside one interval is delivered once, newest value only
+            start = loop.time()
+            for i in range(1, 50):
+                bus.publish("Cam:1", "camera.metrics", {"frame": i})
+            batch = await subscription.next_batch(timeout=1.0)
+            assert loop.time() - start >= 0.09
+            assert [s["values"]["frame"] for s in batch] == [49]
+            assert subscription.samples_coalesced == 48
+            assert subscription.samples_delivered == 2
+
+        asyncio.run(run())
+
+    def test_update_changes_filter_and_rate(self):
+        async def run():
+            bus = TelemetryBus()
+            subscription = bus.subscribe(("audio.*",), max_rate=1000.0)
+            assert subscription.max_rate == pytest.approx(30.0)  # Capped
+
+            bus.publish("Audio:1", "audio.levels", {})
+            subscription.update(topics=("gps.*",), max_rate=2.0)
+            assert await subscription.next_batch(timeout=0.05) == []  # Pending audio sample dropped
+
+            bus.publish("GPS:1", "gps.fix", {})
+            assert [s["topic"] for s in await subscription.next_batch(timeout=1.0)] == ["gps.fix"]
+
+        asyncio.run(run())
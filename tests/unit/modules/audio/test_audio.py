@@ -996,7 +996,7 @@ class TestAudioDeviceRecorder:
 
     def test_pcm_byte_conversion_logic(self, sample_audio_data: np.ndarray):
         """Test PCM byte conversion logic."""
-        # Simulate the conversion logic from AudioDeviceRecorder._to_pcm_bytes
+        # Simulate the float32 -> int16 conversion done by PcmRing.push
         array = np.asarray(sample_audio_data, dtype=np.float32)
         if array.ndim > 1:
             array = array[:, 0]
@@ -1080,6 +1080,222 @@ class TestAudioDeviceRecorder:
         assert handle.start_time_unix is not None
 
 
+class TestPcmRing:
+    """Tests for the preallocated callback-to-writer PCM ring."""
+
+    def _ring(self, capacity: int = 16, max_blocks: int = 8):
+        from rpi_logger.modules.Audio.services.pcm_ring import PcmRing
+
+        return PcmRing(capacity, max_blocks=max_blocks)
+
+    def test_conversion_matches_astype(self):
+        ring = self._ring()
+        samples = np.array([1.5, -1.5, 0.5, -0.25, 0.0], dtype=np.float32)
+        assert ring.push(samples, 1.0, 2.0, None)
+
+        _, count, spans = ring.peek()
+        expected = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        assert count == 1
+        assert b"".join(bytes(span) for span in spans) == expected.tobytes()
+
+    def test_wraps_into_two_spans(self):
+        ring = self._ring(capacity=8)
+        ring.push(np.full(6, 0.5, dtype=np.float32), 0.0, 0.0, None)
+        ring.peek()
+        ring.release(1)
+        ring.push(np.full(5, -0.5, dtype=np.float32), 1.0, 1.0, 3.5)
+
+        first_seq, count, spans = ring.peek()
+        assert (first_seq, count) == (1, 1)
+        assert [len(span) for span in spans] == [2, 3]
+        slot = first_seq % ring.max_blocks
+        assert ring.frames[slot] == 5
+        assert ring.adc_time[slot] == 3.5
+
+    def test_full_ring_rejects_block(self):
+        ring = self._ring(capacity=8, max_blocks=2)
+        assert ring.push(np.zeros(4, dtype=np.float32), 0.0, 0.0, None)
+        assert not ring.push(np.zeros(5, dtype=np.float32), 0.0, 0.0, None)
+        assert ring.push(np.zeros(4, dtype=np.float32), 0.0, 0.0, None)
+        # Out of block slots even though samples would fit after a release
+        assert not ring.push(np.zeros(1, dtype=np.float32), 0.0, 0.0, None)
+        assert ring.pending_blocks == 2
+
+
+class TestChannelSelection:
+    """Tests for multi-channel selection and interleaved recording."""
+
+    @pytest.mark.parametrize(
+        "spec, available, expected",
+        [
+            ("1", 2, (0,)),
+            ("2,1", 2, (1, 0)),
+            ("1-4", 8, (0, 1, 2, 3)),
+            ("all", 3, (0, 1, 2)),
+            ("3,5", 4, (2,)),  # Channel 5 does not exist
+            ("5", 2, (0,)),  # Nothing valid: fall back to the first channel
+            ([2, 3], 4, (1, 2)),
+        ],
+    )
+    def test_resolve_channel_map(self, spec, available, expected):
+        from rpi_logger.modules.Audio.domain import resolve_channel_map
+
+        assert resolve_channel_map(spec, available) == expected
+
+    @pytest.mark.parametrize("spec", ["", "0", "1,1", "x"])
+    def test_invalid_spec_rejected(self, spec):
+        from rpi_logger.modules.Audio.domain import parse_channel_spec
+
+        with pytest.raises(ValueError):
+            parse_channel_spec(spec)
+
+    def test_cli_channels(self):
+        parser = build_arg_parser({"channels": "1-2"})
+        assert AudioSettings.from_args(parser.parse_args([])).channels == "1-2"
+        assert AudioSettings.from_args(parser.parse_args(["--channels", "all"])).channels == "all"
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--channels", "0"])
+
+    def test_ring_maps_channels(self):
+        from rpi_logger.modules.Audio.services.pcm_ring import PcmRing
+
+        ring = PcmRing(16, channels=2)
+        block = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32)
+        assert ring.push(block, 0.0, 0.0, None, channel_map=(2, 0))
+
+        _, _, spans = ring.peek()
+        expected = (block[:, [2, 0]] * 32767).astype(np.int16)
+        assert b"".join(bytes(span) for span in spans) == expected.tobytes()
+
+    def test_interleaved_recording(self, tmp_path: Path):
+        import wave
+
+        from rpi_logger.modules.Audio.services.device_recorder import AudioDeviceRecorder
+
+        device = AudioDeviceInfo(device_id=0, name="Array", channels=4, sample_rate=48000.0)
+        meter = LevelMeter()
+        recorder = AudioDeviceRecorder(
+            device, 48000, meter, logging.getLogger("test_channels"), channel_map=(3, 1),
+        )
+        assert recorder.channels == 2
+        assert recorder.channel_meters[0] is meter
+
+        block = np.zeros((240, 4), dtype=np.float32)
+        block[:, 1] = 0.25
+        block[:, 3] = -0.5
+        recorder.begin_recording(tmp_path, trial_number=1)
+        for _ in range(4):
+            recorder._handle_callback(block, 240, None, None)
+        handle = recorder.finish_recording()
+
+        with wave.open(str(handle.file_path), "rb") as wav:
+            assert wav.getnchannels() == 2
+            assert wav.getnframes() == 4 * 240
+            frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16).reshape(-1, 2)
+        assert np.all(frames[:, 0] == int(-0.5 * 32767))
+        assert np.all(frames[:, 1] == int(0.25 * 32767))
+        rows = handle.timing_csv_path.read_text().splitlines()
+        assert len(rows) == 5
+        assert rows[-1].split(",")[12] == str(4 * 240)
+
+        # Per-channel meters: first follows device channel 4, second channel 2
+        rms_first, _ = recorder.channel_meters[0].get_db_levels()
+        rms_second, _ = recorder.channel_meters[1].get_db_levels()
+        assert rms_first > rms_second
+
+
+class TestAudioPreRoll:
+    """Tests for AudioDeviceRecorder pre-roll buffering."""
+
+    BLOCK = 480
+
+    def _recorder(self, device, preroll_seconds: float):
+        from rpi_logger.modules.Audio.services.device_recorder import AudioDeviceRecorder
+
+        return AudioDeviceRecorder(
+            device, 48000, LevelMeter(), logging.getLogger("test_preroll"),
+            preroll_seconds=preroll_seconds,
+        )
+
+    def _feed(self, recorder, blocks: int) -> None:
+        block = np.full((self.BLOCK, 1), 0.25, dtype=np.float32)
+        for _ in range(blocks):
+            recorder._handle_callback(block, self.BLOCK, None, None)
+
+    def test_disabled_by_default(self, mock_device_info_mono: AudioDeviceInfo):
+        recorder = self._recorder(mock_device_info_mono, 0.0)
+        self._feed(recorder, 5)
+        assert recorder.preroll_stats().items == 0
+
+    def test_recording_starts_with_preroll(self, mock_device_info_mono: AudioDeviceInfo, tmp_path: Path):
+        import wave
+
+        recorder = self._recorder(mock_device_info_mono, 1.0)
+        self._feed(recorder, 5)
+        assert recorder.preroll_stats().items == 5
+
+        recorder.begin_recording(tmp_path, trial_number=1)
+        self._feed(recorder, 3)
+        handle = recorder.finish_recording()
+
+        assert handle is not None
+        assert handle.preroll_chunks == 5
+        assert handle.preroll_seconds == pytest.approx(5 * self.BLOCK / 48000)
+        with wave.open(str(handle.file_path), "rb") as wav:
+            assert wav.getnframes() == 8 * self.BLOCK
+        rows = handle.timing_csv_path.read_text().splitlines()[1:]
+        assert [row.split(",")[10] for row in rows] == [str(i) for i in range(1, 9)]
+        assert rows[-1].split(",")[12] == str(8 * self.BLOCK)
+        assert recorder.preroll_stats().items == 0
+
+    def test_npy_timing_sidecar(self, mock_device_info_mono: AudioDeviceInfo, tmp_path: Path):
+        from rpi_logger.modules.Audio.services.device_recorder import AudioDeviceRecorder
+        from rpi_logger.modules.base.columnar import columnar_to_csv, load_columnar
+
+        recorder = AudioDeviceRecorder(
+            mock_device_info_mono, 48000, LevelMeter(), logging.getLogger("test_npy"),
+            preroll_seconds=1.0, data_format="npy",
+        )
+        self._feed(recorder, 2)
+        recorder.begin_recording(tmp_path, trial_number=3)
+        self._feed(recorder, 3)
+        handle = recorder.finish_recording()
+
+        assert handle.timing_csv_path.name.endswith("_timing.npy")
+        rows, schema = load_columnar(handle.timing_csv_path)
+        assert rows["chunk_index"].tolist() == [1, 2, 3, 4, 5]
+        assert rows["total_frames"][-1] == 5 * self.BLOCK
+        assert schema["prefix"][:2] == ["3", "Audio"]
+        lines = columnar_to_csv(handle.timing_csv_path).read_text().splitlines()
+        assert lines[0].startswith("trial,module,device_id,label,record_time_unix")
+        assert lines[-1].split(",")[10:] == ["5", str(self.BLOCK), str(5 * self.BLOCK)]
+
+    def test_ring_evicts_by_window_and_cap(self):
+        from rpi_logger.modules.Audio.services.pcm_ring import PcmPreRoll
+
+        block = np.full(self.BLOCK, 0.25, dtype=np.float32)
+        preroll = PcmPreRoll(48000, 0.05, 1 << 20, max_block_frames=self.BLOCK)
+        for i in range(10):
+            preroll.push(block, 100.0 + i / 100, i / 100, None)
+        stats = preroll.stats()
+        assert (stats.items, stats.evicted, stats.capped) == (6, 4, 0)
+        assert stats.seconds == pytest.approx(0.05)
+        assert stats.bytes == 6 * self.BLOCK * 2
+
+        samples, blocks = preroll.take()
+        assert samples.shape == (6 * self.BLOCK, 1)
+        assert np.all(samples == int(0.25 * 32767))
+        assert [b[2] for b in blocks] == pytest.approx([i / 100 for i in range(4, 10)])
+        assert preroll.stats().items == 0
+
+        # Memory cap smaller than the window: four blocks fit
+        capped = PcmPreRoll(48000, 1.0, 4 * self.BLOCK * 2, max_block_frames=self.BLOCK)
+        for i in range(10):
+            capped.push(block, 100.0 + i / 100, i / 100, None)
+        stats = capped.stats()
+        assert (stats.items, stats.evicted, stats.capped) == (4, 6, 6)
+
+
 # =============================================================================
 # Test Error Handling for Missing Devices
 # =============================================================================
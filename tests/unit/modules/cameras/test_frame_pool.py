@@ -0,0 +1,140 @@
+"""Unit tests for the Cameras capture frame pool."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from rpi_logger.modules.Cameras.capture import (
+    CapturedFrame,
+    FramePool,
+    FrameRingBuffer,
+)
+
+
+def _frame(slot=None, number: int = 1) -> CapturedFrame:
+    data = slot.array if slot is not None else np.zeros((4, 6, 3), dtype=np.uint8)
+    return CapturedFrame(
+        data=data,
+        frame_number=number,
+        monotonic_time=0.0,
+        wall_time=0.0,
+        size=(6, 4),
+        slot=slot,
+    )
+
+
+class TestFramePool:
+    """Test FramePool slot accounting."""
+
+    def test_preallocates_slots_with_shape(self):
+        pool = FramePool((4, 6, 3), capacity=3)
+
+        slot = pool.acquire()
+
+        assert slot.array.shape == (4, 6, 3)
+        assert slot.array.dtype == np.uint8
+        assert pool.stats.capacity == 3
+        assert pool.stats.in_use == 1
+
+    def test_slot_recycled_after_last_release(self):
+        pool = FramePool((4, 6, 3), capacity=1)
+        slot = pool.acquire()
+        slot.retain()
+
+        slot.release()
+        assert pool.acquire() is None
+
+        slot.release()
+        assert pool.acquire() is slot
+
+    def test_starvation_counted(self):
+        pool = FramePool((4, 6, 3), capacity=2)
+        pool.acquire()
+        pool.acquire()
+
+        assert pool.acquire() is None
+        assert pool.stats.starved == 1
+
+    def test_hit_and_miss_counters(self):
+        pool = FramePool((4, 6, 3), capacity=2)
+
+        pool.record_hit()
+        pool.record_hit()
+        pool.record_miss((4, 6, 3))
+
+        stats = pool.stats
+        assert stats.hits == 2
+        assert stats.misses == 1
+
+    def test_miss_with_new_shape_resizes_pool(self):
+        pool = FramePool((4, 6, 3), capacity=2)
+        old = pool.acquire()
+
+        pool.record_miss((8, 10, 3))
+        new = pool.acquire()
+        old.release()
+
+        assert pool.shape == (8, 10, 3)
+        assert new.array.shape == (8, 10, 3)
+        # Old-shape slot is replaced rather than recycled
+        assert pool.acquire().array.shape == (8, 10, 3)
+        assert pool.acquire() is None
+
+    def test_unpooled_frame_release_is_noop(self):
+        frame = _frame()
+
+        frame.retain()
+        frame.release()
+
+
+class TestFrameRingBufferOwnership:
+    """Test FrameRingBuffer releases frames it discards."""
+
+    def test_overwrite_releases_evicted_frame(self):
+        pool = FramePool((4, 6, 3), capacity=3)
+        buffer = FrameRingBuffer(capacity=2)
+
+        for n in range(3):
+            buffer.put(_frame(pool.acquire(), n))
+
+        assert buffer.drops == 1
+        assert pool.stats.in_use == 2
+
+    def test_clear_releases_frames(self):
+        pool = FramePool((4, 6, 3), capacity=2)
+        buffer = FrameRingBuffer(capacity=2)
+        buffer.put(_frame(pool.acquire()))
+        buffer.put(_frame(pool.acquire()))
+
+        buffer.clear()
+
+        assert pool.stats.in_use == 0
+
+    def test_borrow_latest_holds_reference(self):
+        pool = FramePool((4, 6, 3), capacity=1)
+        buffer = FrameRingBuffer(capacity=1)
+        buffer.put(_frame(pool.acquire()))
+
+        frame = buffer.borrow_latest()
+        buffer.clear()
+
+        assert pool.stats.in_use == 1
+        frame.release()
+        assert pool.stats.in_use == 0
+
+    async def test_consumer_owns_yielded_frame(self):
+        pool = FramePool((4, 6, 3), capacity=2)
+        buffer = FrameRingBuffer(capacity=2)
+        buffer.bind_loop(asyncio.get_running_loop())
+        buffer.put(_frame(pool.acquire()))
+
+        async for frame in buffer.frames():
+            # Producer can still queue while the consumer holds a frame
+            assert buffer.put(_frame(pool.acquire(), 2))
+            assert pool.stats.in_use == 2
+            frame.release()
+            break
+
+        buffer.clear()
+        assert pool.stats.in_use == 0
@@ -0,0 +1,123 @@
+"""Unit tests for the Cameras pre-roll recorder."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+av = pytest.importorskip("av")
+
+from rpi_logger.modules.Cameras.capture import AudioChunk, CapturedFrame
+from rpi_logger.modules.Cameras.recording import PreRollRecorder, TimingWriter
+
+FPS = 10
+SIZE = (64, 48)
+
+
+def _frame(index: int, t0: float) -> CapturedFrame:
+    data = np.full((SIZE[1], SIZE[0], 3), index % 256, dtype=np.uint8)
+    return CapturedFrame(data, index, t0 + index / FPS, 1e9 + index / FPS, SIZE)
+
+
+def _audio(index: int, t0: float) -> AudioChunk:
+    samples = 48000 // FPS
+    return AudioChunk(np.zeros((samples, 1), np.float32), index, t0 + index / FPS, 1e9 + index / FPS, 48000, 1, samples)
+
+
+class TestPreRollRecorder:
+    """Test that recordings start with the buffered window."""
+
+    def test_recording_starts_with_preroll(self, tmp_path):
+        async def run():
+            recorder = PreRollRecorder(SIZE, FPS, window=2.0, sample_rate=48000)
+            await recorder.start()
+            t0 = time.perf_counter()
+            try:
+                for i in range(50):
+                    await recorder.write_video(_frame(i, t0))
+                    await recorder.write_audio(_audio(i, t0))
+                buffered = recorder.stats()
+                assert 0 < buffered.seconds <= 2.0
+
+                timing = TimingWriter(tmp_path / "timing.csv", 1, "cam")
+                await timing.start()
+                stats = await recorder.start_recording(tmp_path / "out.mp4", timing)
+                for i in range(50, 60):
+                    await recorder.write_video(_frame(i, t0))
+                    await recorder.write_audio(_audio(i, t0))
+                await recorder.stop_recording()
+                await timing.stop()
+
+                assert stats.items == buffered.items
+                assert recorder.preroll_frame_count > 0
+                return recorder.video_frame_count, recorder.preroll_frame_count
+            finally:
+                await recorder.close()
+
+        total, preroll = asyncio.run(run())
+
+        with av.open(str(tmp_path / "out.mp4")) as container:
+            assert len(container.streams.audio) == 1
+            decoded = sum(1 for _ in container.decode(video=0))
+        assert decoded == total
+        # Pre-roll frames plus the ten recorded live
+        assert total == preroll + 10
+        lines = (tmp_path / "timing.csv").read_text().splitlines()
+        assert len(lines) == total + 1
+
+    def test_immediate_second_recording_forces_keyframe(self, tmp_path):
+        async def run():
+            recorder = PreRollRecorder(SIZE, FPS, window=2.0)
+            await recorder.start()
+            t0 = time.perf_counter()
+            try:
+                for i in range(12):
+                    await recorder.write_video(_frame(i, t0))
+                await recorder.start_recording(tmp_path / "first.mp4")
+                await recorder.stop_recording()
+                await recorder.start_recording(tmp_path / "second.mp4")
+                for i in range(12, 17):
+                    await recorder.write_video(_frame(i, t0))
+                await recorder.stop_recording()
+                return recorder.preroll_frame_count, recorder.video_frame_count
+            finally:
+                await recorder.close()
+
+        preroll, total = asyncio.run(run())
+        assert preroll == 0
+        with av.open(str(tmp_path / "second.mp4")) as container:
+            assert sum(1 for _ in container.decode(video=0)) == total > 0
+
+
+def test_controller_preroll_uses_selected_backend(monkeypatch):
+    import rpi_logger.modules.Cameras.recording as recording
+    from dataclasses import replace
+    from types import SimpleNamespace
+    from rpi_logger.modules.base.codec_backends import get_backend
+    from rpi_logger.modules.Cameras.core.controller import CameraController
+
+    backend = get_backend("h264_v4l2m2m")
+    created = []
+
+    class FakePreRoll:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+        async def start(self):
+            pass
+
+    async def select():
+        await asyncio.sleep(0.01)
+        return backend
+
+    async def run():
+        controller = CameraController()
+        controller._state.settings = replace(controller._state.settings, preroll_seconds=2.0)
+        controller._camera = SimpleNamespace(resolution=SIZE)
+        controller._codec_task = asyncio.create_task(select())
+        await controller._setup_preroll()
+
+    monkeypatch.setattr(recording, "PreRollRecorder", FakePreRoll)
+    asyncio.run(run())
+    assert created[0]["codec_backend"] is backend
@@ -0,0 +1,109 @@
+"""Unit tests for the Cameras API preview stream fan-out."""
+
+import asyncio
+import os
+
+import cv2
+import numpy as np
+
+from rpi_logger.modules.Cameras.api.preview_stream import PreviewStream
+from rpi_logger.modules.base.preview_shm import PreviewSlotWriter
+
+
+class TestPreviewStream:
+    def test_encodes_once_for_all_clients(self):
+        async def run():
+            stream = PreviewStream(f"Cameras:test{os.getpid()}")
+            writer = PreviewSlotWriter(stream.slot_name, 64 * 48 * 3)
+            try:
+                assert stream.available
+                writer.publish(np.full((48, 64, 3), 200, np.uint8), frame_number=4)
+                first, second = await asyncio.gather(stream.next_frame(), stream.next_frame())
+                assert first[1] is second[1]
+                assert stream.frames_encoded == 1
+                assert writer.wanted()  # The stream keeps the module publishing
+
+                sequence, jpeg, meta = first
+                assert meta["frame_number"] == 4
+                image = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+                assert image.shape == (48, 64, 3)
+
+                writer.publish(np.zeros((48, 64, 3), np.uint8), frame_number=5)
+                newer = await stream.next_frame(after=sequence)
+                assert newer[2]["frame_number"] == 5
+            finally:
+                await stream.close()
+                writer.close()
+
+        asyncio.run(run())
+
+    def test_unavailable_without_slot(self):
+        stream = PreviewStream(f"Cameras:missing{os.getpid()}")
+        assert not stream.available
+
+    def test_unchanged_slot_is_not_reencoded(self):
+        async def run():
+            stream = PreviewStream(f"Cameras:idle{os.getpid()}")
+            writer = PreviewSlotWriter(stream.slot_name, 64 * 48 * 3)
+            calls = []
+            encode = stream._encode
+            stream._encode = lambda *args: calls.append(args) or encode(*args)
+            try:
+                writer.publish(np.full((48, 64, 3), 50, np.uint8), frame_number=1)
+                assert await stream.next_frame() is not None
+                await asyncio.sleep(20 * PreviewStream.POLL_INTERVAL)
+                assert len(calls) == 1
+            finally:
+                await stream.close()
+                writer.close()
+
+        asyncio.run(run())
+
+
+    def test_idle_restart_waits_for_new_frame(self):
+        async def run():
+            stream = PreviewStream(f"Cameras:restart{os.getpid()}")
+            stream.IDLE_TIMEOUT = 0.3
+            writer = PreviewSlotWriter(stream.slot_name, 64 * 48 * 3)
+            try:
+                writer.publish(np.full((48, 64, 3), 50, np.uint8), frame_number=1)
+                assert (await stream.next_frame())[2]["frame_number"] == 1
+                await asyncio.wait_for(stream._task, 2.0)  # Polling stops once idle
+
+                # The old frame is not served again
+                assert await stream.next_frame(timeout=0.2) is None
+                waiter = asyncio.ensure_future(stream.next_frame())
+                await asyncio.sleep(0.05)
+                assert not waiter.done()
+                writer.publish(np.zeros((48, 64, 3), np.uint8), frame_number=2)
+                assert (await waiter)[2]["frame_number"] == 2
+            finally:
+                await stream.close()
+                writer.close()
+
+        asyncio.run(run())
+
+
+class TestPreviewFallback:
+    def test_command_goes_to_matched_module(self):
+        from rpi_logger.modules.Cameras.api.controller import CamerasApiMixin
+
+        class _Controller:
+            def __init__(self):
+                self.commands = []
+
+            async def list_instances(self):
+                return [
+                    {"instance_id": "Cameras:usb0", "module_id": "Cameras", "device_id": "usb0"},
+                    {"instance_id": f"Cameras_CSI:csi{os.getpid()}", "module_id": "Cameras_CSI",
+                     "device_id": f"csi{os.getpid()}"},
+                ]
+
+            async def send_module_command(self, name, command, **kwargs):
+                self.commands.append((name, command))
+                return {"success": False, "message": "no frame"}
+
+        controller = _Controller()
+        result = asyncio.run(CamerasApiMixin.get_camera_preview(controller, f"csi{os.getpid()}"))
+        assert result["error_code"] == "PREVIEW_FAILED"
+        assert controller.commands == [("Cameras_CSI", "get_preview")]
@@ -24,6 +24,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from rpi_logger.core.devices.transports import BaseTransport
+
 
 # =============================================================================
 # Async Test Helper
@@ -751,6 +753,49 @@ class TestDRTDataLogger:
         mono_time = float(row["record_time_mono"])
         assert mono_time > 0
 
+    def test_record_time_is_serial_arrival(self, data_logger_sdrt, tmp_path):
+        """Test record times come from the line's arrival, not the write."""
+        from rpi_logger.core.devices.transports import RawLine
+
+        arrival = RawLine(b"trl>12345,1,250\r\n", 5_000_000_000, 1_733_649_120_250_000_000)
+        data_logger_sdrt.start_recording(trial_number=1)
+        data_logger_sdrt.log_trial(
+            {"timestamp": 12345, "trial_number": 1, "reaction_time": 250}, arrival=arrival
+        )
+        filepath = data_logger_sdrt.filepath
+        data_logger_sdrt.stop_recording()
+
+        with open(filepath, "r") as f:
+            row = next(csv.DictReader(f))
+
+        assert row["record_time_unix"] == "1733649120.250000"
+        assert row["record_time_mono"] == "5.000000000"
+        assert "host_latency_us" not in row
+
+    def test_host_latency_column(self, tmp_path):
+        """Test the optional host_latency_us column."""
+        from rpi_logger.core.devices.transports import RawLine
+        from rpi_logger.modules.DRT.drt_core.data_logger import DRTDataLogger
+
+        data_logger = DRTDataLogger(
+            output_dir=tmp_path, device_id="/dev/ttyACM1", device_type="wdrt", host_latency=True
+        )
+        assert data_logger.csv_header.endswith(",battery_percent,host_latency_us")
+
+        data_logger.start_recording(trial_number=1)
+        arrival = RawLine.now(b"dta>1,1,1,250,90,0\n")
+        data_logger.log_trial({"trial_number": 1}, arrival=arrival)
+        data_logger.log_trial({"trial_number": 2})
+        filepath = data_logger.filepath
+        data_logger.stop_recording()
+
+        with open(filepath, "r") as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(rows[0]) == 12
+        assert 0 <= float(rows[0]["host_latency_us"]) < 1_000_000
+        assert rows[1]["host_latency_us"] == ""
+
 
 # =============================================================================
 # Handler Response Processing Tests
@@ -762,10 +807,10 @@ class TestSDRTHandlerResponseProcessing:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport for testing."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     @pytest.fixture
@@ -816,6 +861,22 @@ class TestSDRTHandlerResponseProcessing:
 
         assert sdrt_handler._stimulus_on is False
 
+    def test_trial_logged_with_trial_line_arrival(self, sdrt_handler):
+        """Test the trl line's arrival, not stm>0's, is logged as the record time."""
+        from rpi_logger.core.devices.transports import RawLine
+
+        trial_line = RawLine(b"trl>12345,1,250\r\n", 1_000, 2_000)
+        sdrt_handler._data_logger = MagicMock()
+        sdrt_handler._current_line = trial_line
+        sdrt_handler._process_response("trl>12345,1,250")
+        sdrt_handler._current_line = RawLine(b"stm>0\r\n", 9_000, 9_000)
+        sdrt_handler._stimulus_on = True
+        sdrt_handler._process_response("stm>0")
+
+        _, kwargs = sdrt_handler._data_logger.log_trial.call_args
+        assert kwargs["arrival"] is trial_line
+        assert sdrt_handler._buffered_trial_arrival is None
+
     def test_process_invalid_response_ignored(self, sdrt_handler):
         """Test that invalid responses are ignored."""
         # No delimiter
@@ -870,10 +931,10 @@ class TestWDRTHandlerResponseProcessing:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport for testing."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     @pytest.fixture
@@ -955,10 +1016,10 @@ class TestSDRTHandlerCommands:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport for testing."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     @pytest.fixture
@@ -1054,10 +1115,10 @@ class TestWDRTHandlerCommands:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport for testing."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     @pytest.fixture
@@ -1209,6 +1270,36 @@ class TestUSBTransport:
 
         assert result is None
 
+    def test_read_line_from_reactor(self, patch_serial):
+        """Test lines arrive through the serial reactor with arrival stamps."""
+        from rpi_logger.modules.DRT.drt_core.transports.usb_transport import USBTransport
+        from tests.infrastructure.mocks.serial_mocks import MockSerialConfig, MockSerialDevice
+
+        port = MockSerialDevice(MockSerialConfig(port="/dev/ttyACM0", timeout=0.05))
+        port.open()
+        patch_serial.return_value = port
+
+        async def _test():
+            transport = USBTransport(port="/dev/ttyACM0", baudrate=9600, read_timeout=0.05)
+            assert await transport.connect()
+            try:
+                before = time.perf_counter_ns()
+                port._queue_response(b"trl>1000,1,250\r\nclk>1\r\n")
+                assert await transport.wait_for_data(2.0)
+                while len(transport._inbox) < 2:
+                    await transport.wait_for_data(0.1)
+                raw = await transport.read_raw_line()
+                assert raw.text == "trl>1000,1,250"
+                assert raw.port == "/dev/ttyACM0"
+                assert raw.arrival_mono_ns >= before
+                assert await transport.read_line() == "clk>1"
+                assert await transport.read_line() is None
+            finally:
+                await transport.disconnect()
+            assert port.is_open is False
+
+        run_async(_test())
+
 
 # =============================================================================
 # Error Handling Tests
@@ -1238,7 +1329,7 @@ class TestErrorHandling:
         """Test handler doesn't crash on malformed responses."""
         from rpi_logger.modules.DRT.drt_core.handlers.sdrt_handler import SDRTHandler
 
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
 
         handler = SDRTHandler(
@@ -1302,12 +1393,12 @@ class TestBaseDRTHandler:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.connect = AsyncMock(return_value=True)
         transport.disconnect = AsyncMock()
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     @pytest.fixture
@@ -1497,10 +1588,10 @@ class TestSDRTFullWorkflow:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     def test_full_trial_workflow(self, mock_transport, tmp_path):
@@ -1550,10 +1641,10 @@ class TestWDRTFullWorkflow:
     @pytest.fixture
     def mock_transport(self):
         """Create a mock transport."""
-        transport = AsyncMock()
+        transport = AsyncMock(spec=BaseTransport)
         transport.is_connected = True
         transport.write_line = AsyncMock(return_value=True)
-        transport.read_line = AsyncMock(return_value=None)
+        transport.read_raw_line = AsyncMock(return_value=None)
         return transport
 
     def test_full_trial_workflow_with_battery(self, mock_transport, tmp_path):
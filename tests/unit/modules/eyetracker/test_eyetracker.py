@@ -21,6 +21,7 @@ from __future__ import annotations
 import asyncio
 import csv
 import io
+import math
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -419,15 +420,20 @@ class TestStreamHandler:
 
         handler = StreamHandler()
 
+        def gaze_callback(data):
+            pass
+
         def imu_callback(data):
             pass
 
         def event_callback(data):
             pass
 
+        handler.set_gaze_listener(gaze_callback)
         handler.set_imu_listener(imu_callback)
         handler.set_event_listener(event_callback)
 
+        assert handler.gaze_listener is gaze_callback
         assert handler.imu_listener is imu_callback
         assert handler.event_listener is event_callback
 
@@ -728,11 +734,11 @@ class TestRecordingManager:
 
             # Test with dict
             result = manager._extract_xyz({'x': 1.0, 'y': 2.0, 'z': 3.0})
-            assert result == ['1', '2', '3']
+            assert result == [1.0, 2.0, 3.0]
 
-            # Test with None
+            # Test with None (missing values are NaN)
             result = manager._extract_xyz(None)
-            assert result == ['', '', '']
+            assert len(result) == 3 and all(math.isnan(v) for v in result)
 
     def test_extract_quat(self, tracker_config, temp_recording_dir):
         """Test _extract_quat helper."""
@@ -744,33 +750,47 @@ class TestRecordingManager:
 
             # Test with dict
             result = manager._extract_quat({'w': 1.0, 'x': 0.0, 'y': 0.0, 'z': 0.0})
-            assert result == ['1', '0', '0', '0']
+            assert result == [1.0, 0.0, 0.0, 0.0]
 
-            # Test with None
+            # Test with None (missing values are NaN)
             result = manager._extract_quat(None)
-            assert result == ['', '', '', '']
+            assert len(result) == 4 and all(math.isnan(v) for v in result)
 
 
 class TestRecordingManagerCSVOutput:
     """Tests for CSV output formatting."""
 
     def test_gaze_csv_line_composition(self, tracker_config, temp_recording_dir, mock_gaze_data):
-        """Test gaze CSV line composition."""
+        """Test gaze rows format to one CSV line per sample matching the header."""
         with patch('rpi_logger.modules.EyeTracker.tracker_core.recording.manager.VideoEncoder'):
-            from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import RecordingManager
+            from rpi_logger.modules.EyeTracker.tracker_core.recording.columnar_writer import ColumnarSampleWriter
+            from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import (
+                GAZE_COLUMNS,
+                GAZE_HEADER,
+                RecordingManager,
+            )
 
             tracker_config.output_dir = str(temp_recording_dir)
             manager = RecordingManager(tracker_config)
             manager._current_trial_number = 1
 
-            line = manager._compose_gaze_line(mock_gaze_data, time.time(), time.perf_counter())
-
-            # Should be comma-separated values
-            assert "," in line
-            fields = line.strip().split(",")
-
-            # Should have all expected fields
-            assert len(fields) > 10
+            writer = ColumnarSampleWriter(GAZE_COLUMNS, prefix_fields=("1", "EyeTracker", "eye_tracker", ""))
+            row = manager._gaze_row(mock_gaze_data, 1700000000.25, 12.5)
+            chunk = np.array([row], dtype=writer.dtype)
+            line = writer.format_chunk(chunk)
+
+            fields = next(csv.reader(io.StringIO(line)))
+            record = dict(zip(GAZE_HEADER.split(","), fields))
+            assert len(fields) == len(GAZE_HEADER.split(","))
+            assert record["trial"] == "1"
+            assert record["record_time_unix"] == "1700000000.250000"
+            assert record["device_time_ns"] == str(mock_gaze_data.timestamp_unix_ns)
+            assert record["stream_type"] == "MockGazeData"
+            assert record["worn"] == "1"
+            assert record["x"] == "0.5"
+            assert record["left_x"] == "0.45"
+            assert record["pupil_diameter_right"] == "4.2"
+            assert record["eyeball_center_left_x"] == ""
 
     def test_csv_line_helper(self, tracker_config, temp_recording_dir):
         """Test _csv_line helper."""
@@ -788,6 +808,249 @@ class TestRecordingManagerCSVOutput:
             assert line.endswith("\n")
 
 
+# =============================================================================
+# ColumnarSampleWriter Tests
+# =============================================================================
+
+class TestColumnarSampleWriter:
+    """Tests for the chunked gaze writer."""
+
+    def _writer(self, **kwargs):
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.columnar_writer import (
+            Column,
+            ColumnarSampleWriter,
+        )
+        columns = (Column("t", "f8", "%.6f"), Column("ns", "i8"), Column("kind", "U16"), Column("v", "f8"))
+        return ColumnarSampleWriter(columns, header="trial,t,ns,kind,v", prefix_fields=("3",), **kwargs)
+
+    def test_writes_every_row_in_chunks(self, tmp_path):
+        """Every appended row is written, including the final partial chunk."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.columnar_writer import MISSING_INT
+
+        async def _test():
+            path = tmp_path / "gaze.csv"
+            writer = self._writer(chunk_rows=4)
+            await writer.start(path)
+            for i in range(10):
+                writer.append((1.5 + i, i * 1000 if i else MISSING_INT, "Gaze", 0.25 if i % 2 else float("nan")))
+            assert writer.buffered_rows == 2
+            await writer.stop()
+            return path, writer
+
+        path, writer = run_async(_test())
+        rows = list(csv.reader(path.read_text().splitlines()))
+        assert rows[0] == ["trial", "t", "ns", "kind", "v"]
+        assert rows[1] == ["3", "1.500000", "", "Gaze", ""]
+        assert rows[2] == ["3", "2.500000", "1000", "Gaze", "0.25"]
+        assert len(rows) == 11
+        assert writer.rows_appended == writer.rows_written == 10
+        assert writer.rows_dropped == 0
+
+    def test_npy_restart_keeps_earlier_rows(self, tmp_path):
+        """A restarted npy recording extends the file, as CSV mode appends."""
+        from rpi_logger.modules.base.columnar import load_columnar
+
+        async def _record(values):
+            writer = self._writer(data_format="npy")
+            await writer.start(tmp_path / "gaze.csv")
+            for value in values:
+                writer.append((value, 1, "Gaze", 0.0))
+            await writer.stop()
+            return writer.path
+
+        run_async(_record([1.0, 2.0]))
+        path = run_async(_record([3.0]))
+        rows, _schema = load_columnar(path)
+        assert rows["t"].tolist() == [1.0, 2.0, 3.0]
+
+    def test_text_fields_are_quoted(self):
+        """Text values with separators are CSV-quoted."""
+        writer = self._writer()
+        chunk = np.array([(0.0, 1, 'a,"b"', -2.0)], dtype=writer.dtype)
+        assert writer.format_chunk(chunk) == '3,0.000000,1,"a,""b""",-2\n'
+
+    def test_append_without_start_raises(self):
+        """Appending before start raises."""
+        writer = self._writer()
+        with pytest.raises(RuntimeError, match="not started"):
+            writer.append((0.0, 0, "", 0.0))
+
+    def test_npy_mode_converts_to_same_csv(self, tmp_path):
+        """npy mode writes a columnar sidecar that converts to the CSV output."""
+        from rpi_logger.modules.base.columnar import columnar_to_csv
+
+        rows = [(1.5, 7, "Gaze", 0.25), (2.5, 8, "a,b", float("nan"))]
+
+        async def _test(data_format):
+            writer = self._writer(chunk_rows=1, data_format=data_format)
+            await writer.start(tmp_path / f"{data_format}.csv")
+            for row in rows:
+                writer.append(row)
+            await writer.stop()
+            return writer.path
+
+        csv_path = run_async(_test("csv"))
+        npy_path = run_async(_test("npy"))
+        assert npy_path.suffix == ".npy"
+        converted = columnar_to_csv(npy_path, tmp_path / "converted.csv")
+        assert converted.read_text() == csv_path.read_text()
+
+
+# =============================================================================
+# VideoEncoder Tests
+# =============================================================================
+
+class TestPtsClock:
+    """Tests for device-timestamp PTS assignment."""
+
+    def test_pts_follow_device_timestamps(self):
+        """Skipped frames leave a gap instead of shifting later frames."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import PtsClock
+
+        clock = PtsClock(fps=30.0)
+        assert clock.next(1000.0) == 0
+        assert clock.next(1000.1) == 9000
+        assert clock.next(1000.3) == 27000  # Two frames skipped
+
+    def test_pts_strictly_increase(self):
+        """Repeated/backwards timestamps and missing ones still advance."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import PtsClock
+
+        clock = PtsClock(fps=30.0)
+        assert clock.next(5.0) == 0
+        assert clock.next(5.0) == 1
+        assert clock.next(None) == 1 + 3000
+        assert clock.next(4.0) == 3002
+
+
+class TestVideoEncoder:
+    """Tests for the in-process PyAV encoder."""
+
+    av = pytest.importorskip("av")
+
+    def _frames(self, count, shape=(48, 64, 3)):
+        return [np.full(shape, i * 10 % 255, dtype=np.uint8) for i in range(count)]
+
+    def test_pts_written_from_timestamps(self, tmp_path):
+        """Encoded packets carry the device-timestamp PTS."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import VideoEncoder
+
+        path = tmp_path / "world.mp4"
+        timestamps = [100.0, 100.1, 100.2, 100.5, 100.6]  # 100.3/100.4 skipped
+
+        async def _test():
+            encoder = VideoEncoder((64, 48), 10.0, backend="pyav")
+            await encoder.start(path)
+            assert encoder.is_running()
+            for frame, ts in zip(self._frames(len(timestamps)), timestamps):
+                await encoder.write_frame(frame, ts)
+            await encoder.stop()
+            assert not encoder.is_running()
+
+        run_async(_test())
+        with self.av.open(str(path)) as container:
+            stream = container.streams.video[0]
+            pts = sorted(
+                round(float(packet.pts * stream.time_base), 3)
+                for packet in container.demux(stream) if packet.pts is not None
+            )
+        assert pts == [0.0, 0.1, 0.2, 0.5, 0.6]
+
+    def test_resizes_frames(self, tmp_path):
+        """Frames of another size are resized to the encoder resolution."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import VideoEncoder
+
+        path = tmp_path / "eyes.mp4"
+
+        async def _test():
+            encoder = VideoEncoder((32, 16), 200.0, backend="pyav")
+            await encoder.start(path)
+            for i, frame in enumerate(self._frames(3, shape=(40, 80, 3))):
+                await encoder.write_frame(frame, 1.0 + i / 200)
+            await encoder.stop()
+
+        run_async(_test())
+        with self.av.open(str(path)) as container:
+            stream = container.streams.video[0]
+            assert (stream.width, stream.height) == (32, 16)
+            assert stream.frames == 3
+
+    def test_shared_container(self, tmp_path):
+        """Two encoders write two streams on one timeline into one file."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import (
+            SharedVideoContainer,
+            VideoEncoder,
+        )
+
+        path = tmp_path / "combined.mp4"
+
+        async def _test():
+            container = SharedVideoContainer(path)
+            world = VideoEncoder((64, 48), 30.0)
+            eyes = VideoEncoder((32, 16), 200.0)
+            await world.start(path, container=container)
+            await eyes.start(path, container=container)
+            for i, frame in enumerate(self._frames(4)):
+                await world.write_frame(frame, 50.0 + i / 30)
+            for i, frame in enumerate(self._frames(6, shape=(16, 32, 3))):
+                await eyes.write_frame(frame, 50.1 + i / 200)
+            assert eyes.last_pts == round((0.1 + 5 / 200) * 90000)
+            await world.stop()
+            await eyes.stop()
+
+        run_async(_test())
+        with self.av.open(str(path)) as container:
+            assert [s.frames for s in container.streams.video] == [4, 6]
+
+    def test_unused_container_is_discarded(self, tmp_path):
+        """discard() closes a file no stream was added to, and nothing else."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import SharedVideoContainer
+
+        unused = SharedVideoContainer(tmp_path / "unused.mp4")
+        unused.discard()
+        assert unused._container is None
+
+        used = SharedVideoContainer(tmp_path / "used.mp4")
+        used.add_stream((64, 48), 30.0)
+        used.discard()
+        assert used._container is not None
+        used.release()
+        assert used._container is None
+
+    def test_combined_streams_added_before_writers_run(self, tracker_config, tmp_path, monkeypatch):
+        """Frames only reach the shared file once it has both streams."""
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.manager import RecordingManager
+        from rpi_logger.modules.EyeTracker.tracker_core.recording.video_encoder import VideoEncoder
+
+        start = VideoEncoder.start
+
+        async def _yielding_start(self, *args, **kwargs):
+            await asyncio.sleep(0.01)  # Let any writer task that already exists run
+            return await start(self, *args, **kwargs)
+
+        monkeypatch.setattr(VideoEncoder, "start", _yielding_start)
+
+        tracker_config.output_dir = str(tmp_path)
+        tracker_config.combine_video_streams = True
+        tracker_config.video_backend = "pyav"
+        manager = RecordingManager(tracker_config)
+        streams_seen = []
+
+        async def _writer_loop():
+            streams_seen.append(manager._video_container._open_streams)
+
+        manager._world_writer_loop = _writer_loop
+        manager._eyes_writer_loop = _writer_loop
+
+        async def _test():
+            await manager.start_recording(tmp_path, trial_number=1)
+            await asyncio.sleep(0)
+            await manager.stop_recording()
+
+        run_async(_test())
+        assert streams_seen == [2, 2]
+
+
 # =============================================================================
 # AsyncCSVWriter Tests
 # =============================================================================
@@ -992,6 +1255,130 @@ class TestGazeTracker:
             assert fps >= 0
 
 
+class TestLoadController:
+    """Tests for adaptive load shedding."""
+
+    def _controller(self, tracker_config, **kwargs):
+        from rpi_logger.modules.EyeTracker.tracker_core.load_controller import LoadController
+        return LoadController(tracker_config, window_frames=5, **kwargs)
+
+    def _run_window(self, controller, latency_ms, *, start_index=0, step=1):
+        now = 100.0
+        for i in range(controller.window_frames):
+            controller.end_frame(now - latency_ms / 1000.0, start_index + i * step, now)
+        return start_index + controller.window_frames * step
+
+    def test_starts_at_configured_factors(self, tracker_config):
+        controller = self._controller(tracker_config)
+        assert controller.preview_skip_factor == tracker_config.preview_skip_factor()
+        assert controller.eyes_skip_factor == tracker_config.eyes_recording_skip_factor()
+
+    def test_sheds_preview_before_eyes(self, tracker_config):
+        controller = self._controller(tracker_config)
+        index = 0
+        while controller.preview_skip_factor < controller.max_preview_skip:
+            assert controller.eyes_skip_factor == controller.base_eyes_skip
+            index = self._run_window(controller, 500.0, start_index=index)
+        for _ in range(2):  # Shedding needs two overloaded windows in a row
+            index = self._run_window(controller, 500.0, start_index=index)
+        assert controller.eyes_skip_factor > controller.base_eyes_skip
+
+        # Saturated: further overload changes nothing
+        for _ in range(5):
+            index = self._run_window(controller, 500.0, start_index=index)
+        assert controller.preview_skip_factor == controller.max_preview_skip
+        assert controller.eyes_skip_factor == controller.max_eyes_skip
+
+    def test_missed_frames_trigger_shedding(self, tracker_config):
+        controller = self._controller(tracker_config)
+        index = self._run_window(controller, 1.0, step=2)
+        # One overloaded window is not enough
+        assert controller.preview_skip_factor == controller.base_preview_skip
+        self._run_window(controller, 1.0, start_index=index, step=2)
+        assert controller.preview_skip_factor > controller.base_preview_skip
+        assert controller.get_stats()["frames_missed"] == 9
+
+    def test_occasional_missed_frame_is_tolerated(self, tracker_config):
+        from rpi_logger.modules.EyeTracker.tracker_core.load_controller import LoadController
+
+        controller = LoadController(tracker_config, window_frames=40)
+        index = 0
+        for _ in range(4):
+            # One frame in 41 missed per window (under 5%)
+            index = self._run_window(controller, 1.0, start_index=index + 1)
+        assert controller.get_stats()["frames_missed"] == 3
+        assert controller.preview_skip_factor == controller.base_preview_skip
+
+    def test_queue_backpressure_triggers_shedding(self, tracker_config):
+        controller = self._controller(tracker_config)
+        controller.observe_queue_fill(0.9)
+        self._run_window(controller, 1.0)
+        self._run_window(controller, 1.0)
+        assert controller.preview_skip_factor > controller.base_preview_skip
+
+    def test_recovers_eyes_first_with_hysteresis(self, tracker_config):
+        controller = self._controller(tracker_config)
+        index = 0
+        while controller.eyes_skip_factor == controller.base_eyes_skip:
+            index = self._run_window(controller, 500.0, start_index=index)
+        shed_preview = controller.preview_skip_factor
+        shed_eyes = controller.eyes_skip_factor
+        assert shed_eyes > controller.base_eyes_skip
+
+        # One calm window is not enough
+        index = self._run_window(controller, 1.0, start_index=index)
+        assert controller.eyes_skip_factor == shed_eyes
+
+        while controller.eyes_skip_factor > controller.base_eyes_skip:
+            assert controller.preview_skip_factor == shed_preview
+            index = self._run_window(controller, 1.0, start_index=index)
+        while controller.preview_skip_factor > controller.base_preview_skip:
+            index = self._run_window(controller, 1.0, start_index=index)
+        assert controller.eyes_skip_factor == controller.base_eyes_skip
+
+    def test_disabled_keeps_factors(self, tracker_config):
+        tracker_config.adaptive_load = False
+        controller = self._controller(tracker_config)
+        self._run_window(controller, 500.0, step=3)
+        assert controller.preview_skip_factor == controller.base_preview_skip
+        assert controller.eyes_skip_factor == controller.base_eyes_skip
+        assert controller.get_stats()["latency_ms"] > 0
+
+    def test_reduced_mode_uses_preview_floor(self, tracker_config):
+        controller = self._controller(tracker_config)
+        controller.set_reduced(True)
+        assert controller.preview_skip_factor == controller.max_preview_skip
+        controller.set_reduced(False)
+        assert controller.preview_skip_factor == controller.base_preview_skip
+
+    def test_stats_report_stage_timings(self, tracker_config):
+        controller = self._controller(tracker_config)
+        controller.record_stage("overlay", 0.004)
+        stats = controller.get_stats()
+        assert set(stats["stage_ms"]) == {"drain", "process", "overlay", "encode", "preview"}
+        assert stats["stage_ms"]["overlay"] > 0
+        assert stats["preview_skip_factor"] == controller.base_preview_skip
+
+    def test_gaze_tracker_exposes_load_stats(self, tracker_config):
+        from rpi_logger.modules.EyeTracker.tracker_core.gaze_tracker import GazeTracker
+
+        stream_handler = MagicMock()
+        stream_handler.dropped_frames = 3
+        stream_handler.avg_wait_ms = 12.5
+        tracker = GazeTracker(
+            tracker_config,
+            device_manager=MagicMock(),
+            stream_handler=stream_handler,
+            frame_processor=MagicMock(),
+            recording_manager=MagicMock(),
+        )
+        tracker.set_reduced_processing(True)
+        stats = tracker.get_load_stats()
+        assert stats["preview_skip_factor"] == tracker.load_controller.max_preview_skip
+        assert stats["stream_dropped_frames"] == 3
+        assert stats["stream_avg_wait_ms"] == 12.5
+
+
 # =============================================================================
 # TrackerHandler Tests
 # =============================================================================
@@ -1299,9 +1686,10 @@ class TestDataFlowIntegration:
             manager._current_trial_number = 1
 
             manager.write_gaze_sample(mock_gaze_data)
+            manager.write_gaze_sample(mock_gaze_data)  # Duplicate timestamp
 
-            manager._gaze_writer.enqueue.assert_called_once()
-            assert manager._gaze_samples_written == 1
+            manager._gaze_writer.append.assert_called_once()
+            assert manager._gaze_samples_received == 2
 
     def test_imu_data_to_recording_manager(self, tracker_config, temp_recording_dir, mock_imu_data):
         """Test IMU data flows to recording manager."""
@@ -1318,7 +1706,7 @@ class TestDataFlowIntegration:
 
             manager.write_imu_sample(mock_imu_data)
 
-            manager._imu_writer.enqueue.assert_called_once()
+            manager._imu_writer.append.assert_called_once()
             assert manager._imu_samples_written == 1
 
     def test_event_data_to_recording_manager(self, tracker_config, temp_recording_dir, mock_eye_event):
@@ -1336,7 +1724,7 @@ class TestDataFlowIntegration:
 
             manager.write_event_sample(mock_eye_event)
 
-            manager._event_writer.enqueue.assert_called_once()
+            manager._event_writer.append.assert_called_once()
             assert manager._event_samples_written == 1
 
     def test_write_methods_no_op_when_not_recording(self, tracker_config, temp_recording_dir, mock_gaze_data):
@@ -1355,6 +1743,7 @@ class TestDataFlowIntegration:
             manager.write_event_sample(MagicMock())
 
             # Should not have written anything
+            assert manager._gaze_samples_received == 0
             assert manager._gaze_samples_written == 0
             assert manager._imu_samples_written == 0
             assert manager._event_samples_written == 0
@@ -7,7 +7,8 @@ import pytest
 
 from rpi_logger.modules.GPS.gps_core.data_logger import GPSDataLogger
 from rpi_logger.modules.GPS.gps_core.parsers.nmea_types import GPSFixSnapshot
-from rpi_logger.modules.GPS.gps_core.constants import GPS_CSV_HEADER
+from rpi_logger.modules.GPS.gps_core.constants import GPS_CSV_HEADER, HOST_LATENCY_COLUMN
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
 
 
 class TestGPSDataLogger:
@@ -258,6 +259,34 @@ class TestGPSDataLogger:
         logger = GPSDataLogger(tmp_path, "GPS:serial0", flush_threshold=10)
         assert logger._flush_threshold == 10
 
+    def test_record_time_is_serial_arrival(self, tmp_path):
+        """Test record times come from the sentence's arrival."""
+        logger = GPSDataLogger(tmp_path, "GPS:serial0")
+        path = logger.start_recording()
+        arrival = RawLine(b"$GPRMC,...\r\n", 7_500_000_000, 1_733_665_822_500_000_000)
+        logger.log_fix(GPSFixSnapshot(), "RMC", "$GPRMC,...", arrival=arrival)
+        logger.stop_recording()
+
+        with open(path, "r") as f:
+            row = next(csv.DictReader(f))
+        assert row["record_time_unix"] == "1733665822.500000"
+        assert row["record_time_mono"] == "7.500000000"
+
+    def test_host_latency_column(self, tmp_path):
+        """Test the optional host_latency_us column."""
+        logger = GPSDataLogger(tmp_path, "GPS:serial0", host_latency=True)
+        path = logger.start_recording()
+        logger.log_fix(GPSFixSnapshot(), "GGA", "$GPGGA,...", arrival=RawLine.now(b"$GPGGA,...\r\n"))
+        logger.stop_recording()
+
+        with open(path, "r") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            row = next(reader)
+        assert header == GPS_CSV_HEADER + [HOST_LATENCY_COLUMN]
+        assert len(row) == len(header)
+        assert float(row[-1]) >= 0
+
 
 class TestGPSDataLoggerEdgeCases:
     """Test edge cases and error handling."""
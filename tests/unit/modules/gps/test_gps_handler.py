@@ -8,6 +8,7 @@ import pytest
 from rpi_logger.modules.GPS.gps_core.handlers.gps_handler import GPSHandler
 from rpi_logger.modules.GPS.gps_core.handlers.base_handler import BaseGPSHandler
 from rpi_logger.modules.GPS.gps_core.transports import BaseGPSTransport
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
 from rpi_logger.modules.GPS.gps_core.parsers.nmea_types import GPSFixSnapshot
 
 
@@ -45,6 +46,20 @@ class MockTransport(BaseGPSTransport):
         return None
 
 
+class BatchTransport(MockTransport):
+    """Mock transport that delivers all sentences in one read_raw_lines batch."""
+
+    def __init__(self, batch: list[RawLine]):
+        super().__init__([])
+        self._batch = batch
+
+    async def read_raw_lines(self, timeout: float = 1.0) -> list[RawLine]:
+        batch, self._batch = self._batch, []
+        if not batch:
+            await asyncio.sleep(0.01)
+        return batch
+
+
 class TestBaseGPSHandler:
     """Test the base handler interface."""
 
@@ -152,6 +167,32 @@ class TestGPSHandler:
             assert update["sentence_type"] == "GGA"
         run_async(_test())
 
+    def test_batched_sentences_keep_their_arrival(self, tmp_path):
+        """Test a burst read in one batch is parsed with each line's arrival time."""
+        async def _test():
+            sentences = [
+                "$GNGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*51",
+                "$GPGSV,1,1,04,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*72",
+                "$GLGSV,1,1,02,65,60,245,45,66,67,282,48*65",
+            ]
+            batch = [RawLine(s.encode() + b"\r\n", i, i) for i, s in enumerate(sentences)]
+            transport = BatchTransport(batch)
+            await transport.connect()
+
+            handler = GPSHandler("GPS:test", tmp_path, transport)
+            seen = []
+            handler._on_parser_update = lambda fix, update: seen.append(
+                (update.sentence_type, handler._current_line.arrival_mono_ns)
+            )
+            handler._parser._on_fix_update = handler._on_parser_update
+            await handler.start()
+            await asyncio.sleep(0.1)
+            await handler.stop()
+
+            assert seen == [("GGA", 0), ("GSV", 1), ("GSV", 2)]
+            assert handler.fix.satellites_in_view == 6
+        run_async(_test())
+
     def test_recording(self, tmp_path):
         """Test recording functionality."""
         async def _test():
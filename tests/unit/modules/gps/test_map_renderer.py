@@ -0,0 +1,258 @@
+"""Unit tests for GPS map tile service and renderer."""
+
+import io
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from rpi_logger.modules.GPS.gps_core.constants import GRID_SIZE, TILE_SIZE
+from rpi_logger.modules.GPS.gps_core.interfaces.gui import GPSMapRenderer, TileService
+from rpi_logger.modules.GPS.gps_core.interfaces.gui.trajectory import (
+    Trajectory,
+    douglas_peucker,
+    project_mercator,
+)
+
+ZOOM = 13
+
+
+def _tile_png(x: int, y: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (TILE_SIZE, TILE_SIZE), (x % 256, y % 256, 7)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def make_tile_db(path: Path, xs: range, ys: range, zoom: int = ZOOM) -> Path:
+    """Create a tkintermapview-style tile database."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE tiles (zoom int, x int, y int, server text, tile_image blob, "
+        "PRIMARY KEY (zoom, x, y, server))"
+    )
+    conn.executemany(
+        "INSERT INTO tiles VALUES (?, ?, ?, ?, ?)",
+        [(zoom, x, y, "osm", _tile_png(x, y)) for x in xs for y in ys],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def tile_db(tmp_path):
+    # Salt Lake City at zoom 13 is around tile (1549, 3078)
+    return make_tile_db(tmp_path / "tiles.db", range(1540, 1560), range(3070, 3090))
+
+
+class TestTileService:
+    """Test batched lookups and the decoded-tile LRU."""
+
+    def test_get_tiles_decodes_and_caches(self, tile_db):
+        service = TileService(tile_db)
+        tiles = service.get_tiles(ZOOM, [(1550, 3080), (1551, 3080), (9999, 9999)])
+
+        assert tiles[(1550, 3080)].getpixel((0, 0)) == (1550 % 256, 3080 % 256, 7)
+        assert tiles[(9999, 9999)] is None
+        assert service.stats() == {"hits": 0, "misses": 3, "cached": 3}
+
+        again = service.get_tiles(ZOOM, [(1550, 3080), (9999, 9999)])
+        assert again[(1550, 3080)] is tiles[(1550, 3080)]
+        assert service.stats()["hits"] == 2
+        service.close()
+
+    def test_lru_eviction(self, tile_db):
+        service = TileService(tile_db, cache_tiles=2)
+        service.get_tile(ZOOM, 1550, 3080)
+        service.get_tile(ZOOM, 1551, 3080)
+        service.get_tile(ZOOM, 1550, 3080)  # Most recently used
+        service.get_tile(ZOOM, 1552, 3080)  # Evicts 1551
+
+        service.get_tile(ZOOM, 1550, 3080)
+        assert service.stats()["hits"] == 2
+        service.get_tile(ZOOM, 1551, 3080)
+        assert service.stats()["misses"] == 4
+        service.close()
+
+    def test_read_only_connection(self, tile_db):
+        service = TileService(tile_db, immutable=False)
+        service.get_tile(ZOOM, 1550, 3080)
+        with pytest.raises(sqlite3.OperationalError):
+            service._connection().execute("DELETE FROM tiles")
+        service.close()
+
+    def test_failed_query_is_not_cached(self, tmp_path):
+        path = tmp_path / "tiles.db"
+        service = TileService(path)
+        assert service.get_tile(ZOOM, 1550, 3080) is None  # Database not there yet
+        assert service.stats()["cached"] == 0
+
+        make_tile_db(path, range(1550, 1551), range(3080, 3081))
+        assert service.get_tile(ZOOM, 1550, 3080) is not None
+        service.close()
+
+
+class TestGPSMapRenderer:
+    """Test mosaic rendering through the tile service."""
+
+    def test_render_size_and_info(self, tile_db):
+        renderer = GPSMapRenderer(tile_db)
+        renderer.set_center(40.7608, -111.8910)
+        renderer.set_zoom(ZOOM)
+
+        image, info = renderer.render()
+        assert image.size == (GRID_SIZE * TILE_SIZE, GRID_SIZE * TILE_SIZE)
+        load_grid = GRID_SIZE + 2
+        assert info == f"{load_grid * load_grid}/{load_grid * load_grid} tiles (zoom={ZOOM})"
+        renderer.close()
+
+    def test_small_move_reuses_mosaic(self, tile_db):
+        service = TileService(tile_db)
+        renderer = GPSMapRenderer(tile_db, tile_service=service)
+        renderer.set_zoom(ZOOM)
+        renderer.set_center(40.7608, -111.8910)
+        renderer.render()
+        mosaic = renderer._mosaic
+        misses = service.stats()["misses"]
+
+        renderer.set_center(40.76081, -111.89101)  # A few pixels
+        renderer.render()
+        assert renderer._mosaic is mosaic
+        assert service.stats()["misses"] == misses
+        service.close()
+
+    def test_shift_loads_only_exposed_tiles(self, tile_db):
+        service = TileService(tile_db)
+        renderer = GPSMapRenderer(tile_db, tile_service=service)
+        renderer.set_zoom(ZOOM)
+        renderer.set_center(40.7608, -111.8910)
+        renderer.render()
+        zoom, base_x, base_y = renderer._mosaic_origin
+
+        # Move one tile east
+        renderer.set_center(40.7608, -111.8910 + 360.0 / 2 ** ZOOM)
+        service.clear()
+        renderer.render()
+        load_grid = GRID_SIZE + 2
+        assert renderer._mosaic_origin == (zoom, base_x + 1, base_y)
+        assert service.stats()["cached"] == load_grid  # One new column
+
+        # Shifted mosaic matches a from-scratch render
+        fresh = GPSMapRenderer(tile_db)
+        fresh.set_zoom(ZOOM)
+        fresh.set_center(*renderer.center)
+        fresh.render()
+        assert renderer._mosaic.tobytes() == fresh._mosaic.tobytes()
+        fresh.close()
+        service.close()
+
+    def test_missing_tiles_counted(self, tmp_path):
+        db = make_tile_db(tmp_path / "sparse.db", range(1549, 1550), range(3078, 3079))
+        renderer = GPSMapRenderer(db)
+        renderer.set_zoom(ZOOM)
+        renderer.set_center(40.7608, -111.8910)
+        _image, info = renderer.render()
+        assert info.startswith("1/")
+        renderer.close()
+
+    def test_shift_retries_missing_tiles(self, tmp_path):
+        db = make_tile_db(tmp_path / "sparse.db", range(1549, 1550), range(3078, 3079))
+        service = TileService(db, immutable=False)
+        renderer = GPSMapRenderer(db, tile_service=service)
+        renderer.set_zoom(ZOOM)
+        renderer.set_center(40.7608, -111.8910)
+        renderer.render()
+        _zoom, base_x, base_y = renderer._mosaic_origin
+        assert renderer._mosaic_loaded[(base_x + 2, base_y)] is False
+
+        # The tile arrives (e.g. downloaded) and stays in view after a shift
+        conn = sqlite3.connect(db)
+        conn.execute("INSERT INTO tiles VALUES (?, ?, ?, ?, ?)",
+                     (ZOOM, base_x + 2, base_y, "osm", _tile_png(base_x + 2, base_y)))
+        conn.commit()
+        conn.close()
+        service.clear()
+
+        renderer.set_center(40.7608, -111.8910 + 360.0 / 2 ** ZOOM)
+        renderer.render()
+        assert renderer._mosaic_loaded[(base_x + 2, base_y)] is True
+        renderer.close()
+
+
+class TestTrajectory:
+    """Test the session trajectory store and its simplification."""
+
+    def test_unbounded_growth(self):
+        trajectory = Trajectory()
+        for i in range(10_000):
+            trajectory.append(40.0 + i * 1e-5, -111.0)
+        assert len(trajectory) == 10_000
+        assert trajectory.latitudes[-1] == pytest.approx(40.0 + 9_999 * 1e-5)
+
+    def test_projection_matches_tile_math(self, tile_db):
+        renderer = GPSMapRenderer(tile_db)
+        x, y = project_mercator(np.array([40.7608]), np.array([-111.8910]))
+        xtile, ytile = renderer._latlon_to_tile(40.7608, -111.8910, ZOOM)
+        assert x[0] * 2 ** ZOOM == pytest.approx(xtile)
+        assert y[0] * 2 ** ZOOM == pytest.approx(ytile)
+        renderer.close()
+
+    def test_douglas_peucker_bounds_error(self):
+        t = np.linspace(0, 4 * np.pi, 2_000)
+        x, y = t, np.sin(t)
+        kept = douglas_peucker(x, y, 0.01)
+        assert kept[0] == 0 and kept[-1] == len(t) - 1
+        assert len(kept) < 200
+        # Every dropped point lies within tolerance of the simplified line
+        # (vertical error <= perpendicular * sqrt(2) for slopes up to 1)
+        approx = np.interp(x, x[kept], y[kept])
+        assert np.max(np.abs(approx - y)) < 0.01 * np.sqrt(2)
+
+    def test_straight_line_collapses(self):
+        trajectory = Trajectory()
+        for i in range(5_000):
+            trajectory.append(40.0, -111.0 + i * 1e-5)
+            if i % 500 == 0:
+                trajectory.simplified(ZOOM)  # Incremental updates
+        assert trajectory.simplified_count(ZOOM) <= 3
+
+    def test_incremental_matches_bounds(self):
+        rng = np.random.default_rng(1)
+        lat = 40.0 + np.cumsum(rng.normal(0, 1e-4, 3_000))
+        lon = -111.0 + np.cumsum(rng.normal(0, 1e-4, 3_000))
+        trajectory = Trajectory()
+        for i in range(len(lat)):
+            trajectory.append(lat[i], lon[i])
+            if i % 37 == 0:
+                trajectory.simplified(ZOOM)
+        x, _y = trajectory.simplified(ZOOM)
+        full_x, _ = project_mercator(lat, lon)
+        assert x[0] == full_x[0] and x[-1] == full_x[-1]
+        assert 2 < len(x) < len(lat)
+        # Coarser zoom keeps fewer points
+        assert trajectory.simplified_count(ZOOM - 3) < len(x)
+
+    def test_clear(self):
+        trajectory = Trajectory()
+        trajectory.append(40.0, -111.0)
+        trajectory.simplified(ZOOM)
+        trajectory.clear()
+        assert len(trajectory) == 0
+        assert trajectory.simplified_count(ZOOM) == 0
+
+    def test_render_draws_visible_trajectory_only(self, tile_db):
+        renderer = GPSMapRenderer(tile_db)
+        renderer.set_zoom(ZOOM)
+        # A long drive far away, then a short one through the map center
+        for i in range(2_000):
+            renderer.add_position_to_trajectory(10.0 + i * 1e-3, 10.0)
+        for i in range(50):
+            renderer.add_position_to_trajectory(40.7608, -111.8950 + i * 1e-4)
+        renderer.set_center(40.7608, -111.8910)
+        image, _info = renderer.render()
+        pixels = np.asarray(image)
+        line_color = (0x34, 0x98, 0xDB)
+        assert np.any(np.all(pixels == line_color, axis=-1))
+        renderer.close()
@@ -0,0 +1,197 @@
+"""Unit tests for the raw NMEA archive and offline re-parsing."""
+
+import asyncio
+import csv
+import gzip
+
+import pytest
+
+from rpi_logger.core.devices.transports.serial_reactor import RawLine
+from rpi_logger.modules.GPS.gps_core.constants import GPS_CSV_HEADER
+from rpi_logger.modules.GPS.gps_core.handlers.gps_handler import GPSHandler
+from rpi_logger.modules.GPS.gps_core.nmea_archive import (
+    NMEAArchiveWriter,
+    archive_codec,
+    find_archives,
+    read_archive,
+    reparse_archive,
+    resolve_codec,
+)
+from rpi_logger.modules.GPS.gps_core.transports import BaseGPSTransport
+from rpi_logger.tools.nmea_reparse import reparse
+
+
+def _raw_lines(sentences: list[str]) -> list[RawLine]:
+    return [
+        RawLine(s.encode() + b"\r\n", 1_000_000_000 + i * 100_000_000, 1_733_665_822_000_000_000 + i * 100_000_000)
+        for i, s in enumerate(sentences)
+    ]
+
+
+def _write_archive(path, lines, block_bytes=512, codec="gzip"):
+    writer = NMEAArchiveWriter(path, codec, block_bytes=block_bytes)
+    writer.open()
+    writer.write_meta({"device_id": "GPS:serial0", "trial": 2, "label": "drive"})
+    for i in range(0, len(lines), 17):
+        writer.write_lines(lines[i:i + 17])
+    writer.close()
+    return writer
+
+
+class TestArchiveFormat:
+    """Test writing and reading archives."""
+
+    def test_round_trip_keeps_every_byte(self, tmp_path):
+        lines = _raw_lines(["$GNRMC,1*00", "$GNGGA,2*00"])
+        lines.append(RawLine(b"\x00\xffgarbage", 5, 6))  # No terminator
+        path = tmp_path / "a_GPS_serial0.nmea.gz"
+        writer = _write_archive(path, lines)
+
+        records = list(read_archive(path))
+        assert [raw for _meta, raw in records] == [
+            RawLine(raw.data, raw.arrival_mono_ns, raw.arrival_unix_ns, "GPS:serial0") for raw in lines
+        ]
+        assert records[0][0] == {"device_id": "GPS:serial0", "trial": 2, "label": "drive"}
+        assert writer.lines_written == 3
+
+    def test_blocks_are_gzip_members(self, tmp_path, sample_nmea_gnss):
+        lines = _raw_lines(sample_nmea_gnss.read_text().splitlines())
+        path = tmp_path / "a_GPS_serial0.nmea.gz"
+        writer = _write_archive(path, lines, block_bytes=4096)
+
+        assert writer.compressed_bytes < writer.raw_bytes / 3
+        text = gzip.decompress(path.read_bytes())  # Plain multi-member gzip
+        assert text.count(b"$GPGSV") == sum(1 for raw in lines if raw.data.startswith(b"$GPGSV"))
+
+    def test_truncated_block_is_skipped(self, tmp_path, sample_nmea_gnss):
+        lines = _raw_lines(sample_nmea_gnss.read_text().splitlines())
+        path = tmp_path / "a_GPS_serial0.nmea.gz"
+        _write_archive(path, lines, block_bytes=4096)
+        complete = len(list(read_archive(path)))
+
+        data = path.read_bytes()
+        path.write_bytes(data[:-100])  # Crash mid-way through the last block
+        survived = len(list(read_archive(path)))
+        assert 0 < survived < complete
+
+    def test_zstd_frames(self, tmp_path, sample_nmea_gnss):
+        zstandard = pytest.importorskip("zstandard")
+        lines = _raw_lines(sample_nmea_gnss.read_text().splitlines())
+        path = tmp_path / "a_GPS_serial0.nmea.zst"
+        writer = _write_archive(path, lines, block_bytes=4096, codec="zstd")
+
+        assert writer.codec == "zstd"
+        assert archive_codec(path) == "zstd"
+        assert [raw.data for _meta, raw in read_archive(path)] == [raw.data for raw in lines]
+        # Plain multi-frame zstd, as zstdcat reads it
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb"), read_across_frames=True) as reader:
+            assert reader.read().count(b"$GPGSV") == sum(1 for raw in lines if raw.data.startswith(b"$GPGSV"))
+
+        complete = len(lines)
+        path.write_bytes(path.read_bytes()[:-100])  # Crash mid-way through the last frame
+        assert 0 < len(list(read_archive(path))) < complete
+
+    def test_codec_and_discovery(self, tmp_path):
+        assert resolve_codec("gzip") == "gzip"
+        assert resolve_codec("zstd") in ("zstd", "gzip")
+        (tmp_path / "s1").mkdir()
+        archive = tmp_path / "s1" / "x_GPS_serial0.nmea.gz"
+        archive.write_bytes(b"")
+        (tmp_path / "s1" / "x_GPS_serial0.csv").write_text("")
+        assert archive_codec(archive) == "gzip"
+        assert find_archives(tmp_path) == [archive]
+
+
+class TestReparse:
+    """Test regenerating the GPS CSV from an archive."""
+
+    def test_reparse_all_and_filtered(self, tmp_path, sample_nmea_gnss):
+        sentences = sample_nmea_gnss.read_text().splitlines()
+        path = tmp_path / "a_GPS_serial0.nmea.gz"
+        _write_archive(path, _raw_lines(sentences))
+
+        full = tmp_path / "full.csv"
+        assert reparse_archive(path, full) == len(sentences)
+        lean = tmp_path / "lean.csv"
+        assert reparse_archive(path, lean, {"RMC", "GGA"}) == 100
+
+        with lean.open(newline="") as handle:
+            rows = list(csv.reader(handle))
+        assert rows[0] == GPS_CSV_HEADER
+        first = dict(zip(GPS_CSV_HEADER, rows[1]))
+        assert first["trial"] == "2"
+        assert first["device_id"] == "GPS:serial0"
+        assert first["label"] == "drive"
+        assert first["sentence_type"] == "RMC"
+        assert first["record_time_mono"] == "1.000000000"
+        assert first["raw_sentence"] == sentences[0]
+
+
+    def test_tool_keeps_live_csv(self, tmp_path):
+        session = tmp_path / "GPS"
+        archive = session / "a_GPS_serial0.nmea.gz"
+        session.mkdir()
+        _write_archive(archive, _raw_lines(["$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A"]))
+        live = session / "a_GPS_serial0.csv"
+        live.write_text("live recording\n")
+
+        assert reparse([tmp_path]) == 0
+        assert live.read_text() == "live recording\n"
+        assert (session / "a_GPS_serial0_reparsed.csv").read_text().startswith(",".join(GPS_CSV_HEADER))
+
+
+class _BatchTransport(BaseGPSTransport):
+    def __init__(self, batch: list[RawLine]):
+        super().__init__()
+        self._batch = batch
+
+    async def connect(self) -> bool:
+        self._connected = True
+        return True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+
+    async def read_line(self, timeout: float = 1.0):
+        return None
+
+    async def read_raw_lines(self, timeout: float = 1.0) -> list[RawLine]:
+        batch, self._batch = self._batch, []
+        if not batch:
+            await asyncio.sleep(0.01)
+        return batch
+
+
+def test_handler_archives_lines_it_does_not_parse(tmp_path):
+    """Test the live path parses only RMC while the archive keeps everything."""
+    async def _test():
+        batch = _raw_lines([
+            "$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A",
+            "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*4F",
+        ])
+        batch.append(RawLine(b"\xb5b\x01\x07binary\r\n", 9, 9))  # UBX noise
+        transport = _BatchTransport(batch)
+        await transport.connect()
+        handler = GPSHandler(
+            "GPS:serial0", tmp_path, transport,
+            enabled_sentences={"RMC"}, raw_archive_codec="gzip",
+        )
+        assert handler.start_recording(trial_number=3)
+        csv_path = handler._data_logger.filepath
+        await handler.start()
+        await asyncio.sleep(0.1)
+        await handler.stop()
+        return csv_path
+
+    csv_path = asyncio.run(_test())
+    archive = csv_path.with_name(csv_path.stem + ".nmea.gz")
+    records = list(read_archive(archive))
+    assert len(records) == 3
+    assert records[0][0]["trial"] == 3
+    with csv_path.open(newline="") as handle:
+        live_rows = list(csv.reader(handle))[1:]
+    assert [row[GPS_CSV_HEADER.index("sentence_type")] for row in live_rows] == ["RMC"]
+
+    # The skipped GGA comes back from the archive
+    target = tmp_path / "regenerated.csv"
+    assert reparse_archive(archive, target) == 2
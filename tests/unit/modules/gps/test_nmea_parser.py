@@ -12,7 +12,7 @@ from rpi_logger.modules.GPS.gps_core.parsers.nmea_parser import (
     _parse_hms,
     _parse_date,
 )
-from rpi_logger.modules.GPS.gps_core.parsers.nmea_types import GPSFixSnapshot
+from rpi_logger.modules.GPS.gps_core.parsers.nmea_types import GPSFixSnapshot, NMEAUpdate
 
 
 class TestHelperFunctions:
@@ -310,6 +310,74 @@ class TestNMEAParser:
         assert parser.fix.timestamp.date() == parser.last_known_date
 
 
+class TestMultiConstellation:
+    """Test GN/GA/GB talkers, GSV bursts and batch parsing."""
+
+    def test_gn_talker_dispatch(self):
+        parser = NMEAParser(validate_checksums=False)
+        result = parser.parse_sentence("$GNGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*00")
+
+        assert result.sentence_type == "GGA"
+        assert result.talker == "GN"
+        assert parser.fix.satellites_in_use == 8
+        assert parser.parse_sentence("$PUBX,00,123519*00") is None  # Proprietary
+
+    def test_satellites_in_view_summed_over_talkers(self):
+        parser = NMEAParser(validate_checksums=False)
+        parser.parse_sentence("$GPGSV,3,1,11,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*00")
+        parser.parse_sentence("$GLGSV,2,1,07,65,60,245,45,66,67,282,48,67,74,319,31,68,81,356,34,1*00")
+        result = parser.parse_sentence("$GLGSV,2,2,07,69,08,033,37,70,15,070,40,71,22,107,43,1*00")
+
+        assert result["satellites_in_view"] == 18
+        assert parser.fix.satellites_in_view == 18
+
+        # A new GPS burst replaces only the GPS count
+        parser.parse_sentence("$GPGSV,3,1,09,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*00")
+        assert parser.fix.satellites_in_view == 16
+
+    def test_silent_talker_ages_out(self):
+        parser = NMEAParser(validate_checksums=False)
+        gps = "$GPGSV,3,1,11,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*00"
+        for second, bursts in ((19, (gps, "$GLGSV,2,1,07,65,60,245,45,1*00")), (25, (gps,)), (31, (gps,))):
+            parser.parse_sentence(f"$GPRMC,1235{second},A,4807.038,N,01131.000,E,022.4,084.4,230394,,*00")
+            for sentence in bursts:
+                parser.parse_sentence(sentence)
+            if second == 25:
+                assert parser.fix.satellites_in_view == 18  # GLONASS heard 6 s ago
+
+        # No GLONASS burst for 12 s of receiver time
+        assert parser.fix.satellites_in_view == 11
+
+    def test_parse_many_recorded_epochs(self, sample_nmea_gnss):
+        lines = sample_nmea_gnss.read_text().splitlines()
+        seen = []
+        parser = NMEAParser(on_fix_update=lambda fix, update: seen.append(update.raw_sentence))
+
+        updates = parser.parse_many(lines)
+
+        assert len(updates) == len(lines)
+        assert seen == lines
+        assert parser.fix.fix_valid is True
+        assert parser.fix.satellites_in_view == 28
+        assert parser.fix.timestamp == dt.datetime(2024, 10, 15, 16, 22, 9, 900000, tzinfo=dt.timezone.utc)
+
+    def test_set_enabled_sentences_resets_dispatch(self):
+        parser = NMEAParser(validate_checksums=False)
+        sentence = "$GPVTG,054.7,T,034.4,M,005.5,N,010.2,K*48"
+        assert parser.parse_sentence(sentence) is not None
+
+        parser.set_enabled_sentences({"GGA"})
+        assert parser.parse_sentence(sentence) is None
+
+    def test_update_mapping_access(self):
+        update = NMEAUpdate(sentence_type="GGA", latitude=48.1)
+        assert update["latitude"] == 48.1
+        assert update.get("hdop") is None
+        assert update.get("hdop", 0.0) == 0.0
+        with pytest.raises(KeyError):
+            update["not_a_field"]
+
+
 class TestGPSFixSnapshot:
     """Test GPSFixSnapshot dataclass."""
 
@@ -1,14 +1,17 @@
 """Unit tests for GPS serial transport."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import patch
 import pytest
 
+from rpi_logger.modules.GPS.gps_core.transports import serial_transport
 from rpi_logger.modules.GPS.gps_core.transports.serial_transport import (
     SerialGPSTransport,
     SERIAL_AVAILABLE,
 )
 from rpi_logger.modules.GPS.gps_core.transports import BaseGPSTransport
+from tests.infrastructure.mocks.serial_mocks import MockSerialConfig, MockSerialDevice
 
 
 def run_async(coro):
@@ -20,6 +23,13 @@ def run_async(coro):
         loop.close()
 
 
+def _mock_port() -> MockSerialDevice:
+    """Open mock port with a short read timeout so readers stop quickly."""
+    port = MockSerialDevice(MockSerialConfig(port="/dev/serial0", timeout=0.05))
+    port.open()
+    return port
+
+
 class TestBaseGPSTransport:
     """Test the abstract base transport interface."""
 
@@ -55,34 +65,32 @@ class TestSerialGPSTransport:
     def test_connect_success(self):
         """Test successful connection."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_reader = AsyncMock()
-                mock_writer = MagicMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
-
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port) as mock_serial:
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 result = await transport.connect()
 
                 assert result is True
                 assert transport.is_connected is True
-                mock_serial.open_serial_connection.assert_called_once_with(
-                    url="/dev/serial0",
+                mock_serial.assert_called_once_with(
+                    port="/dev/serial0",
                     baudrate=9600,
+                    timeout=serial_transport.READ_TIMEOUT,
                 )
+                await transport.disconnect()
         run_async(_test())
 
     def test_connect_failure(self):
         """Test connection failure handling."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_serial.open_serial_connection = AsyncMock(side_effect=OSError("Device not found"))
-
+            error = serial_transport.serial.SerialException("Device not found")
+            with patch.object(serial_transport.serial, "Serial", side_effect=error):
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 result = await transport.connect()
 
@@ -92,66 +100,121 @@ class TestSerialGPSTransport:
         run_async(_test())
 
     def test_disconnect(self):
-        """Test disconnection."""
+        """Test disconnection stops the reader and closes the port."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_reader = AsyncMock()
-                mock_writer = MagicMock()
-                mock_writer.close = MagicMock()
-                mock_writer.wait_closed = AsyncMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
-
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 await transport.connect()
                 assert transport.is_connected is True
+                reader = transport._reader
 
                 await transport.disconnect()
                 assert transport.is_connected is False
-                mock_writer.close.assert_called_once()
+                assert port.is_open is False
+                assert not reader.is_alive()
         run_async(_test())
 
     def test_read_line_success(self):
         """Test successful line reading."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_reader = AsyncMock()
-                mock_reader.readline = AsyncMock(return_value=b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47\r\n")
-                mock_writer = MagicMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
+                transport = SerialGPSTransport("/dev/serial0", 9600)
+                await transport.connect()
+                try:
+                    port._queue_response(b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47\r\n")
 
+                    line = await transport.read_line(timeout=2.0)
+                    assert line == "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47"
+                finally:
+                    await transport.disconnect()
+        run_async(_test())
+
+    def test_read_raw_line_has_arrival_time(self):
+        """Test sentences carry the time they arrived on the port."""
+        if not SERIAL_AVAILABLE:
+            pytest.skip("pyserial not available")
+
+        async def _test():
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 await transport.connect()
+                try:
+                    before = time.perf_counter_ns()
+                    port._queue_response(b"$GPRMC,123519,A*6A\r\n")
+
+                    raw = await transport.read_raw_line(timeout=2.0)
+                    assert raw.data == b"$GPRMC,123519,A*6A\r\n"
+                    assert before <= raw.arrival_mono_ns <= time.perf_counter_ns()
+                finally:
+                    await transport.disconnect()
+        run_async(_test())
+
+    def test_read_raw_lines_drains_burst(self):
+        """Test a burst of sentences is returned in one batch."""
+        if not SERIAL_AVAILABLE:
+            pytest.skip("pyserial not available")
 
-                line = await transport.read_line()
-                assert line == "$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47"
+        async def _test():
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
+                transport = SerialGPSTransport("/dev/serial0", 9600)
+                await transport.connect()
+                try:
+                    port._queue_response(b"$GNRMC,1*00\r\n$GPGSV,1*00\r\n$GLGSV,1*00\r\n")
+
+                    batch = await transport.read_raw_lines(timeout=2.0)
+                    while len(batch) < 3:  # Burst split across reads
+                        batch += await transport.read_raw_lines(timeout=2.0)
+                    assert [raw.text for raw in batch] == ["$GNRMC,1*00", "$GPGSV,1*00", "$GLGSV,1*00"]
+                    assert await transport.read_raw_lines(timeout=0.05) == []
+                finally:
+                    await transport.disconnect()
         run_async(_test())
 
     def test_read_line_timeout(self):
         """Test read timeout handling."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_reader = AsyncMock()
-                # Simulate timeout by raising asyncio.TimeoutError
-                mock_reader.readline = AsyncMock(side_effect=asyncio.TimeoutError())
-                mock_writer = MagicMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
+                transport = SerialGPSTransport("/dev/serial0", 9600)
+                await transport.connect()
+                try:
+                    line = await transport.read_line(timeout=0.05)
+                    assert line is None
+                    assert transport.is_connected is True
+                finally:
+                    await transport.disconnect()
+        run_async(_test())
+
+    def test_read_error_disconnects(self):
+        """Test that a failed read marks the transport disconnected."""
+        if not SERIAL_AVAILABLE:
+            pytest.skip("pyserial not available")
 
+        async def _test():
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 await transport.connect()
+                port._is_open = False  # read() now raises IOError
 
-                # Mock wait_for to immediately raise TimeoutError
-                with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError()):
-                    line = await transport.read_line()
-                    assert line is None
+                line = await transport.read_line(timeout=2.0)
+                assert line is None
+                assert transport.is_connected is False
+                assert "Port not open" in transport.last_error
+                await transport.disconnect()
         run_async(_test())
 
     def test_read_line_not_connected(self):
@@ -165,38 +228,27 @@ class TestSerialGPSTransport:
     def test_read_sentences_generator(self):
         """Test the read_sentences async generator."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                sentences = [
-                    b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47\r\n",
-                    b"$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A\r\n",
-                    b"",  # Empty line - will cause EOF detection
-                ]
-                call_count = 0
-
-                async def mock_readline():
-                    nonlocal call_count
-                    if call_count < len(sentences):
-                        result = sentences[call_count]
-                        call_count += 1
-                        return result
-                    return b""  # EOF
-
-                mock_reader = AsyncMock()
-                mock_reader.readline = mock_readline
-                mock_writer = MagicMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
-
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
                 transport = SerialGPSTransport("/dev/serial0", 9600)
                 await transport.connect()
+                port._queue_response(
+                    b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*47\r\n"
+                    b"garbage\r\n"
+                    b"$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A\r\n"
+                )
 
                 collected = []
-                async for sentence in transport.read_sentences():
-                    collected.append(sentence)
-                    if len(collected) >= 2:
-                        break
+                try:
+                    async for sentence in transport.read_sentences(timeout=2.0):
+                        collected.append(sentence)
+                        if len(collected) >= 2:
+                            break
+                finally:
+                    await transport.disconnect()
 
                 assert len(collected) == 2
                 assert collected[0].startswith("$GPGGA")
@@ -206,16 +258,11 @@ class TestSerialGPSTransport:
     def test_context_manager(self):
         """Test async context manager protocol."""
         if not SERIAL_AVAILABLE:
-            pytest.skip("serial_asyncio not available")
+            pytest.skip("pyserial not available")
 
         async def _test():
-            with patch("rpi_logger.modules.GPS.gps_core.transports.serial_transport.serial_asyncio") as mock_serial:
-                mock_reader = AsyncMock()
-                mock_writer = MagicMock()
-                mock_writer.close = MagicMock()
-                mock_writer.wait_closed = AsyncMock()
-                mock_serial.open_serial_connection = AsyncMock(return_value=(mock_reader, mock_writer))
-
+            port = _mock_port()
+            with patch.object(serial_transport.serial, "Serial", return_value=port):
                 async with SerialGPSTransport("/dev/serial0", 9600) as transport:
                     assert transport.is_connected is True
 
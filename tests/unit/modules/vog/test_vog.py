@@ -1199,6 +1199,28 @@ class TestCSVFormatValidation:
         assert "1700000000.123456" in row[4]
         assert "12345.123456789" in row[5]
 
+    async def test_data_logger_uses_arrival_and_latency_column(
+        self, wvog_protocol, sample_wvog_data_packet, tmp_path
+    ):
+        """Test logged rows take the line's arrival time and end with host_latency_us."""
+        import csv
+
+        from rpi_logger.core.devices.transports import RawLine
+        from rpi_logger.modules.VOG.vog_core.data_logger import VOGDataLogger
+
+        data_logger = VOGDataLogger(tmp_path, "/dev/ttyACM0", wvog_protocol, host_latency=True)
+        arrival = RawLine(b"dta>...\n", time.perf_counter_ns(), 1_700_000_000_500_000_000)
+        data_file = await data_logger.log_trial_data(sample_wvog_data_packet, 1, "test", arrival=arrival)
+
+        with open(data_file, newline="") as f:
+            rows = list(csv.reader(f))
+        header, row = rows
+        assert header[-1] == "host_latency_us"
+        assert len(row) == len(header) == 13
+        assert row[4] == "1700000000.500000"
+        assert row[5] == f"{arrival.arrival_mono:.9f}"
+        assert float(row[-1]) >= 0
+
 
 # =============================================================================
 # Integration-style Protocol Tests